@@ -2,17 +2,34 @@
 
 from __future__ import annotations
 
+from functools import partial
 from typing import Any
 
+from mloda.core.abstract_plugins.components.feature import Feature
 from mloda.core.abstract_plugins.components.feature_set import FeatureSet
 from mloda.provider import DefaultOptionKeys, property_spec
 
+from mloda.community.feature_groups.data_operations.approximate import APPROXIMATE, approximate_requested
 from mloda.community.feature_groups.data_operations.aggregation_base import (
     AGGREGATION_TYPES,
     AggregationFeatureGroupBase,
+    AggregationRequest,
+    bucket_by_key,
 )
 from mloda.community.feature_groups.data_operations.mask_utils import MASK_KEY, parse_mask_spec
-from mloda.community.feature_groups.data_operations.base import is_op_token
+from mloda.community.feature_groups.data_operations.base import (
+    is_flag,
+    is_op_token,
+    is_positive_int,
+    option_value,
+    positive_int_value,
+)
+from mloda.community.feature_groups.data_operations.sharded_execution import (
+    SHARDS,
+    ShardFrameOps,
+    run_sharded,
+    shards_supported,
+)
 
 
 class AggregationFeatureGroup(AggregationFeatureGroupBase):
@@ -79,6 +96,11 @@ class AggregationFeatureGroup(AggregationFeatureGroupBase):
     - ``aggregation_type``: The type of aggregation to perform
     - ``in_features``: The source feature to aggregate
     - ``partition_by``: List of columns to partition by
+    - ``shards``: Optional number of hash shards computed in parallel processes
+      (see ``sharded_execution``); backends without ``SHARD_FRAME_OPS`` reject it
+    - ``approximate``: Optional flag allowing ``median`` and ``nunique`` to use an
+      approximate kernel (see ``approximate``); computed exactly where the backend
+      has none in ``APPROXIMATE_KERNELS``
     """
 
     PREFIX_PATTERN = r".*__([\w]+)_agg$"
@@ -87,6 +109,14 @@ class AggregationFeatureGroup(AggregationFeatureGroupBase):
     MAX_IN_FEATURES = 1
 
     PARTITION_BY = "partition_by"
+    SHARDS = SHARDS
+    APPROXIMATE = APPROXIMATE
+
+    # Backends that can split the partitions across processes set this; see sharded_execution.
+    SHARD_FRAME_OPS: type[ShardFrameOps] | None = None
+
+    # Aggregation types the backend computes approximately when ``approximate`` is set.
+    APPROXIMATE_KERNELS: frozenset[str] = frozenset()
 
     PROPERTY_MAPPING = {
         AggregationFeatureGroupBase.AGGREGATION_TYPE: property_spec(
@@ -108,6 +138,18 @@ class AggregationFeatureGroup(AggregationFeatureGroupBase):
             strict=False,
             default=None,
         ),
+        SHARDS: property_spec(
+            "Number of hash shards of the partitions to compute in parallel processes (opt-in)",
+            strict=False,
+            default=None,
+            match_guard=is_positive_int,
+        ),
+        APPROXIMATE: property_spec(
+            "Allow median and nunique to use an approximate kernel (opt-in)",
+            strict=False,
+            default=None,
+            match_guard=is_flag,
+        ),
     }
 
     @classmethod
@@ -126,6 +168,7 @@ class AggregationFeatureGroup(AggregationFeatureGroupBase):
 
         We add:
         - partition_by type validation (must be a list or tuple of strings)
+        - ``shards`` needs a backend that runs sharded
         """
         if not super().match_feature_group_criteria(feature_name, options, _data_access_collection):
             return False
@@ -136,18 +179,23 @@ class AggregationFeatureGroup(AggregationFeatureGroupBase):
         if not all(isinstance(item, str) for item in partition_by):
             return False
 
-        return True
+        return shards_supported(cls, options)
 
     @classmethod
     def calculate_feature(cls, data: Any, features: FeatureSet) -> Any:
-        """Shared loop: extract params from each feature, delegate to _compute_group.
+        """Plan the FeatureSet into one fused bucket, then delegate it to _compute_group_bucket.
 
         Supports both string-based features (e.g. "value_int__sum_agg") and
         configuration-based features (via Options with aggregation_type, in_features,
         partition_by).
-        """
-        table = data
 
+        Aggregation reduces the table to one row per group, so every feature of a
+        FeatureSet must share the same ``(partition_by, mask)`` to be reduced together;
+        they are then computed in one grouping pass and returned as one table. When
+        features set ``shards``, the bucket runs sharded with the largest of them.
+        """
+        shards = max((cls._extract_shards(feature) or 1 for feature in features.features), default=1)
+        planned: list[tuple[tuple[tuple[str, ...], Any], AggregationRequest]] = []
         for feature in features.features:
             feature_name = feature.name
 
@@ -157,10 +205,55 @@ class AggregationFeatureGroup(AggregationFeatureGroupBase):
             partition_by = feature.options.get(cls.PARTITION_BY)
             mask_spec = parse_mask_spec(feature.options.get(MASK_KEY))
 
-            table = cls._compute_group(table, feature_name, source_col, partition_by, agg_type, mask_spec)
+            key = (tuple(partition_by), mask_spec)
+            approximate = approximate_requested(cls, feature, agg_type)
+            planned.append((key, AggregationRequest(feature_name, source_col, agg_type, approximate)))
+
+        buckets = bucket_by_key(planned)
+        if len(buckets) > 1:
+            raise ValueError(
+                "aggregation features computed together must share partition_by and mask, because each "
+                f"feature reduces the table to one row per group; got {len(buckets)} distinct combinations "
+                f"for features {[str(feature.name) for feature in features.features]}."
+            )
 
+        table = data
+        for (partition_key, mask_spec), requests in buckets:
+            if shards > 1:
+                compute = partial(
+                    cls._compute_group_bucket, requests=requests, partition_by=list(partition_key), mask_spec=mask_spec
+                )
+                table = run_sharded(cls.SHARD_FRAME_OPS, table, list(partition_key), shards, compute, reduces_rows=True)
+            else:
+                table = cls._compute_group_bucket(table, requests, list(partition_key), mask_spec)
         return table
 
+    @classmethod
+    def _extract_shards(cls, feature: Feature) -> int | None:
+        """Return the ``shards`` count, or None when the feature runs in-process."""
+        return option_value(feature.options, cls.SHARDS, positive_int_value)
+
+    @classmethod
+    def _compute_group_bucket(
+        cls,
+        data: Any,
+        requests: list[AggregationRequest],
+        partition_by: list[str],
+        mask_spec: list[tuple[str, str, Any]] | None = None,
+    ) -> Any:
+        """Reduce every request of one bucket; all share partition_by and mask_spec.
+
+        The default delegates a single request to ``_compute_group``. Backends override
+        this to emit the whole bucket as one multi-aggregate call, which is also what
+        lets a bucket hold more than one feature.
+        """
+        if len(requests) != 1:
+            raise NotImplementedError(f"{cls.__name__} cannot reduce {len(requests)} aggregation features together.")
+        (request,) = requests
+        return cls._compute_group(
+            data, request.feature_name, request.source_col, partition_by, request.agg_type, mask_spec
+        )
+
     @classmethod
     def _compute_group(
         cls,
@@ -12,6 +12,7 @@ from mloda_plugins.compute_framework.base_implementations.sql.sql_utils import q
 from mloda.community.feature_groups.data_operations.aggregation.base import (
     AggregationFeatureGroup,
 )
+from mloda.community.feature_groups.data_operations.aggregation_base import AggregationRequest
 from mloda.community.feature_groups.data_operations.errors import unsupported_agg_type_error
 from mloda.community.feature_groups.data_operations.mask_utils import build_sql_case_when
 
@@ -38,6 +39,9 @@ _DUCKDB_AGG_FUNCS: dict[str, str] = {
 
 
 class DuckdbAggregation(AggregationFeatureGroup):
+    # approx_count_distinct is left out: its error is far beyond the approximate budget.
+    APPROXIMATE_KERNELS = frozenset({"median"})
+
     @classmethod
     def compute_framework_rule(cls) -> set[type[ComputeFramework]] | None:
         return {DuckDBFramework}
@@ -52,26 +56,41 @@ class DuckdbAggregation(AggregationFeatureGroup):
         agg_type: str,
         mask_spec: list[tuple[str, str, Any]] | None = None,
     ) -> DuckdbRelation:
-        quoted_source = quote_ident(source_col)
-        quoted_feature = quote_ident(feature_name)
+        request = AggregationRequest(feature_name, source_col, agg_type)
+        return cls._compute_group_bucket(data, [request], partition_by, mask_spec)
+
+    @classmethod
+    def _compute_group_bucket(
+        cls,
+        data: Any,
+        requests: list[AggregationRequest],
+        partition_by: list[str],
+        mask_spec: list[tuple[str, str, Any]] | None = None,
+    ) -> DuckdbRelation:
+        """All aggregates of the bucket in a single GROUP BY."""
         partition_cols = ", ".join(quote_ident(col) for col in partition_by)
 
-        source_sql = quoted_source
-        if mask_spec is not None:
-            source_sql = build_sql_case_when(mask_spec, quoted_source)
+        agg_exprs = []
+        for request in requests:
+            source_sql = quote_ident(request.source_col)
+            if mask_spec is not None:
+                source_sql = build_sql_case_when(mask_spec, source_sql)
 
-        if agg_type == "nunique":
-            agg_expr = f"COUNT(DISTINCT {source_sql})"
-        else:
-            agg_func = _DUCKDB_AGG_FUNCS.get(agg_type)
-            if agg_func is None:
-                raise unsupported_agg_type_error(agg_type, _DUCKDB_AGG_FUNCS.keys(), framework="DuckDB")
-            agg_expr = f"{agg_func}({source_sql})"
-            if agg_type in ("first", "last"):
-                agg_expr += f" FILTER (WHERE {source_sql} IS NOT NULL)"
+            if request.agg_type == "nunique":
+                agg_expr = f"COUNT(DISTINCT {source_sql})"
+            elif request.approximate and request.agg_type == "median":
+                agg_expr = f"APPROX_QUANTILE({source_sql}, 0.5)"
+            else:
+                agg_func = _DUCKDB_AGG_FUNCS.get(request.agg_type)
+                if agg_func is None:
+                    raise unsupported_agg_type_error(request.agg_type, _DUCKDB_AGG_FUNCS.keys(), framework="DuckDB")
+                agg_expr = f"{agg_func}({source_sql})"
+                if request.agg_type in ("first", "last"):
+                    agg_expr += f" FILTER (WHERE {source_sql} IS NOT NULL)"
+            agg_exprs.append(f"{agg_expr} AS {quote_ident(request.feature_name)}")
 
         # Use lazy relation methods (aggregate + order) instead of eager query()
         # so DuckDB defers execution until the result is consumed.
-        rel: DuckdbRelation = data.aggregate(f"{partition_cols}, {agg_expr} AS {quoted_feature}", partition_cols)
+        rel: DuckdbRelation = data.aggregate(f"{partition_cols}, {', '.join(agg_exprs)}", partition_cols)
         rel = rel.order(partition_cols)
         return rel
@@ -1,24 +1,23 @@
 """Entry-point manifest for mloda-community-aggregation.
 
-Lists the concrete FeatureGroup classes that mloda discovers via the
-``mloda.feature_groups`` entry point. Backends whose optional framework is not
-installed are skipped so the rest still register. See issue #271.
+Declares the concrete FeatureGroup classes that mloda discovers via the
+``mloda.feature_groups`` entry point as (module, class, framework) triples;
+importing this module imports no backend. Backends whose optional framework is
+not installed are skipped so the rest still register. See issue #271.
 """
 
 from __future__ import annotations
 
-from mloda.provider import FeatureGroup
+from mloda.community.feature_groups.data_operations.manifest_utils import LazyPluginManifest
 
-from mloda.community.feature_groups.data_operations.manifest_utils import load_plugin_classes
-
-FEATURE_GROUPS: list[type[FeatureGroup]] = load_plugin_classes(
+FEATURE_GROUPS = LazyPluginManifest(
     __package__ or __name__.rpartition(".")[0],
     [
-        ("duckdb_aggregation", "DuckdbAggregation"),
-        ("pandas_aggregation", "PandasAggregation"),
-        ("polars_lazy_aggregation", "PolarsLazyAggregation"),
-        ("pyarrow_aggregation", "PyArrowAggregation"),
-        ("python_dict_aggregation", "PythonDictAggregation"),
-        ("sqlite_aggregation", "SqliteAggregation"),
+        ("duckdb_aggregation", "DuckdbAggregation", "DuckDBFramework"),
+        ("pandas_aggregation", "PandasAggregation", "PandasDataFrame"),
+        ("polars_lazy_aggregation", "PolarsLazyAggregation", "PolarsLazyDataFrame"),
+        ("pyarrow_aggregation", "PyArrowAggregation", "PyArrowTable"),
+        ("python_dict_aggregation", "PythonDictAggregation", "PythonDictFramework"),
+        ("sqlite_aggregation", "SqliteAggregation", "SqliteFramework"),
     ],
 )
@@ -12,23 +12,23 @@ from mloda_plugins.compute_framework.base_implementations.pandas.dataframe impor
 from mloda.community.feature_groups.data_operations.aggregation.base import (
     AggregationFeatureGroup,
 )
+from mloda.community.feature_groups.data_operations.aggregation_base import AggregationRequest
 from mloda.community.feature_groups.data_operations.errors import unsupported_agg_type_error
-from mloda.community.feature_groups.data_operations.mask_utils import build_mask_from_spec
+from mloda.community.feature_groups.data_operations.mask_utils import apply_pandas_mask_columns
 from mloda.community.feature_groups.data_operations.pandas_helpers import (
     PANDAS_AGG_FUNCS,
+    PandasShardFrame,
     apply_null_safe_agg,
     coerce_count_dtype,
     compute_mode_winners,
-    null_safe_groupby,
-)
-from mloda_plugins.compute_framework.base_implementations.pandas.pandas_mask_engine import (
-    PandasMaskEngine,
 )
 
 _SUPPORTED_AGG_TYPES = {*PANDAS_AGG_FUNCS.keys(), "mode"}
 
 
 class PandasAggregation(AggregationFeatureGroup):
+    SHARD_FRAME_OPS = PandasShardFrame
+
     @classmethod
     def compute_framework_rule(cls) -> set[type[ComputeFramework]] | None:
         return {PandasDataFrame}
@@ -43,23 +43,53 @@ class PandasAggregation(AggregationFeatureGroup):
         agg_type: str,
         mask_spec: list[tuple[str, str, Any]] | None = None,
     ) -> pd.DataFrame:
-        if mask_spec is not None:
-            mask = build_mask_from_spec(PandasMaskEngine, data, mask_spec)
-            data = data.copy()
-            data[source_col] = data[source_col].where(mask)
+        request = AggregationRequest(feature_name, source_col, agg_type)
+        return cls._compute_group_bucket(data, [request], partition_by, mask_spec)
 
-        if agg_type == "mode":
-            return cls._compute_mode(data, feature_name, source_col, partition_by)
-
-        pandas_func = PANDAS_AGG_FUNCS.get(agg_type)
-        if pandas_func is None:
-            raise unsupported_agg_type_error(agg_type, _SUPPORTED_AGG_TYPES, framework="Pandas")
+    @classmethod
+    def _compute_group_bucket(
+        cls,
+        data: pd.DataFrame,
+        requests: list[AggregationRequest],
+        partition_by: list[str],
+        mask_spec: list[tuple[str, str, Any]] | None = None,
+    ) -> pd.DataFrame:
+        """Reduce every request of the bucket against one shared groupby.
 
-        grouped = null_safe_groupby(data, partition_by, source_col)
-        result = apply_null_safe_agg(grouped, pandas_func, agg_type).reset_index()
-        result = result.rename(columns={source_col: feature_name})
+        Mode has its own tie-breaking pass and is merged onto the other results on
+        the partition keys.
+        """
+        for request in requests:
+            if request.agg_type != "mode" and request.agg_type not in PANDAS_AGG_FUNCS:
+                raise unsupported_agg_type_error(request.agg_type, _SUPPORTED_AGG_TYPES, framework="Pandas")
 
-        coerce_count_dtype(result, feature_name, agg_type)
+        partition_by = list(partition_by)
+        work = data
+        if mask_spec is not None:
+            work = apply_pandas_mask_columns(data, [request.source_col for request in requests], mask_spec)
+
+        by: str | list[str] = partition_by[0] if len(partition_by) == 1 else partition_by
+        grouped = work.groupby(by, dropna=False)
+        reduced: list[pd.Series] = []
+        mode_results: list[pd.DataFrame] = []
+        for request in requests:
+            if request.agg_type == "mode":
+                mode_results.append(cls._compute_mode(work, request.feature_name, request.source_col, partition_by))
+                continue
+            series = apply_null_safe_agg(
+                grouped[request.source_col], PANDAS_AGG_FUNCS[request.agg_type], request.agg_type
+            )
+            reduced.append(series.rename(request.feature_name))
+
+        if reduced:
+            result = pd.concat(reduced, axis=1).reset_index()
+        else:
+            result = mode_results.pop(0)
+        for mode_result in mode_results:
+            result = result.merge(mode_result, on=partition_by, how="left")
+
+        for request in requests:
+            coerce_count_dtype(result, request.feature_name, request.agg_type)
 
         return result
 
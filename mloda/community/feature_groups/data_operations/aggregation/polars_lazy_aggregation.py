@@ -12,8 +12,9 @@ from mloda_plugins.compute_framework.base_implementations.polars.lazy_dataframe
 from mloda.community.feature_groups.data_operations.aggregation.base import (
     AggregationFeatureGroup,
 )
+from mloda.community.feature_groups.data_operations.aggregation_base import AggregationRequest
 from mloda.community.feature_groups.data_operations.errors import unsupported_agg_type_error
-from mloda.community.feature_groups.data_operations.mask_utils import _POLARS_MASK_TMP, apply_polars_mask
+from mloda.community.feature_groups.data_operations.mask_utils import apply_polars_mask_columns
 from mloda.community.feature_groups.data_operations.polars_mode_helpers import (
     ModeHelperCols,
     add_mode_helper_cols,
@@ -44,6 +45,8 @@ _SUPPORTED_AGG_TYPES = {*_POLARS_AGG_EXPRS.keys(), "mode"}
 
 
 class PolarsLazyAggregation(AggregationFeatureGroup):
+    APPROXIMATE_KERNELS = frozenset({"nunique"})
+
     @classmethod
     def compute_framework_rule(cls) -> set[type[ComputeFramework]] | None:
         return {PolarsLazyDataFrame}
@@ -58,31 +61,44 @@ class PolarsLazyAggregation(AggregationFeatureGroup):
         agg_type: str,
         mask_spec: list[tuple[str, str, Any]] | None = None,
     ) -> pl.LazyFrame:
-        actual_source = source_col
+        request = AggregationRequest(feature_name, source_col, agg_type)
+        return cls._compute_group_bucket(data, [request], partition_by, mask_spec)
+
+    @classmethod
+    def _compute_group_bucket(
+        cls,
+        data: pl.LazyFrame,
+        requests: list[AggregationRequest],
+        partition_by: list[str],
+        mask_spec: list[tuple[str, str, Any]] | None = None,
+    ) -> pl.LazyFrame:
+        """All aggregations of the bucket in a single ``group_by(...).agg(...)``."""
+        for request in requests:
+            if request.agg_type not in _SUPPORTED_AGG_TYPES:
+                raise unsupported_agg_type_error(request.agg_type, _SUPPORTED_AGG_TYPES, framework="Polars")
+
+        taken = set(data.collect_schema().names()) | {request.feature_name for request in requests}
+        sources = {request.source_col: request.source_col for request in requests}
         if mask_spec is not None:
-            data, actual_source = apply_polars_mask(data, source_col, mask_spec)
+            data, sources = apply_polars_mask_columns(data, list(sources), mask_spec, taken)
+            taken |= set(sources.values())
 
-        if agg_type == "mode":
-            cols = ModeHelperCols.pick(set(data.collect_schema().names()) | {feature_name})
-            data = add_mode_helper_cols(data, actual_source, partition_by, cols)
-            expr = mode_agg_expr(actual_source, feature_name, cols)
-        elif agg_type in _POLARS_AGG_EXPRS:
-            raw_expr = _POLARS_AGG_EXPRS[agg_type](actual_source).alias(feature_name)
-            if agg_type == "sum":
+        exprs: list[pl.Expr] = []
+        for request in requests:
+            actual_source = sources[request.source_col]
+            feature_name = request.feature_name
+            if request.agg_type == "mode":
+                cols = ModeHelperCols.pick(taken)
+                taken |= set(cols.as_list())
+                data = add_mode_helper_cols(data, actual_source, partition_by, cols)
+                exprs.append(mode_agg_expr(actual_source, feature_name, cols))
+            elif request.agg_type == "sum":
                 # Polars sum() returns 0 for all-null groups; correct to null.
                 has_values = pl.col(actual_source).count() > 0
-                expr = (
-                    pl.when(has_values)
-                    .then(_POLARS_AGG_EXPRS[agg_type](actual_source))
-                    .otherwise(None)
-                    .alias(feature_name)
-                )
+                exprs.append(pl.when(has_values).then(pl.col(actual_source).sum()).otherwise(None).alias(feature_name))
+            elif request.approximate and request.agg_type == "nunique":
+                exprs.append(pl.col(actual_source).drop_nulls().approx_n_unique().alias(feature_name))
             else:
-                expr = raw_expr
-        else:
-            raise unsupported_agg_type_error(agg_type, _SUPPORTED_AGG_TYPES, framework="Polars")
+                exprs.append(_POLARS_AGG_EXPRS[request.agg_type](actual_source).alias(feature_name))
 
-        result = data.group_by(partition_by, maintain_order=True).agg(expr)
-        if mask_spec is not None:
-            result = result.drop(_POLARS_MASK_TMP, strict=False)
-        return result
+        return data.group_by(partition_by, maintain_order=True).agg(exprs)
@@ -1,7 +1,8 @@
 """PyArrow implementation for aggregation feature groups.
 
 Uses PyArrow's native ``Table.group_by().aggregate()`` API for vectorized,
-C++-backed aggregation.
+C++-backed aggregation. Every feature of a bucket is aggregated by one
+group_by call, so the partition keys are hashed once per bucket.
 """
 
 from __future__ import annotations
@@ -17,8 +18,10 @@ from mloda_plugins.compute_framework.base_implementations.pyarrow.table import P
 from mloda.community.feature_groups.data_operations.aggregation.base import (
     AggregationFeatureGroup,
 )
+from mloda.community.feature_groups.data_operations.aggregation_base import AggregationRequest
 from mloda.community.feature_groups.data_operations.errors import unsupported_agg_type_error
-from mloda.community.feature_groups.data_operations.mask_utils import apply_pyarrow_mask
+from mloda.community.feature_groups.data_operations.mask_utils import apply_pyarrow_mask_columns
+from mloda.community.feature_groups.data_operations.pyarrow_helpers import fused_group_by
 
 # Aggregation types with direct PyArrow group_by support.
 _PA_AGG_FUNCS: dict[str, str] = {
@@ -69,22 +72,41 @@ class PyArrowAggregation(AggregationFeatureGroup):
         agg_type: str,
         mask_spec: list[tuple[str, str, Any]] | None = None,
     ) -> pa.Table:
+        request = AggregationRequest(feature_name, source_col, agg_type)
+        return cls._compute_group_bucket(table, [request], partition_by, mask_spec)
+
+    @classmethod
+    def _compute_group_bucket(
+        cls,
+        table: pa.Table,
+        requests: list[AggregationRequest],
+        partition_by: list[str],
+        mask_spec: list[tuple[str, str, Any]] | None = None,
+    ) -> pa.Table:
+        """One ``group_by().aggregate([...])`` call for every feature of the bucket."""
+        aggregations = [(request.source_col, *cls._pa_aggregation(request.agg_type)) for request in requests]
+        # Ordered aggregates read rows in input order, which needs a single-threaded group_by.
+        ordered = any(request.agg_type in _ORDERED_FUNCS for request in requests)
+
         if mask_spec is not None:
-            table = apply_pyarrow_mask(table, source_col, mask_spec)
+            table = apply_pyarrow_mask_columns(table, [request.source_col for request in requests], mask_spec)
+
+        grouped, output_cols = fused_group_by(table, partition_by, aggregations, use_threads=not ordered)
+
+        # Keep the group keys in the grouped table's own order, then one column per feature.
+        key_names = [name for name in grouped.column_names if name in partition_by]
+        columns = [grouped.column(name) for name in key_names]
+        columns += [grouped.column(output_col) for output_col in output_cols]
+        return pa.table(columns, names=key_names + [request.feature_name for request in requests])
 
+    @staticmethod
+    def _pa_aggregation(agg_type: str) -> tuple[str, pc.FunctionOptions | None]:
+        """PyArrow hash-aggregate function name and options for *agg_type*."""
         if agg_type in _PA_AGG_FUNCS:
-            pa_func = _PA_AGG_FUNCS[agg_type]
-            grouped = table.group_by(partition_by).aggregate([(source_col, pa_func)])
-        elif agg_type in _VARIANCE_FUNCS:
+            return _PA_AGG_FUNCS[agg_type], None
+        if agg_type in _VARIANCE_FUNCS:
             pa_func, ddof = _VARIANCE_FUNCS[agg_type]
-            grouped = table.group_by(partition_by).aggregate([(source_col, pa_func, pc.VarianceOptions(ddof=ddof))])
-        elif agg_type in _ORDERED_FUNCS:
-            pa_func = _ORDERED_FUNCS[agg_type]
-            grouped = table.group_by(partition_by, use_threads=False).aggregate([(source_col, pa_func)])
-        else:
-            raise unsupported_agg_type_error(agg_type, _SUPPORTED_AGG_TYPES, framework="PyArrow")
-
-        # Rename auto-generated column (e.g. "val_sum") to feature_name.
-        auto_col = f"{source_col}_{pa_func}"
-        names = [feature_name if c == auto_col else c for c in grouped.column_names]
-        return grouped.rename_columns(names)
+            return pa_func, pc.VarianceOptions(ddof=ddof)
+        if agg_type in _ORDERED_FUNCS:
+            return _ORDERED_FUNCS[agg_type], None
+        raise unsupported_agg_type_error(agg_type, _SUPPORTED_AGG_TYPES, framework="PyArrow")
@@ -20,6 +20,7 @@ from mloda_plugins.compute_framework.base_implementations.python_dict.python_dic
 from mloda.community.feature_groups.data_operations.aggregation.base import (
     AggregationFeatureGroup,
 )
+from mloda.community.feature_groups.data_operations.aggregation_base import AggregationRequest
 from mloda.community.feature_groups.data_operations.errors import unsupported_agg_type_error
 from mloda.community.feature_groups.data_operations.mask_utils import build_mask_from_spec
 from mloda.community.feature_groups.data_operations.python_dict_helpers import (
@@ -27,9 +28,12 @@ from mloda.community.feature_groups.data_operations.python_dict_helpers import (
     group_key_value,
     reduce_agg,
 )
+from mloda.community.feature_groups.data_operations.sharded_execution import PythonDictShardFrame
 
 
 class PythonDictAggregation(AggregationFeatureGroup):
+    SHARD_FRAME_OPS = PythonDictShardFrame
+
     @classmethod
     def compute_framework_rule(cls) -> set[type[ComputeFramework]] | None:
         return {PythonDictFramework}
@@ -44,31 +48,50 @@ class PythonDictAggregation(AggregationFeatureGroup):
         agg_type: str,
         mask_spec: list[tuple[str, str, Any]] | None = None,
     ) -> dict[str, list[Any]]:
-        if agg_type not in SUPPORTED_AGG_TYPES:
-            raise unsupported_agg_type_error(agg_type, SUPPORTED_AGG_TYPES, framework="PythonDict")
+        request = AggregationRequest(feature_name, source_col, agg_type)
+        return cls._compute_group_bucket(data, [request], partition_by, mask_spec)
+
+    @classmethod
+    def _compute_group_bucket(
+        cls,
+        data: dict[str, list[Any]],
+        requests: list[AggregationRequest],
+        partition_by: list[str],
+        mask_spec: list[tuple[str, str, Any]] | None = None,
+    ) -> dict[str, list[Any]]:
+        """Group the rows once and reduce every request of the bucket against that grouping."""
+        for request in requests:
+            if request.agg_type not in SUPPORTED_AGG_TYPES:
+                raise unsupported_agg_type_error(request.agg_type, SUPPORTED_AGG_TYPES, framework="PythonDict")
 
         partition_by = list(partition_by)
-        source_values = data[source_col]
 
-        if mask_spec is not None:
-            mask = build_mask_from_spec(PythonDictMaskEngine, data, mask_spec)
-            source_values = [v if m else None for v, m in zip(source_values, mask)]
+        mask = build_mask_from_spec(PythonDictMaskEngine, data, mask_spec) if mask_spec is not None else None
+        source_values: dict[str, list[Any]] = {}
+        for request in requests:
+            if request.source_col not in source_values:
+                values = data[request.source_col]
+                if mask is not None:
+                    values = [v if m else None for v, m in zip(values, mask)]
+                source_values[request.source_col] = values
 
         partition_cols = [data[col] for col in partition_by]
 
         groups: dict[tuple[Any, ...], list[int]] = {}
-        for i in range(len(source_values)):
+        for i in range(len(data[requests[0].source_col])):
             key = tuple(group_key_value(col[i]) for col in partition_cols)
             groups.setdefault(key, []).append(i)
 
         result: dict[str, list[Any]] = {col: [] for col in partition_by}
-        result[feature_name] = []
+        for request in requests:
+            result[request.feature_name] = []
 
         for indices in groups.values():
             first_idx = indices[0]
             for col_name, col in zip(partition_by, partition_cols):
                 result[col_name].append(col[first_idx])
-            values = [source_values[i] for i in indices]
-            result[feature_name].append(reduce_agg(agg_type, values))
+            for request in requests:
+                source = source_values[request.source_col]
+                result[request.feature_name].append(reduce_agg(request.agg_type, [source[i] for i in indices]))
 
         return result
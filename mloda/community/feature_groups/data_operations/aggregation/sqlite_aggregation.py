@@ -12,6 +12,7 @@ from mloda_plugins.compute_framework.base_implementations.sqlite.sqlite_relation
 from mloda.community.feature_groups.data_operations.aggregation.base import (
     AggregationFeatureGroup,
 )
+from mloda.community.feature_groups.data_operations.aggregation_base import AggregationRequest
 from mloda.community.feature_groups.data_operations.errors import unsupported_agg_type_error
 from mloda.community.feature_groups.data_operations.mask_utils import build_sql_case_when
 
@@ -45,23 +46,35 @@ class SqliteAggregation(AggregationFeatureGroup):
         agg_type: str,
         mask_spec: list[tuple[str, str, Any]] | None = None,
     ) -> SqliteRelation:
-        agg_func = _SQLITE_AGG_FUNCS.get(agg_type)
-        if agg_func is None:
-            raise unsupported_agg_type_error(agg_type, _SQLITE_AGG_FUNCS.keys(), framework="SQLite")
+        request = AggregationRequest(feature_name, source_col, agg_type)
+        return cls._compute_group_bucket(data, [request], partition_by, mask_spec)
 
-        quoted_source = quote_ident(source_col)
-        quoted_feature = quote_ident(feature_name)
+    @classmethod
+    def _compute_group_bucket(
+        cls,
+        data: SqliteRelation,
+        requests: list[AggregationRequest],
+        partition_by: list[str],
+        mask_spec: list[tuple[str, str, Any]] | None = None,
+    ) -> SqliteRelation:
+        """All aggregates of the bucket in a single GROUP BY view."""
         partition_cols = ", ".join(quote_ident(col) for col in partition_by)
 
-        source_sql = quoted_source
-        if mask_spec is not None:
-            source_sql = build_sql_case_when(mask_spec, quoted_source)
+        agg_exprs = []
+        for request in requests:
+            agg_func = _SQLITE_AGG_FUNCS.get(request.agg_type)
+            if agg_func is None:
+                raise unsupported_agg_type_error(request.agg_type, _SQLITE_AGG_FUNCS.keys(), framework="SQLite")
+            source_sql = quote_ident(request.source_col)
+            if mask_spec is not None:
+                source_sql = build_sql_case_when(mask_spec, source_sql)
+            agg_exprs.append(f"{agg_func}({source_sql}) AS {quote_ident(request.feature_name)}")
 
         new_name = _next_table_name()
         sql = (
             f"CREATE TEMP VIEW {quote_ident(new_name)} AS "  # nosec
             f"SELECT {partition_cols}, "
-            f"{agg_func}({source_sql}) AS {quoted_feature} "
+            f"{', '.join(agg_exprs)} "
             f"FROM {quote_ident(data.table_name)} "
             f"GROUP BY {partition_cols}"
         )
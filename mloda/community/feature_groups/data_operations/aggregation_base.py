@@ -13,10 +13,20 @@ own supported set / descriptions) and ``_COUNTING_AGG_TYPES`` (which agg types
 produce an integer count), plus the family-specific bits (operand count,
 matching, PROPERTY_MAPPING). Per-backend computation lives in the backend
 modules.
+
+The aggregation and window-aggregation families also share the planning step
+that fuses a FeatureSet's features into buckets: ``AggregationRequest`` is one
+feature's share of a fused call, and ``bucket_by_key`` groups the requests by
+their shared grouping key (partition_by, mask, order_by) so each backend runs
+one multi-aggregate group-by per bucket instead of one per feature.
 """
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
 from mloda.core.abstract_plugins.components.data_types import DataType
 from mloda.core.abstract_plugins.components.feature import Feature
 from mloda.core.abstract_plugins.components.feature_chainer.feature_chain_parser import FeatureChainParser
@@ -26,6 +36,8 @@ from mloda.provider import FeatureGroup
 from mloda.community.feature_groups.data_operations.base import RejectionReasonMixin, op_token_value
 from mloda.community.feature_groups.data_operations.capability_hook import SubtypeCapabilityHook
 
+T = TypeVar("T")
+
 AGGREGATION_TYPES: dict[str, str] = {
     "sum": "Sum of values",
     "avg": "Average of values",
@@ -47,6 +59,38 @@ AGGREGATION_TYPES: dict[str, str] = {
 }
 
 
+@dataclass(frozen=True)
+class AggregationRequest:
+    """One feature's aggregation inside a fused group-by bucket.
+
+    ``approximate`` is True when the feature allows, and the backend has, an approximate
+    kernel for ``agg_type`` (see ``approximate``).
+    """
+
+    feature_name: str
+    source_col: str
+    agg_type: str
+    approximate: bool = False
+
+
+def bucket_by_key(entries: Iterable[tuple[Any, T]]) -> list[tuple[Any, list[T]]]:
+    """Group ``(key, item)`` pairs by key, keeping first-seen key order and item order within a key.
+
+    Keys are compared with ``==`` rather than hashed, because a parsed mask spec holds
+    lists (``is_in`` values) and is unhashable. A FeatureSet has few distinct keys, so the
+    linear scan over the buckets found so far stays cheap.
+    """
+    buckets: list[tuple[Any, list[T]]] = []
+    for key, item in entries:
+        for bucket_key, items in buckets:
+            if bucket_key == key:
+                items.append(item)
+                break
+        else:
+            buckets.append((key, [item]))
+    return buckets
+
+
 class AggregationFeatureGroupBase(SubtypeCapabilityHook, RejectionReasonMixin, FeatureGroup):
     AGGREGATION_TYPE = "aggregation_type"
 
@@ -0,0 +1,44 @@
+"""Opt-in approximate kernels for percentile, median and nunique.
+
+The exact percentile, median and nunique sort or hash every value of every
+partition, which makes them the most expensive aggregates the operations run.
+Setting the ``approximate`` option to True allows a feature to use a sketch-based
+kernel instead, where the engine has one that stays within the error budget:
+
+- quantiles (``percentile``, ``median``): a t-digest, whose *rank* error stays
+  well below 1% (DuckDB ``approx_quantile``, PyArrow ``tdigest``). The result is a
+  value of the partition near the requested rank; it is not interpolated the way
+  PERCENTILE_CONT interpolates, so a small partition can differ by one value step.
+- ``nunique``: HyperLogLog, with a relative error of about 1% (Polars
+  ``approx_n_unique``).
+
+``approximate`` grants a tolerance, it does not demand an approximation: every
+backend accepts it, and a backend without a kernel for an aggregate within that
+tolerance computes it exactly (exact results are within any bound). Each backend
+lists its approximate aggregates in ``APPROXIMATE_KERNELS``, and the catalog
+reports them per framework (``OperationInfo.approximate``). DuckDB's
+``approx_count_distinct`` is deliberately not used: its error exceeds 20% on
+tables of a few thousand distinct values. The engines expose no common way to
+tighten their bounds, so the option is a flag rather than a tunable bound.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from mloda.core.abstract_plugins.components.feature import Feature
+
+from mloda.community.feature_groups.data_operations.base import flag_value, option_value
+
+APPROXIMATE = "approximate"
+"""Config key allowing percentile, median and nunique to use an approximate kernel (opt-in bool).
+
+Used by: aggregation, scalar_aggregate, percentile.
+"""
+
+
+def approximate_requested(feature_group: type[Any], feature: Feature, agg_type: str) -> bool:
+    """True when ``feature`` sets ``approximate`` and ``feature_group`` approximates ``agg_type``."""
+    if agg_type not in feature_group.APPROXIMATE_KERNELS:
+        return False
+    return option_value(feature.options, APPROXIMATE, flag_value) is True
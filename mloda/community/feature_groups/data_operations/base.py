@@ -215,6 +215,17 @@ def positive_int_value(value: object) -> int:
     return n
 
 
+def is_flag(value: object) -> bool:
+    """True only for exactly one bool, bare or in a single-element container (rejects 0/1 and strings)."""
+    return isinstance(_unwrap_singleton(value), bool)
+
+
+def flag_value(value: object) -> bool:
+    """The single bool of a value is_flag accepts, unwrapped from its container."""
+    flag: bool = _unwrap_singleton(value)
+    return flag
+
+
 def always_required(_options: Options) -> bool:
     """required_when predicate for a key required on every path: a PREFIX_PATTERN match otherwise skips the check."""
     return True
@@ -8,6 +8,11 @@ framework iff the concrete backend class both matches a probe feature
 (``supports_compute_framework``). Nothing framework-heavy is imported at module
 import time; backend modules are imported lazily and skipped when their
 optional dependency (or their whole pip package) is missing.
+
+``OperationInfo.approximate`` reports, per framework, the subtypes the backend
+computes with an approximate kernel when a feature sets ``approximate`` (from the
+backend's ``APPROXIMATE_KERNELS``; see ``approximate``). Frameworks without one
+are absent and compute exactly.
 """
 
 from __future__ import annotations
@@ -15,7 +20,7 @@ from __future__ import annotations
 import importlib
 import inspect
 from collections.abc import Callable, Mapping
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import lru_cache
 from types import MappingProxyType, ModuleType
 from typing import Any
@@ -23,6 +28,7 @@ from typing import Any
 from mloda.core.abstract_plugins.components.options import Options
 
 from mloda.community.feature_groups.data_operations.errors import (
+    unsupported_framework_error,
     unsupported_op_error,
     unsupported_subtype_error,
 )
@@ -39,13 +45,18 @@ _TIME_UNIT_ORDER: tuple[str, ...] = ("second", "minute", "hour", "day", "week",
 
 @dataclass(frozen=True)
 class OperationInfo:
-    """Describes one built-in data operation and its per-framework capability."""
+    """Describes one built-in data operation and its per-framework capability.
+
+    ``approximate`` maps each framework with an approximate kernel to the subtypes it
+    approximates (None for an operation without subtypes, as in ``frameworks``).
+    """
 
     name: str
     prefix_pattern: str
     subtype_label: str
     subtypes: tuple[str, ...] | None
     frameworks: Mapping[str, frozenset[str] | None]
+    approximate: Mapping[str, frozenset[str] | None] = field(default_factory=lambda: MappingProxyType({}))
 
 
 _SubtypesFn = Callable[[ModuleType], tuple[str, ...]]
@@ -393,6 +404,20 @@ def _supported_subtypes(
     return frozenset(supported)
 
 
+def _concrete_classes(spec: _OperationSpec, base_cls: type[Any]) -> list[type[Any]]:
+    """The installed concrete backend classes of *spec*, in framework-prefix order."""
+    classes: list[type[Any]] = []
+    op_dirname = spec.package.rsplit(".", 1)[-1]
+    for prefix in _FRAMEWORK_MODULE_PREFIXES:
+        backend_module = _import_optional(f"{spec.package}.{prefix}_{op_dirname}")
+        if backend_module is None:
+            continue
+        concrete = _module_local_subclass(backend_module, base_cls)
+        if concrete is not None:
+            classes.append(concrete)
+    return classes
+
+
 def _build_operation(spec: _OperationSpec) -> OperationInfo | None:
     """Build one OperationInfo, or None when the operation's package is not installed."""
     base_module = _import_optional(f"{spec.package}.base")
@@ -402,20 +427,18 @@ def _build_operation(spec: _OperationSpec) -> OperationInfo | None:
     subtypes = spec.subtypes(base_module) if spec.subtypes is not None else None
 
     frameworks: dict[str, frozenset[str] | None] = {}
-    op_dirname = spec.package.rsplit(".", 1)[-1]
-    for prefix in _FRAMEWORK_MODULE_PREFIXES:
-        backend_module = _import_optional(f"{spec.package}.{prefix}_{op_dirname}")
-        if backend_module is None:
-            continue
-        concrete = _module_local_subclass(backend_module, base_cls)
-        if concrete is None:
-            continue
+    approximate: dict[str, frozenset[str] | None] = {}
+    for concrete in _concrete_classes(spec, base_cls):
+        kernels: frozenset[str] = getattr(concrete, "APPROXIMATE_KERNELS", frozenset())
         for framework in concrete.compute_framework_definition():
             key = str(framework.__name__)
             if subtypes is None or spec.probe is None:
                 frameworks[key] = None
             else:
                 frameworks[key] = _supported_subtypes(concrete, framework, base_module, subtypes, spec.probe)
+            if kernels:
+                supported = frameworks[key]
+                approximate[key] = None if supported is None else supported & kernels
 
     return OperationInfo(
         name=spec.name,
@@ -423,6 +446,7 @@ def _build_operation(spec: _OperationSpec) -> OperationInfo | None:
         subtype_label=spec.subtype_label,
         subtypes=subtypes,
         frameworks=MappingProxyType(frameworks),
+        approximate=MappingProxyType(approximate),
     )
 
 
@@ -473,3 +497,20 @@ class DataOperationsCatalog:
                 return True
             return supported is not None and subtype in supported
         return False
+
+    @classmethod
+    def implementation(cls, operation: str, framework: str) -> type[Any]:
+        """Return the concrete feature group class implementing *operation* on *framework*.
+
+        Framework names match case-insensitively, as in ``is_supported``. Unknown
+        operations, and frameworks the operation has no implementation for, raise
+        ValueError listing the valid choices.
+        """
+        info = cls.get(operation)
+        spec = next(spec for spec in _OPERATION_SPECS if spec.name == info.name)
+        base_cls: type[Any] = getattr(importlib.import_module(f"{spec.package}.base"), spec.base_class)
+        for concrete in _concrete_classes(spec, base_cls):
+            for candidate in concrete.compute_framework_definition():
+                if str(candidate.__name__).lower() == framework.lower():
+                    return concrete
+        raise unsupported_framework_error(framework, info.frameworks, operation=info.name)
@@ -0,0 +1,51 @@
+"""Declared asymptotic complexity budgets of data-operation backends.
+
+Each concrete backend may declare how its running time grows with the number of
+input rows, next to its other class-level capability declarations:
+
+- ``COMPLEXITY``: the budget for every subtype (default ``Complexity.LINEARITHMIC``,
+  i.e. "at most a sort").
+- ``SUBTYPE_COMPLEXITY``: per-subtype overrides, keyed like ``OperationInfo.subtypes``
+  (e.g. ``"time:day"`` for frame aggregates).
+
+The complexity regression tests time every catalog cell at ``n`` and ``k * n`` rows,
+fit the scaling exponent and fail when it exceeds the declared class. Declaring
+``Complexity.QUADRATIC`` documents a known slow path; tightening it once the path is
+fixed keeps the fix from silently regressing.
+"""
+
+from __future__ import annotations
+
+import math
+from enum import Enum
+from typing import Any
+
+
+class Complexity(str, Enum):
+    """Growth class of a backend's running time in the number of input rows ``n``."""
+
+    LINEAR = "n"
+    """One or a constant number of passes over the rows."""
+
+    LINEARITHMIC = "n log n"
+    """Dominated by sorting or hashing the rows."""
+
+    QUADRATIC = "n^2"
+    """Per-row work proportional to the partition size (e.g. correlated subqueries)."""
+
+    def exponent(self, n: int, factor: float) -> float:
+        """The log-log slope this class predicts between ``n`` and ``factor * n`` rows."""
+        if self is Complexity.LINEAR:
+            return 1.0
+        if self is Complexity.QUADRATIC:
+            return 2.0
+        return 1.0 + math.log(math.log(factor * n) / math.log(n)) / math.log(factor)
+
+
+def complexity_budget(feature_group: type[Any], subtype: str | None = None) -> Complexity:
+    """The declared budget of ``feature_group`` for ``subtype`` (or for all subtypes when None)."""
+    overrides: dict[str, Complexity] = getattr(feature_group, "SUBTYPE_COMPLEXITY", {})
+    if subtype is not None and subtype in overrides:
+        return overrides[subtype]
+    budget: Complexity = getattr(feature_group, "COMPLEXITY", Complexity.LINEARITHMIC)
+    return budget
@@ -1,4 +1,4 @@
-"""Shared DuckDB helper utilities for time bucketization and resample.
+"""Shared DuckDB helper utilities for time bucketization, resample and fitted statistics.
 
 Centralizes the epoch-anchored floor expression (and the interval-literal
 building block it depends on) so every DuckDB-based bucket/resample feature
@@ -7,6 +7,16 @@ group floors timestamps identically.
 
 from __future__ import annotations
 
+import math
+from decimal import Decimal
+from typing import Any
+
+import pyarrow as pa
+from mloda_plugins.compute_framework.base_implementations.duckdb.duckdb_relation import DuckdbRelation
+from mloda_plugins.compute_framework.base_implementations.sql.sql_utils import pick_helper_column_name, quote_ident
+
+from mloda.community.feature_groups.data_operations.fitted_statistics import FittedStatisticsOps
+
 # DuckDB ``DATE_TRUNC`` unit names per logical unit.
 DUCKDB_TRUNC_UNIT: dict[str, str] = {
     "minute": "minute",
@@ -52,3 +62,67 @@ def floor_expr(quoted_source: str, n: int, unit: str) -> str:
     # TIMESTAMP and TIMESTAMPTZ so the same literal works for either
     # source column type.
     return f"time_bucket({interval}, {quoted_source}, DATE '1970-01-01')"
+
+
+def sql_literal(value: Any) -> str:
+    """DuckDB SQL literal of a JSON scalar (None, bool, int, float or str)."""
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        return f"CAST('{value!r}' AS DOUBLE)" if not math.isfinite(value) else f"CAST({value!r} AS DOUBLE)"
+    if isinstance(value, str):
+        return "'" + value.replace("'", "''") + "'"
+    raise ValueError(f"Cannot render {value!r} as a DuckDB literal.")
+
+
+def _json_number(value: Any) -> Any:
+    """``value`` with a DECIMAL (e.g. the HUGEINT ``SUM`` of integers) as an int or float, for JSON."""
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    return value
+
+
+class DuckdbFittedStatistics(FittedStatisticsOps):
+    """``FittedStatisticsOps`` for DuckDB relations; partitioned values are a null-safe left join."""
+
+    @classmethod
+    def rows(cls, data: DuckdbRelation, feature_name: str, partition_by: list[str]) -> list[list[Any]]:
+        quoted_feature = quote_ident(feature_name)
+        if partition_by:
+            keys = ", ".join(quote_ident(col) for col in partition_by)
+            data = data.aggregate(f"{keys}, ANY_VALUE({quoted_feature}) AS {quoted_feature}", keys)
+        else:
+            data = data.project(quoted_feature).limit(1)
+        table = data.to_arrow_table()
+        columns = [table.column(col).to_pylist() for col in [*partition_by, feature_name]]
+        return [[_json_number(value) for value in row] for row in zip(*columns)]
+
+    @classmethod
+    def apply(
+        cls, data: DuckdbRelation, feature_name: str, partition_by: list[str], rows: list[list[Any]]
+    ) -> DuckdbRelation:
+        quoted_feature = quote_ident(feature_name)
+        if not partition_by:
+            return data.project(f"*, {sql_literal(rows[0][-1] if rows else None)} AS {quoted_feature}")
+
+        taken = set(data.columns) | {feature_name}
+        rn = pick_helper_column_name(taken=taken)
+        helpers: list[str] = []
+        for _ in partition_by:
+            helpers.append(pick_helper_column_name(taken=taken | {rn, *helpers}))
+        fitted_columns = {helper: [row[i] for row in rows] for i, helper in enumerate(helpers)}
+        fitted_columns[feature_name] = [row[-1] for row in rows]
+        fitted = DuckdbRelation.from_arrow(data.connection, pa.table(fitted_columns)).set_alias("fitted_rows")
+
+        condition = " AND ".join(
+            f"(data_rows.{quote_ident(col)} = fitted_rows.{quote_ident(helper)} "
+            f"OR (data_rows.{quote_ident(col)} IS NULL AND fitted_rows.{quote_ident(helper)} IS NULL))"
+            for col, helper in zip(partition_by, helpers)
+        )
+        joined = data.with_row_number(rn).set_alias("data_rows").join(fitted, condition, how="left")
+        keep = ", ".join(quote_ident(col) for col in [*data.columns, feature_name])
+        return joined.order(quote_ident(rn)).project(keep)
@@ -141,3 +141,25 @@ def unsupported_subtype_error(
         value_label=f"{operation} subtype",
         supported_plural="subtypes",
     )
+
+
+def unsupported_framework_error(
+    framework: str,
+    supported: Iterable[str],
+    *,
+    operation: str,
+) -> ValueError:
+    """Build a ``ValueError`` describing a framework a data operation has no implementation for.
+
+    Args:
+        framework: The framework name the caller provided.
+        supported: All framework names implementing the operation.
+            Deduplicated and sorted alphabetically in the message.
+        operation: The operation name, included in the value label.
+    """
+    return _build_unsupported_value_error(
+        framework,
+        supported,
+        value_label=f"{operation} framework",
+        supported_plural="frameworks",
+    )
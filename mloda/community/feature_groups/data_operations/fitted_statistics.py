@@ -0,0 +1,188 @@
+"""Fit-once statistics for scalar_aggregate and percentile, served from a training run.
+
+``scalar_aggregate`` broadcasts a statistic of the whole column and ``percentile`` one
+of each partition. In the realtime pattern (``mloda.prepare()`` once, ``session.run()``
+per request) the statistic should describe the training data, not the few rows of a
+request. Setting the ``statistics_version`` option to a label opts a feature into that:
+
+1. A run without artifacts computes the statistic from its data, as always, and saves
+   the values in a ``StatisticsArtifact`` under the label: the global value, or one
+   ``[*partition key, value]`` row per partition.
+2. A run given that artifact (``artifacts=session.get_artifacts()``) serves the stored
+   values instead of computing: the global value is broadcast, partitioned values are
+   looked up by the row's partition key (a hash join on Polars and DuckDB, a dictionary
+   lookup elsewhere). A partition the training data did not have gets null.
+
+Refreshing is explicit: the stored values are only replaced by a run without the
+artifact. The label is checked on load, so an artifact fitted under another label (or
+for another source, statistic or ``partition_by``) raises instead of serving stale
+values; bump the label in the feature's options to require a refit. Keys and values
+must be JSON types. Features without the option compute from their data every run
+and record nothing in the artifact; a feature set where none has it saves no
+artifact at all. Backends without ``FITTED_STATISTICS_OPS``
+reject the option at match time.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from mloda.core.abstract_plugins.components.feature import Feature
+from mloda.provider import record_match_rejection
+from mloda_plugins.compute_framework.base_implementations.python_dict.python_dict_utils import row_count
+
+from mloda.community.feature_groups.data_operations.base import op_token_value, option_value
+from mloda.community.feature_groups.data_operations.json_artifact import JsonArtifact
+from mloda.community.feature_groups.data_operations.python_dict_helpers import group_key_value
+
+STATISTICS_VERSION = "statistics_version"
+"""Config key labelling the fitted statistics a feature saves and serves (opt-in).
+
+Used by: scalar_aggregate, percentile.
+"""
+
+
+class StatisticsArtifact(JsonArtifact):
+    """Fitted statistics of a feature set, keyed by feature name.
+
+    Each entry records the ``version`` label, ``source`` column, ``statistic``,
+    ``partition_by`` and ``rows``: ``[[value]]`` for a global statistic, otherwise
+    one ``[*partition key, value]`` row per partition.
+    """
+
+
+class FittedStatisticsOps:
+    """The two table operations serving fitted statistics needs, implemented once per backend."""
+
+    @classmethod
+    def rows(cls, data: Any, feature_name: str, partition_by: list[str]) -> list[list[Any]]:
+        """One ``[*partition key, value]`` row of ``feature_name`` per partition (``[[value]]`` globally)."""
+        raise NotImplementedError
+
+    @classmethod
+    def apply(cls, data: Any, feature_name: str, partition_by: list[str], rows: list[list[Any]]) -> Any:
+        """``data`` with ``feature_name`` appended, each row's value looked up in ``rows`` (null if absent)."""
+        raise NotImplementedError
+
+
+class PythonDictFittedStatistics(FittedStatisticsOps):
+    @classmethod
+    def rows(cls, data: dict[str, list[Any]], feature_name: str, partition_by: list[str]) -> list[list[Any]]:
+        key_lists = [data[col] for col in partition_by]
+        return distinct_key_rows(key_lists, data[feature_name])
+
+    @classmethod
+    def apply(
+        cls, data: dict[str, list[Any]], feature_name: str, partition_by: list[str], rows: list[list[Any]]
+    ) -> dict[str, list[Any]]:
+        result = dict(data)
+        result[feature_name] = lookup_values([data[col] for col in partition_by], rows, row_count(data))
+        return result
+
+
+def statistics_version(feature: Feature) -> str | None:
+    """The ``statistics_version`` label of ``feature``, or None when it computes every run."""
+    return option_value(feature.options, STATISTICS_VERSION, op_token_value)
+
+
+def fitted_statistics_supported(feature_group: type[Any], options: Any) -> bool:
+    """False (with a recorded rejection) when ``statistics_version`` is set but the backend cannot serve it."""
+    if options.get(STATISTICS_VERSION) is None or getattr(feature_group, "FITTED_STATISTICS_OPS", None) is not None:
+        return True
+    record_match_rejection(
+        feature_group.get_class_name(),
+        f"option '{STATISTICS_VERSION}' is set but this compute framework does not serve fitted statistics",
+    )
+    return False
+
+
+def compute_with_fitted_statistics(
+    ops: type[FittedStatisticsOps] | None,
+    fitted: Any,
+    saved: dict[str, Any] | None,
+    data: Any,
+    feature: Feature,
+    source_col: str,
+    statistic: Any,
+    partition_by: list[str],
+    compute: Callable[[Any], Any],
+) -> Any:
+    """Serve ``feature`` from ``fitted``, or ``compute`` it and record its rows in ``saved``.
+
+    ``fitted`` is the loaded artifact (None when the run fits) and ``saved`` the entries
+    the run saves (None when mloda requested no artifact). A feature without
+    ``statistics_version`` is always computed and never recorded.
+    """
+    version = statistics_version(feature)
+    if version is None:
+        return compute(data)
+    feature_name = feature.name
+    if ops is None:
+        raise ValueError(
+            f"{feature_name!r}: this compute framework cannot serve fitted statistics ({STATISTICS_VERSION!r})."
+        )
+    if fitted is not None:
+        rows = fitted_rows(fitted, feature_name, version, source_col, statistic, partition_by)
+        return ops.apply(data, feature_name, partition_by, rows)
+    result = compute(data)
+    if saved is not None:
+        rows = ops.rows(result, feature_name, partition_by)
+        saved[feature_name] = statistic_entry(version, source_col, statistic, partition_by, rows)
+    return result
+
+
+def statistic_entry(
+    version: str, source_col: str, statistic: Any, partition_by: list[str], rows: list[list[Any]]
+) -> dict[str, Any]:
+    """The artifact entry of one feature."""
+    return {
+        "version": version,
+        "source": source_col,
+        "statistic": statistic,
+        "partition_by": list(partition_by),
+        "rows": rows,
+    }
+
+
+def fitted_rows(
+    fitted: Any, feature_name: str, version: str, source_col: str, statistic: Any, partition_by: list[str]
+) -> list[list[Any]]:
+    """The rows ``fitted`` stores for ``feature_name``, checked against its label and statistic."""
+    entry = fitted.get(feature_name) if isinstance(fitted, dict) else None
+    if entry is None:
+        raise ValueError(f"Statistics artifact has no entry for feature '{feature_name}'.")
+    if entry.get("version") != version:
+        raise ValueError(
+            f"Statistics artifact for feature '{feature_name}' was fitted as version {entry.get('version')!r}, "
+            f"but the feature requests {STATISTICS_VERSION}={version!r}. Run without the artifact to refit."
+        )
+    stored = (entry.get("source"), entry.get("statistic"), entry.get("partition_by"))
+    if stored != (source_col, statistic, list(partition_by)):
+        raise ValueError(
+            f"Statistics artifact for feature '{feature_name}' was fitted for source/statistic/partition_by "
+            f"{stored}, but the feature requests {(source_col, statistic, list(partition_by))}."
+        )
+    rows: list[list[Any]] = entry.get("rows", [])
+    return rows
+
+
+def distinct_key_rows(key_lists: list[list[Any]], values: list[Any]) -> list[list[Any]]:
+    """One ``[*key, value]`` row per distinct key of ``key_lists``, in first-appearance order."""
+    seen: set[Hashable] = set()
+    rows: list[list[Any]] = []
+    for i, value in enumerate(values):
+        key = [col[i] for col in key_lists]
+        group = tuple(group_key_value(v) for v in key)
+        if group not in seen:
+            seen.add(group)
+            rows.append([*key, value])
+        if not key_lists:
+            break
+    return rows
+
+
+def lookup_values(key_lists: list[list[Any]], rows: list[list[Any]], num_rows: int) -> list[Any]:
+    """Each row's value under its key in ``rows``; None where ``rows`` has no such key."""
+    lookup = {tuple(group_key_value(v) for v in row[:-1]): row[-1] for row in rows}
+    return [lookup.get(tuple(group_key_value(col[i]) for col in key_lists)) for i in range(num_rows)]
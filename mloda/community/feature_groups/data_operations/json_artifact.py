@@ -0,0 +1,61 @@
+"""JSON artifacts for feature groups that fit on training data and serve the fit later.
+
+Binning (``BinEdgesArtifact``) and scalar_aggregate/percentile (``StatisticsArtifact``)
+save what they fitted as a JSON string, so an artifact from ``session.get_artifacts()``
+can be persisted as-is and passed back to a later run with ``artifacts=``. The fitted
+content is a dict keyed by feature name; its values must be JSON types.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from mloda.provider import BaseArtifact, FeatureSet
+
+
+class JsonArtifact(BaseArtifact):
+    """Saves the fitted dict as a JSON string; loads that string or the equivalent dict."""
+
+    @classmethod
+    def custom_saver(cls, features: FeatureSet, artifact: Any) -> Any:
+        if artifact is None:
+            return None
+        try:
+            return json.dumps(artifact, sort_keys=True)
+        except TypeError as error:
+            raise ValueError(f"{cls.get_class_name()} can only hold JSON values: {error}") from error
+
+    @classmethod
+    def custom_loader(cls, features: FeatureSet) -> Any:
+        return load_json_artifact(features)
+
+
+def load_json_artifact(features: FeatureSet) -> Any:
+    """The fitted dict ``features`` should load, or None when the run fits.
+
+    Reads the feature set's own options rather than every feature's: a run given
+    ``artifacts=`` sets the artifact on those alone, so ``BaseArtifact.load``, which
+    requires all features of the set to carry it, rejects a set of several features.
+    """
+    if features.artifact_to_load is None or features.options is None:
+        return None
+    stored = features.options.get(features.artifact_to_load)
+    if stored is None:
+        raise ValueError(f"No artifact found for '{features.artifact_to_load}'.")
+    if isinstance(stored, str):
+        return json.loads(stored)
+    return stored
+
+
+def save_json_artifact(features: FeatureSet, fitted: dict[str, Any] | None) -> None:
+    """Hand the entries in ``fitted`` to mloda to save, or withdraw the request when there are none.
+
+    mloda requests an artifact for every feature set of a group that declares one and
+    raises if none is handed back, so a set whose features did not opt in clears
+    ``artifact_to_save`` instead of saving an empty dict.
+    """
+    if fitted:
+        features.save_artifact = fitted
+    elif features.artifact_to_save is not None:
+        features.artifact_to_save = None
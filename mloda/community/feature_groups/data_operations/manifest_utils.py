@@ -10,13 +10,24 @@ every optional framework is installed. ``load_plugin_classes`` imports each
 backend individually and drops only the backends whose optional framework is
 absent, while still raising on any other import error (so typos and real
 breakage stay loud). See issue #271.
+
+``LazyPluginManifest`` is the import-free manifest format: it declares
+``(module, class, framework)`` triples statically and imports nothing until a
+class is requested. Importing a manifest is therefore cheap, but mloda's
+entry-point loader iterates every manifest, and iteration resolves every
+installed backend: by default a loader run still imports all frameworks, only
+later. Setting ``MLODA_DATA_OPERATIONS_FRAMEWORKS`` (comma-separated compute
+framework names, e.g. ``PandasDataFrame,PyArrowTable``) limits iteration, and so
+the loader, to those frameworks' backends. ``resolve(frameworks)`` does the same
+for callers that register classes themselves.
 """
 
 from __future__ import annotations
 
 import importlib
-from collections.abc import Iterable
-from typing import Any
+import os
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any, NamedTuple, overload
 
 # Optional third-party roots a data_operations backend may top-import (a framework
 # or one of its transitive deps, e.g. numpy via pandas). A missing import whose
@@ -24,6 +35,15 @@ from typing import Any
 # other ModuleNotFoundError is a real error and re-raised.
 _OPTIONAL_BACKENDS = frozenset({"pandas", "polars", "duckdb", "pyarrow", "numpy"})
 
+# Comma-separated compute framework names that iterating a LazyPluginManifest resolves.
+FRAMEWORKS_ENV_VAR = "MLODA_DATA_OPERATIONS_FRAMEWORKS"
+
+
+def _frameworks_from_env() -> tuple[str, ...] | None:
+    """Framework names from ``FRAMEWORKS_ENV_VAR``; None (every framework) when unset or empty."""
+    names = tuple(name.strip() for name in os.environ.get(FRAMEWORKS_ENV_VAR, "").split(",") if name.strip())
+    return names or None
+
 
 def load_plugin_classes(package: str, specs: Iterable[tuple[str, str]]) -> list[type[Any]]:
     """Import ``(submodule, class_name)`` pairs under ``package``.
@@ -42,3 +62,78 @@ def load_plugin_classes(package: str, specs: Iterable[tuple[str, str]]) -> list[
             raise
         classes.append(getattr(module, class_name))
     return classes
+
+
+class PluginSpec(NamedTuple):
+    """One backend of a plugin package: ``class_name`` in ``package.module``, built for ``framework``.
+
+    ``framework`` is the compute framework class name (``ComputeFramework.__name__``,
+    e.g. ``"PandasDataFrame"``), as used by ``DataOperationsCatalog``.
+    """
+
+    module: str
+    class_name: str
+    framework: str
+
+
+class LazyPluginManifest(Sequence[type[Any]]):
+    """Entry-point manifest that declares its backends statically and imports them on demand.
+
+    Behaves as the sequence of resolved plugin classes (resolved on first access,
+    skipping backends whose optional framework is missing), so mloda's entry-point
+    loader consumes it like a list. The sequence holds the backends of the
+    frameworks named in ``FRAMEWORKS_ENV_VAR``, or every backend when it is unset.
+    """
+
+    def __init__(self, package: str, specs: Iterable[tuple[str, str, str]]) -> None:
+        self._package = package
+        self._specs = tuple(PluginSpec(*spec) for spec in specs)
+        self._classes: list[type[Any]] | None = None
+        self._classes_frameworks: tuple[str, ...] | None = None
+
+    @property
+    def specs(self) -> tuple[PluginSpec, ...]:
+        return self._specs
+
+    @property
+    def frameworks(self) -> tuple[str, ...]:
+        """The declared compute framework names, in spec order."""
+        return tuple(dict.fromkeys(spec.framework for spec in self._specs))
+
+    def resolve(self, frameworks: Iterable[str] | None = None) -> list[type[Any]]:
+        """Import and return the classes of ``frameworks`` (all when None), matched case-insensitively.
+
+        Backends whose optional framework is not installed are skipped, as in
+        ``load_plugin_classes``.
+        """
+        if frameworks is None:
+            specs: Iterable[PluginSpec] = self._specs
+        else:
+            wanted = {framework.casefold() for framework in frameworks}
+            specs = [spec for spec in self._specs if spec.framework.casefold() in wanted]
+        return load_plugin_classes(self._package, ((spec.module, spec.class_name) for spec in specs))
+
+    def _resolved(self) -> list[type[Any]]:
+        frameworks = _frameworks_from_env()
+        if self._classes is None or frameworks != self._classes_frameworks:
+            self._classes = self.resolve(frameworks)
+            self._classes_frameworks = frameworks
+        return self._classes
+
+    @overload
+    def __getitem__(self, index: int) -> type[Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[type[Any]]: ...
+
+    def __getitem__(self, index: int | slice) -> type[Any] | list[type[Any]]:
+        return self._resolved()[index]
+
+    def __len__(self) -> int:
+        return len(self._resolved())
+
+    def __iter__(self) -> Iterator[type[Any]]:
+        return iter(self._resolved())
+
+    def __repr__(self) -> str:
+        return f"LazyPluginManifest({self._package!r}, {[tuple(spec) for spec in self._specs]!r})"
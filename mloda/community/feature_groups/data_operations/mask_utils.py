@@ -11,7 +11,10 @@ Provides mask-building strategies matched to framework capabilities:
    then wraps them in a ``CASE WHEN ... THEN source END`` expression.
 
 Apply helpers ``apply_polars_mask`` and ``apply_pyarrow_mask`` build on
-the above to create masked columns in framework-specific ways.
+the above to create masked columns in framework-specific ways; their
+``*_columns`` variants (plus ``apply_pandas_mask_columns``) mask several
+source columns with one mask evaluation, for the fused multi-feature
+aggregation paths.
 """
 
 from __future__ import annotations
@@ -21,6 +24,8 @@ from typing import Any
 from mloda.core.abstract_plugins.components.mask.base_mask_engine import BaseMaskEngine
 from mloda_plugins.compute_framework.base_implementations.sql.sql_utils import quote_ident
 
+from mloda.community.feature_groups.data_operations.helper_columns import unique_helper_name
+
 MASK_KEY = "mask"
 
 _SUPPORTED_OPS: frozenset[str] = frozenset(
@@ -167,6 +172,33 @@ def apply_polars_mask(
     return data, _POLARS_MASK_TMP
 
 
+def apply_polars_mask_columns(
+    data: Any,
+    source_cols: list[str],
+    mask_spec: list[tuple[str, str, Any]],
+    taken: set[str],
+) -> tuple[Any, dict[str, str]]:
+    """Apply one mask spec to several source columns of a Polars LazyFrame.
+
+    Adds one masked temp column per distinct source, named collision-free against
+    *taken* and the frame's own columns, in a single ``with_columns``. Returns
+    ``(data_with_masks, masked_names)`` where *masked_names* maps each source column
+    to its temp column. Callers must drop the temp columns from the result when done.
+    """
+    import polars as pl
+
+    mask_expr = build_polars_mask_expr(mask_spec)
+    used = set(taken) | set(data.collect_schema().names())
+    masked_names: dict[str, str] = {}
+    exprs = []
+    for source_col in dict.fromkeys(source_cols):
+        tmp = unique_helper_name(_POLARS_MASK_TMP, used)
+        used.add(tmp)
+        masked_names[source_col] = tmp
+        exprs.append(pl.when(mask_expr).then(pl.col(source_col)).otherwise(None).alias(tmp))
+    return data.with_columns(exprs), masked_names
+
+
 def apply_pyarrow_mask(
     table: Any,
     source_col: str,
@@ -177,6 +209,20 @@ def apply_pyarrow_mask(
     Returns the table with the *source_col* column replaced so that rows
     not matching the mask have null values.
     """
+    return apply_pyarrow_mask_columns(table, [source_col], mask_spec)
+
+
+def apply_pyarrow_mask_columns(
+    table: Any,
+    source_cols: list[str],
+    mask_spec: list[tuple[str, str, Any]],
+) -> Any:
+    """Apply one mask spec to several columns of a PyArrow table.
+
+    The mask is evaluated once against the unmasked *table*, then every column in
+    *source_cols* is replaced so that rows not matching the mask are null. Evaluating
+    once matters when a mask condition reads one of the masked columns itself.
+    """
     import pyarrow as pa
     import pyarrow.compute as pc
 
@@ -184,11 +230,34 @@ def apply_pyarrow_mask(
         PyArrowMaskEngine,
     )
 
-    mask = build_mask_from_spec(PyArrowMaskEngine, table, mask_spec)
-    null_scalar = pa.scalar(None, type=table.schema.field(source_col).type)
-    masked_col = pc.if_else(pc.fill_null(mask, False), table.column(source_col), null_scalar)
-    col_idx = table.schema.get_field_index(source_col)
-    return table.set_column(col_idx, source_col, masked_col)
+    mask = pc.fill_null(build_mask_from_spec(PyArrowMaskEngine, table, mask_spec), False)
+    masked_cols = {}
+    for source_col in dict.fromkeys(source_cols):
+        null_scalar = pa.scalar(None, type=table.schema.field(source_col).type)
+        masked_cols[source_col] = pc.if_else(mask, table.column(source_col), null_scalar)
+    for source_col, masked_col in masked_cols.items():
+        col_idx = table.schema.get_field_index(source_col)
+        table = table.set_column(col_idx, source_col, masked_col)
+    return table
+
+
+def apply_pandas_mask_columns(
+    df: Any,
+    source_cols: list[str],
+    mask_spec: list[tuple[str, str, Any]],
+) -> Any:
+    """Return a new DataFrame with each of *source_cols* nulled where the mask is False.
+
+    The mask is evaluated once against the unmasked *df*; *df* itself is not modified.
+    """
+    from mloda_plugins.compute_framework.base_implementations.pandas.pandas_mask_engine import (
+        PandasMaskEngine,
+    )
+
+    from mloda.community.feature_groups.data_operations.pandas_helpers import with_columns
+
+    mask = build_mask_from_spec(PandasMaskEngine, df, mask_spec)
+    return with_columns(df, {source_col: df[source_col].where(mask) for source_col in dict.fromkeys(source_cols)})
 
 
 def build_sql_case_when(
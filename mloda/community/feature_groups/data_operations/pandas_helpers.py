@@ -2,16 +2,24 @@
 
 Centralizes the dropna=False and min_count=1 patterns so that every
 pandas-based aggregation feature group handles null keys and all-null
-groups consistently.
+groups consistently, the copy-free way the row-preserving backends
+attach their output columns (``with_columns``, ``narrow_frame``), and the
+partition-key factorization they share within a FeatureSet
+(``partition_grouping``).
 """
 
 from __future__ import annotations
 
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
+from mloda.community.feature_groups.data_operations.fitted_statistics import FittedStatisticsOps, lookup_values
 from mloda.community.feature_groups.data_operations.helper_columns import unique_helper_name
+from mloda.community.feature_groups.data_operations.recurrence_state import StateFrameOps
+from mloda.community.feature_groups.data_operations.sharded_execution import ShardFrameOps, ShardPlan
+from mloda.community.feature_groups.data_operations.sort_cache import Grouping, cached_grouping
 
 # Pandas frequency aliases for fixed-freq dt floor/ceil/round.
 FIXED_FREQ_ALIASES: dict[str, str] = {
@@ -40,6 +48,34 @@ PANDAS_AGG_FUNCS: dict[str, str] = {
 }
 
 
+def with_columns(data: pd.DataFrame, columns: dict[str, Any]) -> pd.DataFrame:
+    """*data* plus *columns*, without copying the columns *data* already has.
+
+    A shallow copy shares every column buffer with *data* (under pandas
+    Copy-on-Write a buffer is only copied if one side later writes to it).
+    Setting a column replaces it in the copy alone, so *data* is never
+    modified. ``data.copy()`` would instead duplicate the whole frame for
+    every feature computed on it, and ``DataFrame.assign`` does the same
+    on pandas versions without Copy-on-Write.
+    """
+    result = data.copy(deep=False)
+    for name, values in columns.items():
+        result[name] = values
+    return result
+
+
+def narrow_frame(data: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
+    """The *columns* of *data* (each once) on a fresh ``RangeIndex``.
+
+    Backends that sort to compute work on this frame rather than on *data*,
+    so the sort only reorders the columns the computation reads. The index
+    holds each row's input position: ``sort_index()`` on a result computed
+    from the sorted frame restores input order, after which it is attached
+    to *data* with ``with_columns`` (``set_axis(data.index)``).
+    """
+    return data[list(dict.fromkeys(columns))].reset_index(drop=True)
+
+
 def null_safe_groupby(df: Any, partition_by: list[str], col: str) -> Any:
     """Group *df* by *partition_by* keeping null keys, then select *col*.
 
@@ -51,9 +87,50 @@ def null_safe_groupby(df: Any, partition_by: list[str], col: str) -> Any:
     return df.groupby(by, dropna=False)[col]
 
 
-# Pandas groupby.agg("std") / .transform("std") always uses ddof=1.
-# There is no way to pass ddof through the string-based API, so we
-# intercept std/var operations and use a lambda wrapper instead.
+def _column_identity(series: pd.Series) -> tuple[tuple[object, ...], Any] | None:
+    """Identity of the memory behind *series*, plus the object holding it; None for other storage.
+
+    NumPy-backed columns are identified by their buffer, Arrow-backed ones by their Arrow
+    buffers. Both survive ``with_columns`` and ``narrow_frame``, which share the buffers
+    rather than copying them; the Series object itself does not.
+    """
+    if isinstance(series.dtype, np.dtype):
+        values = series.to_numpy()
+        address = values.__array_interface__["data"][0]
+        return ("numpy", str(values.dtype), address, values.shape, values.strides), values
+    if isinstance(series.array, pd.arrays.ArrowExtensionArray):
+        # Imported here: an Arrow-backed column implies pyarrow, which pandas alone does not.
+        from mloda.community.feature_groups.data_operations.pyarrow_helpers import array_identity
+
+        arrow = series.array.__arrow_array__()
+        return ("arrow", array_identity(arrow)), arrow
+    return None
+
+
+def partition_grouping(data: pd.DataFrame, partition_by: list[str]) -> Grouping:
+    """The group number of every row of *data* under *partition_by* (null keys kept), and group sizes.
+
+    Goes through the active ``sort_permutation_scope`` cache, so the features of one
+    FeatureSet factorize the same partition columns once; each then groups by
+    ``codes`` (``series.groupby(grouping.codes)``), whose groups are numbered as
+    ``codes`` numbers them. Both arrays are int64.
+    """
+
+    def compute() -> Grouping:
+        grouped = data.groupby(list(partition_by), dropna=False)
+        codes = grouped.ngroup().to_numpy(dtype=np.int64)
+        sizes = np.bincount(codes, minlength=grouped.ngroups).astype(np.int64)
+        return Grouping(codes, sizes, codes.nbytes + sizes.nbytes)
+
+    identities = [_column_identity(data[col]) for col in partition_by]
+    if any(identity is None for identity in identities):
+        return compute()
+    key = ("pandas_grouping", tuple(identity[0] for identity in identities if identity is not None))
+    pins = tuple(identity[1] for identity in identities if identity is not None)
+    return cached_grouping(key, pins, compute)
+
+
+# ddof of every std/var variant; ``grouped_variance`` computes them all.
 _DDOF_BY_AGG_TYPE: dict[str, int] = {
     "std": 0,
     "var": 0,
@@ -64,6 +141,35 @@ _DDOF_BY_AGG_TYPE: dict[str, int] = {
 }
 
 
+def grouped_variance(grouped: Any, ddof: int, *, sqrt: bool = False, method: str = "agg") -> pd.Series:
+    """Variance (or with *sqrt* the standard deviation) of each group, with *ddof*.
+
+    Two vectorized passes instead of a Python callable per group: the grouped
+    mean, then the grouped sum of squared deviations from it, divided by
+    ``count - ddof``. Subtracting the group mean before squaring keeps the
+    result accurate for values with a large offset, where ``sum(x**2)`` and
+    ``sum(x)**2`` would cancel. Groups with ``count <= ddof`` (and all-null
+    groups) are NaN, as in ``Series.var(ddof=ddof)``.
+
+    *method* ``"agg"`` returns one value per group, shaped like
+    ``grouped.count()``; ``"transform"`` broadcasts it to the rows of
+    ``grouped.obj``.
+    """
+    values = grouped.obj
+    group_ids = grouped.ngroup().to_numpy()
+    squared = (values - grouped.transform("mean")) ** 2
+    sum_squared = squared.groupby(group_ids).sum().to_numpy(dtype="float64", na_value=np.nan)
+    count = grouped.count()
+    denominator = count.to_numpy(dtype="float64") - ddof
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = np.where(denominator > 0, sum_squared / denominator, np.nan)
+    if sqrt:
+        result = np.sqrt(result)
+    if method == "transform":
+        return pd.Series(result[group_ids], index=values.index, name=values.name)
+    return pd.Series(result, index=count.index, name=count.name)
+
+
 def apply_null_safe_agg(
     grouped: Any,
     pandas_func: str,
@@ -76,18 +182,13 @@ def apply_null_safe_agg(
     When *agg_type* is ``"sum"``, ``min_count=1`` is forwarded so that
     all-NaN groups return NaN rather than 0.
 
-    When *agg_type* is a std/var variant, a lambda wrapper is used to
-    pass the correct ``ddof`` (0 for population, 1 for sample) because
-    the string-based pandas API does not support a ddof parameter.
+    When *agg_type* is a std/var variant, ``grouped_variance`` computes it
+    with the correct ``ddof`` (0 for population, 1 for sample), which the
+    string-based pandas API has no parameter for.
     """
     ddof = _DDOF_BY_AGG_TYPE.get(agg_type)
     if ddof is not None:
-        _ddof: int = ddof
-
-        def func(x: Any, _d: int = _ddof, _f: str = pandas_func) -> Any:
-            return getattr(x, _f)(ddof=_d)
-
-        return getattr(grouped, method)(func)
+        return grouped_variance(grouped, ddof, sqrt=pandas_func == "std", method=method)
 
     kwargs: dict[str, Any] = {}
     if agg_type == "sum":
@@ -148,3 +249,86 @@ def compute_mode_winners(
     # tripping the pandas 2.x FutureWarning / pandas 3.0 dtype reconciliation.
     winners[source_col] = winners[source_col].astype(object)
     return winners
+
+
+class PandasStateFrame(StateFrameOps):
+    """``StateFrameOps`` for pandas: NaN/NaT read as None; seed rows keep each column's dtype where they can."""
+
+    @classmethod
+    def select(cls, data: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
+        return data[columns]
+
+    @classmethod
+    def to_lists(cls, frame: pd.DataFrame, columns: list[str]) -> dict[str, list[Any]]:
+        lists: dict[str, list[Any]] = {}
+        for col in columns:
+            series = frame[col]
+            lists[col] = series.astype(object).where(series.notna(), None).tolist()
+        return lists
+
+    @classmethod
+    def prepend(cls, frame: pd.DataFrame, rows: dict[str, list[Any]]) -> pd.DataFrame:
+        # An all-null seed column takes the frame column's dtype rather than object, so the
+        # concatenation neither changes the column's dtype nor warns about all-NA entries.
+        seed = pd.DataFrame(
+            {
+                col: pd.Series(rows[col], dtype=frame[col].dtype)
+                if all(v is None for v in rows[col])
+                else pd.Series(rows[col])
+                for col in frame.columns
+            }
+        )
+        return pd.concat([seed, frame], ignore_index=True)
+
+    @classmethod
+    def with_column(cls, data: pd.DataFrame, name: str, values: list[Any], like: pd.DataFrame) -> pd.DataFrame:
+        return with_columns(data, {name: pd.Series(values, index=data.index, dtype=like[name].dtype)})
+
+
+class PandasShardFrame(ShardFrameOps):
+    """``ShardFrameOps`` for pandas; groups come back sorted by key, nulls last, as ``groupby`` sorts them."""
+
+    @classmethod
+    def plan(cls, data: pd.DataFrame, partition_by: list[str], shards: int) -> ShardPlan:
+        # hash_pandas_object hashes None and NaN alike, as groupby(dropna=False) groups them.
+        hashes = pd.util.hash_pandas_object(data[partition_by], index=False).to_numpy()
+        shard_ids = hashes % np.uint64(shards)
+        row_lists = [np.flatnonzero(shard_ids == shard) for shard in range(shards)]
+        return ShardPlan([rows for rows in row_lists if len(rows)])
+
+    @classmethod
+    def take(cls, data: pd.DataFrame, rows: np.ndarray) -> pd.DataFrame:
+        return data.iloc[rows].reset_index(drop=True)
+
+    @classmethod
+    def stitch_rows(cls, data: pd.DataFrame, parts: list[pd.DataFrame], plan: ShardPlan) -> pd.DataFrame:
+        order = np.concatenate(plan.row_lists)
+        inverse = np.empty_like(order)
+        inverse[order] = np.arange(len(order))
+        result = pd.concat(parts, ignore_index=True).iloc[inverse]
+        result.index = data.index
+        return result
+
+    @classmethod
+    def concat_groups(cls, parts: list[pd.DataFrame], partition_by: list[str], plan: ShardPlan) -> pd.DataFrame:
+        result = pd.concat(parts, ignore_index=True)
+        return result.sort_values(partition_by, na_position="last", kind="stable").reset_index(drop=True)
+
+
+class PandasFittedStatistics(FittedStatisticsOps):
+    """``FittedStatisticsOps`` for pandas; NaN/NaT read as None, partitioned values are a dictionary lookup."""
+
+    @classmethod
+    def rows(cls, data: pd.DataFrame, feature_name: str, partition_by: list[str]) -> list[list[Any]]:
+        columns = [*partition_by, feature_name]
+        frame = data[columns].drop_duplicates(subset=partition_by) if partition_by else data[columns].head(1)
+        lists = PandasStateFrame.to_lists(frame, columns)
+        return [list(row) for row in zip(*(lists[col] for col in columns))]
+
+    @classmethod
+    def apply(
+        cls, data: pd.DataFrame, feature_name: str, partition_by: list[str], rows: list[list[Any]]
+    ) -> pd.DataFrame:
+        key_lists = list(PandasStateFrame.to_lists(data, partition_by).values())
+        values = pd.Series(lookup_values(key_lists, rows, len(data)), index=data.index)
+        return with_columns(data, {feature_name: values})
@@ -0,0 +1,354 @@
+"""Mergeable partial-aggregate states for the aggregation families, as Arrow tables.
+
+The aggregation backends reduce a whole column to final values in one pass. This module
+splits that pass in three, so a table can be aggregated in chunks (or on several
+workers, e.g. behind an Arrow Flight server) and the pieces combined exactly:
+
+- ``partial_aggregate(table, partition_by, requests)`` reduces one chunk to a *state*:
+  the partition keys plus a few state columns per request, one row per partition;
+- ``merge_partials(states)`` combines states into one; its output merges again;
+- ``finalize_partials(state)`` turns a state into one value column per request, typed
+  as ``PyArrowAggregation`` types it, and ``broadcast_partials(state, table)`` spreads
+  those values over the rows of ``table``, the window-aggregation shape.
+
+A state is a plain ``pa.Table`` whose schema metadata records its partition keys,
+requests and ``order_by``, so it survives Arrow IPC, Parquet or Flight unchanged. Its
+state columns are named ``{feature_name}.{field}``:
+
+- ``count``: ``count``; ``sum``: ``sum``; ``avg``/``mean``: ``sum`` and ``count``;
+- ``min``/``max``: ``min``/``max``;
+- ``std``/``var`` and their ``_pop``/``_samp`` forms: ``count``, ``mean`` and ``m2``
+  (the sum of squared deviations), merged with the parallel update of Chan et al.;
+- ``nunique``: ``distinct``, the list of distinct non-null values (exact, not a sketch);
+- ``first``/``last``: ``value``, the first/last non-null value, plus ``order``, its
+  ``order_by`` value, when the state was built with ``order_by``. Without ``order_by``
+  "first" means first in row order, and states must be merged in chunk order.
+
+Counts, integer sums, min/max, distinct sets and first/last merge exactly; float sums
+and moments merge up to rounding. ``median`` and ``mode`` have no bounded state and are
+rejected.
+"""
+
+from __future__ import annotations
+
+import json
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from mloda.community.feature_groups.data_operations.aggregation_base import AggregationRequest
+from mloda.community.feature_groups.data_operations.errors import unsupported_agg_type_error
+from mloda.community.feature_groups.data_operations.helper_columns import unique_helper_name
+from mloda.community.feature_groups.data_operations.pyarrow_helpers import (
+    broadcast_group_values,
+    fused_group_by,
+    row_positions,
+    scatter_to_rows,
+)
+
+_METADATA_KEY = b"mloda.partial_aggregation"
+
+# State fields per agg_type; first/last add ``order`` when the state has an order_by.
+_STATE_FIELDS: dict[str, tuple[str, ...]] = {
+    "count": ("count",),
+    "sum": ("sum",),
+    "avg": ("sum", "count"),
+    "mean": ("sum", "count"),
+    "min": ("min",),
+    "max": ("max",),
+    "nunique": ("distinct",),
+    "first": ("value",),
+    "last": ("value",),
+}
+
+# Variance/stddev operations mapped to (is stddev, ddof).
+_VARIANCE_FUNCS: dict[str, tuple[bool, int]] = {
+    "std": (True, 0),
+    "var": (False, 0),
+    "std_pop": (True, 0),
+    "std_samp": (True, 1),
+    "var_pop": (False, 0),
+    "var_samp": (False, 1),
+}
+
+# Merge function of the state fields merged by one plain aggregation.
+_MERGE_FUNCS: dict[str, str] = {"count": "sum", "sum": "sum", "min": "min", "max": "max"}
+
+MERGEABLE_AGG_TYPES: frozenset[str] = frozenset({*_STATE_FIELDS, *_VARIANCE_FUNCS})
+
+_ORDERED = ("first", "last")
+_NULL_INT = pa.scalar(None, type=pa.int64())
+_NULL_FLOAT = pa.scalar(None, type=pa.float64())
+
+Aggregation = tuple[str, str, "pc.FunctionOptions | None"]
+
+
+def partial_aggregate(
+    table: pa.Table,
+    partition_by: list[str],
+    requests: list[AggregationRequest],
+    order_by: str | None = None,
+) -> pa.Table:
+    """Reduce ``table`` to a mergeable state, one row per partition.
+
+    ``order_by`` orders ``first``/``last``: ascending, nulls last, ties in row order.
+    """
+    for request in requests:
+        if request.agg_type not in MERGEABLE_AGG_TYPES:
+            raise unsupported_agg_type_error(
+                request.agg_type, MERGEABLE_AGG_TYPES, framework="PyArrow", operation="partial aggregation"
+            )
+    if order_by is not None and any(request.agg_type in _ORDERED for request in requests):
+        table = table.take(pc.sort_indices(table.column(order_by), null_placement="at_end"))
+
+    taken = set(table.column_names)
+    work, positions = _with_row_positions(table, taken)
+    aggregations: list[Aggregation] = []
+    for request in requests:
+        col, agg = request.source_col, request.agg_type
+        if agg in _VARIANCE_FUNCS:
+            aggregations += [(col, "count", None), (col, "mean", None), (col, "variance", pc.VarianceOptions(ddof=0))]
+        elif agg == "nunique":
+            aggregations.append((col, "distinct", pc.CountOptions(mode="only_valid")))
+        elif agg in _ORDERED:
+            work = _append_valid_positions(work, taken, work.column(col), positions, agg, aggregations)
+        else:
+            aggregations += [(col, field, None) for field in _STATE_FIELDS[agg]]
+
+    grouped, outputs = fused_group_by(work, partition_by, aggregations)
+    output = iter(outputs)
+    names, columns = _key_columns(grouped, partition_by)
+    for request in requests:
+        name, agg = request.feature_name, request.agg_type
+        if agg in _VARIANCE_FUNCS:
+            count, mean, variance = (grouped.column(next(output)) for _ in range(3))
+            m2 = pc.multiply(pc.fill_null(variance, 0.0), pc.cast(count, pa.float64()))
+            columns += [count, pc.cast(mean, pa.float64()), m2]
+            names += [f"{name}.count", f"{name}.mean", f"{name}.m2"]
+        elif agg in _ORDERED:
+            picked = grouped.column(next(output))
+            columns.append(pc.take(work.column(request.source_col), picked))
+            names.append(f"{name}.value")
+            if order_by is not None:
+                columns.append(pc.take(work.column(order_by), picked))
+                names.append(f"{name}.order")
+        else:
+            columns += [grouped.column(next(output)) for _ in _STATE_FIELDS[agg]]
+            names += [f"{name}.{field}" for field in _STATE_FIELDS[agg]]
+    return _state_table(columns, names, partition_by, requests, order_by)
+
+
+def merge_partials(states: list[pa.Table]) -> pa.Table:
+    """Combine states built by ``partial_aggregate`` (or by earlier merges) with one spec."""
+    if not states:
+        raise ValueError("merge_partials needs at least one state.")
+    spec = _read_spec(states[0])
+    if any(_read_spec(state) != spec for state in states[1:]):
+        raise ValueError("merge_partials: all states must share partition_by, requests and order_by.")
+    partition_by, requests, order_by = spec
+
+    combined = pa.concat_tables([state.replace_schema_metadata(None) for state in states])
+    taken = set(combined.column_names)
+    work, positions = _with_row_positions(combined, taken)
+    aggregations: list[Aggregation] = [(positions, "list", None)]
+    sorted_rows: dict[str, pa.Array] = {}
+    for request in requests:
+        name, agg = request.feature_name, request.agg_type
+        if agg in _VARIANCE_FUNCS:
+            weighted = unique_helper_name(f"__mloda_partial_weighted_{name}__", taken)
+            taken.add(weighted)
+            work = work.append_column(
+                weighted, pc.multiply(pc.cast(work.column(f"{name}.count"), pa.float64()), work.column(f"{name}.mean"))
+            )
+            aggregations += [(f"{name}.count", "sum", None), (weighted, "sum", None), (f"{name}.m2", "sum", None)]
+        elif agg in _ORDERED:
+            rank = positions
+            if order_by is not None:
+                # Ties in the order key keep chunk order, as one sort over every row would.
+                work, rank, sorted_rows[name] = _order_rank(work, taken, f"{name}.order")
+            work = _append_valid_positions(work, taken, work.column(f"{name}.value"), rank, agg, aggregations)
+        elif agg != "nunique":
+            aggregations += [(f"{name}.{field}", _MERGE_FUNCS[field], None) for field in _STATE_FIELDS[agg]]
+
+    grouped, outputs = fused_group_by(work, partition_by, aggregations)
+    output = iter(outputs)
+    row_lists = grouped.column(next(output))
+    num_groups = grouped.num_rows
+    group_of_row = broadcast_group_values(row_positions(num_groups), row_lists)
+
+    names, columns = _key_columns(grouped, partition_by)
+    for request in requests:
+        name, agg = request.feature_name, request.agg_type
+        if agg in _VARIANCE_FUNCS:
+            count, weighted_sum, m2 = (grouped.column(next(output)) for _ in range(3))
+            mean = pc.divide(weighted_sum, pc.cast(count, pa.float64()))
+            # Chan et al.: M2 = sum(M2_i) + sum(n_i * (mean_i - mean)^2).
+            deviation = pc.subtract(work.column(f"{name}.mean"), pc.take(mean, group_of_row))
+            spread = pc.multiply(pc.cast(work.column(f"{name}.count"), pa.float64()), pc.multiply(deviation, deviation))
+            spread_sum = _per_group(group_of_row, num_groups, spread, "sum", None)
+            columns += [count, mean, pc.add(pc.fill_null(m2, 0.0), pc.fill_null(spread_sum, 0.0))]
+            names += [f"{name}.count", f"{name}.mean", f"{name}.m2"]
+        elif agg == "nunique":
+            columns.append(_merge_distinct(work.column(f"{name}.distinct"), group_of_row, num_groups))
+            names.append(f"{name}.distinct")
+        elif agg in _ORDERED:
+            picked = grouped.column(next(output))
+            if name in sorted_rows:
+                picked = pc.take(sorted_rows[name], picked)
+            columns.append(pc.take(work.column(f"{name}.value"), picked))
+            names.append(f"{name}.value")
+            if order_by is not None:
+                columns.append(pc.take(work.column(f"{name}.order"), picked))
+                names.append(f"{name}.order")
+        else:
+            columns += [grouped.column(next(output)) for _ in _STATE_FIELDS[agg]]
+            names += [f"{name}.{field}" for field in _STATE_FIELDS[agg]]
+    return _state_table(columns, names, partition_by, requests, order_by)
+
+
+def finalize_partials(state: pa.Table) -> pa.Table:
+    """The partition keys followed by one final value column per request."""
+    partition_by, requests, _ = _read_spec(state)
+    names = [name for name in state.column_names if name in partition_by]
+    columns: list[pa.Array | pa.ChunkedArray] = [state.column(name) for name in names]
+    for request in requests:
+        name, agg = request.feature_name, request.agg_type
+        if agg in _VARIANCE_FUNCS:
+            as_std, ddof = _VARIANCE_FUNCS[agg]
+            dof = pc.subtract(pc.cast(state.column(f"{name}.count"), pa.float64()), float(ddof))
+            value = pc.if_else(pc.greater(dof, 0.0), pc.divide(state.column(f"{name}.m2"), dof), _NULL_FLOAT)
+            columns.append(pc.sqrt(value) if as_std else value)
+        elif agg in ("avg", "mean"):
+            count = pc.cast(state.column(f"{name}.count"), pa.float64())
+            total = pc.cast(state.column(f"{name}.sum"), pa.float64())
+            columns.append(pc.if_else(pc.greater(count, 0.0), pc.divide(total, count), _NULL_FLOAT))
+        elif agg == "nunique":
+            columns.append(pc.cast(pc.list_value_length(state.column(f"{name}.distinct")), pa.int64()))
+        else:
+            columns.append(state.column(f"{name}.{_STATE_FIELDS[agg][0]}"))
+        names.append(name)
+    return pa.table(columns, names=names)
+
+
+def broadcast_partials(state: pa.Table, table: pa.Table) -> pa.Table:
+    """``table`` with every request's final value appended to each row of its partition.
+
+    Rows are matched to state rows by the group_by's own key equality (null keys form a
+    partition); a row whose partition the state has not seen gets null.
+    """
+    partition_by, requests, _ = _read_spec(state)
+    final = finalize_partials(state)
+    num_groups = final.num_rows
+    keys = pa.concat_tables(
+        [
+            final.select(partition_by).cast(table.select(partition_by).schema),
+            table.select(partition_by),
+        ]
+    )
+    taken = set(partition_by)
+    keys, positions = _with_row_positions(keys, taken)
+    grouped, (first_row, row_lists) = fused_group_by(
+        keys, partition_by, [(positions, "min", None), (positions, "list", None)]
+    )
+    # State rows come first, so a partition's smallest row is its state row, if it has one.
+    first = grouped.column(first_row)
+    state_row = pc.if_else(pc.less(first, num_groups), first, _NULL_INT)
+    state_row_per_row = broadcast_group_values(state_row, grouped.column(row_lists)).slice(num_groups)
+    for request in requests:
+        table = table.append_column(
+            request.feature_name, pc.take(final.column(request.feature_name), state_row_per_row)
+        )
+    return table
+
+
+def _with_row_positions(table: pa.Table, taken: set[str]) -> tuple[pa.Table, str]:
+    name = unique_helper_name("__mloda_partial_row__", taken)
+    taken.add(name)
+    return table.append_column(name, row_positions(table.num_rows)), name
+
+
+def _append_valid_positions(
+    work: pa.Table,
+    taken: set[str],
+    values: pa.ChunkedArray,
+    rank: str,
+    agg: str,
+    aggregations: list[Aggregation],
+) -> pa.Table:
+    """Add the ``min``/``max`` aggregation picking each group's first/last non-null row.
+
+    ``rank`` is a column whose value orders the rows and identifies one row: the row
+    position, or the position in ``order``-sorted order.
+    """
+    masked = unique_helper_name("__mloda_partial_pick__", taken)
+    taken.add(masked)
+    work = work.append_column(masked, pc.if_else(pc.is_valid(values), work.column(rank), _NULL_INT))
+    aggregations.append((masked, "min" if agg == "first" else "max", None))
+    return work
+
+
+def _order_rank(work: pa.Table, taken: set[str], order_col: str) -> tuple[pa.Table, str, pa.Array]:
+    """Add each row's position in a stable ascending sort by ``order_col`` (nulls last).
+
+    Also returns the sort's indices, which map a position back to its row.
+    """
+    name = unique_helper_name("__mloda_partial_rank__", taken)
+    taken.add(name)
+    order = pc.cast(pc.sort_indices(work.column(order_col), null_placement="at_end"), pa.int64())
+    return work.append_column(name, scatter_to_rows(row_positions(work.num_rows), order)), name, order
+
+
+def _per_group(
+    group_of_row: pa.Array,
+    num_groups: int,
+    values: pa.Array | pa.ChunkedArray,
+    function: str,
+    options: pc.FunctionOptions | None,
+) -> pa.Array:
+    """``function`` of ``values`` per group id, one entry per group id in ``range(num_groups)``.
+
+    One null row per group id is added so that every group appears exactly once in the
+    group_by output, which is then scattered back into group id order.
+    """
+    ids = pa.chunked_array([group_of_row, row_positions(num_groups)])
+    chunks = values.chunks if isinstance(values, pa.ChunkedArray) else [values]
+    padded = pa.chunked_array([*chunks, pa.nulls(num_groups, type=values.type)], type=values.type)
+    spec = ("v", function) if options is None else ("v", function, options)
+    grouped = pa.table({"g": ids, "v": padded}).group_by("g").aggregate([spec])
+    return scatter_to_rows(grouped.column(f"v_{function}"), grouped.column("g"))
+
+
+def _merge_distinct(distinct: pa.ChunkedArray, group_of_row: pa.Array, num_groups: int) -> pa.Array:
+    """The distinct values of each group's union of ``distinct`` lists."""
+    lists = distinct.combine_chunks()
+    values = pc.list_flatten(lists)
+    owner = pc.take(group_of_row, pc.list_parent_indices(lists))
+    return _per_group(owner, num_groups, values, "distinct", pc.CountOptions(mode="only_valid"))
+
+
+def _key_columns(grouped: pa.Table, partition_by: list[str]) -> tuple[list[str], list[pa.Array | pa.ChunkedArray]]:
+    names = [name for name in grouped.column_names if name in partition_by]
+    return names, [grouped.column(name) for name in names]
+
+
+def _state_table(
+    columns: list[pa.Array | pa.ChunkedArray],
+    names: list[str],
+    partition_by: list[str],
+    requests: list[AggregationRequest],
+    order_by: str | None,
+) -> pa.Table:
+    spec = {
+        "partition_by": partition_by,
+        "order_by": order_by,
+        "requests": [[r.feature_name, r.source_col, r.agg_type] for r in requests],
+    }
+    return pa.table(columns, names=names).replace_schema_metadata({_METADATA_KEY: json.dumps(spec).encode()})
+
+
+def _read_spec(state: pa.Table) -> tuple[list[str], list[AggregationRequest], str | None]:
+    metadata = state.schema.metadata or {}
+    if _METADATA_KEY not in metadata:
+        raise ValueError("Not a partial-aggregation state: its schema metadata has no aggregation spec.")
+    spec = json.loads(metadata[_METADATA_KEY])
+    return list(spec["partition_by"]), [AggregationRequest(*r) for r in spec["requests"]], spec["order_by"]
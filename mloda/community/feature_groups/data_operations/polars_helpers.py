@@ -1,4 +1,4 @@
-"""Shared Polars duration-token helper for time bucketization and resample.
+"""Shared Polars helpers: the duration token of time bucketization and resample, and fitted statistics.
 
 Centralizes the unit-alias table and the ``(n, unit)`` -> duration string
 formatting so every Polars-based bucket/resample feature group builds the
@@ -7,6 +7,12 @@ same ``dt.truncate`` / ``dt.round`` tokens.
 
 from __future__ import annotations
 
+from typing import Any
+
+import polars as pl
+
+from mloda.community.feature_groups.data_operations.fitted_statistics import FittedStatisticsOps
+
 # Polars duration aliases for each unit. Polars' ``dt.truncate('1w')`` is
 # Monday-anchored, which matches the ISO week convention pinned by the FG.
 POLARS_UNIT_ALIASES: dict[str, str] = {
@@ -22,3 +28,32 @@ POLARS_UNIT_ALIASES: dict[str, str] = {
 def duration_token(n: int, unit: str) -> str:
     """Format the Polars duration token for ``(n, unit)`` (e.g. ``5m``, ``1d``)."""
     return f"{n}{POLARS_UNIT_ALIASES[unit]}"
+
+
+class PolarsLazyFittedStatistics(FittedStatisticsOps):
+    """``FittedStatisticsOps`` for Polars lazy frames; partitioned values are a null-safe left join."""
+
+    @classmethod
+    def rows(cls, data: pl.LazyFrame, feature_name: str, partition_by: list[str]) -> list[list[Any]]:
+        columns = [*partition_by, feature_name]
+        if partition_by:
+            frame = data.select(columns).unique(subset=partition_by, maintain_order=True)
+        else:
+            frame = data.select(columns).head(1)
+        return [list(row) for row in frame.collect().rows()]
+
+    @classmethod
+    def apply(
+        cls, data: pl.LazyFrame, feature_name: str, partition_by: list[str], rows: list[list[Any]]
+    ) -> pl.LazyFrame:
+        if not partition_by:
+            return data.with_columns(pl.lit(rows[0][-1] if rows else None).alias(feature_name))
+        schema = data.collect_schema()
+        fitted = pl.LazyFrame(
+            [
+                pl.Series(col, [row[i] for row in rows], dtype=schema[col], strict=False)
+                for i, col in enumerate(partition_by)
+            ]
+            + [pl.Series(feature_name, [row[-1] for row in rows], strict=False)]
+        )
+        return data.join(fitted, on=partition_by, how="left", nulls_equal=True, maintain_order="left")
@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 import pyarrow as pa
 import pyarrow.compute as pc
 
+from mloda.community.feature_groups.data_operations.fitted_statistics import FittedStatisticsOps, lookup_values
+from mloda.community.feature_groups.data_operations.helper_columns import unique_helper_name
+from mloda.community.feature_groups.data_operations.recurrence_state import StateFrameOps
+from mloda.community.feature_groups.data_operations.sort_cache import SortPermutation, cached_sort_permutation
+
 
 def nan_safe_not_equal(
     curr: pa.Array | pa.ChunkedArray, prev: pa.Array | pa.ChunkedArray
@@ -23,3 +30,340 @@ def nan_safe_not_equal(
         both_nan = pc.and_(pc.fill_null(pc.is_nan(curr), False), pc.fill_null(pc.is_nan(prev), False))
         result = pc.and_(result, pc.invert(both_nan))
     return result
+
+
+def partition_start_mask(sorted_partition_cols: list[pa.Array | pa.ChunkedArray], num_rows: int) -> pa.Array:
+    """Boolean mask over sorted rows, True where a row starts a new partition.
+
+    ``sorted_partition_cols`` are the partition columns already ordered so that rows of
+    one partition are contiguous. Row 0 is always a start. Neighbouring keys that are both
+    null or both NaN belong to the same partition, as in ``Table.group_by()``.
+    """
+    if num_rows == 0:
+        return pa.array([], type=pa.bool_())
+    changed: pa.Array | pa.ChunkedArray = pa.array([False] * (num_rows - 1), type=pa.bool_())
+    for col in sorted_partition_cols:
+        prev = col.slice(0, num_rows - 1)
+        curr = col.slice(1, num_rows - 1)
+        # not equal (NaN-safe) OR exactly one side null -> key changed at this position.
+        neq = nan_safe_not_equal(curr, prev)
+        null_diff = pc.not_equal(pc.is_null(curr), pc.is_null(prev))
+        col_changed = pc.fill_null(pc.or_(neq, null_diff), True)
+        both_null = pc.and_(pc.is_null(curr), pc.is_null(prev))
+        col_changed = pc.and_(col_changed, pc.invert(both_null))
+        changed = pc.or_(changed, col_changed)
+    if isinstance(changed, pa.ChunkedArray):
+        changed = changed.combine_chunks()
+    return pa.concat_arrays([pa.array([True], type=pa.bool_()), changed])
+
+
+def nan_as_null(column: pa.Array | pa.ChunkedArray) -> pa.Array | pa.ChunkedArray:
+    """``column`` with NaN replaced by null; non-float columns and columns without NaN are returned as is."""
+    if not pa.types.is_floating(column.type):
+        return column
+    is_nan = pc.fill_null(pc.is_nan(column), False)
+    if not pc.any(is_nan).as_py():
+        return column
+    return pc.if_else(is_nan, pa.scalar(None, type=column.type), column)
+
+
+def array_identity(column: pa.Array | pa.ChunkedArray) -> tuple[object, ...]:
+    """Identity of a column's memory: type plus, per chunk, offset, length and buffer addresses."""
+    chunks = column.chunks if isinstance(column, pa.ChunkedArray) else [column]
+    parts: list[object] = [str(column.type)]
+    for chunk in chunks:
+        buffers = tuple(0 if buf is None else (buf.address, buf.size) for buf in chunk.buffers())
+        parts.append((chunk.offset, len(chunk), buffers))
+        if pa.types.is_dictionary(chunk.type):
+            parts.append(array_identity(chunk.dictionary))
+    return tuple(parts)
+
+
+def sort_permutation(table: pa.Table, partition_by: list[str], order_by: str | None) -> SortPermutation:
+    """Ordering of *table* by ``[*partition_by, order_by]`` ascending, nulls last.
+
+    A NaN ``order_by`` value sorts as null, so NaN and null rows form one tier kept in
+    input order, as the shared nulls-last sort key of the other backends does (Arrow
+    alone would place NaN ahead of the nulls).
+
+    The result goes through the active ``sort_permutation_scope`` cache. Features of one
+    FeatureSet that order by the same key columns share one ``sort_indices`` call, one
+    inverse and one segment-boundary pass. All three arrays are int64.
+    """
+    key_names = [*partition_by] if order_by is None else [*partition_by, order_by]
+    key_columns = tuple(table.column(name) for name in key_names)
+    key = ("pyarrow", len(partition_by), tuple(array_identity(col) for col in key_columns))
+
+    def compute() -> SortPermutation:
+        num_rows = table.num_rows
+        sort_keys = [(name, "ascending") for name in key_names]
+        sort_table = pa.table(
+            [*key_columns[: len(partition_by)], *(nan_as_null(col) for col in key_columns[len(partition_by) :])],
+            names=key_names,
+        )
+        # int64 rather than the uint64 of sort_indices: scatter and inverse_permutation
+        # only accept signed indices.
+        forward = pc.cast(pc.sort_indices(sort_table, sort_keys=sort_keys, null_placement="at_end"), pa.int64())
+        if hasattr(pc, "inverse_permutation"):
+            inverse = pc.inverse_permutation(forward)
+        else:
+            inverse = scatter_to_rows(row_positions(num_rows), forward)
+        if partition_by:
+            sorted_partition_cols = [pc.take(col, forward) for col in key_columns[: len(partition_by)]]
+            starts = pc.indices_nonzero(partition_start_mask(sorted_partition_cols, num_rows))
+            boundaries = pc.cast(starts, pa.int64())
+        else:
+            boundaries = pa.array([0] if num_rows else [], type=pa.int64())
+        nbytes = forward.nbytes + inverse.nbytes + boundaries.nbytes
+        return SortPermutation(forward, inverse, boundaries, nbytes)
+
+    return cached_sort_permutation(key, key_columns, compute)
+
+
+def scatter_to_rows(values: pa.Array | pa.ChunkedArray, positions: pa.Array | pa.ChunkedArray) -> pa.Array:
+    """Place ``values[i]`` at row ``positions[i]``; ``positions`` must be a permutation of ``range(len(values))``.
+
+    Uses the native ``scatter`` kernel (pyarrow >= 20). Older pyarrow falls back to taking
+    through the inverse permutation, which costs one extra ``sort_indices`` over the positions.
+    ``scatter`` only accepts signed indices, so the uint64 output of ``sort_indices`` is cast.
+    """
+    if hasattr(pc, "scatter"):
+        if pa.types.is_unsigned_integer(positions.type):
+            positions = pc.cast(positions, pa.int64())
+        return pc.scatter(values, positions)
+    return pc.take(values, pc.sort_indices(positions))
+
+
+def row_positions(num_rows: int) -> pa.Array:
+    """``[0, 1, ..., num_rows - 1]`` as int64, built by a native cumulative sum (no Python range)."""
+    if num_rows == 0:
+        return pa.array([], type=pa.int64())
+    ones = pa.repeat(pa.scalar(1, type=pa.int64()), num_rows)
+    return pc.subtract(pc.cumulative_sum(ones), pa.scalar(1, type=pa.int64()))
+
+
+def segment_start_per_row(boundaries: pa.Array | pa.ChunkedArray, num_rows: int) -> pa.Array:
+    """For every sorted row, the position at which its segment starts.
+
+    ``boundaries`` are the ascending segment start positions (first entry 0), as in
+    ``SortPermutation.boundaries``. Start rows keep their own position and every other
+    row inherits it through a running maximum, so no per-segment loop is needed.
+    """
+    positions = row_positions(num_rows)
+    is_start = pc.is_in(positions, value_set=pc.cast(boundaries, pa.int64()))
+    return pc.cumulative_max(pc.if_else(is_start, positions, pa.scalar(0, type=pa.int64())))
+
+
+def segment_size_per_row(boundaries: pa.Array | pa.ChunkedArray, num_rows: int) -> pa.Array:
+    """For every sorted row, the number of rows in its segment.
+
+    Segment sizes are the differences of consecutive ``boundaries`` (closed by
+    ``num_rows``); each row picks its segment's size by segment index, a running
+    count of the segment starts up to the row.
+    """
+    if num_rows == 0:
+        return pa.array([], type=pa.int64())
+    starts = pc.cast(boundaries, pa.int64())
+    if isinstance(starts, pa.ChunkedArray):
+        starts = starts.combine_chunks()
+    ends = pa.concat_arrays([starts.slice(1), pa.array([num_rows], type=pa.int64())])
+    sizes = pc.subtract(ends, starts)
+    is_start = pc.cast(pc.is_in(row_positions(num_rows), value_set=starts), pa.int64())
+    segment_index = pc.subtract(pc.cumulative_sum(is_start), pa.scalar(1, type=pa.int64()))
+    return pc.take(sizes, segment_index)
+
+
+def segment_sum_per_row(values: pa.Array | pa.ChunkedArray, boundaries: pa.Array | pa.ChunkedArray) -> pa.Array:
+    """For every sorted row, the sum of ``values`` over its whole segment, from one prefix sum.
+
+    ``values`` must be numeric without nulls (e.g. a 0/1 validity cast to int64).
+    """
+    num_rows = len(values)
+    if num_rows == 0:
+        return pa.array([], type=values.type)
+    inclusive = pc.cumulative_sum(values)
+    start = segment_start_per_row(boundaries, num_rows)
+    last = pc.subtract(pc.add(start, segment_size_per_row(boundaries, num_rows)), pa.scalar(1, type=pa.int64()))
+    before = pc.subtract(pc.take(inclusive, start), pc.take(values, start))
+    return pc.subtract(pc.take(inclusive, last), before)
+
+
+def segmented_fill_null_forward(
+    sorted_values: pa.Array | pa.ChunkedArray, boundaries: pa.Array | pa.ChunkedArray
+) -> pa.Array:
+    """``fill_null_forward`` applied independently within each contiguous segment of ``sorted_values``.
+
+    The last valid position up to each row is a running maximum over the valid rows'
+    positions (-1 elsewhere). When it lies before the row's segment start the segment
+    has no earlier value and the row stays null. One ``take`` then gathers the fill
+    values, so the cost does not depend on the number of segments.
+    """
+    if isinstance(sorted_values, pa.ChunkedArray):
+        sorted_values = sorted_values.combine_chunks()
+    num_rows = len(sorted_values)
+    if num_rows == 0:
+        return sorted_values
+    positions = row_positions(num_rows)
+    last_valid = pc.cumulative_max(pc.if_else(pc.is_valid(sorted_values), positions, pa.scalar(-1, type=pa.int64())))
+    in_segment = pc.greater_equal(last_valid, segment_start_per_row(boundaries, num_rows))
+    source = pc.if_else(in_segment, last_valid, pa.scalar(None, type=pa.int64()))
+    return pc.take(sorted_values, source)
+
+
+def segmented_search_left(
+    segments: pa.Array | pa.ChunkedArray, keys: pa.Array | pa.ChunkedArray, queries: pa.Array | pa.ChunkedArray
+) -> pa.Array:
+    """Per-row ``searchsorted(side="left")`` of ``queries[i]`` within row ``i``'s own segment.
+
+    Rows must be sorted by ``(segments, keys)`` ascending with null keys last in each
+    segment (e.g. ``segments`` from ``segment_start_per_row`` over a ``sort_permutation``).
+    Returns, for every row ``i``, the global position of the first row of its segment
+    whose key is ``>= queries[i]``; a null query lands on the segment's first null key.
+    Rows and queries are merged by one stable sort on ``(segment, key, is_row)``, and the
+    number of rows ahead of each query is its answer, so there is no per-segment loop.
+    """
+    num_rows = len(keys)
+    if num_rows == 0:
+        return pa.array([], type=pa.int64())
+    is_row = pa.concat_arrays(
+        [pa.repeat(pa.scalar(1, type=pa.int64()), num_rows), pa.repeat(pa.scalar(0, type=pa.int64()), num_rows)]
+    )
+    merged = pa.table(
+        {
+            "segment": pa.chunked_array([segments, segments]),
+            "key": pa.chunked_array([keys, pc.cast(queries, keys.type)]),
+            "is_row": is_row,
+        }
+    )
+    order = pc.cast(
+        pc.sort_indices(
+            merged,
+            sort_keys=[("segment", "ascending"), ("key", "ascending"), ("is_row", "ascending")],
+            null_placement="at_end",
+        ),
+        pa.int64(),
+    )
+    rows_in_order = pc.take(is_row, order)
+    rows_ahead = pc.subtract(pc.cumulative_sum(rows_in_order), rows_in_order)
+    is_query = pc.equal(rows_in_order, pa.scalar(0, type=pa.int64()))
+    query_rows = pc.subtract(pc.filter(order, is_query), pa.scalar(num_rows, type=pa.int64()))
+    return scatter_to_rows(pc.filter(rows_ahead, is_query), query_rows)
+
+
+def broadcast_group_values(
+    group_values: pa.Array | pa.ChunkedArray, group_row_lists: pa.Array | pa.ChunkedArray
+) -> pa.Array:
+    """Broadcast one value per group back to every row of that group, in original row order.
+
+    ``group_row_lists`` is the ``list`` aggregate of a row-index column from the same
+    ``Table.group_by()`` call that produced ``group_values``, so every row index appears in
+    exactly one group's list. Flattening the lists and scattering each entry's parent index
+    to its row yields the per-row group id; one ``take`` of ``group_values`` then broadcasts
+    the aggregate. Group membership (null keys, merged NaN keys) is exactly the group_by's own,
+    and no per-group or per-row Python object is created.
+    """
+    if isinstance(group_row_lists, pa.ChunkedArray):
+        group_row_lists = group_row_lists.combine_chunks()
+    row_positions = pc.list_flatten(group_row_lists)
+    owning_group = pc.list_parent_indices(group_row_lists)
+    return pc.take(group_values, scatter_to_rows(owning_group, row_positions))
+
+
+def _same_aggregation(
+    a: tuple[str, str, pc.FunctionOptions | None], b: tuple[str, str, pc.FunctionOptions | None]
+) -> bool:
+    """Equality of two aggregation specs; FunctionOptions is only ever compared to its own type.
+
+    Comparing a ``FunctionOptions`` against ``None`` (as plain tuple equality would) is not
+    safe across pyarrow versions, so the options are compared only when both are present
+    and of the same class.
+    """
+    if a[0] != b[0] or a[1] != b[1]:
+        return False
+    if a[2] is None or b[2] is None:
+        return a[2] is None and b[2] is None
+    return type(a[2]) is type(b[2]) and bool(a[2] == b[2])
+
+
+def fused_group_by(
+    table: pa.Table,
+    partition_by: list[str],
+    aggregations: list[tuple[str, str, pc.FunctionOptions | None]],
+    *,
+    use_threads: bool = True,
+) -> tuple[pa.Table, list[str]]:
+    """Run several ``(column, function, options)`` aggregations in one ``Table.group_by()`` call.
+
+    Returns the grouped table and, aligned with *aggregations*, the name of each
+    aggregation's output column. The keys are hashed once for the whole list instead
+    of once per aggregation. Identical aggregations share one output column. Every
+    distinct aggregation reads its column through its own zero-copy alias, so two
+    aggregations whose default ``{column}_{function}`` names would coincide (e.g.
+    ``stddev`` with ddof 0 and ddof 1) still get distinct outputs.
+    """
+    taken = set(table.column_names)
+    distinct: list[tuple[str, str, pc.FunctionOptions | None]] = []
+    aliases: list[str] = []
+    output_names: list[str] = []
+    for aggregation in aggregations:
+        for position, seen in enumerate(distinct):
+            if _same_aggregation(seen, aggregation):
+                output_names.append(f"{aliases[position]}_{seen[1]}")
+                break
+        else:
+            alias = unique_helper_name(f"__mloda_agg_{len(distinct)}__", taken)
+            taken.add(alias)
+            distinct.append(aggregation)
+            aliases.append(alias)
+            output_names.append(f"{alias}_{aggregation[1]}")
+
+    work = table
+    for alias, (column, _, _) in zip(aliases, distinct):
+        work = work.append_column(alias, table.column(column))
+    specs = [
+        (alias, function) if options is None else (alias, function, options)
+        for alias, (_, function, options) in zip(aliases, distinct)
+    ]
+    return work.group_by(partition_by, use_threads=use_threads).aggregate(specs), output_names
+
+
+class PyArrowStateFrame(StateFrameOps):
+    """``StateFrameOps`` for PyArrow tables; seed rows are built with the frame's schema."""
+
+    @classmethod
+    def select(cls, data: pa.Table, columns: list[str]) -> pa.Table:
+        return data.select(columns)
+
+    @classmethod
+    def to_lists(cls, frame: pa.Table, columns: list[str]) -> dict[str, list[Any]]:
+        return {col: frame.column(col).to_pylist() for col in columns}
+
+    @classmethod
+    def prepend(cls, frame: pa.Table, rows: dict[str, list[Any]]) -> pa.Table:
+        return pa.concat_tables([pa.Table.from_pydict(rows, schema=frame.schema), frame])
+
+    @classmethod
+    def with_column(cls, data: pa.Table, name: str, values: list[Any], like: pa.Table) -> pa.Table:
+        return data.append_column(name, pa.array(values, type=like.schema.field(name).type))
+
+
+class PyArrowFittedStatistics(FittedStatisticsOps):
+    """``FittedStatisticsOps`` for PyArrow tables; partitioned values are a dictionary lookup."""
+
+    @classmethod
+    def rows(cls, data: pa.Table, feature_name: str, partition_by: list[str]) -> list[list[Any]]:
+        if not partition_by:
+            return [[data.column(feature_name)[0].as_py()]] if data.num_rows else []
+        grouped = (
+            data.select([*partition_by, feature_name])
+            .group_by(partition_by, use_threads=False)
+            .aggregate([(feature_name, "first", pc.ScalarAggregateOptions(skip_nulls=False))])
+        )
+        keys = [grouped.column(col).to_pylist() for col in partition_by]
+        values = grouped.column(f"{feature_name}_first").to_pylist()
+        return [[*key, value] for key, value in zip(zip(*keys), values)]
+
+    @classmethod
+    def apply(cls, data: pa.Table, feature_name: str, partition_by: list[str], rows: list[list[Any]]) -> pa.Table:
+        key_lists = [data.column(col).to_pylist() for col in partition_by]
+        return data.append_column(feature_name, pa.array(lookup_values(key_lists, rows, data.num_rows)))
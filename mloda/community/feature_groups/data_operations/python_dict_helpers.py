@@ -6,11 +6,14 @@ numeric-column checks are handled identically everywhere.
 
 from __future__ import annotations
 
+import heapq
 import statistics
+from collections import deque
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
 from mloda.community.feature_groups.data_operations.errors import unsupported_agg_type_error
+from mloda.community.feature_groups.data_operations.sort_cache import SortPermutation, cached_sort_permutation
 
 # Sentinel substituted for any NaN partition-key value so NaN-valued rows of a partition
 # column land in one shared group, matching PyArrow's Table.group_by() (which merges all
@@ -76,6 +79,48 @@ def partition_sort_key(value: Any) -> tuple[int, Any]:
     return (0, value)
 
 
+def sort_permutation(data: dict[str, list[Any]], partition_by: list[str], order_by: str) -> SortPermutation:
+    """Rows of *data* grouped by *partition_by*, each group stable-sorted by *order_by* (nulls last).
+
+    Groups appear in first-seen order; ``forward[boundaries[g]:boundaries[g + 1]]`` are the
+    row indices of group ``g`` in order. Goes through the active ``sort_permutation_scope``
+    cache keyed by the identity of the key-column lists, which every backend passes on
+    unchanged (``result = dict(data)``), so features of one FeatureSet over the same keys
+    group and sort once.
+    """
+    key_columns = tuple(data[col] for col in (*partition_by, order_by))
+    key = ("python_dict", len(partition_by), tuple(id(col) for col in key_columns))
+
+    def compute() -> SortPermutation:
+        order_vals = key_columns[-1]
+        partition_cols = key_columns[:-1]
+        groups: dict[tuple[Any, ...], list[int]] = {}
+        for i in range(len(order_vals)):
+            groups.setdefault(tuple(group_key_value(col[i]) for col in partition_cols), []).append(i)
+
+        forward: list[int] = []
+        boundaries: list[int] = []
+        for rows in groups.values():
+            rows.sort(key=lambda i: nulls_last_sort_key(order_vals[i]))
+            boundaries.append(len(forward))
+            forward.extend(rows)
+        inverse = [0] * len(forward)
+        for position, row in enumerate(forward):
+            inverse[row] = position
+        # Rough CPython footprint: an 8-byte pointer per slot plus a small int object.
+        nbytes = 36 * (len(forward) + len(inverse) + len(boundaries))
+        return SortPermutation(forward, inverse, boundaries, nbytes)
+
+    return cached_sort_permutation(key, key_columns, compute)
+
+
+def sorted_groups(perm: SortPermutation) -> list[list[int]]:
+    """Split a PythonDict ``sort_permutation`` into its per-group, ordered row-index lists."""
+    forward: list[int] = perm.forward
+    ends = [*perm.boundaries[1:], len(forward)]
+    return [forward[start:end] for start, end in zip(perm.boundaries, ends)]
+
+
 def values_equal(a: Any, b: Any) -> bool:
     """NaN-safe equality: NaN equals NaN here, unlike Python's own ``==``.
 
@@ -184,7 +229,7 @@ def reduce_agg(agg_type: str, values: list[Any]) -> Any:
     """Reduce one group's raw (possibly null-containing) values per *agg_type*.
 
     NaN is skipped (in addition to None) for ``min``/``max``, matching PyArrow's
-    ``pc.min``/``pc.max``.
+    ``pc.min``/``pc.max``; a NaN makes ``median`` NaN.
     """
     non_null = [v for v in values if v is not None]
 
@@ -201,7 +246,10 @@ def reduce_agg(agg_type: str, values: list[Any]) -> Any:
     if agg_type == "last":
         return non_null[-1] if non_null else None
     if agg_type == "median":
-        return statistics.median(non_null) if non_null else None
+        if not non_null:
+            return None
+        # statistics.median sorts, and a sort with NaN depends on input order: any NaN gives NaN.
+        return float("nan") if any(is_nan(v) for v in non_null) else statistics.median(non_null)
     if agg_type in VARIANCE_DDOF:
         return variance(non_null, ddof=VARIANCE_DDOF[agg_type], as_std=agg_type in STD_AGG_TYPES)
 
@@ -221,6 +269,215 @@ def reduce_agg(agg_type: str, values: list[Any]) -> Any:
     raise unsupported_agg_type_error(agg_type, SUPPORTED_AGG_TYPES, framework="PythonDict")
 
 
+_INF = float("inf")
+
+
+class SlidingWindowReducer:
+    """Incremental ``reduce_agg`` over a window that grows at the back and shrinks at the front.
+
+    Rows enter through ``push(index, value)`` in increasing ``index`` order and leave
+    through ``pop(index, value)`` in the same order, so every window is a contiguous run
+    of an ordered partition. ``result()`` then equals ``reduce_agg(agg_type, window)``
+    up to float rounding, at amortized O(1) per row (O(log w) for ``median``):
+
+    - ``count``/``sum``/``avg``: running count and a compensated (Neumaier) sum, with NaN
+      and +/-inf counted separately so they leave the window without poisoning the sum.
+    - ``min``/``max``: monotonic deques of the non-NaN values; equal values keep the
+      earliest, matching builtin ``min()``/``max()``.
+    - ``std``/``var``: Welford updates with removal (population, ddof=0); any non-finite
+      value in the window gives NaN, as the two-pass ``variance`` does.
+    - ``median``: two lazily-pruned heaps of the non-NaN values; a NaN in the window
+      gives NaN from the count alone, as ``reduce_agg``'s ``median`` does.
+    """
+
+    def __init__(self, agg_type: str) -> None:
+        if agg_type not in _SLIDING_AGG_TYPES:
+            raise unsupported_agg_type_error(agg_type, _SLIDING_AGG_TYPES, framework="PythonDict")
+        self.agg_type = agg_type
+        self.count = 0
+        self.nan_count = 0
+        self.pos_inf_count = 0
+        self.neg_inf_count = 0
+        # Neumaier-compensated sum of the finite values.
+        self.total: Any = 0
+        self.compensation: Any = 0
+        # Welford state of the finite values.
+        self.mean = 0.0
+        self.m2 = 0.0
+        # (index, value) candidates for min/max, monotonic in value.
+        self.extrema: deque[tuple[int, Any]] = deque()
+        # Median: max-heap ``low`` (negated) and min-heap ``high`` with lazy deletion.
+        self.low: list[tuple[Any, int]] = []
+        self.high: list[tuple[Any, int]] = []
+        self.side: dict[int, bool] = {}
+        self.low_size = 0
+        self.high_size = 0
+
+    def push(self, index: int, value: Any) -> None:
+        if value is None:
+            return
+        self.count += 1
+        if is_nan(value):
+            self.nan_count += 1
+        elif value == _INF:
+            self.pos_inf_count += 1
+        elif value == -_INF:
+            self.neg_inf_count += 1
+        else:
+            self._push_finite(value)
+        if is_nan(value):
+            return
+        if self.agg_type == "median":
+            self._push_median(index, value)
+        elif self.agg_type in ("min", "max"):
+            self._push_extremum(index, value)
+
+    def pop(self, index: int, value: Any) -> None:
+        if value is None:
+            return
+        self.count -= 1
+        if is_nan(value):
+            self.nan_count -= 1
+        elif value == _INF:
+            self.pos_inf_count -= 1
+        elif value == -_INF:
+            self.neg_inf_count -= 1
+        else:
+            self._pop_finite(value)
+        if self.agg_type == "median":
+            if not is_nan(value):
+                self._pop_median(index)
+        elif self.extrema and self.extrema[0][0] == index:
+            self.extrema.popleft()
+
+    def result(self) -> Any:
+        agg_type = self.agg_type
+        if agg_type == "count":
+            return self.count
+        if agg_type in ("min", "max"):
+            return self.extrema[0][1] if self.extrema else None
+        if agg_type == "median":
+            if self.nan_count:
+                return float("nan")
+            return self._median()
+        if agg_type in ("std", "var"):
+            finite = self.count - self.nan_count - self.pos_inf_count - self.neg_inf_count
+            if self.count == 0:
+                return None
+            if finite < self.count:
+                return float("nan")
+            var = max(self.m2, 0.0) / finite
+            return var**0.5 if agg_type == "std" else var
+        if self.count == 0:
+            return None
+        if self.nan_count or (self.pos_inf_count and self.neg_inf_count):
+            total: Any = float("nan")
+        elif self.pos_inf_count:
+            total = _INF
+        elif self.neg_inf_count:
+            total = -_INF
+        else:
+            total = self.total + self.compensation
+        return total if agg_type == "sum" else total / self.count
+
+    def _push_finite(self, value: Any) -> None:
+        agg_type = self.agg_type
+        if agg_type in ("sum", "avg"):
+            self._add(value)
+        elif agg_type in ("std", "var"):
+            finite = self.count - self.nan_count - self.pos_inf_count - self.neg_inf_count
+            delta = value - self.mean
+            self.mean += delta / finite
+            self.m2 += delta * (value - self.mean)
+
+    def _pop_finite(self, value: Any) -> None:
+        agg_type = self.agg_type
+        if agg_type in ("sum", "avg"):
+            self._add(-value)
+        elif agg_type in ("std", "var"):
+            finite = self.count - self.nan_count - self.pos_inf_count - self.neg_inf_count
+            if finite == 0:
+                self.mean = 0.0
+                self.m2 = 0.0
+                return
+            delta = value - self.mean
+            self.mean -= delta / finite
+            # A single remaining value has zero spread; resetting here stops removal
+            # round-off from surviving as a spurious std of a one-value window.
+            self.m2 = 0.0 if finite == 1 else self.m2 - delta * (value - self.mean)
+
+    def _add(self, value: Any) -> None:
+        total = self.total + value
+        if abs(self.total) >= abs(value):
+            self.compensation += (self.total - total) + value
+        else:
+            self.compensation += (value - total) + self.total
+        self.total = total
+
+    def _push_extremum(self, index: int, value: Any) -> None:
+        extrema = self.extrema
+        if self.agg_type == "min":
+            while extrema and extrema[-1][1] > value:
+                extrema.pop()
+        else:
+            while extrema and extrema[-1][1] < value:
+                extrema.pop()
+        extrema.append((index, value))
+
+    def _push_median(self, index: int, value: Any) -> None:
+        self._prune()
+        if self.low and value > -self.low[0][0]:
+            heapq.heappush(self.high, (value, index))
+            self.side[index] = False
+            self.high_size += 1
+        else:
+            heapq.heappush(self.low, (-value, index))
+            self.side[index] = True
+            self.low_size += 1
+        self._rebalance()
+
+    def _pop_median(self, index: int) -> None:
+        if self.side.pop(index):
+            self.low_size -= 1
+        else:
+            self.high_size -= 1
+        self._rebalance()
+
+    def _prune(self) -> None:
+        """Drop popped entries from the heap tops (entries whose index left ``side``)."""
+        while self.low and self.side.get(self.low[0][1]) is not True:
+            heapq.heappop(self.low)
+        while self.high and self.side.get(self.high[0][1]) is not False:
+            heapq.heappop(self.high)
+
+    def _rebalance(self) -> None:
+        self._prune()
+        while self.low_size > self.high_size + 1:
+            negated, index = heapq.heappop(self.low)
+            heapq.heappush(self.high, (-negated, index))
+            self.side[index] = False
+            self.low_size -= 1
+            self.high_size += 1
+            self._prune()
+        while self.high_size > self.low_size:
+            value, index = heapq.heappop(self.high)
+            heapq.heappush(self.low, (-value, index))
+            self.side[index] = True
+            self.high_size -= 1
+            self.low_size += 1
+            self._prune()
+
+    def _median(self) -> Any:
+        if self.low_size == 0:
+            return None
+        lower = -self.low[0][0]
+        if self.low_size > self.high_size:
+            return lower
+        return (lower + self.high[0][0]) / 2
+
+
+_SLIDING_AGG_TYPES: frozenset[str] = frozenset({"sum", "avg", "count", "min", "max", "std", "var", "median"})
+
 _EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
 
 # Fixed-duration units bucketed by an epoch-anchored floor (see floor_fixed_duration).
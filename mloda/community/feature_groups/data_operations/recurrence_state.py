@@ -0,0 +1,284 @@
+"""Per-partition tail state carried across runs for sequential recurrences.
+
+``ema``, ``ffill`` and ``sessionize`` are recurrences over each partition's time order:
+a row's result depends only on the row and on the state left behind by the partition's
+previous row. In the realtime pattern (``mloda.prepare()`` once, ``session.run()`` per
+micro-batch) the default is to recompute from scratch, so every call must resend the
+full history. Setting the ``state_store`` option to a store name opts a feature into
+carrying that state instead: each run only receives the new rows, and what the next run
+needs is remembered per partition in a named ``RecurrenceStateStore``:
+
+- ``ema``: the last EMA value;
+- ``ffill``: the last non-null value;
+- ``sessionize``: the session id of the last row (its timestamp is the tail itself).
+
+A run is computed by the feature group's own backend kernel. For every partition with a
+stored tail, one seed row holding the tail (at the tail's ``order_by`` value) is placed
+in front of the batch; the seed continues the recurrence exactly where the previous run
+stopped and is dropped from the result. Session ids are then renumbered so they stay
+globally unique across runs: a session continued from a seed keeps its stored id, new
+sessions take the next ids of a per-feature counter.
+
+Rows must arrive in time order per partition: a row whose ``order_by`` is earlier than
+the partition's stored tail raises ``OutOfOrderRowError``, and a null ``order_by`` (no
+position in time) raises ``ValueError``. A row equal to the tail counts as later, as a
+stable sort would order it. The store is bounded by its number of partition tails; the
+least recently used ones are evicted first, and an evicted partition simply starts over
+on its next row, as an unseen partition does (for ``sessionize``, with a new session id).
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from mloda.provider import record_match_rejection
+
+from mloda.community.feature_groups.data_operations.python_dict_helpers import group_key_value, is_nan
+
+STATE_STORE = "state_store"
+"""Config key naming the ``RecurrenceStateStore`` a recurrence carries its state in (opt-in).
+
+Used by: ema, ffill, sessionization.
+"""
+
+#: Default bound of one store, in partition tails.
+DEFAULT_MAX_PARTITIONS = 100_000
+
+Recurrence = Literal["ema", "ffill", "sessionize"]
+
+
+class OutOfOrderRowError(ValueError):
+    """A row arrived with an ``order_by`` value earlier than its partition's carried tail."""
+
+
+@dataclass(frozen=True)
+class PartitionTail:
+    """State one partition leaves for the next run: its last ``order_by`` value and the carry."""
+
+    last_order: Any
+    carry: Any
+
+
+class RecurrenceStateStore:
+    """LRU store of ``PartitionTail`` objects, bounded by the number of partitions."""
+
+    def __init__(self, max_partitions: int = DEFAULT_MAX_PARTITIONS) -> None:
+        self.max_partitions = max_partitions
+        self._tails: OrderedDict[tuple[Hashable, Hashable], PartitionTail] = OrderedDict()
+        self._next_session_id: dict[Hashable, int] = {}
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._tails)
+
+    def get(self, state_key: Hashable, partition: Hashable) -> PartitionTail | None:
+        """The tail of ``partition`` under ``state_key``, or None if never stored or evicted."""
+        key = (state_key, partition)
+        tail = self._tails.get(key)
+        if tail is not None:
+            self._tails.move_to_end(key)
+        return tail
+
+    def put(self, state_key: Hashable, partition: Hashable, tail: PartitionTail) -> None:
+        key = (state_key, partition)
+        self._tails[key] = tail
+        self._tails.move_to_end(key)
+        while len(self._tails) > max(self.max_partitions, 0):
+            self._tails.popitem(last=False)
+            self.evictions += 1
+
+    def allocate_session_ids(self, state_key: Hashable, count: int) -> int:
+        """Reserve ``count`` consecutive session ids under ``state_key``; returns the first.
+
+        The counter is not subject to eviction, so ids are never reused.
+        """
+        first = self._next_session_id.get(state_key, 0)
+        self._next_session_id[state_key] = first + count
+        return first
+
+    def clear(self) -> None:
+        self._tails.clear()
+        self._next_session_id.clear()
+        self.evictions = 0
+
+
+_STORES: dict[str, RecurrenceStateStore] = {}
+
+
+def get_state_store(name: str, max_partitions: int = DEFAULT_MAX_PARTITIONS) -> RecurrenceStateStore:
+    """Return the store registered under ``name``, creating it with ``max_partitions`` if absent."""
+    store = _STORES.get(name)
+    if store is None:
+        store = _STORES[name] = RecurrenceStateStore(max_partitions)
+    return store
+
+
+def drop_state_store(name: str) -> None:
+    """Forget the store registered under ``name`` (a no-op if there is none)."""
+    _STORES.pop(name, None)
+
+
+class StateFrameOps:
+    """The few table operations carrying state needs, implemented once per backend."""
+
+    @classmethod
+    def select(cls, data: Any, columns: list[str]) -> Any:
+        """A table holding only ``columns`` of ``data``, in ``data``'s row order."""
+        raise NotImplementedError
+
+    @classmethod
+    def to_lists(cls, frame: Any, columns: list[str]) -> dict[str, list[Any]]:
+        """``columns`` as Python lists, with every null (and NaN in pandas) as None."""
+        raise NotImplementedError
+
+    @classmethod
+    def prepend(cls, frame: Any, rows: dict[str, list[Any]]) -> Any:
+        """``frame`` with ``rows`` (one list per column of ``frame``) in front of its rows."""
+        raise NotImplementedError
+
+    @classmethod
+    def with_column(cls, data: Any, name: str, values: list[Any], like: Any) -> Any:
+        """``data`` with ``values`` appended as column ``name``, typed like ``like``'s column ``name``."""
+        raise NotImplementedError
+
+
+class PythonDictStateFrame(StateFrameOps):
+    @classmethod
+    def select(cls, data: dict[str, list[Any]], columns: list[str]) -> dict[str, list[Any]]:
+        return {col: data[col] for col in columns}
+
+    @classmethod
+    def to_lists(cls, frame: dict[str, list[Any]], columns: list[str]) -> dict[str, list[Any]]:
+        return {col: list(frame[col]) for col in columns}
+
+    @classmethod
+    def prepend(cls, frame: dict[str, list[Any]], rows: dict[str, list[Any]]) -> dict[str, list[Any]]:
+        return {col: [*rows[col], *values] for col, values in frame.items()}
+
+    @classmethod
+    def with_column(
+        cls, data: dict[str, list[Any]], name: str, values: list[Any], like: dict[str, list[Any]]
+    ) -> dict[str, list[Any]]:
+        result = dict(data)
+        result[name] = values
+        return result
+
+
+def state_store_supported(feature_group: type[Any], options: Any) -> bool:
+    """False (with a recorded rejection) when ``state_store`` is set but the backend cannot carry state."""
+    if options.get(STATE_STORE) is None or getattr(feature_group, "STATE_FRAME_OPS", None) is not None:
+        return True
+    record_match_rejection(
+        feature_group.get_class_name(),
+        f"option '{STATE_STORE}' is set but this compute framework does not carry recurrence state",
+    )
+    return False
+
+
+def compute_with_carried_state(
+    ops: type[StateFrameOps] | None,
+    store: RecurrenceStateStore,
+    recurrence: Recurrence,
+    data: Any,
+    feature_name: str,
+    source_col: str,
+    partition_by: list[str],
+    order_by: str,
+    compute: Callable[[Any], Any],
+) -> Any:
+    """Run ``compute`` (the stateless backend kernel) on the new rows of ``data`` only.
+
+    ``compute`` takes a table of ``[*partition_by, order_by, source_col]`` and returns it
+    with ``feature_name`` appended. The stored tails of the partitions in ``data`` are
+    prepended to it as seed rows, and the tails are updated from the result.
+    """
+    if ops is None:
+        raise ValueError(f"{feature_name!r}: this compute framework cannot carry recurrence state ({STATE_STORE!r}).")
+    if recurrence == "ema" and source_col == order_by:
+        raise ValueError(
+            f"ema with state_store cannot carry state when the source column is the order_by column ({order_by!r})."
+        )
+    state_key = (feature_name, tuple(partition_by), order_by)
+    columns = list(dict.fromkeys([*partition_by, order_by, source_col]))
+    frame = ops.select(data, columns)
+    lists = ops.to_lists(frame, [*partition_by, order_by])
+    orders = lists[order_by]
+    raw_partitions = list(zip(*(lists[col] for col in partition_by))) if partition_by else [()] * len(orders)
+    partitions: list[Hashable] = [tuple(group_key_value(v) for v in raw) for raw in raw_partitions]
+
+    seeds: dict[str, list[Any]] = {col: [] for col in columns}
+    seeded: list[Hashable] = []
+    tails: dict[Hashable, PartitionTail | None] = {}
+    for row, (partition, order) in enumerate(zip(partitions, orders)):
+        if order is None or is_nan(order):
+            raise ValueError(
+                f"{feature_name!r} with state_store needs a non-null order_by value on every row; "
+                f"row {row} has {order!r} in {order_by!r}."
+            )
+        if partition not in tails:
+            tail = tails[partition] = store.get(state_key, partition)
+            if tail is not None and tail.carry is not None:
+                for col, value in zip(partition_by, raw_partitions[row]):
+                    seeds[col].append(value)
+                seeds[order_by].append(tail.last_order)
+                if source_col != order_by:
+                    seeds[source_col].append(tail.carry if recurrence != "sessionize" else None)
+                seeded.append(partition)
+        tail = tails[partition]
+        if tail is not None and order < tail.last_order:
+            raise OutOfOrderRowError(
+                f"{feature_name!r}: row {row} has {order_by}={order!r}, earlier than the last row already "
+                f"processed for its partition ({tail.last_order!r}). Rows must arrive in {order_by!r} order "
+                "per partition; drop the state store to recompute from full history."
+            )
+
+    computed = compute(ops.prepend(frame, seeds) if seeded else frame)
+    results = ops.to_lists(computed, [feature_name])[feature_name]
+    seed_results, values = results[: len(seeded)], results[len(seeded) :]
+
+    if recurrence == "sessionize":
+        values = _renumber_sessions(store, state_key, seeded, seed_results, values, tails)
+
+    # The partition's last row in time order is the one with the largest order_by value,
+    # the latest in input order among ties.
+    last_row: dict[Hashable, int] = {}
+    last_carry: dict[Hashable, Any] = {}
+    for row, (partition, order) in enumerate(zip(partitions, orders)):
+        previous = last_row.get(partition)
+        if previous is None or not order < orders[previous]:
+            last_row[partition] = row
+            if recurrence != "ema" or values[row] is not None:
+                last_carry[partition] = values[row]
+    for partition, row in last_row.items():
+        tail = tails[partition]
+        carry = last_carry.get(partition, tail.carry if tail is not None else None)
+        store.put(state_key, partition, PartitionTail(orders[row], carry))
+
+    return ops.with_column(data, feature_name, values, computed)
+
+
+def _renumber_sessions(
+    store: RecurrenceStateStore,
+    state_key: Hashable,
+    seeded: list[Hashable],
+    seed_results: list[Any],
+    values: list[Any],
+    tails: dict[Hashable, PartitionTail | None],
+) -> list[Any]:
+    """Map this run's 0-based session ids to ids unique across runs.
+
+    A session that contains a seed row continues the stored session and keeps its id;
+    every other session takes a fresh id, in the order of this run's ids.
+    """
+    mapping: dict[int, int] = {}
+    for partition, local in zip(seeded, seed_results):
+        tail = tails[partition]
+        if local is not None and tail is not None:
+            mapping[local] = tail.carry
+    new_sessions = sorted({v for v in values if v is not None and v not in mapping})
+    first = store.allocate_session_ids(state_key, len(new_sessions))
+    mapping.update({local: first + i for i, local in enumerate(new_sessions)})
+    return [None if v is None else mapping[v] for v in values]
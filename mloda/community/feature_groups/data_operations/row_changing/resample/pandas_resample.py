@@ -19,6 +19,7 @@ from mloda.community.feature_groups.data_operations.pandas_helpers import (
     PANDAS_AGG_FUNCS,
     apply_null_safe_agg,
     coerce_count_dtype,
+    narrow_frame,
     null_safe_groupby,
 )
 from mloda.community.feature_groups.data_operations.row_changing.resample.base import (
@@ -64,12 +65,12 @@ class PandasResample(ResampleFeatureGroup):
         if pandas_func is None:
             raise ValueError(f"Unsupported resample agg {agg!r} for Pandas; supported: {sorted(RESAMPLE_AGGS)}.")
 
-        data = data.copy()
-        # Floor the time column in place (bucket start keeps the original name).
-        data[time_column] = data[time_column].dt.floor(f"{n}{FIXED_FREQ_ALIASES[unit]}")
+        # Floor the time column of a narrow working frame (bucket start keeps the original name).
+        work = narrow_frame(data, [*partition_by, time_column, source_col])
+        work[time_column] = work[time_column].dt.floor(f"{n}{FIXED_FREQ_ALIASES[unit]}")
 
         keys = [*partition_by, time_column]
-        grouped = null_safe_groupby(data, keys, source_col)
+        grouped = null_safe_groupby(work, keys, source_col)
         result = apply_null_safe_agg(grouped, pandas_func, agg).reset_index()
         result = result.rename(columns={source_col: feature_name})
 
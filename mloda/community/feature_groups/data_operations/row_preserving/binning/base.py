@@ -13,7 +13,7 @@ from mloda.core.abstract_plugins.components.feature_name import FeatureName
 from mloda.core.abstract_plugins.components.feature_set import FeatureSet
 from mloda.core.abstract_plugins.components.options import Options
 from mloda.core.abstract_plugins.components.utils import escalate_match_abort
-from mloda.provider import DefaultOptionKeys, FeatureGroup, property_spec
+from mloda.provider import BaseArtifact, DefaultOptionKeys, FeatureGroup, property_spec
 from mloda.community.feature_groups.data_operations.base import (
     RejectionReasonMixin,
     is_op_token,
@@ -21,6 +21,14 @@ from mloda.community.feature_groups.data_operations.base import (
     op_token_value,
     positive_int_value,
 )
+from mloda.community.feature_groups.data_operations.row_preserving.binning.bin_edges import (
+    BIN_EDGES_VERSION,
+    BinEdgesArtifact,
+    bin_edges_version,
+    fit_bin_edges,
+    fitted_bin_edges,
+)
+from mloda.community.feature_groups.data_operations.json_artifact import load_json_artifact, save_json_artifact
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +46,7 @@ class BinningFeatureGroup(RejectionReasonMixin, FeatureGroup):
 
     BINNING_OP = "binning_op"
     N_BINS = "n_bins"
+    BIN_EDGES_VERSION = BIN_EDGES_VERSION
 
     PROPERTY_MAPPING = {
         BINNING_OP: property_spec(
@@ -55,6 +64,11 @@ class BinningFeatureGroup(RejectionReasonMixin, FeatureGroup):
         DefaultOptionKeys.in_features: property_spec(
             "Source numeric column",
         ),
+        BIN_EDGES_VERSION: property_spec(
+            "Label of the bin edges to save and serve across runs (opt-in)",
+            default=None,
+            match_guard=is_op_token,
+        ),
     }
 
     @classmethod
@@ -182,9 +196,25 @@ class BinningFeatureGroup(RejectionReasonMixin, FeatureGroup):
         in_features_set = feature.options.get_in_features()
         return [str(f.name) for f in in_features_set]
 
+    @staticmethod
+    def artifact() -> type[BaseArtifact] | None:
+        """Bin edges fitted for features with ``bin_edges_version``; see ``bin_edges``."""
+        return BinEdgesArtifact
+
     @classmethod
     def calculate_feature(cls, data: Any, features: FeatureSet) -> Any:
+        """Bin each feature, against loaded bin edges when it has ``bin_edges_version``.
+
+        A feature with ``bin_edges_version`` is binned against the loaded edges when
+        the run passed them in; otherwise its bins are computed from ``data``, and when
+        mloda requested an artifact the edges fitted on ``data`` are saved under the
+        label. The source values are sorted once per source column for fitting.
+        Features without the option are always binned from ``data``.
+        """
         table = data
+        fitted = load_json_artifact(features)
+        saved: dict[str, Any] | None = {} if features.artifact_to_save is not None else None
+        sorted_sources: dict[str, Any] = {}
 
         for feature in features.features:
             feature_name = feature.name
@@ -192,9 +222,26 @@ class BinningFeatureGroup(RejectionReasonMixin, FeatureGroup):
             source_features = cls._extract_source_features(feature)
             source_col = source_features[0]
             op, n_bins = cls._extract_binning_params(feature)
+            version = bin_edges_version(feature)
 
-            table = cls._compute_binning(table, feature_name, source_col, op, n_bins)
+            if version is not None and fitted is not None:
+                edges = fitted_bin_edges(fitted, feature_name, version, source_col, op, n_bins)
+                table = cls._apply_bin_edges(table, feature_name, source_col, edges)
+                continue
 
+            table = cls._compute_binning(table, feature_name, source_col, op, n_bins)
+            if version is not None and saved is not None:
+                if source_col not in sorted_sources:
+                    sorted_sources[source_col] = cls._sorted_source_values(table, source_col)
+                saved[feature_name] = {
+                    "version": version,
+                    "source": source_col,
+                    "op": op,
+                    "n_bins": n_bins,
+                    "edges": fit_bin_edges(sorted_sources[source_col], op, n_bins),
+                }
+
+        save_json_artifact(features, saved)
         return table
 
     @classmethod
@@ -207,3 +254,13 @@ class BinningFeatureGroup(RejectionReasonMixin, FeatureGroup):
         n_bins: int,
     ) -> Any:
         raise NotImplementedError
+
+    @classmethod
+    def _apply_bin_edges(cls, data: Any, feature_name: str, source_col: str, edges: list[Any]) -> Any:
+        """Append ``feature_name``: the number of ``edges`` at or below each value, null for null/NaN."""
+        raise NotImplementedError
+
+    @classmethod
+    def _sorted_source_values(cls, data: Any, source_col: str) -> Any:
+        """The non-null, non-NaN values of ``source_col`` in ascending order, as an indexable sequence."""
+        raise NotImplementedError
@@ -0,0 +1,128 @@
+"""Fitted bin edges: fit binning once on training data, apply the edges when serving.
+
+``bin`` needs the column's min/max and ``qbin`` a full rank of the column, so
+both are global passes over whatever data they run on. Setting the
+``bin_edges_version`` option to a label opts a feature into fitting once: a run
+without artifacts bins from its data, as always, and saves the edges it fitted
+under the label in a ``BinEdgesArtifact``; passing that artifact back to a later
+run (``artifacts=session.get_artifacts()``) bins the new rows against the stored
+edges instead, a per-row search over the edges with no pass over the rest of the
+data. The label is checked on load, so edges fitted under another label raise;
+bump it to require a refit. Features without the option bin from their data every
+run, record nothing and never sort their source for a fit.
+
+The edges of a feature are the ascending interior boundaries of its bins:
+bin ``i`` holds ``edges[i - 1] <= value < edges[i]``, values below the first
+edge fall in bin 0 and values at or above the last in the last bin.
+
+- ``bin``: ``min + k * (max - min) / n_bins`` for ``k`` in ``1..n_bins-1``.
+- ``qbin``: the value at the first rank ``r`` with ``r * n_bins // count >= k``,
+  the rank convention of the in-memory backends. Values tied across a bin
+  boundary all fall in the upper bin, where a fresh rank splits them by position.
+
+A source without a non-null value at fit time, or ``bin`` on a constant source,
+fits no edges: every non-null value goes to bin 0.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from typing import Any
+
+from mloda.core.abstract_plugins.components.feature import Feature
+
+from mloda.community.feature_groups.data_operations.base import op_token_value, option_value
+from mloda.community.feature_groups.data_operations.json_artifact import JsonArtifact
+
+BIN_EDGES_VERSION = "bin_edges_version"
+"""Config key labelling the bin edges a feature saves and serves (opt-in).
+
+Used by: binning.
+"""
+
+
+class BinEdgesArtifact(JsonArtifact):
+    """Bin edges of the binning features with ``bin_edges_version``, keyed by feature name.
+
+    Each entry records the ``version`` label, ``source`` column, ``op``, ``n_bins`` and ``edges``.
+    """
+
+
+def bin_edges_version(feature: Feature) -> str | None:
+    """The ``bin_edges_version`` label of ``feature``, or None when it bins from its data every run."""
+    return option_value(feature.options, BIN_EDGES_VERSION, op_token_value)
+
+
+def fit_bin_edges(sorted_values: Sequence[Any], op: str, n_bins: int) -> list[Any]:
+    """The edges of ``op`` with ``n_bins`` bins over the ascending non-null ``sorted_values``.
+
+    ``sorted_values`` is any indexable sequence: a list, an Arrow or NumPy array, a Polars Series.
+    """
+    count = len(sorted_values)
+    if count == 0:
+        return []
+    if op == "bin":
+        col_min = _python_value(sorted_values[0])
+        col_max = _python_value(sorted_values[count - 1])
+        if col_min == col_max:
+            return []
+        width = (col_max - col_min) / n_bins
+        return [col_min + k * width for k in range(1, n_bins)]
+    if op == "qbin":
+        # First rank r with r * n_bins // count >= k, i.e. ceil(k * count / n_bins).
+        ranks = [-(-k * count // n_bins) for k in range(1, n_bins)]
+        return [_python_value(sorted_values[r]) for r in ranks if r < count]
+    raise ValueError(f"Unsupported binning operation: {op}")
+
+
+def fitted_bin_edges(fitted: Any, feature_name: str, version: str, source_col: str, op: str, n_bins: int) -> list[Any]:
+    """The edges ``fitted`` stores for ``feature_name``, checked against its label and binning."""
+    entry = fitted.get(feature_name) if isinstance(fitted, dict) else None
+    if entry is None:
+        raise ValueError(f"Bin edges artifact has no entry for feature '{feature_name}'.")
+    if entry.get("version") != version:
+        raise ValueError(
+            f"Bin edges artifact for feature '{feature_name}' was fitted as version {entry.get('version')!r}, "
+            f"but the feature requests {BIN_EDGES_VERSION}={version!r}. Run without the artifact to refit."
+        )
+    stored = (entry.get("source"), entry.get("op"), entry.get("n_bins"))
+    if stored != (source_col, op, n_bins):
+        raise ValueError(
+            f"Bin edges artifact for feature '{feature_name}' was fitted for source/op/n_bins {stored}, "
+            f"but the feature requests {(source_col, op, n_bins)}."
+        )
+    edges = list(entry.get("edges", []))
+    if len(edges) >= n_bins or edges != sorted(edges):
+        raise ValueError(
+            f"Bin edges artifact for feature '{feature_name}' must hold fewer than {n_bins} ascending edges, "
+            f"got {edges}."
+        )
+    return edges
+
+
+def bin_edges_case_sql(quoted_source: str, edges: list[Any], null_condition: str) -> str:
+    """A SQL CASE assigning ``quoted_source`` its bin index under ``edges``, NULL where ``null_condition``."""
+    branches = [f"WHEN {null_condition} THEN NULL"]
+    for index in range(len(edges), 0, -1):
+        branches.append(f"WHEN {quoted_source} >= {_sql_number(edges[index - 1])} THEN {index}")
+    return f"CASE {' '.join(branches)} ELSE 0 END"
+
+
+def _python_value(value: Any) -> Any:
+    """``value`` as a plain Python scalar, so the edges serialize to JSON."""
+    if hasattr(value, "as_py"):
+        return value.as_py()
+    if hasattr(value, "item"):
+        return value.item()
+    return value
+
+
+def _sql_number(value: Any) -> str:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"Bin edges must be numbers, got {value!r}.")
+    if isinstance(value, int):
+        return str(value)
+    if not math.isfinite(value):
+        raise ValueError(f"Bin edges must be finite, got {value!r}.")
+    return f"CAST({value!r} AS DOUBLE)"
@@ -12,6 +12,7 @@ from mloda_plugins.compute_framework.base_implementations.sql.sql_utils import p
 from mloda.community.feature_groups.data_operations.row_preserving.binning.base import (
     BinningFeatureGroup,
 )
+from mloda.community.feature_groups.data_operations.row_preserving.binning.bin_edges import bin_edges_case_sql
 
 
 class DuckdbBinning(BinningFeatureGroup):
@@ -79,3 +80,17 @@ class DuckdbBinning(BinningFeatureGroup):
             return qbin_rel.project(keep)
 
         raise ValueError(f"Unsupported binning operation for DuckDB: {op}")
+
+    @classmethod
+    def _apply_bin_edges(cls, data: Any, feature_name: str, source_col: str, edges: list[Any]) -> DuckdbRelation:
+        quoted_source = quote_ident(source_col)
+        null_condition = f"{quoted_source} IS NULL OR isnan({quoted_source})"
+        expr = bin_edges_case_sql(quoted_source, edges, null_condition)
+        rel: DuckdbRelation = data.project(f"*, {expr} AS {quote_ident(feature_name)}")
+        return rel
+
+    @classmethod
+    def _sorted_source_values(cls, data: Any, source_col: str) -> Any:
+        quoted_source = quote_ident(source_col)
+        rel = data.project(quoted_source).filter(f"{quoted_source} IS NOT NULL AND NOT isnan({quoted_source})")
+        return rel.order(quoted_source).to_arrow_table().column(0)
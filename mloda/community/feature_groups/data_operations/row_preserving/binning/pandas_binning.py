@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from typing import Any
 
 import numpy as np
 import pandas as pd
@@ -9,6 +10,7 @@ import pandas as pd
 from mloda.provider import ComputeFramework
 from mloda_plugins.compute_framework.base_implementations.pandas.dataframe import PandasDataFrame
 
+from mloda.community.feature_groups.data_operations.pandas_helpers import with_columns
 from mloda.community.feature_groups.data_operations.row_preserving.binning.base import (
     BinningFeatureGroup,
 )
@@ -28,13 +30,11 @@ class PandasBinning(BinningFeatureGroup):
         op: str,
         n_bins: int,
     ) -> pd.DataFrame:
-        data = data.copy()
         col = data[source_col]
         non_null_mask = col.notna()
 
         if non_null_mask.sum() == 0:
-            data[feature_name] = None
-            return data
+            return with_columns(data, {feature_name: None})
 
         if op == "bin":
             col_min = col[non_null_mask].min()
@@ -47,14 +47,22 @@ class PandasBinning(BinningFeatureGroup):
                 bin_idx = np.floor((col - col_min) / bin_width)
                 bin_idx = bin_idx.clip(upper=n_bins - 1)
                 result = bin_idx.astype("Int64")
-
-            data[feature_name] = result
         elif op == "qbin":
             n = non_null_mask.sum()
             rank = col.rank(method="first", na_option="keep") - 1
             result = (rank * n_bins // n).astype("Int64")
-            data[feature_name] = result
         else:
             raise ValueError(f"Unsupported binning operation: {op}")
 
-        return data
+        return with_columns(data, {feature_name: result})
+
+    @classmethod
+    def _apply_bin_edges(cls, data: pd.DataFrame, feature_name: str, source_col: str, edges: list[Any]) -> pd.DataFrame:
+        values = data[source_col].to_numpy(dtype=np.float64, na_value=np.nan)
+        indices = np.searchsorted(np.asarray(edges, dtype=np.float64), values, side="right")
+        result = pd.Series(indices, index=data.index, dtype="Int64").mask(np.isnan(values))
+        return with_columns(data, {feature_name: result})
+
+    @classmethod
+    def _sorted_source_values(cls, data: pd.DataFrame, source_col: str) -> np.ndarray[Any, Any]:
+        return np.sort(data[source_col].dropna().to_numpy())
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 import polars as pl
 
 from mloda.provider import ComputeFramework
@@ -65,3 +67,15 @@ class PolarsLazyBinning(BinningFeatureGroup):
         bin_expr = (rank_expr * n_bins) // count_expr
 
         return pl.when(col.is_null()).then(pl.lit(None, dtype=pl.Int64)).otherwise(bin_expr).cast(pl.Int64)
+
+    @classmethod
+    def _apply_bin_edges(cls, data: pl.LazyFrame, feature_name: str, source_col: str, edges: list[Any]) -> pl.LazyFrame:
+        col = pl.col(source_col).cast(pl.Float64).fill_nan(None)
+        indices = pl.lit(pl.Series(edges, dtype=pl.Float64)).search_sorted(col, side="right")
+        expr = pl.when(col.is_null()).then(pl.lit(None, dtype=pl.Int64)).otherwise(indices.cast(pl.Int64))
+        return data.with_columns(expr.alias(feature_name))
+
+    @classmethod
+    def _sorted_source_values(cls, data: pl.LazyFrame, source_col: str) -> pl.Series:
+        col = pl.col(source_col).fill_nan(None) if data.collect_schema()[source_col].is_float() else pl.col(source_col)
+        return data.select(col.drop_nulls().sort()).collect().to_series()
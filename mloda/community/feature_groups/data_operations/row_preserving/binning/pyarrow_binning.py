@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import Any
 
+import numpy as np
 import pyarrow as pa
 import pyarrow.compute as pc
 
@@ -86,3 +87,20 @@ class PyArrowBinning(BinningFeatureGroup):
             result_values[original_idx] = bin_val
 
         return pa.array(result_values, type=pa.int64())
+
+    @classmethod
+    def _apply_bin_edges(cls, table: pa.Table, feature_name: str, source_col: str, edges: list[Any]) -> pa.Table:
+        col = table.column(source_col).cast(pa.float64())
+        valid = pc.and_(pc.is_valid(col), pc.invert(pc.is_nan(col)))
+        values = pc.fill_null(col, float("nan")).to_numpy()
+        indices = np.searchsorted(np.asarray(edges, dtype=np.float64), values, side="right")
+        result = pc.if_else(valid, pa.array(indices, type=pa.int64()), pa.scalar(None, type=pa.int64()))
+        return table.append_column(feature_name, result)
+
+    @classmethod
+    def _sorted_source_values(cls, table: pa.Table, source_col: str) -> pa.Array:
+        col = table.column(source_col)
+        if pa.types.is_floating(col.type):
+            col = col.filter(pc.invert(pc.is_nan(col)))
+        col = col.drop_null()
+        return pc.take(col, pc.sort_indices(col)).combine_chunks()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import bisect
 import math
 from typing import Any
 
@@ -86,3 +87,15 @@ class PythonDictBinning(BinningFeatureGroup):
             result[original_idx] = rank * n_bins // n
 
         return result
+
+    @classmethod
+    def _apply_bin_edges(
+        cls, data: dict[str, list[Any]], feature_name: str, source_col: str, edges: list[Any]
+    ) -> dict[str, list[Any]]:
+        data = dict(data)
+        data[feature_name] = [None if cls._is_null(v) else bisect.bisect_right(edges, v) for v in data[source_col]]
+        return data
+
+    @classmethod
+    def _sorted_source_values(cls, data: dict[str, list[Any]], source_col: str) -> list[Any]:
+        return sorted(v for v in data[source_col] if not cls._is_null(v))
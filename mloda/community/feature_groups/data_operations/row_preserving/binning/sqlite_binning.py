@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from typing import Any
 
 from mloda.provider import ComputeFramework
 from mloda_plugins.compute_framework.base_implementations.sql.sql_utils import pick_helper_column_name, quote_ident
@@ -11,6 +12,7 @@ from mloda_plugins.compute_framework.base_implementations.sqlite.sqlite_relation
 from mloda.community.feature_groups.data_operations.row_preserving.binning.base import (
     BinningFeatureGroup,
 )
+from mloda.community.feature_groups.data_operations.row_preserving.binning.bin_edges import bin_edges_case_sql
 
 
 class SqliteBinning(BinningFeatureGroup):
@@ -81,3 +83,22 @@ class SqliteBinning(BinningFeatureGroup):
         rel = rel.select(_raw_sql=proj)
         rel = rel.order(rn)
         return rel.select(*original_cols, feature_name)
+
+    @classmethod
+    def _apply_bin_edges(
+        cls, data: SqliteRelation, feature_name: str, source_col: str, edges: list[Any]
+    ) -> SqliteRelation:
+        # SQLite stores NaN as NULL, so the IS NULL check covers both.
+        quoted_source = quote_ident(source_col)
+        expr = bin_edges_case_sql(quoted_source, edges, f"{quoted_source} IS NULL")
+        return data.select(_raw_sql=f"*, {expr} AS {quote_ident(feature_name)}")
+
+    @classmethod
+    def _sorted_source_values(cls, data: SqliteRelation, source_col: str) -> Any:
+        # Safety: the identifiers are quote_ident()-quoted.
+        quoted_source = quote_ident(source_col)
+        sql = (
+            f"SELECT {quoted_source} FROM {quote_ident(data.table_name)} "  # nosec
+            f"WHERE {quoted_source} IS NOT NULL ORDER BY {quoted_source}"
+        )
+        return [row[0] for row in data.connection.execute(sql).fetchall()]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from typing import Any
 
 import pyarrow as pa
@@ -11,6 +12,7 @@ from mloda.testing.data_creator.pyarrow import PyArrowDataOpsTestDataCreator
 from mloda.testing.feature_groups.data_operations.integration import DataOpsIntegrationTestBase
 from mloda.testing.feature_groups.data_operations.row_preserving.binning.binning import (
     EXPECTED_BIN_3,
+    EXPECTED_EDGES_0_25,
     EXPECTED_QBIN_3,
 )
 from mloda.user import Feature, PluginCollector, mloda
@@ -187,3 +189,51 @@ class TestIntegrationMultipleFeatures:
 
         assert bin3_found, "value_int__bin_3 result not found"
         assert qbin3_found, "value_int__qbin_3 result not found"
+
+
+class TestIntegrationFittedBinEdges:
+    """Bin edges saved by one run and loaded by the next."""
+
+    @staticmethod
+    def _column(results: list[Any], name: str) -> list[Any]:
+        for table in results:
+            if isinstance(table, pa.Table) and name in table.column_names:
+                return list(table.column(name).to_pylist())
+        raise AssertionError(f"{name} result not found")
+
+    def _session(self, *feature_names: str, version: str | None = "v1") -> Any:
+        plugin_collector = PluginCollector.enabled_feature_groups({PyArrowDataOpsTestDataCreator, PyArrowBinning})
+        context = {} if version is None else {"bin_edges_version": version}
+        return mloda.prepare(
+            [Feature(name, options=Options(context=context)) for name in feature_names],
+            compute_frameworks={PyArrowTable},
+            plugin_collector=plugin_collector,
+        )
+
+    def test_saved_edges_round_trip(self) -> None:
+        """The artifact a run saves reproduces that run's bins when loaded."""
+        session = self._session("value_int__bin_3", "value_int__qbin_3")
+        session.run()
+        artifacts = session.get_artifacts()
+        assert len(artifacts) == 1
+        (saved,) = artifacts.values()
+        assert set(json.loads(saved)) == {"value_int__bin_3", "value_int__qbin_3"}
+
+        results = self._session("value_int__bin_3", "value_int__qbin_3").run(artifacts=artifacts)
+        assert self._column(results, "value_int__bin_3") == EXPECTED_BIN_3
+        assert self._column(results, "value_int__qbin_3") == EXPECTED_QBIN_3
+
+    def test_loaded_edges_replace_the_fit(self) -> None:
+        """A run given an artifact bins against its edges instead of the data's own range."""
+        fitted = {
+            "value_int__bin_3": {"version": "v1", "source": "value_int", "op": "bin", "n_bins": 3, "edges": [0, 25]}
+        }
+        results = self._session("value_int__bin_3").run(artifacts={"value_int__bin_3": json.dumps(fitted)})
+        assert self._column(results, "value_int__bin_3") == EXPECTED_EDGES_0_25
+
+    def test_without_version_no_edges_are_saved(self) -> None:
+        """Binning without ``bin_edges_version`` saves no artifact, so a later run keeps binning its data."""
+        session = self._session("value_int__bin_3", version=None)
+        results = session.run()
+        assert self._column(results, "value_int__bin_3") == EXPECTED_BIN_3
+        assert session.get_artifacts() == {}
@@ -7,6 +7,7 @@ import pandas as pd
 from mloda.provider import ComputeFramework
 from mloda_plugins.compute_framework.base_implementations.pandas.dataframe import PandasDataFrame
 
+from mloda.community.feature_groups.data_operations.pandas_helpers import with_columns
 from mloda.community.feature_groups.data_operations.row_preserving.datetime.base import (
     DateTimeFeatureGroup,
 )
@@ -25,31 +26,29 @@ class PandasDateTimeExtraction(DateTimeFeatureGroup):
         source_col: str,
         op: str,
     ) -> pd.DataFrame:
-        data = data.copy()
         col = pd.to_datetime(data[source_col])
 
         if op == "year":
-            data[feature_name] = col.dt.year
+            values = col.dt.year
         elif op == "month":
-            data[feature_name] = col.dt.month
+            values = col.dt.month
         elif op == "day":
-            data[feature_name] = col.dt.day
+            values = col.dt.day
         elif op == "hour":
-            data[feature_name] = col.dt.hour
+            values = col.dt.hour
         elif op == "minute":
-            data[feature_name] = col.dt.minute
+            values = col.dt.minute
         elif op == "second":
-            data[feature_name] = col.dt.second
+            values = col.dt.second
         elif op == "dayofweek":
-            data[feature_name] = col.dt.dayofweek
+            values = col.dt.dayofweek
         elif op == "is_weekend":
             mask = col.notna()
-            result = pd.array([pd.NA] * len(col), dtype="Int64")
-            result[mask] = (col[mask].dt.dayofweek >= 5).astype(int).values
-            data[feature_name] = result
+            values = pd.array([pd.NA] * len(col), dtype="Int64")
+            values[mask] = (col[mask].dt.dayofweek >= 5).astype(int).values
         elif op == "quarter":
-            data[feature_name] = col.dt.quarter
+            values = col.dt.quarter
         else:
             raise ValueError(f"Unsupported datetime operation: {op}")
 
-        return data
+        return with_columns(data, {feature_name: values})
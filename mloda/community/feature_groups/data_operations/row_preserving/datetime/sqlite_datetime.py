@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import pyarrow as pa
+
 from mloda.provider import ComputeFramework
 from mloda_plugins.compute_framework.base_implementations.sql.sql_utils import quote_ident
 from mloda_plugins.compute_framework.base_implementations.sqlite.sqlite_framework import SqliteFramework
 from mloda_plugins.compute_framework.base_implementations.sqlite.sqlite_relation import SqliteRelation
 
+from mloda.community.feature_groups.data_operations.sqlite_helpers import append_sql_column
 from mloda.community.feature_groups.data_operations.row_preserving.datetime.base import (
     DateTimeFeatureGroup,
 )
@@ -46,19 +49,5 @@ class SqliteDateTimeExtraction(DateTimeFeatureGroup):
 
         quoted_source = quote_ident(source_col)
         expr = expr_template.format(col=quoted_source)
-        quoted_feature = quote_ident(feature_name)
-
-        sql = " ".join(
-            [
-                "SELECT",
-                f"{expr} AS {quoted_feature}",
-                "FROM",
-                f"{quote_ident(data.table_name)}",
-                "ORDER BY rowid",
-            ]
-        )
-        cursor = data.connection.execute(sql)
-        rows = cursor.fetchall()
-
-        result_values = [row[0] for row in rows]
-        return data.append_column(feature_name, result_values)
+        # Every extraction (is_weekend included) is an integer, as in the other backends.
+        return append_sql_column(data, feature_name, expr, pa.int64())
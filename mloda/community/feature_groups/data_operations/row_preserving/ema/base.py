@@ -25,6 +25,9 @@ Options context:
 - ``partition_by``: OPTIONAL list of columns; default ``[]`` treats the whole
   table as a single partition.
 - ``in_features``: the single source column (when not derivable from the name).
+- ``state_store``: OPTIONAL name of a ``recurrence_state`` store; when set, each run
+  continues every partition from the tail the previous run left there instead of
+  recomputing from scratch (see ``recurrence_state``).
 
 The ``span`` is passed DIRECTLY to the underlying library (pandas
 ``ewm(span=...)`` / polars ``ewm_mean(span=...)``); backends must NOT
@@ -54,7 +57,18 @@ from mloda.community.feature_groups.data_operations.base import (
     always_required,
     column_ref_value,
     is_column_ref,
+    is_op_token,
+    op_token_value,
+    option_value,
 )
+from mloda.community.feature_groups.data_operations.recurrence_state import (
+    STATE_STORE,
+    StateFrameOps,
+    compute_with_carried_state,
+    get_state_store,
+    state_store_supported,
+)
+from mloda.community.feature_groups.data_operations.sort_cache import sort_permutation_scope
 
 
 class EmaFeatureGroup(RejectionReasonMixin, FeatureGroup):
@@ -67,6 +81,10 @@ class EmaFeatureGroup(RejectionReasonMixin, FeatureGroup):
 
     PARTITION_BY = "partition_by"
     ORDER_BY = "order_by"
+    STATE_STORE = STATE_STORE
+
+    # Backends that can carry recurrence state across runs set this; see recurrence_state.
+    STATE_FRAME_OPS: type[StateFrameOps] | None = None
 
     PROPERTY_MAPPING = {
         DefaultOptionKeys.in_features: property_spec(
@@ -81,8 +99,25 @@ class EmaFeatureGroup(RejectionReasonMixin, FeatureGroup):
             match_guard=is_column_ref,
             required_when=always_required,
         ),
+        STATE_STORE: property_spec(
+            "Name of the state store to carry per-partition tail state across runs in (opt-in)",
+            default=None,
+            match_guard=is_op_token,
+        ),
     }
 
+    @classmethod
+    def match_feature_group_criteria(
+        cls,
+        feature_name: Any,
+        options: Any,
+        _data_access_collection: Any = None,
+    ) -> bool:
+        """Extend the declaration-driven match: ``state_store`` needs a backend that carries state."""
+        if not super().match_feature_group_criteria(feature_name, options, _data_access_collection):
+            return False
+        return state_store_supported(cls, options)
+
     def input_features(self, options: Options, feature_name: FeatureName) -> set[Feature] | None:
         _feature_name = str(feature_name)
 
@@ -158,23 +193,43 @@ class EmaFeatureGroup(RejectionReasonMixin, FeatureGroup):
             raise ValueError("ema requires an 'order_by' column in Options context.")
         return column_ref_value(order_by)
 
+    @classmethod
+    def _extract_state_store(cls, feature: Feature) -> str | None:
+        """Return the ``state_store`` name, or None when the feature recomputes from scratch."""
+        return option_value(feature.options, cls.STATE_STORE, op_token_value)
+
     @classmethod
     def calculate_feature(cls, data: Any, features: FeatureSet) -> Any:
         """Compute one EMA column per feature in ``features``."""
         table = data
 
-        for feature in features.features:
-            feature_name = feature.name
-
-            source_features = cls._extract_source_features(feature)
-            source_col = source_features[0]
-            span = cls._extract_span(feature)
-            partition_by = cls._extract_partition_by(feature)
-            order_by = cls._extract_order_by(feature)
-
-            cls._assert_source_column_present(table, source_col)
-
-            table = cls._compute_ema(table, feature_name, source_col, span, partition_by, order_by)
+        with sort_permutation_scope():
+            for feature in features.features:
+                feature_name = feature.name
+
+                source_features = cls._extract_source_features(feature)
+                source_col = source_features[0]
+                span = cls._extract_span(feature)
+                partition_by = cls._extract_partition_by(feature)
+                order_by = cls._extract_order_by(feature)
+
+                cls._assert_source_column_present(table, source_col)
+
+                store_name = cls._extract_state_store(feature)
+                if store_name is None:
+                    table = cls._compute_ema(table, feature_name, source_col, span, partition_by, order_by)
+                else:
+                    table = compute_with_carried_state(
+                        cls.STATE_FRAME_OPS,
+                        get_state_store(store_name),
+                        "ema",
+                        table,
+                        feature_name,
+                        source_col,
+                        partition_by,
+                        order_by,
+                        lambda frame: cls._compute_ema(frame, feature_name, source_col, span, partition_by, order_by),
+                    )
 
         return table
 
@@ -7,11 +7,13 @@ import pandas as pd
 from mloda.provider import ComputeFramework
 from mloda_plugins.compute_framework.base_implementations.pandas.dataframe import PandasDataFrame
 
-from mloda.community.feature_groups.data_operations.helper_columns import unique_helper_name
+from mloda.community.feature_groups.data_operations.pandas_helpers import PandasStateFrame, narrow_frame, with_columns
 from mloda.community.feature_groups.data_operations.row_preserving.ema.base import EmaFeatureGroup
 
 
 class PandasEma(EmaFeatureGroup):
+    STATE_FRAME_OPS = PandasStateFrame
+
     @classmethod
     def compute_framework_rule(cls) -> set[type[ComputeFramework]] | None:
         return {PandasDataFrame}
@@ -33,14 +35,9 @@ class PandasEma(EmaFeatureGroup):
         partition_by: list[str],
         order_by: str,
     ) -> pd.DataFrame:
-        data = data.copy()
-
-        rn_col = unique_helper_name("__mloda_rn__", set(data.columns) | {feature_name})
-
-        # Tag original row order so we can restore it after sorting.
-        data[rn_col] = range(len(data))
-
-        ordered = data.sort_values(by=[*partition_by, order_by], na_position="last")
+        ordered = narrow_frame(data, [*partition_by, order_by, source_col]).sort_values(
+            by=[*partition_by, order_by], na_position="last"
+        )
 
         def _ema(series: pd.Series) -> pd.Series:
             # adjust=False, nulls skipped in the recurrence; null input -> null output.
@@ -51,6 +48,5 @@ class PandasEma(EmaFeatureGroup):
         else:
             ordered[feature_name] = _ema(ordered[source_col])
 
-        # Restore original row order, drop the helper column.
-        result = ordered.sort_values(by=rn_col).drop(columns=[rn_col])
-        return result
+        # Restore input row order.
+        return with_columns(data, {feature_name: ordered[feature_name].sort_index().set_axis(data.index)})
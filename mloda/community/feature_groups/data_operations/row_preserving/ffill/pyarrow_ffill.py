@@ -8,7 +8,12 @@ import pyarrow.compute as pc
 from mloda.provider import ComputeFramework
 from mloda_plugins.compute_framework.base_implementations.pyarrow.table import PyArrowTable
 
-from mloda.community.feature_groups.data_operations.pyarrow_helpers import nan_safe_not_equal
+from mloda.community.feature_groups.data_operations.pyarrow_helpers import (
+    PyArrowStateFrame,
+    scatter_to_rows,
+    segmented_fill_null_forward,
+    sort_permutation,
+)
 from mloda.community.feature_groups.data_operations.row_preserving.ffill.base import FfillFeatureGroup
 
 
@@ -16,13 +21,15 @@ class PyArrowFfill(FfillFeatureGroup):
     """PyArrow backend; also the cross-framework reference implementation.
 
     ``pyarrow.compute.fill_null_forward`` does NOT respect partition boundaries,
-    so the fill is applied PER PARTITION. Rows are tagged with their original
-    position, sorted by ``[*partition_by, order_by]`` ascending, filled within
-    each partition's contiguous (sorted) slice, then scattered back to the
-    original row order. No per-row Python loop is used; only a loop over the
-    (small) set of partition groups.
+    so rows are sorted by ``[*partition_by, order_by]`` ascending and filled with
+    ``segmented_fill_null_forward``, which resets at every partition start, then
+    scattered back to the original row order. The sort comes from
+    ``sort_permutation``, so ffill features of one FeatureSet over the same keys
+    sort once. No Python loop runs, neither per row nor per partition.
     """
 
+    STATE_FRAME_OPS = PyArrowStateFrame
+
     @classmethod
     def compute_framework_rule(cls) -> set[type[ComputeFramework]] | None:
         return {PyArrowTable}
@@ -43,67 +50,14 @@ class PyArrowFfill(FfillFeatureGroup):
         partition_by: list[str],
         order_by: str,
     ) -> pa.Table:
-        # Sort the whole table by [*partition_by, order_by] ascending so that
-        # rows of one partition form a contiguous, time-ordered slice.
-        sort_keys = [(col, "ascending") for col in (*partition_by, order_by)]
-        sorted_indices = pc.sort_indices(data, sort_keys=sort_keys)
-
-        source = data.column(source_col)
-        sorted_source = pc.take(source, sorted_indices)
-
-        if partition_by:
-            # Build, in sorted order, an integer group id that increments at each
-            # partition boundary, then fill within each contiguous group.
-            sorted_partition_cols = [pc.take(data.column(col), sorted_indices) for col in partition_by]
-            filled_sorted = cls._fill_per_partition(sorted_source, sorted_partition_cols)
-        else:
-            filled_sorted = pc.fill_null_forward(sorted_source)
+        # Order by [*partition_by, order_by] ascending so that rows of one partition
+        # form a contiguous, time-ordered slice. The permutation and the partition
+        # starts are shared with other features of the FeatureSet on the same keys.
+        perm = sort_permutation(data, partition_by, order_by)
+        sorted_source = pc.take(data.column(source_col), perm.forward)
+        filled_sorted = segmented_fill_null_forward(sorted_source, perm.boundaries)
 
         # Scatter the filled values back to their original row positions.
-        scatter = pc.sort_indices(sorted_indices)
-        filled = pc.take(filled_sorted, scatter)
+        filled = scatter_to_rows(filled_sorted, perm.forward)
 
         return data.append_column(feature_name, filled)
-
-    @staticmethod
-    def _fill_per_partition(sorted_source: pa.Array, sorted_partition_cols: list[pa.Array]) -> pa.Array:
-        """Forward-fill ``sorted_source`` independently within each contiguous partition.
-
-        ``sorted_source`` and ``sorted_partition_cols`` are already ordered so
-        that rows of one partition are contiguous. A boundary mask (computed with
-        Arrow vector ops, no per-row Python loop) marks where a new partition
-        starts; the source is sliced at those boundaries and each slice is filled
-        independently, then the slices are concatenated. The only Python loop is
-        over the (small) number of partition groups.
-        """
-        n = len(sorted_source)
-        if n == 0:
-            return sorted_source
-
-        # Build a boundary mask of length n where mask[i] is True iff row i begins
-        # a new partition (its key differs from row i-1). Row 0 is always a boundary.
-        # Comparing the shifted columns and OR-ing across partition columns is all
-        # done with Arrow compute kernels.
-        changed: pa.Array = pa.array([False] * (n - 1), type=pa.bool_())
-        for col in sorted_partition_cols:
-            prev = col.slice(0, n - 1)
-            curr = col.slice(1, n - 1)
-            # not equal (NaN-safe, so two NaN neighbours merge like Table.group_by()) OR
-            # exactly one side null -> key changed at this position. Two null neighbours
-            # merge too (Table.group_by() puts every null key in one group, not one per row).
-            neq = nan_safe_not_equal(curr, prev)
-            null_diff = pc.not_equal(pc.is_null(curr), pc.is_null(prev))
-            col_changed = pc.fill_null(pc.or_(neq, null_diff), True)
-            both_null = pc.and_(pc.is_null(curr), pc.is_null(prev))
-            col_changed = pc.and_(col_changed, pc.invert(both_null))
-            changed = pc.or_(changed, col_changed)
-
-        boundary_mask = pa.concat_arrays([pa.array([True], type=pa.bool_()), changed.combine_chunks()])
-        boundaries: list[int] = pc.indices_nonzero(boundary_mask).to_pylist()
-
-        pieces: list[pa.Array] = []
-        for start, end in zip(boundaries, boundaries[1:] + [n]):
-            piece = sorted_source.slice(start, end - start)
-            pieces.append(pc.fill_null_forward(piece))
-
-        return pa.chunked_array(pieces, type=sorted_source.type).combine_chunks()
@@ -15,11 +15,14 @@ from mloda_plugins.compute_framework.base_implementations.python_dict.python_dic
 )
 from mloda_plugins.compute_framework.base_implementations.python_dict.python_dict_utils import row_count
 
-from mloda.community.feature_groups.data_operations.python_dict_helpers import group_key_value, nulls_last_sort_key
+from mloda.community.feature_groups.data_operations.python_dict_helpers import sort_permutation, sorted_groups
+from mloda.community.feature_groups.data_operations.recurrence_state import PythonDictStateFrame
 from mloda.community.feature_groups.data_operations.row_preserving.ffill.base import FfillFeatureGroup
 
 
 class PythonDictFfill(FfillFeatureGroup):
+    STATE_FRAME_OPS = PythonDictStateFrame
+
     @classmethod
     def compute_framework_rule(cls) -> set[type[ComputeFramework]] | None:
         return {PythonDictFramework}
@@ -42,24 +45,18 @@ class PythonDictFfill(FfillFeatureGroup):
     ) -> dict[str, list[Any]]:
         num_rows = row_count(data)
 
-        order_vals = data[order_by]
         source_vals = data[source_col]
-        partition_cols = [data[col] for col in partition_by]
-
-        # Build group keys, then stable-sort each group by order_by (nulls last).
-        groups: dict[tuple[Any, ...], list[tuple[int, Any, Any]]] = {}
-        for i in range(num_rows):
-            key = tuple(group_key_value(col[i]) for col in partition_cols)
-            groups.setdefault(key, []).append((i, order_vals[i], source_vals[i]))
 
-        for rows in groups.values():
-            rows.sort(key=lambda t: nulls_last_sort_key(t[1]))
+        # Row indices per partition group, stable-sorted by order_by (nulls last); shared
+        # with the other features of this FeatureSet that order by the same columns.
+        groups = sorted_groups(sort_permutation(data, partition_by, order_by))
 
         result_values: list[Any] = [None] * num_rows
 
-        for rows in groups.values():
+        for rows in groups:
             carried: Any = None
-            for row_index, _order_val, value in rows:
+            for row_index in rows:
+                value = source_vals[row_index]
                 if value is not None:
                     carried = value
                 result_values[row_index] = carried
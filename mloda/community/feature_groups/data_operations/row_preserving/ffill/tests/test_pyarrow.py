@@ -108,3 +108,42 @@ class TestPyArrowFfillNullPartitionKeyGrouping:
             f"(10.0, matching PyArrow's own group_by()), got {result_col[1]!r} (PyArrowFfill "
             "split the null rows into separate one-row groups)"
         )
+
+
+class TestPyArrowFfillSharedSort:
+    """ffill features of one FeatureSet over the same keys sort the table once."""
+
+    def test_two_features_one_sort(self, monkeypatch: Any) -> None:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        from mloda.testing.feature_groups.data_operations.helpers import (
+            extract_column,
+            make_feature_set,
+            merge_feature_sets,
+        )
+
+        calls: list[int] = []
+        sort_indices = pc.sort_indices
+
+        def counting_sort_indices(*args: Any, **kwargs: Any) -> Any:
+            calls.append(1)
+            return sort_indices(*args, **kwargs)
+
+        table = pa.table(
+            {
+                "grp": ["a", "b", "a", "b"],
+                "ord": [2, 1, 1, 2],
+                "x": [None, 1.0, 5.0, None],
+                "y": [7, None, None, 3],
+            }
+        )
+        fs = merge_feature_sets(
+            make_feature_set("x__ffill", ["grp"], "ord"), make_feature_set("y__ffill", ["grp"], "ord")
+        )
+        monkeypatch.setattr(pc, "sort_indices", counting_sort_indices)
+        result = PyArrowFfill.calculate_feature(table, fs)
+
+        assert extract_column(result, "x__ffill") == [5.0, 1.0, 5.0, 1.0]
+        assert extract_column(result, "y__ffill") == [7, None, None, 3]
+        assert len(calls) == 1
@@ -33,6 +33,13 @@ from mloda.community.feature_groups.data_operations.base import (
 )
 from mloda.community.feature_groups.data_operations.capability_hook import SubtypeCapabilityHook
 from mloda.community.feature_groups.data_operations.mask_utils import MASK_KEY, parse_mask_spec
+from mloda.community.feature_groups.data_operations.sharded_execution import (
+    SHARDS,
+    ShardFrameOps,
+    run_sharded,
+    shards_supported,
+)
+from mloda.community.feature_groups.data_operations.sort_cache import sort_permutation_scope
 
 
 # Patterns for string-based feature names; group 1 is the aggregation token, matching what
@@ -189,6 +196,8 @@ class FrameAggregateFeatureGroup(SubtypeCapabilityHook, RejectionReasonMixin, Fe
     - ``in_features``: The source feature to aggregate
     - ``partition_by``: List of columns to partition by
     - ``order_by``: Column to order by (required for all frame types)
+    - ``shards``: Optional number of hash shards computed in parallel processes
+      (see ``sharded_execution``); backends without ``SHARD_FRAME_OPS`` reject it
     """
 
     # PREFIX_PATTERN is the rolling member; FRAME_PATTERNS is the full matching set the mixin uses.
@@ -216,6 +225,10 @@ class FrameAggregateFeatureGroup(SubtypeCapabilityHook, RejectionReasonMixin, Fe
     FRAME_UNIT = _FRAME_UNIT_KEY
     PARTITION_BY = "partition_by"
     ORDER_BY = "order_by"
+    SHARDS = SHARDS
+
+    # Backends that can split the partitions across processes set this; see sharded_execution.
+    SHARD_FRAME_OPS: type[ShardFrameOps] | None = None
 
     PROPERTY_MAPPING = {
         AGGREGATION_TYPE: property_spec(
@@ -273,6 +286,11 @@ class FrameAggregateFeatureGroup(SubtypeCapabilityHook, RejectionReasonMixin, Fe
             "Conditional mask: (column, operator, value) tuple or list of tuples",
             default=None,
         ),
+        SHARDS: property_spec(
+            "Number of hash shards of the partitions to compute in parallel processes (opt-in)",
+            default=None,
+            match_guard=is_positive_int,
+        ),
     }
 
     def input_features(self, options: Options, feature_name: FeatureName) -> set[Feature] | None:
@@ -372,7 +390,7 @@ class FrameAggregateFeatureGroup(SubtypeCapabilityHook, RejectionReasonMixin, Fe
         if not all(isinstance(item, str) for item in partition_by):
             return False
 
-        return True
+        return shards_supported(cls, options)
 
     @classmethod
     def _validate_forwarded_frame_mismatch(cls, feature_name: Any, options: Any, parsed: dict[str, Any]) -> None:
@@ -489,24 +507,32 @@ class FrameAggregateFeatureGroup(SubtypeCapabilityHook, RejectionReasonMixin, Fe
         """Extract params from each feature, delegate to _compute_frame."""
         table = data
 
-        for feature in features.features:
-            feature_name = feature.name
-            params = cls._extract_params(feature)
-
-            mask_spec = parse_mask_spec(feature.options.get(MASK_KEY))
-
-            table = cls._compute_frame(
-                table,
-                feature_name,
-                params["source_col"],
-                params["partition_by"],
-                params["order_by"],
-                params["agg_type"],
-                params["frame_type"],
-                params.get("frame_size"),
-                params.get("frame_unit"),
-                mask_spec,
-            )
+        with sort_permutation_scope():
+            for feature in features.features:
+                feature_name = feature.name
+                params = cls._extract_params(feature)
+
+                mask_spec = parse_mask_spec(feature.options.get(MASK_KEY))
+
+                compute = functools.partial(
+                    cls._compute_frame,
+                    feature_name=feature_name,
+                    source_col=params["source_col"],
+                    partition_by=params["partition_by"],
+                    order_by=params["order_by"],
+                    agg_type=params["agg_type"],
+                    frame_type=params["frame_type"],
+                    frame_size=params.get("frame_size"),
+                    frame_unit=params.get("frame_unit"),
+                    mask_spec=mask_spec,
+                )
+                shards = option_value(feature.options, cls.SHARDS, positive_int_value)
+                if shards is not None and shards > 1:
+                    table = run_sharded(
+                        cls.SHARD_FRAME_OPS, table, params["partition_by"], shards, compute, reduces_rows=False
+                    )
+                else:
+                    table = compute(table)
 
         return table
 
@@ -16,6 +16,7 @@ from mloda_plugins.compute_framework.base_implementations.sql.sql_window import
     WindowFrame,
 )
 
+from mloda.community.feature_groups.data_operations.complexity import Complexity
 from mloda.community.feature_groups.data_operations.errors import (
     unsupported_agg_type_error,
     unsupported_frame_type_error,
@@ -38,6 +39,11 @@ _DUCKDB_AGG_FUNCS: dict[str, str] = {
 
 
 class DuckdbFrameAggregate(FrameAggregateFeatureGroup):
+    # Time frames run a correlated subquery per row (see _compute_time_frame).
+    SUBTYPE_COMPLEXITY: dict[str, Complexity] = {
+        f"time:{unit}": Complexity.QUADRATIC for unit in ("second", "minute", "hour", "day", "week", "month", "year")
+    }
+
     @classmethod
     def compute_framework_rule(cls) -> set[type[ComputeFramework]] | None:
         return {DuckDBFramework}
@@ -1,10 +1,22 @@
-"""Pandas implementation for frame aggregate feature groups."""
+"""Pandas implementation for frame aggregate feature groups.
+
+Fixed-length time windows (second to week) use ``groupby().rolling(on=ts)``.
+Month/year windows are calendar-anchored, which a rolling offset cannot express,
+so their bounds are computed up front on the sorted frame: each row's cutoff is
+its timestamp minus N calendar months with day-of-month clamping (NumPy
+datetime64 arithmetic, matching ``relativedelta`` and PythonDict's
+``_subtract_months``), a segmented ``searchsorted`` finds the first row of the
+partition at or after it, and pandas' rolling kernels reduce the resulting
+``[start, pos]`` frames through a ``BaseIndexer``.
+"""
 
 from __future__ import annotations
 
 from typing import Any
 
+import numpy as np
 import pandas as pd
+from pandas.api.indexers import BaseIndexer
 
 from mloda.provider import ComputeFramework
 from mloda_plugins.compute_framework.base_implementations.pandas.dataframe import PandasDataFrame
@@ -20,8 +32,11 @@ from mloda.community.feature_groups.data_operations.row_preserving.frame_aggrega
 )
 from mloda.community.feature_groups.data_operations.pandas_helpers import (
     PANDAS_AGG_FUNCS,
+    PandasShardFrame,
     coerce_count_dtype,
+    narrow_frame,
     null_safe_groupby,
+    with_columns,
 )
 from mloda_plugins.compute_framework.base_implementations.pandas.pandas_mask_engine import (
     PandasMaskEngine,
@@ -35,12 +50,56 @@ _PANDAS_FRAME_AGG_FUNCS: dict[str, str] = {
 }
 
 
+def _subtract_months(wall: np.ndarray, months: int) -> np.ndarray:
+    """``wall`` (datetime64) minus *months* calendar months, clamping the day to the target month's length.
+
+    Mar 31 minus 1 month is Feb 28 (Feb 29 in a leap year), as ``relativedelta``.
+    The time of day is kept; NaT stays NaT.
+    """
+    days = wall.astype("datetime64[D]")
+    month_start = days.astype("datetime64[M]")
+    day_of_month = days - month_start.astype("datetime64[D]")
+    target = month_start - months
+    target_start = target.astype("datetime64[D]")
+    month_length = (target + 1).astype("datetime64[D]") - target_start
+    shifted: np.ndarray = target_start + np.minimum(day_of_month, month_length - np.timedelta64(1, "D")) + (wall - days)
+    return shifted
+
+
+def _segmented_search_left(segments: np.ndarray, keys: np.ndarray, queries: np.ndarray) -> np.ndarray:
+    """Per-row ``searchsorted(side="left")`` of ``queries[i]`` within row ``i``'s own segment.
+
+    Rows must be sorted by ``(segments, keys)``. Rows and queries are merged by one
+    stable ``lexsort`` on ``(segment, key, is_row)`` and the number of rows ahead of
+    each query is its answer, so there is no per-segment loop.
+    """
+    num_rows = len(keys)
+    is_row = np.concatenate([np.ones(num_rows, dtype=np.int64), np.zeros(num_rows, dtype=np.int64)])
+    order = np.lexsort((is_row, np.concatenate([keys, queries]), np.concatenate([segments, segments])))
+    rows_in_order = is_row[order]
+    rows_ahead = np.cumsum(rows_in_order) - rows_in_order
+    is_query = rows_in_order == 0
+    result = np.empty(num_rows, dtype=np.int64)
+    result[order[is_query] - num_rows] = rows_ahead[is_query]
+    return result
+
+
+class _FrameBounds(BaseIndexer):  # type: ignore[misc]
+    """Precomputed ``[start, end)`` bounds of every row's frame, for ``Series.rolling(window=...)``."""
+
+    def get_window_bounds(
+        self,
+        num_values: int = 0,
+        min_periods: int | None = None,
+        center: bool | None = None,
+        closed: str | None = None,
+        step: int | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        return self.start, self.end
+
+
 class PandasFrameAggregate(FrameAggregateFeatureGroup):
-    # Pandas .rolling(window="...", on=ts) only accepts fixed-frequency units. Month/year
-    # are calendar-anchored and would require a per-row Python loop, which defeats the
-    # point of running inside pandas. They are rejected at match time. See
-    # known-divergences.md.
-    SUPPORTED_TIME_UNITS: set[str] = {"second", "minute", "hour", "day", "week"}
+    SHARD_FRAME_OPS = PandasShardFrame
 
     _FIXED_FREQ_CODES: dict[str, str] = {
         "second": "s",
@@ -77,21 +136,14 @@ class PandasFrameAggregate(FrameAggregateFeatureGroup):
                 operation="frame aggregate",
             )
 
-        data = data.copy()
-
-        taken = set(data.columns) | {feature_name}
-
-        # Save original row order so we can restore it after sorting
-        rn_col = unique_helper_name("__mloda_rn__", taken)
-        taken = taken | {rn_col}
-        data[rn_col] = range(len(data))
-
-        data = data.sort_values(by=[*partition_by, order_by], na_position="last")
+        work = narrow_frame(data, [*partition_by, order_by, source_col])
+        work = work.sort_values(by=[*partition_by, order_by], na_position="last")
 
         # PyArrow parity: the reference applies masks before aggregation but
         # sorts on unmasked values. Apply mask AFTER sorting so that sort
-        # order uses original (unmasked) values to match this behavior.
-        # Safe to mutate: data was already copied above (data = data.copy()).
+        # order uses original (unmasked) values to match this behavior. The
+        # mask is built on *data* and relabelled with the input positions that
+        # index the sorted narrow frame, so it aligns row by row.
         #
         # Collision case: when source_col == order_by and a mask is applied,
         # the reference treats masked rows as having null ``order_by`` (because
@@ -102,7 +154,7 @@ class PandasFrameAggregate(FrameAggregateFeatureGroup):
         # combo for time frames at runtime. See known-divergences.md.
         agg_col = source_col
         if mask_spec is not None:
-            mask = build_mask_from_spec(PandasMaskEngine, data, mask_spec)
+            mask = build_mask_from_spec(PandasMaskEngine, data, mask_spec).set_axis(range(len(data)))
             if source_col == order_by:
                 if frame_type == "time":
                     raise ValueError(
@@ -113,12 +165,12 @@ class PandasFrameAggregate(FrameAggregateFeatureGroup):
                     )
                 # Non-time frames: aggregate the masked values in a temp column;
                 # order_by is preserved because the sort already happened above.
-                agg_col = unique_helper_name("__mloda_masked_source__", taken)
-                data[agg_col] = data[source_col].where(mask)
+                agg_col = unique_helper_name("__mloda_masked_source__", set(work.columns) | {feature_name})
+                work[agg_col] = work[source_col].where(mask)
             else:
-                data[source_col] = data[source_col].where(mask)
+                work[source_col] = work[source_col].where(mask)
 
-        grouped = null_safe_groupby(data, partition_by, agg_col)
+        grouped = null_safe_groupby(work, partition_by, agg_col)
 
         # std/var require at least 2 observations for a meaningful result
         min_periods = 2 if agg_type in ("std", "var") else 1
@@ -132,16 +184,18 @@ class PandasFrameAggregate(FrameAggregateFeatureGroup):
         elif frame_type == "time":
             size = int(frame_size) if frame_size is not None else 1
             unit = str(frame_unit or "day")
-            if unit not in cls._FIXED_FREQ_CODES:
-                # Defense-in-depth: month/year are rejected at match time via
-                # SUPPORTED_TIME_UNITS. Hitting this path means a caller bypassed
-                # match_feature_group_criteria.
+            if unit in ("month", "year"):
+                months = size * 12 if unit == "year" else size
+                result = cls._compute_calendar_time(
+                    work, agg_col, partition_by, order_by, agg_type, months, min_periods
+                )
+            elif unit not in cls._FIXED_FREQ_CODES:
                 raise unsupported_frame_type_error(
                     f"time:{unit}",
-                    {f"time:{u}" for u in cls._FIXED_FREQ_CODES},
+                    {f"time:{u}" for u in (*cls._FIXED_FREQ_CODES, "month", "year")},
                     framework="Pandas",
                 )
-            if data[order_by].isna().any():
+            elif work[order_by].isna().any():
                 # pandas groupby().rolling(on=ts) raises "ts values must not have NaT".
                 # Convert that cryptic error into an explicit refusal naming the column.
                 # See known-divergences.md.
@@ -150,16 +204,10 @@ class PandasFrameAggregate(FrameAggregateFeatureGroup):
                     "contains null/NaT values, which pandas groupby().rolling(on=...) does "
                     "not support. See known-divergences.md."
                 )
-            data[feature_name] = cls._compute_fixed_freq_time(
-                data, agg_col, partition_by, order_by, agg_type, size, unit, min_periods
-            )
-            coerce_count_dtype(data, feature_name, agg_type)
-            data = data.sort_values(by=rn_col)
-            drop_cols = [rn_col]
-            if mask_spec is not None and source_col == order_by:
-                drop_cols.append(agg_col)
-            data = data.drop(columns=drop_cols)
-            return data
+            else:
+                result = cls._compute_fixed_freq_time(
+                    work, agg_col, partition_by, order_by, agg_type, size, unit, min_periods
+                )
         else:
             raise unsupported_frame_type_error(
                 frame_type,
@@ -167,22 +215,17 @@ class PandasFrameAggregate(FrameAggregateFeatureGroup):
                 framework="Pandas",
             )
 
-        if agg_type in ("std", "var"):
-            result = getattr(window_obj, pandas_func)(ddof=0).reset_index(level=reset_levels, drop=True)
-        else:
-            result = getattr(window_obj, pandas_func)().reset_index(level=reset_levels, drop=True)
-
-        data[feature_name] = result
-        coerce_count_dtype(data, feature_name, agg_type)
+        if frame_type != "time":
+            if agg_type in ("std", "var"):
+                result = getattr(window_obj, pandas_func)(ddof=0).reset_index(level=reset_levels, drop=True)
+            else:
+                result = getattr(window_obj, pandas_func)().reset_index(level=reset_levels, drop=True)
 
-        # Restore original row order and drop helper columns
-        data = data.sort_values(by=rn_col)
-        drop_cols = [rn_col]
-        if mask_spec is not None and source_col == order_by:
-            drop_cols.append(agg_col)
-        data = data.drop(columns=drop_cols)
+        work[feature_name] = result
+        coerce_count_dtype(work, feature_name, agg_type)
 
-        return data
+        # Restore input row order
+        return with_columns(data, {feature_name: work[feature_name].sort_index().set_axis(data.index)})
 
     @classmethod
     def _compute_fixed_freq_time(
@@ -226,3 +269,53 @@ class PandasFrameAggregate(FrameAggregateFeatureGroup):
         else:
             rolled = getattr(rolling_obj, pandas_func)()
         return pd.Series(rolled.values, index=data.index)
+
+    @classmethod
+    def _compute_calendar_time(
+        cls,
+        data: pd.DataFrame,
+        source_col: str,
+        partition_by: list[str],
+        order_by: str,
+        agg_type: str,
+        months: int,
+        min_periods: int,
+    ) -> pd.Series:
+        """Time window of *months* calendar months, reduced over precomputed frame bounds.
+
+        ``data`` is already sorted by ``[*partition_by, order_by]`` with NaT last. A row's
+        frame is every row of its partition up to itself whose timestamp is at or after
+        its cutoff; a NaT row's frame is the row itself, as in the reference. For a
+        tz-aware column the cutoff is taken on the wall clock and keeps the row's UTC
+        offset, like ``relativedelta`` on the reference's (pytz) datetimes. The frames
+        are contiguous and their bounds never move backwards, so pandas' rolling
+        kernels reduce them in one pass.
+        """
+        order = data[order_by]
+        if not pd.api.types.is_datetime64_any_dtype(order):
+            raise ValueError(
+                f"Pandas frame aggregate (time frame): order_by column {order_by!r} must be a "
+                f"datetime column for month/year windows; got {order.dtype}."
+            )
+        if isinstance(order.dtype, pd.DatetimeTZDtype):
+            wall = order.dt.tz_localize(None).to_numpy()
+            instant = order.dt.tz_convert(None).to_numpy()
+        else:
+            wall = instant = order.to_numpy()
+        is_nat = np.isnat(instant)
+        ticks = instant.view(np.int64)
+        cutoff = ticks - (wall - _subtract_months(wall, months)).view(np.int64)
+        # NaT rows sort last in their partition; their key and query never select another row.
+        ticks = np.where(is_nat, np.iinfo(np.int64).max, ticks)
+        cutoff = np.where(is_nat, np.iinfo(np.int64).max, cutoff)
+
+        segments = data.groupby(list(partition_by), dropna=False, sort=False).ngroup().to_numpy()
+        positions = np.arange(len(data), dtype=np.int64)
+        start = np.where(is_nat, positions, _segmented_search_left(segments, ticks, cutoff))
+        bounds = _FrameBounds(start=start, end=positions + 1)
+
+        pandas_func = _PANDAS_FRAME_AGG_FUNCS[agg_type]
+        rolling_obj = data[source_col].rolling(window=bounds, min_periods=min_periods)
+        if agg_type in ("std", "var"):
+            return getattr(rolling_obj, pandas_func)(ddof=0)
+        return getattr(rolling_obj, pandas_func)()
@@ -0,0 +1,269 @@
+"""PyArrow implementation for frame aggregate feature groups.
+
+Rows are ordered by ``[*partition_by, order_by]`` ascending, nulls last, via
+``sort_permutation``. The sort is stable, so same-``order_by`` peers keep their input
+order and a row's frame never includes a later peer (the reference's
+``rows[: pos + 1]`` rule). Every frame is then a contiguous run ``[start, pos]`` of
+sorted rows, and each aggregate is computed for all rows at once from Arrow kernels:
+
+- ``start`` is the partition start (cumulative/expanding), ``max(partition start,
+  pos - size + 1)`` (rolling), or the first row of the partition whose timestamp is at
+  least ``ts - size`` (time), found by ``segmented_search_left``. A null ``order_by``
+  row sorts last and its time frame is the row itself.
+- sum/count/avg are differences of prefix sums. NaN and +/-inf are counted in separate
+  prefix counts, so one of them only affects the frames that contain it.
+- cumulative min/max are one ``cumulative_max`` over keys that rank each value within
+  its partition, so the running extreme restarts at every partition start.
+
+Results are scattered back to the input row order.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from mloda.provider import ComputeFramework
+from mloda_plugins.compute_framework.base_implementations.pyarrow.pyarrow_mask_engine import PyArrowMaskEngine
+from mloda_plugins.compute_framework.base_implementations.pyarrow.table import PyArrowTable
+
+from mloda.community.feature_groups.data_operations.errors import (
+    unsupported_agg_type_error,
+    unsupported_frame_type_error,
+)
+from mloda.community.feature_groups.data_operations.mask_utils import build_mask_from_spec
+from mloda.community.feature_groups.data_operations.pyarrow_helpers import (
+    nan_as_null,
+    row_positions,
+    scatter_to_rows,
+    segment_start_per_row,
+    segmented_search_left,
+    sort_permutation,
+)
+from mloda.community.feature_groups.data_operations.row_preserving.frame_aggregate.base import (
+    FrameAggregateFeatureGroup,
+)
+
+# Prefix-sum differences cover sum/avg/count for every frame; min/max only have a
+# segmented scan for frames anchored at the partition start.
+_WINDOW_AGG_TYPES: frozenset[str] = frozenset({"sum", "avg", "count"})
+_CUMULATIVE_AGG_TYPES: frozenset[str] = frozenset({"sum", "avg", "count", "min", "max"})
+
+_UNIT_SECONDS: dict[str, int] = {
+    "second": 1,
+    "minute": 60,
+    "hour": 3_600,
+    "day": 86_400,
+    "week": 604_800,
+}
+_TICKS_PER_SECOND: dict[str, int] = {"s": 1, "ms": 1_000, "us": 1_000_000, "ns": 1_000_000_000}
+
+
+def _int64(value: int) -> pa.Scalar:
+    return pa.scalar(value, type=pa.int64())
+
+
+def _frame_totals(values: pa.Array, start: pa.Array) -> pa.Array:
+    """Sum of ``values[start[i] : i + 1]`` for every sorted row ``i``, from one prefix sum.
+
+    int64 prefix sums wrap on overflow; the difference is still exact whenever the
+    frame's own total fits in int64.
+    """
+    inclusive = pc.cumulative_sum(values)
+    exclusive = pa.concat_arrays([pa.array([0], type=values.type), inclusive.slice(0, max(len(values) - 1, 0))])
+    return pc.subtract(inclusive, pc.take(exclusive, start))
+
+
+class PyArrowFrameAggregate(FrameAggregateFeatureGroup):
+    # Month/year frames need calendar-aware subtraction with day-of-month clamping,
+    # which Arrow compute has no kernel for. They are rejected at match time. See
+    # known-divergences.md.
+    SUPPORTED_TIME_UNITS: set[str] = {"second", "minute", "hour", "day", "week"}
+
+    @classmethod
+    def compute_framework_rule(cls) -> set[type[ComputeFramework]] | None:
+        return {PyArrowTable}
+
+    @classmethod
+    def supported_op_subtypes(cls, secondary: str | None = None) -> frozenset[str] | None:
+        """Cumulative/expanding frames support sum/avg/count/min/max; rolling/time frames sum/avg/count."""
+        if secondary in ("cumulative", "expanding"):
+            return _CUMULATIVE_AGG_TYPES
+        return _WINDOW_AGG_TYPES
+
+    @classmethod
+    def _compute_frame(
+        cls,
+        data: pa.Table,
+        feature_name: str,
+        source_col: str,
+        partition_by: list[str],
+        order_by: str,
+        agg_type: str,
+        frame_type: str,
+        frame_size: int | None = None,
+        frame_unit: str | None = None,
+        mask_spec: list[tuple[str, str, Any]] | None = None,
+    ) -> pa.Table:
+        if frame_type not in cls.SUPPORTED_FRAME_TYPES:
+            raise unsupported_frame_type_error(frame_type, cls.SUPPORTED_FRAME_TYPES, framework="PyArrow")
+        supported = cls.supported_op_subtypes(frame_type) or _CUMULATIVE_AGG_TYPES
+        if agg_type not in supported:
+            raise unsupported_agg_type_error(agg_type, supported, framework="PyArrow", operation="frame aggregate")
+
+        if frame_type == "time" and mask_spec is not None and source_col == order_by:
+            # Same refusal as the other backends: the reference treats masked rows as
+            # having a null order_by, which the shared-permutation plan does not model.
+            # See known-divergences.md.
+            raise ValueError(
+                "PyArrow frame aggregate (time frame): mask + source_col == order_by "
+                f"({source_col!r}) is unsupported. The reference semantic requires "
+                "treating masked rows as having null order_by, which this backend does "
+                "not special-case. See known-divergences.md."
+            )
+
+        source = data.column(source_col)
+        if mask_spec is not None:
+            # Mask the aggregated values only: the sort uses the unmasked order_by.
+            mask = pc.fill_null(build_mask_from_spec(PyArrowMaskEngine, data, mask_spec), False)
+            source = pc.if_else(mask, source, pa.scalar(None, type=source.type))
+
+        num_rows = data.num_rows
+        perm = sort_permutation(data, partition_by, order_by)
+        values = pc.take(source, perm.forward)
+        if isinstance(values, pa.ChunkedArray):
+            values = values.combine_chunks()
+        positions = row_positions(num_rows)
+        partition_start = segment_start_per_row(perm.boundaries, num_rows)
+
+        if agg_type in ("min", "max"):
+            result = cls._cumulative_extreme(values, positions, partition_start, agg_type)
+        else:
+            if frame_type == "rolling":
+                size = int(frame_size) if frame_size is not None else 1
+                start = pc.max_element_wise(partition_start, pc.subtract(positions, _int64(size - 1)))
+            elif frame_type == "time":
+                size = int(frame_size) if frame_size is not None else 1
+                start = cls._time_frame_start(
+                    pc.take(data.column(order_by), perm.forward), order_by, positions, partition_start, size, frame_unit
+                )
+            else:
+                start = partition_start
+            result = cls._frame_reduce(values, start, agg_type, source_col)
+
+        return data.append_column(feature_name, scatter_to_rows(result, perm.forward))
+
+    @classmethod
+    def _time_frame_start(
+        cls,
+        sorted_order: pa.Array | pa.ChunkedArray,
+        order_by: str,
+        positions: pa.Array,
+        partition_start: pa.Array,
+        size: int,
+        frame_unit: str | None,
+    ) -> pa.Array:
+        """First sorted row of each row's time frame: ``order_by >= current - size units`` in its partition.
+
+        Timestamps of any resolution and dates are compared as int64 ticks. A null
+        ``order_by`` row's frame starts (and ends) at the row itself.
+        """
+        unit = str(frame_unit or "day")
+        if unit not in _UNIT_SECONDS:
+            # Defense-in-depth: month/year are rejected at match time via SUPPORTED_TIME_UNITS.
+            raise unsupported_frame_type_error(
+                f"time:{unit}", {f"time:{u}" for u in _UNIT_SECONDS}, framework="PyArrow"
+            )
+        order_type = sorted_order.type
+        if pa.types.is_timestamp(order_type):
+            ticks = pc.cast(sorted_order, pa.int64())
+            ticks_per_second = _TICKS_PER_SECOND[order_type.unit]
+        elif pa.types.is_date(order_type):
+            ticks = pc.cast(pc.cast(sorted_order, pa.timestamp("s")), pa.int64())
+            ticks_per_second = 1
+        else:
+            raise ValueError(
+                f"PyArrow frame aggregate (time frame): order_by column {order_by!r} must be a "
+                f"timestamp or date; got {order_type}."
+            )
+        if isinstance(ticks, pa.ChunkedArray):
+            ticks = ticks.combine_chunks()
+
+        cutoff = pc.subtract(ticks, _int64(size * _UNIT_SECONDS[unit] * ticks_per_second))
+        start = segmented_search_left(partition_start, ticks, cutoff)
+        return pc.if_else(pc.is_null(ticks), positions, start)
+
+    @classmethod
+    def _frame_reduce(cls, values: pa.Array, start: pa.Array, agg_type: str, source_col: str) -> pa.Array:
+        """sum/avg/count over ``values[start[i] : i + 1]`` for every sorted row ``i``.
+
+        Nulls are skipped; a frame without non-null values yields null (count: 0).
+        Integer sums stay int64 and are exact; float sums differ from a sequential sum
+        by rounding only, and a NaN (or both infinities) in the frame yields NaN.
+        """
+        counts = _frame_totals(pc.cast(pc.is_valid(values), pa.int64()), start)
+        if agg_type == "count":
+            return counts
+
+        value_type = values.type
+        if pa.types.is_integer(value_type) or pa.types.is_boolean(value_type) or pa.types.is_null(value_type):
+            # An all-null column has Arrow type null: every frame is empty.
+            sums = _frame_totals(pc.fill_null(pc.cast(values, pa.int64()), 0), start)
+        elif pa.types.is_floating(value_type):
+            floats = pc.cast(values, pa.float64())
+            nan = pc.fill_null(pc.is_nan(floats), False)
+            pos_inf = pc.fill_null(pc.equal(floats, float("inf")), False)
+            neg_inf = pc.fill_null(pc.equal(floats, float("-inf")), False)
+            special = pc.or_(nan, pc.or_(pos_inf, neg_inf))
+            finite = pc.fill_null(pc.if_else(special, 0.0, floats), 0.0)
+            sums = _frame_totals(finite, start)
+
+            def has(flags: pa.Array) -> pa.Array:
+                return pc.greater(_frame_totals(pc.cast(flags, pa.int64()), start), _int64(0))
+
+            any_nan, any_pos, any_neg = has(nan), has(pos_inf), has(neg_inf)
+            sums = pc.if_else(
+                pc.or_(any_nan, pc.and_(any_pos, any_neg)),
+                float("nan"),
+                pc.if_else(any_pos, float("inf"), pc.if_else(any_neg, float("-inf"), sums)),
+            )
+        else:
+            raise ValueError(
+                f"PyArrow frame aggregate: {agg_type!r} requires a numeric source column; "
+                f"{source_col!r} has type {value_type}."
+            )
+
+        empty = pc.equal(counts, _int64(0))
+        if agg_type == "avg":
+            sums = pc.divide(pc.cast(sums, pa.float64()), pc.cast(counts, pa.float64()))
+        return pc.if_else(empty, pa.scalar(None, type=sums.type), sums)
+
+    @classmethod
+    def _cumulative_extreme(
+        cls, values: pa.Array, positions: pa.Array, partition_start: pa.Array, agg_type: str
+    ) -> pa.Array:
+        """Running min/max from each partition's start, as one unsegmented ``cumulative_max``.
+
+        Each non-null value gets its rank among all values (a stable sort; reversed
+        for min). The key ``partition_start * n + rank`` orders rows of later
+        partitions above every row of earlier ones, so the running maximum of the
+        keys never carries a previous partition's value: a running key below the
+        row's own ``partition_start * n`` means the partition has no value yet. NaN
+        gets the same "no value" key as null, so it is skipped like ``pc.min``/``pc.max``.
+        """
+        num_rows = len(values)
+        values = nan_as_null(values)
+        order = pc.cast(pc.sort_indices(values, null_placement="at_end"), pa.int64())
+        rank = scatter_to_rows(positions, order)
+        if agg_type == "min":
+            rank = pc.subtract(_int64(num_rows - 1), rank)
+        base = pc.multiply(partition_start, _int64(num_rows))
+        keys = pc.if_else(pc.is_valid(values), pc.add(base, rank), _int64(-1))
+        running = pc.cumulative_max(keys)
+        best = pc.subtract(running, base)
+        if agg_type == "min":
+            best = pc.subtract(_int64(num_rows - 1), best)
+        found = pc.greater_equal(running, base)
+        return pc.take(pc.take(values, order), pc.if_else(found, best, pa.scalar(None, type=pa.int64())))
@@ -1,8 +1,10 @@
 """PythonDict implementation for frame aggregate feature groups.
 
 Builds per-partition-group row lists (stable-sorted by ``order_by``, nulls
-last), then for each row computes a window of prior/current rows per the
-frame type and reduces it with the requested aggregation type. Month/year
+last), then scans each list once: every frame type is a contiguous run
+``rows[start : pos + 1]`` whose start never moves backwards, so a
+``SlidingWindowReducer`` pushes each row once and pops it once (O(n) per
+partition, O(n log n) for median) instead of re-reducing every window. Month/year
 time windows use calendar-aware subtraction with day-of-month clamping
 (``_subtract_months``, stdlib ``calendar`` only, no ``dateutil`` dependency).
 """
@@ -29,6 +31,7 @@ from mloda.community.feature_groups.data_operations.errors import (
 )
 from mloda.community.feature_groups.data_operations.mask_utils import build_mask_from_spec
 from mloda.community.feature_groups.data_operations.python_dict_helpers import (
+    SlidingWindowReducer,
     group_key_value,
     is_nan,
     nulls_last_sort_key,
@@ -37,6 +40,7 @@ from mloda.community.feature_groups.data_operations.python_dict_helpers import (
 from mloda.community.feature_groups.data_operations.row_preserving.frame_aggregate.base import (
     FrameAggregateFeatureGroup,
 )
+from mloda.community.feature_groups.data_operations.sharded_execution import PythonDictShardFrame
 
 # Frame aggregation's order-independent aggregation-type subset (no mode/nunique/
 # first/last, no ddof-variant spellings); mirrors base.py's ``_AGGREGATION_TYPES``.
@@ -75,6 +79,8 @@ def _subtract_months(dt: datetime, months: int) -> datetime:
 
 
 class PythonDictFrameAggregate(FrameAggregateFeatureGroup):
+    SHARD_FRAME_OPS = PythonDictShardFrame
+
     @classmethod
     def compute_framework_rule(cls) -> set[type[ComputeFramework]] | None:
         return {PythonDictFramework}
@@ -135,50 +141,72 @@ class PythonDictFrameAggregate(FrameAggregateFeatureGroup):
             rows.sort(key=lambda t: nulls_last_sort_key(t[1]))
 
         result_values: list[Any] = [None] * num_rows
+        unit = str(frame_unit or "day")
 
         for rows in groups.values():
-            for pos, (orig_idx, order_val, _val) in enumerate(rows):
+            reducer = SlidingWindowReducer(agg_type)
+            start = 0  # rows[start:end] is the window the reducer currently holds
+            end = 0
+            for pos, (orig_idx, order_val, val) in enumerate(rows):
                 if frame_type == "rolling":
                     wsize = int(frame_size) if frame_size is not None else 1
                     window_start = max(0, pos - wsize + 1)
-                    window = [r[2] for r in rows[window_start : pos + 1]]
                 elif frame_type in ("cumulative", "expanding"):
-                    window = [r[2] for r in rows[: pos + 1]]
+                    window_start = 0
                 elif frame_type == "time":
-                    window = cls._time_window(rows, pos, order_val, frame_size or 1, str(frame_unit or "day"))
+                    if order_val is None or is_nan(order_val):
+                        # Null/NaN order values sort last: the window is the row itself.
+                        result_values[orig_idx] = cls._reduce_window([val], agg_type)
+                        continue
+                    window_start = cls._time_window_start(rows, start, pos, order_val, frame_size or 1, unit)
                 else:  # pragma: no cover - guarded by the SUPPORTED_FRAME_TYPES check above
                     raise unsupported_frame_type_error(frame_type, cls.SUPPORTED_FRAME_TYPES, framework="PythonDict")
 
-                result_values[orig_idx] = cls._reduce_window(window, agg_type)
+                if window_start < start:
+                    # Only a calendar cutoff that steps back across a DST fold gets here.
+                    reducer = SlidingWindowReducer(agg_type)
+                    start = end = window_start
+                while end <= pos:
+                    reducer.push(end, rows[end][2])
+                    end += 1
+                while start < window_start:
+                    reducer.pop(start, rows[start][2])
+                    start += 1
+                result_values[orig_idx] = reducer.result()
 
         result = dict(data)
         result[feature_name] = result_values
         return result
 
     @classmethod
-    def _time_window(
+    def _time_window_start(
         cls,
         rows: list[tuple[int, Any, Any]],
+        start: int,
         pos: int,
         current_order: Any,
         size: int,
         unit: str,
-    ) -> list[Any]:
-        """Collect values within a time-based window ending at the current row.
+    ) -> int:
+        """First position of the time-based window ending at the (non-null) current row.
 
-        A null or NaN ``current_order`` returns just the row's own value.
+        The window is every row up to ``pos`` whose order value is ``>= current - size``;
+        rows are sorted ascending, so that is a suffix of ``rows[: pos + 1]``. The cutoff
+        only grows with ``current_order``, so the scan resumes from the previous window's
+        ``start`` (a two-pointer sweep) and steps back only if the cutoff did.
         """
-        if current_order is None or is_nan(current_order):
-            return [rows[pos][2]]
-
         if unit in ("month", "year"):
             months = size * 12 if unit == "year" else size
-            window_start = _subtract_months(current_order, months)
+            cutoff = _subtract_months(current_order, months)
         else:
             factory = _TIMEDELTA_FACTORIES.get(unit, _day_delta)
-            window_start = current_order - factory(size)
+            cutoff = current_order - factory(size)
 
-        return [r[2] for r in rows[: pos + 1] if r[1] is not None and r[1] >= window_start]
+        while start > 0 and rows[start - 1][1] >= cutoff:
+            start -= 1
+        while start < pos and rows[start][1] < cutoff:
+            start += 1
+        return start
 
     @classmethod
     def _reduce_window(cls, values: list[Any], agg_type: str) -> Any:
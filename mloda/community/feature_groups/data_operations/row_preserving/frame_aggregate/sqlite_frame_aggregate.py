@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import sqlite3
 from typing import Any
 
+import pyarrow as pa
 from mloda.provider import ComputeFramework
 from mloda_plugins.compute_framework.base_implementations.sql.sql_utils import pick_helper_column_name, quote_ident
 from mloda_plugins.compute_framework.base_implementations.sql.sql_window import (
@@ -24,6 +26,7 @@ from mloda.community.feature_groups.data_operations.mask_utils import build_sql_
 from mloda.community.feature_groups.data_operations.row_preserving.frame_aggregate.base import (
     FrameAggregateFeatureGroup,
 )
+from mloda.community.feature_groups.data_operations.sqlite_helpers import append_sql_query_column, column_type
 
 _SQLITE_AGG_FUNCS: dict[str, str] = {
     "sum": "SUM",
@@ -33,6 +36,41 @@ _SQLITE_AGG_FUNCS: dict[str, str] = {
     "max": "MAX",
 }
 
+# RANGE frames with numeric offset bounds arrived in SQLite 3.28.
+_RANGE_FRAME_MIN_VERSION: tuple[int, int, int] = (3, 28, 0)
+
+
+def _range_frame_supported() -> bool:
+    """Runtime probe: whether the linked SQLite library can run the RANGE-frame time-window plan."""
+    return sqlite3.sqlite_version_info >= _RANGE_FRAME_MIN_VERSION
+
+
+_MS_PER_UNIT: dict[str, int] = {
+    "second": 1_000,
+    "minute": 60_000,
+    "hour": 3_600_000,
+    "day": 86_400_000,
+    "week": 604_800_000,
+}
+
+
+def _epoch_ms_sql(expr: str) -> str:
+    """SQL for ``expr``'s timestamp as an integer count of milliseconds (the resolution of ``julianday()``).
+
+    SQLite keeps timestamps as integer milliseconds internally, so rounding the Julian day back
+    to milliseconds is exact and window bounds compare as integers instead of floats.
+    """
+    return f"CAST(ROUND(julianday({expr}) * 86400000) AS INTEGER)"
+
+
+def _time_frame_result_type(agg_func: str, source_type: pa.DataType) -> pa.DataType:
+    """Arrow type of a time-window aggregate: COUNT is an integer, AVG a float, SUM/MIN/MAX keep the source type."""
+    if agg_func == "COUNT":
+        return pa.int64()
+    if agg_func == "AVG":
+        return pa.float64()
+    return source_type
+
 
 class SqliteFrameAggregate(FrameAggregateFeatureGroup):
     # SQLite has no native calendar-anchored INTERVAL arithmetic: ``datetime(ts, '-N months')``
@@ -84,7 +122,7 @@ class SqliteFrameAggregate(FrameAggregateFeatureGroup):
         if frame_type == "time":
             # Mask + source_col == order_by: the reference treats masked rows as having
             # null order_by (mask writes null into source_col, which is also order_by).
-            # The SQLite correlated subquery uses the unmasked order_by for window bounds
+            # The SQLite time-window query uses the unmasked order_by for window bounds
             # even when ``CASE WHEN ... THEN source END`` wraps the aggregate expression,
             # so this combo cannot be expressed natively. Reject to match pandas.
             # See known-divergences.md.
@@ -92,8 +130,8 @@ class SqliteFrameAggregate(FrameAggregateFeatureGroup):
                 raise ValueError(
                     "SQLite frame aggregate (time frame): mask + source_col == order_by "
                     f"({source_col!r}) is unsupported. The reference semantic requires "
-                    "treating masked rows as having null order_by, which the correlated "
-                    "subquery cannot express natively. See known-divergences.md."
+                    "treating masked rows as having null order_by, which the time-window "
+                    "query cannot express natively. See known-divergences.md."
                 )
             return cls._compute_time_frame(
                 data=data,
@@ -105,6 +143,7 @@ class SqliteFrameAggregate(FrameAggregateFeatureGroup):
                 frame_size=frame_size,
                 frame_unit=frame_unit,
                 mask_spec=mask_spec,
+                result_type=_time_frame_result_type(agg_func, column_type(data, source_col)),
             )
 
         frame: WindowFrame
@@ -148,17 +187,28 @@ class SqliteFrameAggregate(FrameAggregateFeatureGroup):
         frame_size: int | None,
         frame_unit: str | None,
         mask_spec: list[tuple[str, str, Any]] | None,
+        result_type: pa.DataType,
     ) -> SqliteRelation:
-        """Compute a time-based window aggregate via a correlated subquery.
+        """Compute a time-based window aggregate over an integer-millisecond timestamp key.
+
+        Each row ``t`` aggregates the rows ``s`` of its partition whose ``order_by``
+        value falls in ``[t.order_by - delta, t.order_by]``. Bounds use ``julianday()``
+        (rounded to its internal millisecond resolution, see ``_epoch_ms_sql``) rather
+        than ``datetime(ts, '-N units')``: the latter strips fractional seconds and
+        would lose sub-second precision.
+
+        Peer handling: the PyArrow reference uses ``rows[:pos+1]`` after a stable sort by
+        order_by, so peers at the same order_by but later physical position are excluded
+        from the current row's window. The scan position (``ROW_NUMBER() OVER ()`` in the
+        window query, ``rowid`` in the fallback) serves as the tiebreaker.
 
-        SQLite lacks RANGE BETWEEN INTERVAL window frames, so for each row ``t``
-        the inner SELECT aggregates rows ``s`` in the same partition whose
-        ``order_by`` value falls in ``[t.order_by - delta, t.order_by]``.
+        When the row's order_by is NULL, the reference returns the source value of just
+        the current row (see reference.py:115-116).
 
-        Bounds use ``julianday()`` arithmetic (a floating-point day count)
-        rather than ``datetime(ts, '-N units')``. The latter strips fractional
-        seconds and would lose sub-second precision; the former preserves
-        microseconds via the fractional component of the Julian day.
+        SQLite >= 3.28 runs one window query (``_range_frame_sql``) whose result stays in
+        the database as a view; older builds fall back to a correlated subquery per row
+        (``_correlated_sql``) whose values are fetched and appended, chosen by
+        ``_range_frame_supported()``.
 
         Only second/minute/hour/day/week units reach this path. Month/year are
         rejected at ``match_feature_group_criteria`` time via
@@ -166,17 +216,135 @@ class SqliteFrameAggregate(FrameAggregateFeatureGroup):
         diverges from ``relativedelta``. See known-divergences.md.
         """
         size = int(frame_size) if frame_size is not None else 1
-        unit = str(frame_unit or "day")
-        # Convert window span to fractional days for julianday() arithmetic.
-        unit_to_days: dict[str, float] = {
-            "second": size / 86400.0,
-            "minute": size / 1440.0,
-            "hour": size / 24.0,
-            "day": float(size),
-            "week": float(size * 7),
-        }
-        n_days = unit_to_days[unit]
+        span_ms = size * _MS_PER_UNIT[str(frame_unit or "day")]
+
+        if _range_frame_supported():
+            sql = cls._range_frame_sql(
+                data, feature_name, quoted_source, partition_by, quoted_order, agg_func, span_ms, mask_spec
+            )
+            return append_sql_query_column(data, feature_name, sql, result_type)
+
+        sql = cls._correlated_sql(data, quoted_source, partition_by, quoted_order, agg_func, span_ms, mask_spec)
+        cursor = data.connection.execute(sql)
+        rows = cursor.fetchall()
+
+        result_values = [row[0] for row in rows]
+        return data.append_column(feature_name, result_values)
+
+    @classmethod
+    def _range_frame_sql(
+        cls,
+        data: SqliteRelation,
+        feature_name: str,
+        quoted_source: str,
+        partition_by: list[str],
+        quoted_order: str,
+        agg_func: str,
+        span_ms: int,
+        mask_spec: list[tuple[str, str, Any]] | None,
+    ) -> str:
+        """Time-window aggregate as one window query (O(n log n) instead of O(n^2)).
+
+        A RANGE frame includes every same-ts peer, later ones too, so the window is
+        split into two frames whose partial aggregates are combined:
+
+        - ``prior``: ``RANGE BETWEEN span_ms PRECEDING AND 1 PRECEDING`` over the
+          millisecond key, i.e. the rows strictly earlier than the current timestamp
+          but within the window.
+        - ``peers``: ``ROWS UNBOUNDED PRECEDING`` over the current timestamp's peers
+          ordered by scan position, i.e. the same-ts rows up to and including this one.
+
+        ``EXCLUDE GROUP`` would express ``prior`` directly, but SQLite then recomputes
+        every frame from scratch, which is quadratic again. A NULL order_by row is its
+        own peer group (partitioned additionally by its position) and ignores ``prior``,
+        so it aggregates only itself.
 
+        The query selects every column of ``data`` followed by ``feature_name``, in scan
+        order. Positions come from ``ROW_NUMBER() OVER ()`` rather than ``rowid``, which
+        is NULL when ``data`` is a view (the output of an earlier in-database step).
+        """
+        source_sql = build_sql_case_when(mask_spec, quoted_source) if mask_spec is not None else quoted_source
+        quoted_partitions = [quote_ident(col) for col in partition_by]
+        taken = {*data.columns, feature_name}
+        rid, key, val = (
+            quote_ident(pick_helper_column_name(taken, prefix=f"__mloda_{n}")) for n in ("rid", "ts", "val")
+        )
+        prior_over = " ".join(
+            [
+                f"PARTITION BY {', '.join(quoted_partitions)}" if quoted_partitions else "",
+                f"ORDER BY {key} RANGE BETWEEN {span_ms} PRECEDING AND 1 PRECEDING",
+            ]
+        )
+        peer_keys = ", ".join([*quoted_partitions, key, f"CASE WHEN {key} IS NULL THEN {rid} END"])
+        peers_over = f"PARTITION BY {peer_keys} ORDER BY {rid} ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW"
+
+        # Partial aggregates per frame, and how to combine them (a NULL partial means the
+        # frame has no non-null value; ``prior`` is NULL for a NULL order_by row). Their
+        # aliases sit next to the data columns, so they are picked to avoid those names.
+        prior, peers = (
+            {
+                suffix: quote_ident(pick_helper_column_name(taken, prefix=f"__mloda_{frame}_{suffix}"))
+                for suffix in ("s", "c", "a")
+            }
+            for frame in ("prior", "peers")
+        )
+        if agg_func == "AVG":
+            partials = {"s": "SUM", "c": "COUNT"}
+            count = f"COALESCE({prior['c']}, 0) + {peers['c']}"
+            total = f"COALESCE({prior['s']}, 0) + COALESCE({peers['s']}, 0)"
+            combined = f"CASE WHEN {count} = 0 THEN NULL ELSE ({total}) * 1.0 / ({count}) END"
+        elif agg_func == "COUNT":
+            partials = {"c": "COUNT"}
+            combined = f"COALESCE({prior['c']}, 0) + {peers['c']}"
+        else:
+            partials = {"a": agg_func}
+            prior_a, peers_a = prior["a"], peers["a"]
+            merge = f"{prior_a} + {peers_a}" if agg_func == "SUM" else f"{agg_func}({prior_a}, {peers_a})"
+            combined = (
+                f"CASE WHEN {prior_a} IS NULL THEN {peers_a} WHEN {peers_a} IS NULL THEN {prior_a} ELSE {merge} END"
+            )
+        windows = ", ".join(
+            [
+                *(
+                    f"CASE WHEN {key} IS NOT NULL THEN {func}({val}) OVER ({prior_over}) END AS {prior[suffix]}"
+                    for suffix, func in partials.items()
+                ),
+                *(f"{func}({val}) OVER ({peers_over}) AS {peers[suffix]}" for suffix, func in partials.items()),
+            ]
+        )
+
+        # Safety: identifiers via quote_ident(); agg_func from whitelist; span_ms is
+        # computed in Python from sanitized integer/unit values, embedded as an
+        # integer literal.
+        data_cols = "".join(f"{quote_ident(col)}, " for col in data.columns)
+        return " ".join(  # nosec
+            [
+                f"SELECT {data_cols}{combined} AS {quote_ident(feature_name)} FROM (",
+                f"SELECT {data_cols}{rid}, {windows} FROM (",
+                f"SELECT {data_cols}ROW_NUMBER() OVER () AS {rid}, {_epoch_ms_sql(quoted_order)} AS {key},",
+                f"{source_sql} AS {val}",
+                f"FROM {quote_ident(data.table_name)}",
+                ")",
+                f") ORDER BY {rid}",
+            ]
+        )
+
+    @classmethod
+    def _correlated_sql(
+        cls,
+        data: SqliteRelation,
+        quoted_source: str,
+        partition_by: list[str],
+        quoted_order: str,
+        agg_func: str,
+        span_ms: int,
+        mask_spec: list[tuple[str, str, Any]] | None,
+    ) -> str:
+        """Time-window aggregate as a correlated subquery per row (fallback for SQLite < 3.28).
+
+        For each row ``t`` the inner SELECT aggregates rows ``s`` of the same partition
+        within the window; O(n^2) per partition.
+        """
         # Build the inner aggregate expression with the ``s.`` alias prefix.
         inner_source = f"s.{quoted_source}"
         inner_source_sql = build_sql_case_when(mask_spec, inner_source) if mask_spec is not None else inner_source
@@ -190,27 +358,23 @@ class SqliteFrameAggregate(FrameAggregateFeatureGroup):
         else:
             partition_eq = "1=1"
 
-        quoted_feature = quote_ident(feature_name)
         quoted_table = quote_ident(data.table_name)
+        s_key = _epoch_ms_sql(f"s.{quoted_order}")
+        t_key = _epoch_ms_sql(f"t.{quoted_order}")
 
-        # Safety: identifiers via quote_ident(); agg_func from whitelist; n_days is
-        # computed in Python from sanitized integer/unit values, embedded as a
-        # numeric literal.
+        # Safety: identifiers via quote_ident(); agg_func from whitelist; span_ms is
+        # computed in Python from sanitized integer/unit values, embedded as an
+        # integer literal.
         #
-        # Peer handling: the PyArrow reference uses ``rows[:pos+1]`` after a stable
-        # sort by order_by, so peers at the same order_by but later physical position
-        # are excluded from the current row's window. SQL ``BETWEEN`` would include
-        # all same-ts peers (both earlier and later), so the upper bound is split into
-        # ``s.ts < t.ts`` plus an explicit rowid tiebreaker for the equal case. ``rowid``
-        # is the stable insertion order in SQLite, matching the reference's stable-sort
-        # tie-break behaviour.
+        # SQL ``BETWEEN`` would include all same-ts peers (both earlier and later), so
+        # the upper bound is split into ``s.ts < t.ts`` plus an explicit rowid
+        # tiebreaker for the equal case.
         #
-        # When the outer row's order_by is NULL, ``julianday(NULL)`` is NULL and the
-        # comparison short-circuits to NULL, which would leave the row with a NULL
-        # aggregate. The PyArrow reference returns the source value of just the current
-        # row in that case (see reference.py:115-116). The OR branch matches the
-        # self-row only when ``t.{order_by}`` is NULL, restoring reference parity.
-        sql = " ".join(  # nosec
+        # When the outer row's order_by is NULL, the key is NULL and the comparison
+        # short-circuits to NULL, which would leave the row with a NULL aggregate. The
+        # OR branch matches the self-row only when ``t.{order_by}`` is NULL, restoring
+        # reference parity.
+        return " ".join(  # nosec
             [
                 "SELECT",
                 "(SELECT",
@@ -219,18 +383,13 @@ class SqliteFrameAggregate(FrameAggregateFeatureGroup):
                 f"WHERE {partition_eq}",
                 "AND (",
                 f"(t.{quoted_order} IS NOT NULL AND s.{quoted_order} IS NOT NULL",
-                f"AND julianday(s.{quoted_order}) >= julianday(t.{quoted_order}) - {n_days}",
-                f"AND (julianday(s.{quoted_order}) < julianday(t.{quoted_order})",
-                f"OR (julianday(s.{quoted_order}) = julianday(t.{quoted_order}) AND s.rowid <= t.rowid)))",
+                f"AND {s_key} >= {t_key} - {span_ms}",
+                f"AND ({s_key} < {t_key}",
+                f"OR ({s_key} = {t_key} AND s.rowid <= t.rowid)))",
                 f"OR (t.{quoted_order} IS NULL AND s.rowid = t.rowid)",
                 ")",
-                f") AS {quoted_feature}",
+                ")",
                 f"FROM {quoted_table} t",
                 "ORDER BY t.rowid",
             ]
         )
-        cursor = data.connection.execute(sql)
-        rows = cursor.fetchall()
-
-        result_values = [row[0] for row in rows]
-        return data.append_column(feature_name, result_values)
@@ -5,19 +5,26 @@ Uses the unified FrameAggregateTestBase.
 
 from __future__ import annotations
 
+from datetime import datetime, timedelta
 from typing import Any
 
+import pyarrow as pa
 import pytest
 
-pytest.importorskip("pandas")
+pd = pytest.importorskip("pandas")
 
 from mloda.core.abstract_plugins.components.options import Options
+from mloda.testing.benchmarks.data import make_benchmark_table
+from mloda.testing.feature_groups.data_operations.helpers import make_feature_set
 from mloda.testing.feature_groups.data_operations.mixins.capability import CapabilityHookTestMixin
 from mloda.testing.feature_groups.data_operations.mixins.pandas import PandasTestMixin
 from mloda.testing.feature_groups.data_operations.row_preserving.frame_aggregate.frame_aggregate import (
     FrameAggregateTestBase,
     time_frame_options,
 )
+from mloda.testing.feature_groups.data_operations.row_preserving.frame_aggregate.reference import (
+    ReferenceFrameAggregate,
+)
 
 from mloda.community.feature_groups.data_operations.row_preserving.frame_aggregate.pandas_frame_aggregate import (
     PandasFrameAggregate,
@@ -41,31 +48,23 @@ class TestPandasFrameAggregate(CapabilityHookTestMixin, PandasTestMixin, FrameAg
 
     @classmethod
     def capability_unsupported(cls) -> tuple[tuple[str, Options], ...]:
-        return (("value_time_frame", time_frame_options("month")),)
-
-    @classmethod
-    def supported_time_units(cls) -> set[str]:
-        # Pandas .rolling(window="...", on=ts) accepts only fixed-frequency units.
-        # Month/year are calendar-anchored; rather than fall back to a Python loop
-        # (which would defeat the point of running inside pandas), they are rejected
-        # at match time. See known-divergences.md.
-        return {"second", "minute", "hour", "day", "week"}
+        return ()
 
     @classmethod
     def supports_null_order_in_time_window(cls) -> bool:
         # pandas groupby().rolling(on=ts) raises "ts values must not have NaT"
         # when the order_by column contains null timestamps. The implementation
         # surfaces this as an explicit ValueError before calling rolling().
+        # Month/year windows do not use rolling(on=ts) and follow the reference.
         return False
 
     # -- Regression tests for PR #202 review bugs -----------------------------
 
-    def test_pandas_rejects_month_time_window_at_match_time(self) -> None:
-        """Pandas rejects month/year time windows because they would require a Python loop."""
+    def test_pandas_matches_calendar_time_windows_at_match_time(self) -> None:
+        """Month/year windows reduce over precomputed calendar bounds; day/week stay on rolling(on=ts)."""
         options = Options(context={"partition_by": ["region"], "order_by": "ts"})
-        assert not self.implementation_class().match_feature_group_criteria("value__sum_1_month_window", options)
-        assert not self.implementation_class().match_feature_group_criteria("value__sum_1_year_window", options)
-        # day/week still match
+        assert self.implementation_class().match_feature_group_criteria("value__sum_1_month_window", options)
+        assert self.implementation_class().match_feature_group_criteria("value__sum_1_year_window", options)
         assert self.implementation_class().match_feature_group_criteria("value__sum_3_day_window", options)
         assert self.implementation_class().match_feature_group_criteria("value__sum_1_week_window", options)
 
@@ -88,3 +87,80 @@ class TestPandasFrameAggregate(CapabilityHookTestMixin, PandasTestMixin, FrameAg
         assert any(">=2.2" in d or ">=2.3" in d for d in pandas_deps), (
             f"frame-aggregate pandas dep should pin >=2.2 for lowercase freq codes; got {pandas_deps}"
         )
+
+
+class TestPandasCalendarWindowsMatchReference:
+    """Month/year windows reduced over precomputed bounds must reproduce the reference's calendar frames.
+
+    Larger than the shared fixture so the windows slide across month ends, shrink
+    across duplicate timestamps, and nulls enter and leave the windows.
+    """
+
+    @pytest.mark.parametrize("agg_type", ["sum", "avg", "count", "min", "max", "std", "var", "median"])
+    @pytest.mark.parametrize("pattern", ["value__{agg}_1_month_window", "value__{agg}_1_year_window"])
+    def test_matches_reference(self, pattern: str, agg_type: str) -> None:
+        table = make_benchmark_table(
+            400, partitions=3, null_ratio=0.2, seed=3, step=timedelta(days=3), duplicate_timestamp_ratio=0.3
+        )
+        self._assert_matches_reference(table, pattern.format(agg=agg_type))
+
+    def test_month_end_clamps_to_shorter_month(self) -> None:
+        """Mar 31 minus one month is Feb 29 in a leap year, so Feb 28 falls outside that window."""
+        ts = [datetime(2024, 1, 31), datetime(2024, 2, 28), datetime(2024, 2, 29), datetime(2024, 3, 31)]
+        table = pa.table(
+            {
+                "region": ["A"] * 4,
+                "ts": pa.array(ts, type=pa.timestamp("us", tz="UTC")),
+                "value": [1, 2, 4, 8],
+            }
+        )
+        assert self._assert_matches_reference(table, "value__sum_1_month_window") == [1, 3, 7, 12]
+
+    def test_null_order_by_frames_only_its_own_row(self) -> None:
+        ts = [datetime(2023, 1, 1), None, datetime(2023, 1, 20), None]
+        table = pa.table(
+            {
+                "region": ["A", "A", "A", "B"],
+                "ts": pa.array(ts, type=pa.timestamp("us", tz="UTC")),
+                "value": [10, 99, 30, 5],
+            }
+        )
+        self._assert_matches_reference(table, "value__sum_1_month_window")
+
+    def test_dst_change_inside_the_window(self) -> None:
+        """A window spanning the spring-forward change keeps the row's own UTC offset for its cutoff."""
+        ts = [
+            datetime(2023, 2, 12, 6, 30),
+            datetime(2023, 2, 12, 7, 30),
+            datetime(2023, 3, 12, 11, 0),
+            datetime(2023, 3, 12, 11, 30),
+        ]
+        utc = pa.array(ts, type=pa.timestamp("us", tz="UTC"))
+        table = pa.table(
+            {
+                "region": ["A"] * 4,
+                "ts": utc.cast(pa.timestamp("us", tz="America/New_York")),
+                "value": [1, 2, 4, 8],
+            }
+        )
+        self._assert_matches_reference(table, "value__sum_1_month_window")
+
+    @staticmethod
+    def _assert_matches_reference(table: pa.Table, feature_name: str) -> list[Any]:
+        fs = make_feature_set(feature_name, ["region"], order_by="ts")
+        series = PandasFrameAggregate.calculate_feature(table.to_pandas(), fs)[feature_name]
+        result = [None if pd.isna(v) else v for v in series.tolist()]
+        expected = ReferenceFrameAggregate.calculate_feature(table, fs).column(feature_name).to_pylist()
+        if "_std_" in feature_name or "_var_" in feature_name:
+            # Like every pandas window, std/var need two observations (min_periods=2).
+            count_name = feature_name.replace("_std_", "_count_").replace("_var_", "_count_")
+            count_fs = make_feature_set(count_name, ["region"], order_by="ts")
+            counts = ReferenceFrameAggregate.calculate_feature(table, count_fs).column(count_name).to_pylist()
+            expected = [None if count < 2 else want for count, want in zip(counts, expected)]
+        assert len(result) == len(expected)
+        for i, (actual, want) in enumerate(zip(result, expected)):
+            if want is None:
+                assert actual is None, f"row {i}: {actual!r} != None"
+            else:
+                assert actual == pytest.approx(want, rel=1e-9, abs=1e-9), f"row {i}: {actual!r} != {want!r}"
+        return result
@@ -0,0 +1,167 @@
+"""Tests for PyArrow frame aggregate implementation.
+
+Uses the unified FrameAggregateTestBase.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pyarrow as pa
+import pytest
+
+from mloda.core.abstract_plugins.components.options import Options
+from mloda.testing.feature_groups.data_operations.mixins.capability import CapabilityHookTestMixin
+from mloda.testing.feature_groups.data_operations.mixins.pyarrow import PyArrowTestMixin
+from mloda.testing.feature_groups.data_operations.row_preserving.frame_aggregate.frame_aggregate import (
+    FrameAggregateTestBase,
+    config_frame_options,
+    time_frame_options,
+)
+
+from mloda.community.feature_groups.data_operations.row_preserving.frame_aggregate.pyarrow_frame_aggregate import (
+    PyArrowFrameAggregate,
+)
+
+
+class TestPyArrowFrameAggregate(CapabilityHookTestMixin, PyArrowTestMixin, FrameAggregateTestBase):
+    """Unified tests inherited from the base class."""
+
+    @classmethod
+    def implementation_class(cls) -> Any:
+        return PyArrowFrameAggregate
+
+    @classmethod
+    def capability_supported(cls) -> tuple[tuple[str, Options], ...]:
+        return (
+            ("value_time_frame", time_frame_options("day")),
+            ("value__sum_rolling_3", Options()),
+            ("value__cummax", Options()),
+            ("value__expanding_min", Options()),
+        )
+
+    @classmethod
+    def capability_unsupported(cls) -> tuple[tuple[str, Options], ...]:
+        return (
+            ("value_time_frame", time_frame_options("month")),
+            ("value__max_rolling_3", Options()),
+            ("value__min_7_day_window", Options()),
+            ("value__cumstd", Options()),
+            ("value__expanding_median", Options()),
+            *(("value_frame", config_frame_options(t, "rolling")) for t in ("min", "max", "std", "var", "median")),
+        )
+
+    @classmethod
+    def supported_time_units(cls) -> set[str]:
+        # Month/year need calendar-aware subtraction, which Arrow compute lacks;
+        # they are rejected at match time. See known-divergences.md.
+        return {"second", "minute", "hour", "day", "week"}
+
+
+class TestPyArrowFrameAggregateMatchesReference:
+    """The prefix-sum and segmented-scan plans must reproduce the per-row window reduction.
+
+    Larger than the shared fixture so rolling windows actually slide, time windows
+    shrink across duplicate timestamps, and nulls enter and leave the windows.
+    """
+
+    @pytest.mark.parametrize(
+        ("pattern", "agg_types"),
+        [
+            ("value__{agg}_rolling_7", ["sum", "avg", "count"]),
+            ("value__{agg}_2_day_window", ["sum", "avg", "count"]),
+            ("value__{agg}_90_minute_window", ["sum", "count"]),
+            ("value__cum{agg}", ["sum", "avg", "count", "min", "max"]),
+            ("value__expanding_{agg}", ["sum", "avg", "count", "min", "max"]),
+        ],
+    )
+    def test_matches_reference(self, pattern: str, agg_types: list[str]) -> None:
+        from datetime import timedelta
+
+        from mloda.testing.benchmarks.data import make_benchmark_table
+        from mloda.testing.feature_groups.data_operations.helpers import make_feature_set
+        from mloda.testing.feature_groups.data_operations.row_preserving.frame_aggregate.reference import (
+            ReferenceFrameAggregate,
+        )
+
+        table = make_benchmark_table(
+            400, partitions=3, null_ratio=0.2, seed=3, step=timedelta(hours=7), duplicate_timestamp_ratio=0.3
+        )
+        for agg_type in agg_types:
+            feature_name = pattern.format(agg=agg_type)
+            fs = make_feature_set(feature_name, ["region"], order_by="ts")
+
+            result = PyArrowFrameAggregate.calculate_feature(table, fs).column(feature_name).to_pylist()
+            expected = ReferenceFrameAggregate.calculate_feature(table, fs).column(feature_name).to_pylist()
+            for i, (actual, want) in enumerate(zip(result, expected)):
+                if want is None:
+                    assert actual is None, f"{feature_name} row {i}: {actual!r} != None"
+                else:
+                    assert actual == pytest.approx(want, rel=1e-9, abs=1e-9), (
+                        f"{feature_name} row {i}: {actual!r} != {want!r}"
+                    )
+
+
+class TestPyArrowFrameAggregateSpecialFloats:
+    """NaN and infinities only poison the frames that contain them, as in a sequential sum."""
+
+    def test_rolling_sum_isolates_nan_and_inf(self) -> None:
+        data = pa.table(
+            {
+                "ord": pa.array([1, 2, 3, 4, 5, 6], type=pa.int64()),
+                "v": pa.array([1.0, float("nan"), 2.0, 3.0, float("inf"), float("-inf")]),
+            }
+        )
+        result = PyArrowFrameAggregate._compute_frame(data, "f", "v", [], "ord", "sum", "rolling", frame_size=2)
+        values = result.column("f").to_pylist()
+        assert values[0] == 1.0
+        assert values[1] != values[1] and values[2] != values[2], f"expected NaN in rows 1-2, got {values!r}"
+        assert values[3:5] == [5.0, float("inf")]
+        assert values[5] != values[5], f"expected inf + -inf to be NaN, got {values[5]!r}"
+
+    def test_cumulative_min_ignores_nulls_and_restarts_per_partition(self) -> None:
+        data = pa.table(
+            {
+                "g": pa.array(["b", "a", "b", "a", "b", "a"]),
+                "ord": pa.array([1, 1, 2, 2, 3, 3], type=pa.int64()),
+                "v": pa.array([None, 5, 7, None, 3, 9], type=pa.int64()),
+            }
+        )
+        result = PyArrowFrameAggregate._compute_frame(data, "f", "v", ["g"], "ord", "min", "cumulative")
+        assert result.column("f").to_pylist() == [None, 5, 7, 5, 3, 5]
+
+    def test_cumulative_min_and_max_skip_nan(self) -> None:
+        """NaN is no value for min/max, as in ``pc.min``/``pc.max`` and PythonDict's ``reduce_agg``."""
+        data = pa.table(
+            {
+                "ord": pa.array([1, 2, 3, 4, 5], type=pa.int64()),
+                "v": pa.array([1.0, float("nan"), 0.5, 2.0, None]),
+            }
+        )
+        result = PyArrowFrameAggregate._compute_frame(data, "f", "v", [], "ord", "max", "cumulative")
+        assert result.column("f").to_pylist() == [1.0, 1.0, 1.0, 2.0, 2.0]
+        result = PyArrowFrameAggregate._compute_frame(data, "f", "v", [], "ord", "min", "cumulative")
+        assert result.column("f").to_pylist() == [1.0, 1.0, 0.5, 0.5, 0.5]
+
+        all_nan = pa.table({"ord": pa.array([1, 2], type=pa.int64()), "v": pa.array([float("nan"), None])})
+        result = PyArrowFrameAggregate._compute_frame(all_nan, "f", "v", [], "ord", "max", "cumulative")
+        assert result.column("f").to_pylist() == [None, None]
+
+    def test_nan_and_null_order_by_tie_in_input_order(self) -> None:
+        """NaN and null order_by values form one nulls-last tier, as in the other backends."""
+        data = pa.table(
+            {
+                "ord": pa.array([None, float("nan"), 1.0, None]),
+                "v": pa.array([10, 20, 30, 40], type=pa.int64()),
+            }
+        )
+        result = PyArrowFrameAggregate._compute_frame(data, "f", "v", [], "ord", "sum", "cumulative")
+        assert result.column("f").to_pylist() == [40, 60, 30, 100]
+        result = PyArrowFrameAggregate._compute_frame(data, "f", "v", [], "ord", "sum", "rolling", frame_size=2)
+        assert result.column("f").to_pylist() == [40, 30, 30, 60]
+
+    def test_empty_table(self) -> None:
+        data = pa.table({"ord": pa.array([], type=pa.int64()), "v": pa.array([], type=pa.float64())})
+        for agg_type in ("sum", "max"):
+            result = PyArrowFrameAggregate._compute_frame(data, "f", "v", [], "ord", agg_type, "cumulative")
+            assert result.num_rows == 0 and "f" in result.column_names
@@ -6,15 +6,23 @@ Uses the unified FrameAggregateTestBase.
 from __future__ import annotations
 
 import math
+from datetime import timedelta
 from typing import Any
 
+import pytest
+
 from mloda.core.abstract_plugins.components.options import Options
+from mloda.testing.benchmarks.data import make_benchmark_table
+from mloda.testing.feature_groups.data_operations.helpers import extract_column, make_feature_set
 from mloda.testing.feature_groups.data_operations.mixins.capability import CapabilityHookTestMixin
 from mloda.testing.feature_groups.data_operations.mixins.python_dict import PythonDictTestMixin
 from mloda.testing.feature_groups.data_operations.row_preserving.frame_aggregate.frame_aggregate import (
     FrameAggregateTestBase,
     time_frame_options,
 )
+from mloda.testing.feature_groups.data_operations.row_preserving.frame_aggregate.reference import (
+    ReferenceFrameAggregate,
+)
 
 from mloda.community.feature_groups.data_operations.row_preserving.frame_aggregate.python_dict_frame_aggregate import (
     PythonDictFrameAggregate,
@@ -180,3 +188,33 @@ class TestPythonDictFrameAggregateNanOrderBySortsLast:
             f"expected nulls-last order (Jan 1, Jan 3, nan) to give rolling-2 sums [10, 50, "
             f"40] without raising, got {result['f']!r}"
         )
+
+
+class TestPythonDictIncrementalWindowsMatchReference:
+    """The incremental sliding-window scan must reproduce the per-row window reduction.
+
+    Larger than the shared fixture so rolling windows actually slide, time windows
+    shrink across duplicate timestamps, and nulls enter and leave the windows.
+    """
+
+    @pytest.mark.parametrize("agg_type", ["sum", "avg", "count", "min", "max", "std", "var", "median"])
+    @pytest.mark.parametrize(
+        "pattern",
+        ["value__{agg}_rolling_7", "value__cum{agg}", "value__expanding_{agg}", "value__{agg}_2_day_window"]
+        + ["value__{agg}_1_month_window"],
+    )
+    def test_matches_reference(self, pattern: str, agg_type: str) -> None:
+        table = make_benchmark_table(
+            400, partitions=3, null_ratio=0.2, seed=3, step=timedelta(hours=7), duplicate_timestamp_ratio=0.3
+        )
+        data = {name: table.column(name).to_pylist() for name in table.column_names}
+        feature_name = pattern.format(agg=agg_type)
+        fs = make_feature_set(feature_name, ["region"], order_by="ts")
+
+        result = extract_column(PythonDictFrameAggregate.calculate_feature(data, fs), feature_name)
+        expected = ReferenceFrameAggregate.calculate_feature(table, fs).column(feature_name).to_pylist()
+        for i, (actual, want) in enumerate(zip(result, expected)):
+            if want is None:
+                assert actual is None, f"row {i}: {actual!r} != None"
+            else:
+                assert actual == pytest.approx(want, rel=1e-9, abs=1e-9), f"row {i}: {actual!r} != {want!r}"
@@ -5,14 +5,16 @@ Uses the unified FrameAggregateTestBase.
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 import pyarrow as pa
+import pytest
 
 from mloda.core.abstract_plugins.components.feature_set import FeatureSet
 from mloda.core.abstract_plugins.components.options import Options
 from mloda.testing.feature_groups.data_operations.helpers import extract_column as _extract_column
+from mloda.testing.feature_groups.data_operations.helpers import make_feature_set
 from mloda.testing.feature_groups.data_operations.mixins.capability import CapabilityHookTestMixin
 from mloda.testing.feature_groups.data_operations.mixins.sqlite import SqliteTestMixin
 from mloda.testing.feature_groups.data_operations.row_preserving.frame_aggregate.frame_aggregate import (
@@ -21,10 +23,36 @@ from mloda.testing.feature_groups.data_operations.row_preserving.frame_aggregate
 )
 from mloda.user import Feature
 
+from mloda.community.feature_groups.data_operations.row_preserving.frame_aggregate import sqlite_frame_aggregate
 from mloda.community.feature_groups.data_operations.row_preserving.frame_aggregate.sqlite_frame_aggregate import (
     SqliteFrameAggregate,
 )
 
+# Null partition keys, a null timestamp, same-ts peers and null values, so the RANGE
+# plan's peer tiebreak and NULL-order self-row rule are both exercised.
+_T0 = datetime(2023, 1, 1, 12, 0, tzinfo=timezone.utc)
+RANGE_FRAME_TABLE = pa.table(
+    {
+        "region": ["A", "A", "A", "A", "A", "B", "B", "B", None, None, "A", "B"],
+        "ts": [
+            _T0,
+            _T0 + timedelta(minutes=45),
+            _T0 + timedelta(minutes=45),
+            _T0 + timedelta(hours=2),
+            _T0 + timedelta(days=1, minutes=1),
+            _T0,
+            _T0 + timedelta(seconds=90),
+            None,
+            _T0,
+            _T0 + timedelta(minutes=1),
+            None,
+            _T0 + timedelta(hours=3),
+        ],
+        "value": [1.0, 2.0, None, 4.0, 8.0, 16.0, None, 64.0, 128.0, 256.0, 512.0, 1024.0],
+        "a": [0.0, 2.0, 2.0, 0.0, 2.0, 2.0, 2.0, 2.0, 0.0, 2.0, 2.0, 0.0],
+    }
+)
+
 
 class TestSqliteFrameAggregate(CapabilityHookTestMixin, SqliteTestMixin, FrameAggregateTestBase):
     """Unified tests inherited from the base class."""
@@ -75,6 +103,51 @@ class TestSqliteFrameAggregate(CapabilityHookTestMixin, SqliteTestMixin, FrameAg
         assert self.implementation_class().match_feature_group_criteria("value__sum_3_day_window", options)
         assert self.implementation_class().match_feature_group_criteria("value__sum_1_week_window", options)
 
+    @pytest.mark.parametrize("agg_type", ["sum", "avg", "count", "min", "max"])
+    @pytest.mark.parametrize("window", ["2_hour", "1_day", "90_second"])
+    @pytest.mark.parametrize("masked", [False, True])
+    def test_sqlite_range_frame_plan_matches_correlated_fallback(
+        self, monkeypatch: pytest.MonkeyPatch, agg_type: str, window: str, masked: bool
+    ) -> None:
+        """The RANGE-frame time-window plan must agree with the correlated-subquery fallback."""
+        feature_name = f"value__{agg_type}_{window}_window"
+        mask = ("a", "greater_than", 1.0) if masked else None
+        fs = make_feature_set(feature_name, ["region"], order_by="ts", mask=mask)
+
+        range_plan = self.implementation_class().calculate_feature(self.create_test_data(RANGE_FRAME_TABLE), fs)
+        monkeypatch.setattr(sqlite_frame_aggregate, "_range_frame_supported", lambda: False)
+        correlated = self.implementation_class().calculate_feature(self.create_test_data(RANGE_FRAME_TABLE), fs)
+
+        expected = self.extract_column(correlated, feature_name)
+        assert self.extract_column(range_plan, feature_name) == pytest.approx(expected, rel=1e-9)
+
+    @pytest.mark.parametrize(
+        ("agg_type", "expected"),
+        [("sum", [1, 3, 6, 10]), ("avg", [1.0, 1.5, 2.0, 2.5]), ("count", [1, 2, 3, 4]), ("max", [1, 2, 3, 4])],
+    )
+    def test_sqlite_range_frame_plan_ignores_columns_named_like_partials(
+        self, agg_type: str, expected: list[Any]
+    ) -> None:
+        """User columns named like the window partials must not be read back in their place."""
+        table = pa.table(
+            {
+                "region": ["A"] * 4,
+                "ts": [_T0 + timedelta(hours=h) for h in range(4)],
+                "value": [1, 2, 3, 4],
+                **{
+                    name: [100, 100, 100, 100]
+                    for name in ("prior_a", "peers_a", "prior_s", "peers_s", "prior_c", "peers_c")
+                },
+            }
+        )
+        feature_name = f"value__{agg_type}_1_day_window"
+        fs = make_feature_set(feature_name, ["region"], order_by="ts")
+
+        result = self.implementation_class().calculate_feature(self.create_test_data(table), fs)
+
+        assert self.extract_column(result, feature_name) == expected
+        assert self.extract_column(result, "prior_a") == [100, 100, 100, 100]
+
     def test_sqlite_second_window_preserves_subsecond_precision(self) -> None:
         """3-second window should respect sub-second precision.
 
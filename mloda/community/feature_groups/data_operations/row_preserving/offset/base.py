@@ -20,6 +20,7 @@ from mloda.community.feature_groups.data_operations.base import (
     op_token_value,
     option_value,
 )
+from mloda.community.feature_groups.data_operations.sort_cache import sort_permutation_scope
 
 
 _OFFSET_TYPES = {
@@ -227,22 +228,23 @@ class OffsetFeatureGroup(RejectionReasonMixin, FeatureGroup):
         """Shared loop: extract params from each feature, delegate to _compute_offset."""
         table = data
 
-        for feature in features.features:
-            feature_name = feature.name
-
-            source_features = cls._extract_source_features(feature)
-            source_col = source_features[0]
-            offset_type = cls._extract_offset_type(feature)
-            partition_by = feature.options.get(cls.PARTITION_BY)
-            if not isinstance(partition_by, (list, tuple)) or not partition_by:
-                raise ValueError(
-                    f"offset requires a non-empty partition_by, got {partition_by!r} for feature {feature_name!r}."
-                )
-            partition_by = list(partition_by)
-            # Any: matching requires order_by, but a direct call still passes an absent one through.
-            order_by: Any = option_value(feature.options, cls.ORDER_BY, column_ref_value)
-
-            table = cls._compute_offset(table, feature_name, source_col, partition_by, order_by, offset_type)
+        with sort_permutation_scope():
+            for feature in features.features:
+                feature_name = feature.name
+
+                source_features = cls._extract_source_features(feature)
+                source_col = source_features[0]
+                offset_type = cls._extract_offset_type(feature)
+                partition_by = feature.options.get(cls.PARTITION_BY)
+                if not isinstance(partition_by, (list, tuple)) or not partition_by:
+                    raise ValueError(
+                        f"offset requires a non-empty partition_by, got {partition_by!r} for feature {feature_name!r}."
+                    )
+                partition_by = list(partition_by)
+                # Any: matching requires order_by, but a direct call still passes an absent one through.
+                order_by: Any = option_value(feature.options, cls.ORDER_BY, column_ref_value)
+
+                table = cls._compute_offset(table, feature_name, source_col, partition_by, order_by, offset_type)
 
         return table
 
@@ -33,9 +33,25 @@ class DuckdbOffset(OffsetFeatureGroup):
         offset_type: str,
     ) -> DuckdbRelation:
         rn = pick_helper_column_name(taken=set(data.columns) | {feature_name})
+        helpers = {rn}
 
         quoted_source = quote_ident(source_col)
-        order_spec = [OrderBy(order_by, nulls="last")]
+        # PyArrow parity: the reference returns results in original row order.
+        # DuckDB window functions with ORDER BY reorder rows; tag positions with
+        # ROW_NUMBER() and restore the original order afterwards. The tag also
+        # breaks order_by ties, so peers keep their input order.
+        rel = data.with_row_number(rn)
+        order_key = order_by
+        if dict(zip(data.columns, [str(t) for t in data.types])).get(order_by) in ("FLOAT", "DOUBLE"):
+            # DuckDB sorts NaN above every number but ahead of the nulls; order on a
+            # NaN -> NULL key so NaN and null rows form one nulls-last tier.
+            order_key = pick_helper_column_name(taken=set(data.columns) | {feature_name, rn})
+            helpers.add(order_key)
+            quoted_order = quote_ident(order_by)
+            rel = rel.project(
+                f"*, CASE WHEN isnan({quoted_order}) THEN NULL ELSE {quoted_order} END AS {quote_ident(order_key)}"
+            )
+        order_spec: list[OrderBy | str] = [OrderBy(order_key, nulls="last"), rn]
 
         offset_expr: str
         frame: WindowFrame | None = None
@@ -55,11 +71,9 @@ class DuckdbOffset(OffsetFeatureGroup):
             # The LAG window is referenced multiple times inside the CASE, so it
             # cannot be a single window func. Precompute LAG into a helper column,
             # then project the CASE referencing that helper (no OVER).
-            prev = pick_helper_column_name(taken=set(data.columns) | {feature_name, rn})
+            prev = pick_helper_column_name(taken=set(data.columns) | {feature_name} | helpers)
             qprev = quote_ident(prev)
-            # PyArrow parity: tag original physical order before windowing so it
-            # can be restored after DuckDB reorders rows.
-            rel = data.with_row_number(rn)
+            helpers.add(prev)
             rel = rel.window(
                 f"LAG({quoted_source}, {offset_n})",
                 prev,
@@ -72,7 +86,7 @@ class DuckdbOffset(OffsetFeatureGroup):
             )
             rel = rel.project(f"*, {case_expr} AS {quote_ident(feature_name)}")
             rel = rel.order(quote_ident(rn))
-            keep = ", ".join(quote_ident(c) for c in rel.columns if c not in (rn, prev))
+            keep = ", ".join(quote_ident(c) for c in rel.columns if c not in helpers)
             return rel.project(keep)
         elif offset_type == "first_value":
             offset_expr = f"FIRST_VALUE({quoted_source} IGNORE NULLS)"
@@ -88,10 +102,6 @@ class DuckdbOffset(OffsetFeatureGroup):
         else:
             raise ValueError(f"Unsupported offset type for DuckDB: {offset_type}")
 
-        # PyArrow parity: the reference returns results in original row order.
-        # DuckDB window functions with ORDER BY reorder rows; tag positions with
-        # ROW_NUMBER() and restore the original order afterwards.
-        rel = data.with_row_number(rn)
         rel = rel.window(
             offset_expr,
             feature_name,
@@ -100,5 +110,5 @@ class DuckdbOffset(OffsetFeatureGroup):
             frame=frame,
         )
         rel = rel.order(quote_ident(rn))
-        keep = ", ".join(quote_ident(c) for c in rel.columns if c != rn)
+        keep = ", ".join(quote_ident(c) for c in rel.columns if c not in helpers)
         return rel.project(keep)
@@ -1,23 +1,23 @@
 """Entry-point manifest for mloda-community-offset.
 
-Lists the concrete FeatureGroup classes that mloda discovers via the
-``mloda.feature_groups`` entry point. Backends whose optional framework is not
-installed are skipped so the rest still register. See issue #271.
+Declares the concrete FeatureGroup classes that mloda discovers via the
+``mloda.feature_groups`` entry point as (module, class, framework) triples;
+importing this module imports no backend. Backends whose optional framework is
+not installed are skipped so the rest still register. See issue #271.
 """
 
 from __future__ import annotations
 
-from mloda.provider import FeatureGroup
+from mloda.community.feature_groups.data_operations.manifest_utils import LazyPluginManifest
 
-from mloda.community.feature_groups.data_operations.manifest_utils import load_plugin_classes
-
-FEATURE_GROUPS: list[type[FeatureGroup]] = load_plugin_classes(
+FEATURE_GROUPS = LazyPluginManifest(
     __package__ or __name__.rpartition(".")[0],
     [
-        ("duckdb_offset", "DuckdbOffset"),
-        ("pandas_offset", "PandasOffset"),
-        ("polars_lazy_offset", "PolarsLazyOffset"),
-        ("python_dict_offset", "PythonDictOffset"),
-        ("sqlite_offset", "SqliteOffset"),
+        ("duckdb_offset", "DuckdbOffset", "DuckDBFramework"),
+        ("pandas_offset", "PandasOffset", "PandasDataFrame"),
+        ("polars_lazy_offset", "PolarsLazyOffset", "PolarsLazyDataFrame"),
+        ("pyarrow_offset", "PyArrowOffset", "PyArrowTable"),
+        ("python_dict_offset", "PythonDictOffset", "PythonDictFramework"),
+        ("sqlite_offset", "SqliteOffset", "SqliteFramework"),
     ],
 )
@@ -11,7 +11,7 @@ from mloda.community.feature_groups.data_operations.helper_columns import unique
 from mloda.community.feature_groups.data_operations.row_preserving.offset.base import (
     OffsetFeatureGroup,
 )
-from mloda.community.feature_groups.data_operations.pandas_helpers import null_safe_groupby
+from mloda.community.feature_groups.data_operations.pandas_helpers import narrow_frame, null_safe_groupby, with_columns
 
 
 class PandasOffset(OffsetFeatureGroup):
@@ -29,38 +29,35 @@ class PandasOffset(OffsetFeatureGroup):
         order_by: str,
         offset_type: str,
     ) -> pd.DataFrame:
-        data = data.copy()
+        work = narrow_frame(data, [*partition_by, order_by, source_col])
 
-        null_sort_col = unique_helper_name("__mloda_null_sort", set(data.columns) | {feature_name})
+        null_sort_col = unique_helper_name("__mloda_null_sort", set(work.columns) | {feature_name})
 
         # Sort by partition + order_by (nulls last) to ensure correct offset
-        null_sort = data[order_by].isna().astype(int)
-        data[null_sort_col] = null_sort
-        data = data.sort_values(partition_by + [null_sort_col, order_by])
+        work[null_sort_col] = work[order_by].isna().astype(int)
+        work = work.sort_values(partition_by + [null_sort_col, order_by])
 
-        grouped = null_safe_groupby(data, partition_by, source_col)
+        grouped = null_safe_groupby(work, partition_by, source_col)
 
         if offset_type.startswith("lag_"):
             offset_n = int(offset_type[len("lag_") :])
-            data[feature_name] = grouped.shift(offset_n)
+            result = grouped.shift(offset_n)
         elif offset_type.startswith("lead_"):
             offset_n = int(offset_type[len("lead_") :])
-            data[feature_name] = grouped.shift(-offset_n)
+            result = grouped.shift(-offset_n)
         elif offset_type.startswith("diff_"):
             offset_n = int(offset_type[len("diff_") :])
-            data[feature_name] = data[source_col] - grouped.shift(offset_n)
+            result = work[source_col] - grouped.shift(offset_n)
         elif offset_type.startswith("pct_change_"):
             offset_n = int(offset_type[len("pct_change_") :])
             prev = grouped.shift(offset_n)
-            data[feature_name] = (data[source_col] - prev) / prev.replace(0, float("nan"))
+            result = (work[source_col] - prev) / prev.replace(0, float("nan"))
         elif offset_type == "first_value":
-            data[feature_name] = grouped.transform(lambda x: x.dropna().iloc[0] if x.dropna().any() else None)
+            result = grouped.transform(lambda x: x.dropna().iloc[0] if x.dropna().any() else None)
         elif offset_type == "last_value":
-            data[feature_name] = grouped.transform(lambda x: x.dropna().iloc[-1] if x.dropna().any() else None)
+            result = grouped.transform(lambda x: x.dropna().iloc[-1] if x.dropna().any() else None)
         else:
             raise ValueError(f"Unsupported offset type: {offset_type}")
 
-        data = data.drop(columns=[null_sort_col])
-        # Restore original row order
-        data = data.sort_index()
-        return data
+        # Restore input row order
+        return with_columns(data, {feature_name: result.sort_index().set_axis(data.index)})
@@ -36,8 +36,13 @@ class PolarsLazyOffset(OffsetFeatureGroup):
         # Track original row order
         data = data.with_row_index(orig_idx_col)
 
-        # Sort by partition_by + order_by (nulls last) for correct offset
-        data = data.sort(partition_by + [order_by], nulls_last=True)
+        # Sort by partition_by + order_by (nulls last) for correct offset. Polars sorts
+        # NaN ahead of the nulls, so a float order_by sorts with NaN as null: NaN and
+        # null rows form one tier, kept in input order by the stable sort.
+        order_key = pl.col(order_by)
+        if data.collect_schema()[order_by].is_float():
+            order_key = order_key.fill_nan(None)
+        data = data.sort([*(pl.col(col) for col in partition_by), order_key], nulls_last=True, maintain_order=True)
 
         if offset_type.startswith("lag_"):
             offset_n = int(offset_type[len("lag_") :])
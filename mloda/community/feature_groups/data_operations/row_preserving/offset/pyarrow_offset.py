@@ -0,0 +1,106 @@
+"""PyArrow implementation for offset feature groups.
+
+One stable sort by ``[*partition_by, order_by]`` ascending, nulls last
+(``sort_permutation``), lays every partition out as a contiguous segment.
+Each offset is then a shifted ``take`` over the sorted values:
+
+- ``lag_N`` / ``lead_N`` take position ``pos -/+ N``; a shifted index that
+  leaves the row's segment is nulled first, so partition edges yield null
+  (``NullPolicy.EDGE_NULL``) instead of reading the neighbouring partition.
+- ``diff_N`` and ``pct_change_N`` combine the row with its ``lag_N`` value.
+- ``first_value`` / ``last_value`` forward-fill the first / every non-null
+  position through the segment and read it at the segment's last row.
+
+Results are scattered back to the input row order.
+"""
+
+from __future__ import annotations
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from mloda.provider import ComputeFramework
+from mloda_plugins.compute_framework.base_implementations.pyarrow.table import PyArrowTable
+
+from mloda.community.feature_groups.data_operations.pyarrow_helpers import (
+    row_positions,
+    scatter_to_rows,
+    segment_size_per_row,
+    segment_start_per_row,
+    segmented_fill_null_forward,
+    sort_permutation,
+)
+from mloda.community.feature_groups.data_operations.row_preserving.offset.base import (
+    OffsetFeatureGroup,
+)
+
+
+def _int64(value: int) -> pa.Scalar:
+    return pa.scalar(value, type=pa.int64())
+
+
+class PyArrowOffset(OffsetFeatureGroup):
+    @classmethod
+    def compute_framework_rule(cls) -> set[type[ComputeFramework]] | None:
+        return {PyArrowTable}
+
+    @classmethod
+    def _compute_offset(
+        cls,
+        data: pa.Table,
+        feature_name: str,
+        source_col: str,
+        partition_by: list[str],
+        order_by: str,
+        offset_type: str,
+    ) -> pa.Table:
+        num_rows = data.num_rows
+        perm = sort_permutation(data, partition_by, order_by)
+        values = pc.take(data.column(source_col), perm.forward)
+        if isinstance(values, pa.ChunkedArray):
+            values = values.combine_chunks()
+        positions = row_positions(num_rows)
+        segment_start = segment_start_per_row(perm.boundaries, num_rows)
+        segment_end = pc.subtract(pc.add(segment_start, segment_size_per_row(perm.boundaries, num_rows)), _int64(1))
+
+        if offset_type.startswith("lag_"):
+            result = cls._shifted(values, positions, segment_start, segment_end, -int(offset_type[len("lag_") :]))
+        elif offset_type.startswith("lead_"):
+            result = cls._shifted(values, positions, segment_start, segment_end, int(offset_type[len("lead_") :]))
+        elif offset_type.startswith("diff_"):
+            offset_n = int(offset_type[len("diff_") :])
+            result = pc.subtract(values, cls._shifted(values, positions, segment_start, segment_end, -offset_n))
+        elif offset_type.startswith("pct_change_"):
+            offset_n = int(offset_type[len("pct_change_") :])
+            curr = pc.cast(values, pa.float64())
+            prev = pc.cast(cls._shifted(values, positions, segment_start, segment_end, -offset_n), pa.float64())
+            # A zero previous value has no defined percentage change: null, not inf.
+            prev = pc.if_else(pc.equal(prev, 0.0), pa.scalar(None, type=pa.float64()), prev)
+            result = pc.divide(pc.subtract(curr, prev), prev)
+        elif offset_type == "first_value":
+            # Only the first non-null position of each segment is kept, so forward-filling
+            # it reaches the segment's last row, from which every row reads it.
+            valid = pc.is_valid(values)
+            valid_count = pc.cumulative_sum(pc.cast(valid, pa.int64()))
+            before_segment = pc.subtract(
+                pc.take(valid_count, segment_start), pc.cast(pc.take(valid, segment_start), pa.int64())
+            )
+            is_first = pc.and_(valid, pc.equal(pc.subtract(valid_count, before_segment), _int64(1)))
+            first_position = pc.if_else(is_first, positions, pa.scalar(None, type=pa.int64()))
+            filled = segmented_fill_null_forward(first_position, perm.boundaries)
+            result = pc.take(values, pc.take(filled, segment_end))
+        elif offset_type == "last_value":
+            result = pc.take(segmented_fill_null_forward(values, perm.boundaries), segment_end)
+        else:
+            raise ValueError(f"Unsupported offset type: {offset_type}")
+
+        return data.append_column(feature_name, scatter_to_rows(result, perm.forward))
+
+    @staticmethod
+    def _shifted(
+        values: pa.Array, positions: pa.Array, segment_start: pa.Array, segment_end: pa.Array, shift: int
+    ) -> pa.Array:
+        """``values[pos + shift]`` per sorted row, null where that position leaves the row's segment."""
+        source = pc.add(positions, _int64(shift))
+        inside = pc.and_(pc.greater_equal(source, segment_start), pc.less_equal(source, segment_end))
+        return pc.take(values, pc.if_else(inside, source, pa.scalar(None, type=pa.int64())))
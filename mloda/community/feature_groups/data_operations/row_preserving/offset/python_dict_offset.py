@@ -15,7 +15,7 @@ from mloda_plugins.compute_framework.base_implementations.python_dict.python_dic
 )
 from mloda_plugins.compute_framework.base_implementations.python_dict.python_dict_utils import row_count
 
-from mloda.community.feature_groups.data_operations.python_dict_helpers import group_key_value, nulls_last_sort_key
+from mloda.community.feature_groups.data_operations.python_dict_helpers import sort_permutation, sorted_groups
 from mloda.community.feature_groups.data_operations.row_preserving.offset.base import (
     OffsetFeatureGroup,
 )
@@ -40,21 +40,15 @@ class PythonDictOffset(OffsetFeatureGroup):
 
         order_vals = data[order_by]
         source_vals = data[source_col]
-        partition_cols = [data[col] for col in partition_by]
 
-        # Build group keys, then stable-sort each group by order_by (nulls last).
-        groups: dict[tuple[Any, ...], list[tuple[int, Any, Any]]] = {}
-        for i in range(num_rows):
-            key = tuple(group_key_value(col[i]) for col in partition_cols)
-            groups.setdefault(key, []).append((i, order_vals[i], source_vals[i]))
-
-        for rows in groups.values():
-            rows.sort(key=lambda t: nulls_last_sort_key(t[1]))
+        # Row indices per partition group, stable-sorted by order_by (nulls last); shared
+        # with the other features of this FeatureSet that order by the same columns.
+        groups = sorted_groups(sort_permutation(data, partition_by, order_by))
 
         result_values: list[Any] = [None] * num_rows
 
-        for rows in groups.values():
-            cls._apply_offset(rows, offset_type, result_values)
+        for rows in groups:
+            cls._apply_offset([(i, order_vals[i], source_vals[i]) for i in rows], offset_type, result_values)
 
         result = dict(data)
         result[feature_name] = result_values
@@ -8,12 +8,19 @@ from mloda_plugins.compute_framework.base_implementations.sql.sql_window import
 from mloda_plugins.compute_framework.base_implementations.sqlite.sqlite_framework import SqliteFramework
 from mloda_plugins.compute_framework.base_implementations.sqlite.sqlite_relation import SqliteRelation
 
+from mloda.community.feature_groups.data_operations.complexity import Complexity
 from mloda.community.feature_groups.data_operations.row_preserving.offset.base import (
     OffsetFeatureGroup,
 )
 
 
 class SqliteOffset(OffsetFeatureGroup):
+    # first_value/last_value run a correlated subquery per row (see _compute_first_last).
+    SUBTYPE_COMPLEXITY: dict[str, Complexity] = {
+        "first_value": Complexity.QUADRATIC,
+        "last_value": Complexity.QUADRATIC,
+    }
+
     @classmethod
     def compute_framework_rule(cls) -> set[type[ComputeFramework]] | None:
         return {SqliteFramework}
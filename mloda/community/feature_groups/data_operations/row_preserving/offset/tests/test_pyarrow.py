@@ -0,0 +1,47 @@
+"""Tests for PyArrowOffset compute implementation."""
+
+from __future__ import annotations
+
+import random
+from typing import Any
+
+import pyarrow as pa
+import pytest
+
+from mloda.community.feature_groups.data_operations.row_preserving.offset.pyarrow_offset import PyArrowOffset
+from mloda.testing.feature_groups.data_operations.mixins.pyarrow import PyArrowTestMixin
+from mloda.testing.feature_groups.data_operations.row_preserving.offset.offset import OffsetTestBase
+from mloda.testing.feature_groups.data_operations.row_preserving.offset.reference import ReferenceOffset
+
+
+class TestPyArrowOffset(PyArrowTestMixin, OffsetTestBase):
+    @classmethod
+    def implementation_class(cls) -> Any:
+        return PyArrowOffset
+
+
+class TestPyArrowOffsetMatchesReference:
+    """Shifted takes must stop at every partition edge, as the per-partition Python loop does."""
+
+    @pytest.mark.parametrize(
+        "offset_type",
+        ["lag_1", "lag_3", "lead_1", "lead_4", "diff_2", "pct_change_1", "first_value", "last_value"],
+    )
+    def test_matches_reference(self, offset_type: str) -> None:
+        rng = random.Random(9)
+        num_rows = 500
+        table = pa.table(
+            {
+                "grp": pa.array([rng.choice(["a", "b", "c", None]) for _ in range(num_rows)]),
+                "ord": pa.array([None if rng.random() < 0.1 else rng.randint(0, 200) for _ in range(num_rows)]),
+                "val": pa.array([None if rng.random() < 0.3 else rng.randint(-3, 9) for _ in range(num_rows)]),
+            }
+        )
+        result = PyArrowOffset._compute_offset(table, "f", "val", ["grp"], "ord", offset_type)
+        expected = ReferenceOffset._compute_offset(table, "f", "val", ["grp"], "ord", offset_type)
+        assert result.column("f").to_pylist() == pytest.approx(expected.column("f").to_pylist())
+
+    def test_empty_table(self) -> None:
+        table = pa.table({"grp": pa.array([], type=pa.string()), "val": pa.array([], type=pa.int64())})
+        for offset_type in ("lag_1", "pct_change_1", "first_value"):
+            assert PyArrowOffset._compute_offset(table, "f", "val", ["grp"], "val", offset_type).num_rows == 0
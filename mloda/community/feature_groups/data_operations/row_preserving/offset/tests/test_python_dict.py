@@ -25,9 +25,9 @@ class TestPythonDictOffsetNanPartitionKeyGrouping:
     Two rows that both carry ``float('nan')`` in a partition column compare unequal
     (``nan != nan``), so building the group key from the raw partition value would split
     them into separate one-row groups instead of one shared group, and ``lag_1`` on a
-    one-row group is always ``None``. ``offset`` has no PyArrow production backend;
-    ``ReferenceOffset`` (the cross-framework test reference) builds its group key the exact
-    same way and reproduces this identical bug, so it is NOT a valid oracle here. Instead,
+    one-row group is always ``None``. ``ReferenceOffset`` (the cross-framework test
+    reference) builds its group key the exact same way and reproduces this identical bug,
+    so it is NOT a valid oracle here. Instead,
     this test asks PyArrow's own ``Table.group_by()`` directly which rows it considers one
     partition, and derives the expected ``lag_1`` value from that by hand.
     """
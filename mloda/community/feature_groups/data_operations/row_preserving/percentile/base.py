@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import os
+from dataclasses import dataclass
 from typing import Any
 
 from mloda.core.abstract_plugins.components.feature import Feature
@@ -12,14 +13,28 @@ from mloda.core.abstract_plugins.components.feature_name import FeatureName
 from mloda.core.abstract_plugins.components.feature_set import FeatureSet
 from mloda.core.abstract_plugins.components.options import Options
 from mloda.core.abstract_plugins.components.utils import escalate_match_abort
-from mloda.provider import DefaultOptionKeys, FeatureGroup, property_spec
+from mloda.provider import BaseArtifact, DefaultOptionKeys, FeatureGroup, property_spec
 
+from mloda.community.feature_groups.data_operations.aggregation_base import bucket_by_key
+from mloda.community.feature_groups.data_operations.approximate import APPROXIMATE, approximate_requested
 from mloda.community.feature_groups.data_operations.base import (
     RejectionReasonMixin,
+    is_flag,
+    is_op_token,
     is_scalar_number,
     scalar_number_value,
 )
+from mloda.community.feature_groups.data_operations.fitted_statistics import (
+    STATISTICS_VERSION,
+    FittedStatisticsOps,
+    StatisticsArtifact,
+    compute_with_fitted_statistics,
+    fitted_statistics_supported,
+    statistics_version,
+)
+from mloda.community.feature_groups.data_operations.json_artifact import load_json_artifact, save_json_artifact
 from mloda.community.feature_groups.data_operations.mask_utils import MASK_KEY, parse_mask_spec
+from mloda.community.feature_groups.data_operations.sort_cache import sort_permutation_scope
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +59,14 @@ def _is_unit_interval_element(value: object) -> bool:
     return isinstance(value, (int, float)) and not isinstance(value, bool) and 0.0 <= value <= 1.0
 
 
+@dataclass(frozen=True)
+class PercentileRequest:
+    """One feature's percentile inside a bucket sharing source, partition_by and mask."""
+
+    feature_name: str
+    percentile: float
+
+
 class PercentileFeatureGroup(RejectionReasonMixin, FeatureGroup):
     """Base class for percentile operations that preserve row count.
 
@@ -77,6 +100,11 @@ class PercentileFeatureGroup(RejectionReasonMixin, FeatureGroup):
                 }
             ),
         )
+
+    Setting ``approximate=True`` lets the backend use a t-digest instead of the exact
+    interpolation where it has one (``APPROXIMATE_KERNELS``); see ``approximate``.
+    Setting ``statistics_version`` serves the per-partition values fitted by a training
+    run instead of computing them (``FITTED_STATISTICS_OPS``); see ``fitted_statistics``.
     """
 
     PREFIX_PATTERN = r".*__(p\d+)_percentile$"
@@ -86,6 +114,14 @@ class PercentileFeatureGroup(RejectionReasonMixin, FeatureGroup):
 
     PERCENTILE = "percentile"
     PARTITION_BY = "partition_by"
+    APPROXIMATE = APPROXIMATE
+    STATISTICS_VERSION = STATISTICS_VERSION
+
+    # {"percentile"} on backends with an approximate percentile kernel.
+    APPROXIMATE_KERNELS: frozenset[str] = frozenset()
+
+    # Backends that can serve fitted statistics set this; see fitted_statistics.
+    FITTED_STATISTICS_OPS: type[FittedStatisticsOps] | None = None
 
     PROPERTY_MAPPING = {
         # deferred_binding stays True: see _validate_forwarded_percentile_mismatch for why.
@@ -109,6 +145,18 @@ class PercentileFeatureGroup(RejectionReasonMixin, FeatureGroup):
             strict=False,
             default=None,
         ),
+        APPROXIMATE: property_spec(
+            "Allow an approximate (t-digest) percentile kernel (opt-in)",
+            strict=False,
+            default=None,
+            match_guard=is_flag,
+        ),
+        STATISTICS_VERSION: property_spec(
+            "Label of the fitted per-partition values to save and serve across runs (opt-in)",
+            strict=False,
+            default=None,
+            match_guard=is_op_token,
+        ),
     }
 
     @classmethod
@@ -142,6 +190,7 @@ class PercentileFeatureGroup(RejectionReasonMixin, FeatureGroup):
         - forwarded-value vs. name-parsed-value protection for ``percentile``
         - percentile range validation for config-based features (0.0-1.0)
         - partition_by type validation (must be a list of strings)
+        - ``statistics_version`` needs a backend that serves fitted statistics
         """
         if not super().match_feature_group_criteria(feature_name, options, _data_access_collection):
             return False
@@ -162,7 +211,7 @@ class PercentileFeatureGroup(RejectionReasonMixin, FeatureGroup):
         if not all(isinstance(item, str) for item in partition_by):
             return False
 
-        return True
+        return fitted_statistics_supported(cls, options)
 
     @classmethod
     def _validate_forwarded_percentile_mismatch(
@@ -285,8 +334,17 @@ class PercentileFeatureGroup(RejectionReasonMixin, FeatureGroup):
 
         Each feature in the feature set produces one new column containing the
         percentile value repeated for every row in the partition.
+
+        Exact features sharing ``(source, partition_by, mask)`` land in one bucket and are
+        handed to ``_compute_percentile_bucket``, so a backend can compute all of their
+        percentiles with one grouping pass. Approximate features and features with
+        ``statistics_version`` are computed one at a time.
         """
         table = data
+        fitted = load_json_artifact(features)
+        saved: dict[str, Any] | None = {} if features.artifact_to_save is not None else None
+
+        planned: list[tuple[tuple[str, tuple[str, ...], Any], PercentileRequest]] = []
 
         for feature in features.features:
             feature_name = feature.name
@@ -302,10 +360,59 @@ class PercentileFeatureGroup(RejectionReasonMixin, FeatureGroup):
             partition_by = list(partition_by)
             mask_spec = parse_mask_spec(feature.options.get(MASK_KEY))
 
-            table = cls._compute_percentile(table, feature_name, source_col, partition_by, percentile, mask_spec)
+            approximate = approximate_requested(cls, feature, "percentile")
+            if not approximate and statistics_version(feature) is None:
+                key = (source_col, tuple(partition_by), mask_spec)
+                planned.append((key, PercentileRequest(feature_name, percentile)))
+                continue
+
+            compute = cls._compute_approximate_percentile if approximate else cls._compute_percentile
+            table = compute_with_fitted_statistics(
+                cls.FITTED_STATISTICS_OPS,
+                fitted,
+                saved,
+                table,
+                feature,
+                source_col,
+                percentile,
+                partition_by,
+                lambda data: compute(data, feature_name, source_col, partition_by, percentile, mask_spec),
+            )
+
+        # Buckets over the same partition_by share one factorization of the keys on
+        # backends that cache it; see sort_cache.
+        with sort_permutation_scope():
+            for (source_col, partition_key, mask_spec), requests in bucket_by_key(planned):
+                table = cls._compute_percentile_bucket(table, requests, source_col, list(partition_key), mask_spec)
 
+        save_json_artifact(features, saved)
         return table
 
+    @staticmethod
+    def artifact() -> type[BaseArtifact] | None:
+        """Values fitted for features with ``statistics_version``; see ``fitted_statistics``."""
+        return StatisticsArtifact
+
+    @classmethod
+    def _compute_percentile_bucket(
+        cls,
+        data: Any,
+        requests: list[PercentileRequest],
+        source_col: str,
+        partition_by: list[str],
+        mask_spec: list[tuple[str, str, Any]] | None = None,
+    ) -> Any:
+        """Compute every request of one bucket; all share source_col, partition_by and mask_spec.
+
+        The default runs ``_compute_percentile`` once per request. Backends override this to
+        compute all percentiles of the bucket with one grouping pass.
+        """
+        for request in requests:
+            data = cls._compute_percentile(
+                data, request.feature_name, source_col, partition_by, request.percentile, mask_spec
+            )
+        return data
+
     @classmethod
     def _compute_percentile(
         cls,
@@ -318,3 +425,16 @@ class PercentileFeatureGroup(RejectionReasonMixin, FeatureGroup):
     ) -> Any:
         """Subclasses must implement the actual percentile computation."""
         raise NotImplementedError
+
+    @classmethod
+    def _compute_approximate_percentile(
+        cls,
+        data: Any,
+        feature_name: str,
+        source_col: str,
+        partition_by: list[str],
+        percentile: float,
+        mask_spec: list[tuple[str, str, Any]] | None = None,
+    ) -> Any:
+        """Backends with ``"percentile"`` in ``APPROXIMATE_KERNELS`` implement the approximate kernel."""
+        raise NotImplementedError
@@ -9,6 +9,7 @@ from mloda_plugins.compute_framework.base_implementations.duckdb.duckdb_framewor
 from mloda_plugins.compute_framework.base_implementations.duckdb.duckdb_relation import DuckdbRelation
 from mloda_plugins.compute_framework.base_implementations.sql.sql_utils import quote_ident
 
+from mloda.community.feature_groups.data_operations.duckdb_helpers import DuckdbFittedStatistics
 from mloda.community.feature_groups.data_operations.mask_utils import build_sql_case_when
 from mloda.community.feature_groups.data_operations.row_preserving.percentile.base import (
     PercentileFeatureGroup,
@@ -16,6 +17,9 @@ from mloda.community.feature_groups.data_operations.row_preserving.percentile.ba
 
 
 class DuckdbPercentile(PercentileFeatureGroup):
+    APPROXIMATE_KERNELS = frozenset({"percentile"})
+    FITTED_STATISTICS_OPS = DuckdbFittedStatistics
+
     @classmethod
     def compute_framework_rule(cls) -> set[type[ComputeFramework]] | None:
         return {DuckDBFramework}
@@ -29,6 +33,36 @@ class DuckdbPercentile(PercentileFeatureGroup):
         partition_by: list[str],
         percentile: float,
         mask_spec: list[tuple[str, str, Any]] | None = None,
+    ) -> DuckdbRelation:
+        return cls._window_quantile(
+            "QUANTILE_CONT", data, feature_name, source_col, partition_by, percentile, mask_spec
+        )
+
+    @classmethod
+    def _compute_approximate_percentile(
+        cls,
+        data: Any,
+        feature_name: str,
+        source_col: str,
+        partition_by: list[str],
+        percentile: float,
+        mask_spec: list[tuple[str, str, Any]] | None = None,
+    ) -> DuckdbRelation:
+        """DuckDB's t-digest ``APPROX_QUANTILE`` over the same partition window."""
+        return cls._window_quantile(
+            "APPROX_QUANTILE", data, feature_name, source_col, partition_by, percentile, mask_spec
+        )
+
+    @classmethod
+    def _window_quantile(
+        cls,
+        quantile_func: str,
+        data: Any,
+        feature_name: str,
+        source_col: str,
+        partition_by: list[str],
+        percentile: float,
+        mask_spec: list[tuple[str, str, Any]] | None,
     ) -> DuckdbRelation:
         quoted_source = quote_ident(source_col)
 
@@ -40,6 +74,6 @@ class DuckdbPercentile(PercentileFeatureGroup):
         # Python float validated to [0.0, 1.0] by the base class, so it cannot
         # produce SQL injection via float.__format__.
         result: DuckdbRelation = data.window(
-            f"QUANTILE_CONT({source_sql}, {percentile})", feature_name, partition_by=partition_by
+            f"{quantile_func}({source_sql}, {percentile})", feature_name, partition_by=partition_by
         )
         return result
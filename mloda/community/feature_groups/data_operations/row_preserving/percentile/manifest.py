@@ -1,22 +1,22 @@
 """Entry-point manifest for mloda-community-percentile.
 
-Lists the concrete FeatureGroup classes that mloda discovers via the
-``mloda.feature_groups`` entry point. Backends whose optional framework is not
-installed are skipped so the rest still register. See issue #271.
+Declares the concrete FeatureGroup classes that mloda discovers via the
+``mloda.feature_groups`` entry point as (module, class, framework) triples;
+importing this module imports no backend. Backends whose optional framework is
+not installed are skipped so the rest still register. See issue #271.
 """
 
 from __future__ import annotations
 
-from mloda.provider import FeatureGroup
+from mloda.community.feature_groups.data_operations.manifest_utils import LazyPluginManifest
 
-from mloda.community.feature_groups.data_operations.manifest_utils import load_plugin_classes
-
-FEATURE_GROUPS: list[type[FeatureGroup]] = load_plugin_classes(
+FEATURE_GROUPS = LazyPluginManifest(
     __package__ or __name__.rpartition(".")[0],
     [
-        ("duckdb_percentile", "DuckdbPercentile"),
-        ("pandas_percentile", "PandasPercentile"),
-        ("polars_lazy_percentile", "PolarsLazyPercentile"),
-        ("python_dict_percentile", "PythonDictPercentile"),
+        ("duckdb_percentile", "DuckdbPercentile", "DuckDBFramework"),
+        ("pandas_percentile", "PandasPercentile", "PandasDataFrame"),
+        ("polars_lazy_percentile", "PolarsLazyPercentile", "PolarsLazyDataFrame"),
+        ("pyarrow_percentile", "PyArrowPercentile", "PyArrowTable"),
+        ("python_dict_percentile", "PythonDictPercentile", "PythonDictFramework"),
     ],
 )
@@ -10,8 +10,14 @@ from mloda.provider import ComputeFramework
 from mloda_plugins.compute_framework.base_implementations.pandas.dataframe import PandasDataFrame
 
 from mloda.community.feature_groups.data_operations.mask_utils import build_mask_from_spec
+from mloda.community.feature_groups.data_operations.pandas_helpers import (
+    PandasFittedStatistics,
+    partition_grouping,
+    with_columns,
+)
 from mloda.community.feature_groups.data_operations.row_preserving.percentile.base import (
     PercentileFeatureGroup,
+    PercentileRequest,
 )
 from mloda_plugins.compute_framework.base_implementations.pandas.pandas_mask_engine import (
     PandasMaskEngine,
@@ -19,6 +25,8 @@ from mloda_plugins.compute_framework.base_implementations.pandas.pandas_mask_eng
 
 
 class PandasPercentile(PercentileFeatureGroup):
+    FITTED_STATISTICS_OPS = PandasFittedStatistics
+
     @classmethod
     def compute_framework_rule(cls) -> set[type[ComputeFramework]] | None:
         return {PandasDataFrame}
@@ -33,13 +41,36 @@ class PandasPercentile(PercentileFeatureGroup):
         percentile: float,
         mask_spec: list[tuple[str, str, Any]] | None = None,
     ) -> pd.DataFrame:
+        return cls._compute_percentile_bucket(
+            data, [PercentileRequest(feature_name, percentile)], source_col, partition_by, mask_spec
+        )
+
+    @classmethod
+    def _compute_percentile_bucket(
+        cls,
+        data: pd.DataFrame,
+        requests: list[PercentileRequest],
+        source_col: str,
+        partition_by: list[str],
+        mask_spec: list[tuple[str, str, Any]] | None = None,
+    ) -> pd.DataFrame:
+        """One grouped multi-quantile reduction for the bucket, taken back to the rows by group number.
+
+        The source is grouped by the shared ``partition_grouping`` codes. ``quantile`` returns
+        one value per (group, percentile), groups in code order and percentiles innermost,
+        so row ``i`` reads position ``codes[i] * len(percentiles) + j`` for the ``j``-th percentile.
+        """
+        col = data[source_col]
         if mask_spec is not None:
-            mask = build_mask_from_spec(PandasMaskEngine, data, mask_spec)
-            data = data.copy()
-            data[source_col] = data[source_col].where(mask)
-        else:
-            data = data.copy()
-        by: str | list[str] = partition_by[0] if len(partition_by) == 1 else partition_by
-        grouped = data.groupby(by, dropna=False)[source_col]
-        data[feature_name] = grouped.transform(lambda x: x.quantile(percentile))
-        return data
+            col = col.where(build_mask_from_spec(PandasMaskEngine, data, mask_spec))
+        grouping = partition_grouping(data, partition_by)
+        percentiles = list(dict.fromkeys(request.percentile for request in requests))
+        quantiles = col.groupby(grouping.codes).quantile(percentiles).array
+        positions = grouping.codes * len(percentiles)
+        columns = {
+            request.feature_name: pd.Series(
+                quantiles.take(positions + percentiles.index(request.percentile)), index=data.index
+            )
+            for request in requests
+        }
+        return with_columns(data, columns)
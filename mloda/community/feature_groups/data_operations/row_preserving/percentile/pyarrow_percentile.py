@@ -0,0 +1,129 @@
+"""PyArrow implementation for percentile feature groups.
+
+The (masked) source is cast to float64 with NaN treated as null, then sorted
+once by ``[*partition_by, value]`` ascending, nulls last
+(``sort_permutation``). Each partition becomes a contiguous segment whose
+``k`` non-null values come first, already in order, so the percentile is a
+linear interpolation between the values at positions ``floor(q * (k - 1))``
+and ``ceil(q * (k - 1))`` of the segment -- the same rule as ``pc.quantile``
+(``interpolation="linear"``), used by the reference. All of it is computed
+per row from the row's segment start and non-null count, so the result is
+already broadcast; it is scattered back to the input row order.
+
+The approximate kernel skips the sort: one ``group_by`` computes a t-digest
+quantile per partition next to the partition's row-index list, and
+``broadcast_group_values`` takes it back to every row.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from mloda.provider import ComputeFramework
+from mloda_plugins.compute_framework.base_implementations.pyarrow.pyarrow_mask_engine import PyArrowMaskEngine
+from mloda_plugins.compute_framework.base_implementations.pyarrow.table import PyArrowTable
+
+from mloda.community.feature_groups.data_operations.helper_columns import unique_helper_name
+from mloda.community.feature_groups.data_operations.mask_utils import build_mask_from_spec
+from mloda.community.feature_groups.data_operations.pyarrow_helpers import (
+    PyArrowFittedStatistics,
+    broadcast_group_values,
+    fused_group_by,
+    scatter_to_rows,
+    segment_start_per_row,
+    segment_sum_per_row,
+    sort_permutation,
+)
+from mloda.community.feature_groups.data_operations.row_preserving.percentile.base import (
+    PercentileFeatureGroup,
+)
+
+_NULL_FLOAT = pa.scalar(None, type=pa.float64())
+
+
+class PyArrowPercentile(PercentileFeatureGroup):
+    APPROXIMATE_KERNELS = frozenset({"percentile"})
+    FITTED_STATISTICS_OPS = PyArrowFittedStatistics
+
+    @classmethod
+    def compute_framework_rule(cls) -> set[type[ComputeFramework]] | None:
+        return {PyArrowTable}
+
+    @classmethod
+    def _compute_percentile(
+        cls,
+        data: pa.Table,
+        feature_name: str,
+        source_col: str,
+        partition_by: list[str],
+        percentile: float,
+        mask_spec: list[tuple[str, str, Any]] | None = None,
+    ) -> pa.Table:
+        values = cls._masked_values(data, source_col, mask_spec)
+        value_col = unique_helper_name("__mloda_pctl_value", set(partition_by))
+        key_table = pa.table([*(data.column(col) for col in partition_by), values], names=[*partition_by, value_col])
+        perm = sort_permutation(key_table, partition_by, value_col)
+        sorted_values = pc.take(values, perm.forward)
+        if isinstance(sorted_values, pa.ChunkedArray):
+            sorted_values = sorted_values.combine_chunks()
+
+        num_rows = data.num_rows
+        segment_start = segment_start_per_row(perm.boundaries, num_rows)
+        non_null = segment_sum_per_row(pc.cast(pc.is_valid(sorted_values), pa.int64()), perm.boundaries)
+
+        # Fractional rank within the segment's sorted non-null values; null for an
+        # all-null segment, whose takes then yield null too.
+        rank = pc.multiply(pc.cast(pc.subtract(non_null, 1), pa.float64()), float(percentile))
+        rank = pc.if_else(pc.equal(non_null, 0), _NULL_FLOAT, rank)
+        lower_rank = pc.floor(rank)
+        fraction = pc.subtract(rank, lower_rank)
+        lower = pc.take(sorted_values, pc.add(segment_start, pc.cast(lower_rank, pa.int64())))
+        upper = pc.take(sorted_values, pc.add(segment_start, pc.cast(pc.ceil(rank), pa.int64())))
+        result = pc.if_else(
+            pc.equal(fraction, 0.0),
+            lower,
+            pc.add(pc.multiply(lower, pc.subtract(1.0, fraction)), pc.multiply(upper, fraction)),
+        )
+
+        return data.append_column(feature_name, scatter_to_rows(result, perm.forward))
+
+    @classmethod
+    def _compute_approximate_percentile(
+        cls,
+        data: pa.Table,
+        feature_name: str,
+        source_col: str,
+        partition_by: list[str],
+        percentile: float,
+        mask_spec: list[tuple[str, str, Any]] | None = None,
+    ) -> pa.Table:
+        values = cls._masked_values(data, source_col, mask_spec)
+        taken = set(partition_by)
+        value_col = unique_helper_name("__mloda_pctl_value", taken)
+        idx_col = unique_helper_name("__mloda_pctl_idx", taken | {value_col})
+        work = pa.table(
+            [*(data.column(col) for col in partition_by), values, pa.array(range(data.num_rows), type=pa.int64())],
+            names=[*partition_by, value_col, idx_col],
+        )
+        grouped, (digest_col, rows_col) = fused_group_by(
+            work, partition_by, [(value_col, "tdigest", pc.TDigestOptions(q=percentile)), (idx_col, "list", None)]
+        )
+        # One quantile requested, so every digest is a one-element list (null for an all-null partition).
+        quantiles = pc.list_element(grouped.column(digest_col), 0)
+        return data.append_column(feature_name, broadcast_group_values(quantiles, grouped.column(rows_col)))
+
+    @staticmethod
+    def _masked_values(
+        data: pa.Table, source_col: str, mask_spec: list[tuple[str, str, Any]] | None
+    ) -> pa.Array | pa.ChunkedArray:
+        """The source as float64, with NaN and masked-out rows null."""
+        values = pc.cast(data.column(source_col), pa.float64())
+        # pc.quantile ignores NaN as well as null.
+        values = pc.if_else(pc.fill_null(pc.is_nan(values), False), _NULL_FLOAT, values)
+        if mask_spec is not None:
+            mask = pc.fill_null(build_mask_from_spec(PyArrowMaskEngine, data, mask_spec), False)
+            values = pc.if_else(mask, values, _NULL_FLOAT)
+        return values
@@ -21,6 +21,7 @@ from mloda_plugins.compute_framework.base_implementations.python_dict.python_dic
 )
 from mloda_plugins.compute_framework.base_implementations.python_dict.python_dict_utils import row_count
 
+from mloda.community.feature_groups.data_operations.fitted_statistics import PythonDictFittedStatistics
 from mloda.community.feature_groups.data_operations.mask_utils import build_mask_from_spec
 from mloda.community.feature_groups.data_operations.python_dict_helpers import group_key_value, is_nan
 from mloda.community.feature_groups.data_operations.row_preserving.percentile.base import (
@@ -29,6 +30,8 @@ from mloda.community.feature_groups.data_operations.row_preserving.percentile.ba
 
 
 class PythonDictPercentile(PercentileFeatureGroup):
+    FITTED_STATISTICS_OPS = PythonDictFittedStatistics
+
     @classmethod
     def compute_framework_rule(cls) -> set[type[ComputeFramework]] | None:
         return {PythonDictFramework}
@@ -1,13 +1,14 @@
 """Integration tests for percentile through mloda's full pipeline.
 
 Uses the ReferencePercentile implementation (a test utility that accepts PyArrow
-tables and computes in Python) because PyArrow lacks native grouped percentile.
+tables and computes in Python) as the per-row oracle for the native backends.
 The tests verify that percentile operations work end-to-end through mloda's
 runtime, including plugin discovery, feature resolution, and PluginCollector.
 """
 
 from __future__ import annotations
 
+import json
 from typing import Any
 
 import pyarrow as pa
@@ -24,6 +25,10 @@ from mloda.testing.feature_groups.data_operations.row_preserving.percentile.refe
     ReferencePercentile,
 )
 
+from mloda.community.feature_groups.data_operations.row_preserving.percentile.pyarrow_percentile import (
+    PyArrowPercentile,
+)
+
 
 class TestPercentileIntegration(MaskIntegrationTestMixin, DataOpsIntegrationTestBase):
     @classmethod
@@ -187,3 +192,33 @@ class TestIntegrationMultipleFeatures:
 
         assert p25_found, "p25_percentile result not found in any result table"
         assert p100_found, "p100_percentile result not found in any result table"
+
+
+class TestIntegrationFittedStatistics:
+    def test_saved_partition_values_round_trip(self) -> None:
+        """Per-partition values saved by a training run are served, keyed by partition, on the next run."""
+        plugin_collector = PluginCollector.enabled_feature_groups({PyArrowDataOpsTestDataCreator, PyArrowPercentile})
+        options = Options(context={"partition_by": ["region"], "statistics_version": "v1"})
+
+        def run(**kwargs: Any) -> Any:
+            session = mloda.prepare(
+                [Feature("value_int__p50_percentile", options=options)],
+                compute_frameworks={PyArrowTable},
+                plugin_collector=plugin_collector,
+            )
+            return session, session.run(**kwargs)
+
+        training, _ = run()
+        artifacts = training.get_artifacts()
+        saved = json.loads(artifacts["value_int__p50_percentile"])["value_int__p50_percentile"]
+        assert saved["partition_by"] == ["region"]
+        assert sorted(saved["rows"], key=str) == [["A", 5.0], ["B", 50.0], ["C", 15.0], [None, -10.0]]
+
+        _, results = run(artifacts=artifacts)
+        served = [
+            table.column("value_int__p50_percentile").to_pylist()
+            for table in results
+            if isinstance(table, pa.Table) and "value_int__p50_percentile" in table.column_names
+        ]
+        expected = [5.0, 5.0, 5.0, 5.0, 50.0, 50.0, 50.0, 50.0, 15.0, 15.0, 15.0, -10.0]
+        assert served == [pytest.approx(expected)]
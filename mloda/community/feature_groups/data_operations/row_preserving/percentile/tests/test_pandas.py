@@ -2,18 +2,22 @@
 
 from __future__ import annotations
 
+import random
 from typing import Any
 
+import pyarrow as pa
 import pytest
 
 pytest.importorskip("pandas")
 
+from mloda.community.feature_groups.data_operations.row_preserving.percentile.base import PercentileRequest
 from mloda.community.feature_groups.data_operations.row_preserving.percentile.pandas_percentile import (
     PandasPercentile,
 )
 from mloda.testing.feature_groups.data_operations.row_preserving.percentile.percentile import (
     PercentileTestBase,
 )
+from mloda.testing.feature_groups.data_operations.row_preserving.percentile.reference import ReferencePercentile
 from mloda.testing.feature_groups.data_operations.mixins.pandas import PandasTestMixin
 
 
@@ -21,3 +25,28 @@ class TestPandasPercentile(PandasTestMixin, PercentileTestBase):
     @classmethod
     def implementation_class(cls) -> Any:
         return PandasPercentile
+
+
+class TestPandasPercentileBucketMatchesReference:
+    """One multi-quantile reduction must reproduce each percentile computed per group, null keys included."""
+
+    PERCENTILES = (0.0, 0.1, 0.5, 0.77, 1.0)
+
+    def test_matches_reference(self) -> None:
+        rng = random.Random(3)
+        num_rows = 800
+        table = pa.table(
+            {
+                "grp": pa.array([rng.choice(["a", "b", "c", None]) for _ in range(num_rows)]),
+                "sub": pa.array([rng.choice([1, 2, None]) for _ in range(num_rows)], type=pa.int64()),
+                "val": pa.array([None if rng.random() < 0.2 else rng.uniform(-1e3, 1e3) for _ in range(num_rows)]),
+            }
+        )
+        requests = [PercentileRequest(f"p{i}", percentile) for i, percentile in enumerate(self.PERCENTILES)]
+        result = PandasPercentile._compute_percentile_bucket(table.to_pandas(), requests, "val", ["grp", "sub"])
+        for request in requests:
+            expected = ReferencePercentile._compute_percentile(
+                table, request.feature_name, "val", ["grp", "sub"], request.percentile
+            ).column(request.feature_name)
+            actual = pa.array(result[request.feature_name], from_pandas=True)
+            assert actual.to_pylist() == pytest.approx(expected.to_pylist(), rel=1e-12)
@@ -0,0 +1,52 @@
+"""Tests for PyArrowPercentile compute implementation."""
+
+from __future__ import annotations
+
+import random
+from typing import Any
+
+import pyarrow as pa
+import pytest
+
+from mloda.community.feature_groups.data_operations.row_preserving.percentile.pyarrow_percentile import (
+    PyArrowPercentile,
+)
+from mloda.testing.feature_groups.data_operations.mixins.pyarrow import PyArrowTestMixin
+from mloda.testing.feature_groups.data_operations.row_preserving.percentile.percentile import (
+    PercentileTestBase,
+)
+from mloda.testing.feature_groups.data_operations.row_preserving.percentile.reference import ReferencePercentile
+
+
+class TestPyArrowPercentile(PyArrowTestMixin, PercentileTestBase):
+    @classmethod
+    def implementation_class(cls) -> Any:
+        return PyArrowPercentile
+
+
+class TestPyArrowPercentileMatchesReference:
+    """Interpolating in sorted segments must reproduce ``pc.quantile`` per group exactly."""
+
+    @pytest.mark.parametrize("percentile", [0.0, 0.1, 0.25, 0.5, 0.77, 1.0])
+    def test_matches_reference(self, percentile: float) -> None:
+        rng = random.Random(2)
+        num_rows = 800
+        table = pa.table(
+            {
+                "grp": pa.array([rng.choice(["a", "b", "c", "d", None]) for _ in range(num_rows)]),
+                "val": pa.array(
+                    [
+                        None if rng.random() < 0.2 else float("nan") if rng.random() < 0.05 else rng.uniform(-1e3, 1e3)
+                        for _ in range(num_rows)
+                    ]
+                ),
+            }
+        )
+        result = PyArrowPercentile._compute_percentile(table, "p", "val", ["grp"], percentile)
+        expected = ReferencePercentile._compute_percentile(table, "p", "val", ["grp"], percentile)
+        assert result.column("p").to_pylist() == expected.column("p").to_pylist()
+
+    def test_source_in_partition_by(self) -> None:
+        table = pa.table({"val": [1, 1, 2]})
+        result = PyArrowPercentile._compute_percentile(table, "p", "val", ["val"], 0.5)
+        assert result.column("p").to_pylist() == [1.0, 1.0, 2.0]
@@ -1,24 +1,23 @@
 """Entry-point manifest for mloda-community-point-arithmetic.
 
-Lists the concrete FeatureGroup classes that mloda discovers via the
-``mloda.feature_groups`` entry point. Backends whose optional framework is not
-installed are skipped so the rest still register. See issue #271.
+Declares the concrete FeatureGroup classes that mloda discovers via the
+``mloda.feature_groups`` entry point as (module, class, framework) triples;
+importing this module imports no backend. Backends whose optional framework is
+not installed are skipped so the rest still register. See issue #271.
 """
 
 from __future__ import annotations
 
-from mloda.provider import FeatureGroup
+from mloda.community.feature_groups.data_operations.manifest_utils import LazyPluginManifest
 
-from mloda.community.feature_groups.data_operations.manifest_utils import load_plugin_classes
-
-FEATURE_GROUPS: list[type[FeatureGroup]] = load_plugin_classes(
+FEATURE_GROUPS = LazyPluginManifest(
     __package__ or __name__.rpartition(".")[0],
     [
-        ("duckdb_point_arithmetic", "DuckdbPointArithmetic"),
-        ("pandas_point_arithmetic", "PandasPointArithmetic"),
-        ("polars_lazy_point_arithmetic", "PolarsLazyPointArithmetic"),
-        ("pyarrow_point_arithmetic", "PyArrowPointArithmetic"),
-        ("python_dict_point_arithmetic", "PythonDictPointArithmetic"),
-        ("sqlite_point_arithmetic", "SqlitePointArithmetic"),
+        ("duckdb_point_arithmetic", "DuckdbPointArithmetic", "DuckDBFramework"),
+        ("pandas_point_arithmetic", "PandasPointArithmetic", "PandasDataFrame"),
+        ("polars_lazy_point_arithmetic", "PolarsLazyPointArithmetic", "PolarsLazyDataFrame"),
+        ("pyarrow_point_arithmetic", "PyArrowPointArithmetic", "PyArrowTable"),
+        ("python_dict_point_arithmetic", "PythonDictPointArithmetic", "PythonDictFramework"),
+        ("sqlite_point_arithmetic", "SqlitePointArithmetic", "SqliteFramework"),
     ],
 )
@@ -5,6 +5,7 @@ from __future__ import annotations
 import pandas as pd
 
 from mloda.community.feature_groups.data_operations.errors import unsupported_op_error
+from mloda.community.feature_groups.data_operations.pandas_helpers import with_columns
 from mloda.community.feature_groups.data_operations.row_preserving.arithmetic.pandas_mixin import PandasArithmeticMixin
 from mloda.community.feature_groups.data_operations.row_preserving.point_arithmetic.base import (
     ARITHMETIC_OPERATIONS,
@@ -22,17 +23,15 @@ class PandasPointArithmetic(PandasArithmeticMixin, PointArithmeticFeatureGroup):
         col_b: str,
         op: str,
     ) -> pd.DataFrame:
-        data = data.copy()
-
         if op == "add":
-            data[feature_name] = data[col_a] + data[col_b]
+            result = data[col_a] + data[col_b]
         elif op == "subtract":
-            data[feature_name] = data[col_a] - data[col_b]
+            result = data[col_a] - data[col_b]
         elif op == "multiply":
-            data[feature_name] = data[col_a] * data[col_b]
+            result = data[col_a] * data[col_b]
         elif op == "divide":
-            data[feature_name] = data[col_a] / data[col_b]
+            result = data[col_a] / data[col_b]
         else:
             raise unsupported_op_error(op, ARITHMETIC_OPERATIONS, framework="Pandas")
 
-        return data
+        return with_columns(data, {feature_name: result})
@@ -6,6 +6,11 @@ from mloda_plugins.compute_framework.base_implementations.sql.sql_utils import q
 from mloda_plugins.compute_framework.base_implementations.sqlite.sqlite_relation import SqliteRelation
 
 from mloda.community.feature_groups.data_operations.errors import unsupported_op_error
+from mloda.community.feature_groups.data_operations.sqlite_helpers import (
+    append_sql_column,
+    arithmetic_result_type,
+    column_type,
+)
 from mloda.community.feature_groups.data_operations.row_preserving.point_arithmetic.base import (
     PointArithmeticFeatureGroup,
 )
@@ -31,7 +36,6 @@ class SqlitePointArithmetic(SqliteArithmeticMixin, PointArithmeticFeatureGroup):
 
         quoted_a = quote_ident(col_a)
         quoted_b = quote_ident(col_b)
-        quoted_feature = quote_ident(feature_name)
 
         # Cast both operands for divide to guarantee float division;
         # native SQL int/int would truncate. SQLite returns NULL on
@@ -44,21 +48,8 @@ class SqlitePointArithmetic(SqliteArithmeticMixin, PointArithmeticFeatureGroup):
             left = quoted_a
             right = quoted_b
 
-        # Row-preserving contract: append_column below aligns result_values to
-        # the existing rows by position, so this bare SELECT must return rows in
-        # the relation's stored order. Keep it free of ORDER BY / JOIN / GROUP BY
-        # / DISTINCT, any of which could reorder rows and silently misalign the
-        # appended column. See docs/guides/data-operation-patterns/02-row-preserving-contract.md.
-        sql = " ".join(
-            [
-                "SELECT",
-                f"({left} {sql_op} {right}) AS {quoted_feature}",
-                "FROM",
-                f"{quote_ident(data.table_name)}",
-            ]
-        )
-        cursor = data.connection.execute(sql)
-        rows = cursor.fetchall()
-
-        result_values = [row[0] for row in rows]
-        return data.append_column(feature_name, result_values)
+        # Row-preserving contract: the column is projected as ``*, expr`` over the
+        # relation, which keeps its stored row order. See
+        # docs/guides/data-operation-patterns/02-row-preserving-contract.md.
+        arrow_type = arithmetic_result_type(op, column_type(data, col_a), column_type(data, col_b))
+        return append_sql_column(data, feature_name, f"({left} {sql_op} {right})", arrow_type)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import partial
 from typing import Any
 
 from mloda.core.abstract_plugins.components.data_types import DataType
@@ -19,9 +20,18 @@ from mloda.community.feature_groups.data_operations.base import (
     is_in_features_value,
     is_op_token,
     is_parametric_suffix,
+    is_positive_int,
     op_token_value,
     option_value,
+    positive_int_value,
 )
+from mloda.community.feature_groups.data_operations.sharded_execution import (
+    SHARDS,
+    ShardFrameOps,
+    run_sharded,
+    shards_supported,
+)
+from mloda.community.feature_groups.data_operations.sort_cache import sort_permutation_scope
 
 
 _RANK_TYPES = {
@@ -124,6 +134,8 @@ class RankFeatureGroup(SubtypeCapabilityHook, RejectionReasonMixin, FeatureGroup
     - ``in_features``: The source feature (used for ordering)
     - ``partition_by``: List of columns to partition by
     - ``order_by``: Column to order by within each partition
+    - ``shards``: Optional number of hash shards computed in parallel processes
+      (see ``sharded_execution``); backends without ``SHARD_FRAME_OPS`` reject it
     """
 
     MIN_IN_FEATURES = 1
@@ -132,6 +144,10 @@ class RankFeatureGroup(SubtypeCapabilityHook, RejectionReasonMixin, FeatureGroup
     RANK_TYPE = "rank_type"
     PARTITION_BY = "partition_by"
     ORDER_BY = "order_by"
+    SHARDS = SHARDS
+
+    # Backends that can split the partitions across processes set this; see sharded_execution.
+    SHARD_FRAME_OPS: type[ShardFrameOps] | None = None
 
     # Named after RANK_TYPE so bind_name_captures binds it, including the parametric families
     # (ntile_N / top_N / bottom_N) the old allowed_values-based fallback missed.
@@ -165,6 +181,12 @@ class RankFeatureGroup(SubtypeCapabilityHook, RejectionReasonMixin, FeatureGroup
             strict=False,
             match_guard=is_column_ref,
         ),
+        SHARDS: property_spec(
+            "Number of hash shards of the partitions to compute in parallel processes (opt-in)",
+            strict=False,
+            default=None,
+            match_guard=is_positive_int,
+        ),
     }
 
     @classmethod
@@ -208,7 +230,7 @@ class RankFeatureGroup(SubtypeCapabilityHook, RejectionReasonMixin, FeatureGroup
             if len(in_features) > cls.MAX_IN_FEATURES:
                 return False
 
-        return True
+        return shards_supported(cls, options)
 
     @classmethod
     def get_rank_type(cls, feature_name: str) -> str:
@@ -280,23 +302,40 @@ class RankFeatureGroup(SubtypeCapabilityHook, RejectionReasonMixin, FeatureGroup
         """
         table = data
 
-        for feature in features.features:
-            feature_name = feature.name
-
-            rank_type = cls._extract_rank_type(feature)
-            partition_by = feature.options.get(cls.PARTITION_BY)
-            if not isinstance(partition_by, (list, tuple)) or not partition_by:
-                raise ValueError(
-                    f"rank requires a non-empty partition_by, got {partition_by!r} for feature {feature_name!r}."
-                )
-            partition_by = list(partition_by)
-            # Any: matching requires order_by, but a direct call still passes an absent one through.
-            order_by: Any = option_value(feature.options, cls.ORDER_BY, column_ref_value)
-
-            table = cls._compute_rank(table, feature_name, partition_by, order_by, rank_type)
+        with sort_permutation_scope():
+            for feature in features.features:
+                feature_name = feature.name
+
+                rank_type = cls._extract_rank_type(feature)
+                partition_by = feature.options.get(cls.PARTITION_BY)
+                if not isinstance(partition_by, (list, tuple)) or not partition_by:
+                    raise ValueError(
+                        f"rank requires a non-empty partition_by, got {partition_by!r} for feature {feature_name!r}."
+                    )
+                partition_by = list(partition_by)
+                # Any: matching requires order_by, but a direct call still passes an absent one through.
+                order_by: Any = option_value(feature.options, cls.ORDER_BY, column_ref_value)
+
+                shards = cls._extract_shards(feature)
+                if shards is not None and shards > 1:
+                    compute = partial(
+                        cls._compute_rank,
+                        feature_name=feature_name,
+                        partition_by=partition_by,
+                        order_by=order_by,
+                        rank_type=rank_type,
+                    )
+                    table = run_sharded(cls.SHARD_FRAME_OPS, table, partition_by, shards, compute, reduces_rows=False)
+                else:
+                    table = cls._compute_rank(table, feature_name, partition_by, order_by, rank_type)
 
         return table
 
+    @classmethod
+    def _extract_shards(cls, feature: Feature) -> int | None:
+        """Return the ``shards`` count, or None when the feature runs in-process."""
+        return option_value(feature.options, cls.SHARDS, positive_int_value)
+
     @classmethod
     def _compute_rank(
         cls,
@@ -1,23 +1,23 @@
 """Entry-point manifest for mloda-community-rank.
 
-Lists the concrete FeatureGroup classes that mloda discovers via the
-``mloda.feature_groups`` entry point. Backends whose optional framework is not
-installed are skipped so the rest still register. See issue #271.
+Declares the concrete FeatureGroup classes that mloda discovers via the
+``mloda.feature_groups`` entry point as (module, class, framework) triples;
+importing this module imports no backend. Backends whose optional framework is
+not installed are skipped so the rest still register. See issue #271.
 """
 
 from __future__ import annotations
 
-from mloda.provider import FeatureGroup
+from mloda.community.feature_groups.data_operations.manifest_utils import LazyPluginManifest
 
-from mloda.community.feature_groups.data_operations.manifest_utils import load_plugin_classes
-
-FEATURE_GROUPS: list[type[FeatureGroup]] = load_plugin_classes(
+FEATURE_GROUPS = LazyPluginManifest(
     __package__ or __name__.rpartition(".")[0],
     [
-        ("duckdb_rank", "DuckdbRank"),
-        ("pandas_rank", "PandasRank"),
-        ("polars_lazy_rank", "PolarsLazyRank"),
-        ("python_dict_rank", "PythonDictRank"),
-        ("sqlite_rank", "SqliteRank"),
+        ("duckdb_rank", "DuckdbRank", "DuckDBFramework"),
+        ("pandas_rank", "PandasRank", "PandasDataFrame"),
+        ("polars_lazy_rank", "PolarsLazyRank", "PolarsLazyDataFrame"),
+        ("pyarrow_rank", "PyArrowRank", "PyArrowTable"),
+        ("python_dict_rank", "PythonDictRank", "PythonDictFramework"),
+        ("sqlite_rank", "SqliteRank", "SqliteFramework"),
     ],
 )
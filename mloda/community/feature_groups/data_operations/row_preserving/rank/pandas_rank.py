@@ -10,7 +10,11 @@ from mloda_plugins.compute_framework.base_implementations.pandas.dataframe impor
 from mloda.community.feature_groups.data_operations.row_preserving.rank.base import (
     RankFeatureGroup,
 )
-from mloda.community.feature_groups.data_operations.pandas_helpers import null_safe_groupby
+from mloda.community.feature_groups.data_operations.pandas_helpers import (
+    PandasShardFrame,
+    partition_grouping,
+    with_columns,
+)
 
 _PANDAS_RANK_METHODS: dict[str, str] = {
     "row_number": "first",
@@ -20,6 +24,8 @@ _PANDAS_RANK_METHODS: dict[str, str] = {
 
 
 class PandasRank(RankFeatureGroup):
+    SHARD_FRAME_OPS = PandasShardFrame
+
     @classmethod
     def compute_framework_rule(cls) -> set[type[ComputeFramework]] | None:
         return {PandasDataFrame}
@@ -33,42 +39,32 @@ class PandasRank(RankFeatureGroup):
         order_by: str,
         rank_type: str,
     ) -> pd.DataFrame:
-        data = data.copy()
-
+        # One factorization of the partition keys per FeatureSet (see partition_grouping);
+        # every rank type groups the order column by its codes and reads sizes from it.
+        grouping = partition_grouping(data, partition_by)
+        grouped = data[order_by].groupby(grouping.codes)
         if rank_type in _PANDAS_RANK_METHODS:
             method = _PANDAS_RANK_METHODS[rank_type]
-            data[feature_name] = (
-                null_safe_groupby(data, partition_by, order_by)
-                .rank(method=method, ascending=True, na_option="bottom")
-                .astype("int64")
-            )
+            result = grouped.rank(method=method, ascending=True, na_option="bottom").astype("int64")
         elif rank_type == "percent_rank":
             # percent_rank = (rank - 1) / (count - 1)
-            rank_col = null_safe_groupby(data, partition_by, order_by).rank(
-                method="min", ascending=True, na_option="bottom"
-            )
-            group_size = null_safe_groupby(data, partition_by, order_by).transform("size")
-            data[feature_name] = ((rank_col - 1) / (group_size - 1)).fillna(0.0)
+            rank_col = grouped.rank(method="min", ascending=True, na_option="bottom")
+            group_size = grouping.sizes[grouping.codes]
+            result = ((rank_col - 1) / (group_size - 1)).fillna(0.0)
         elif rank_type.startswith("ntile_"):
             ntile_n = int(rank_type[len("ntile_") :])
-            rank_col = null_safe_groupby(data, partition_by, order_by).rank(
-                method="first", ascending=True, na_option="bottom"
-            )
-            group_size = null_safe_groupby(data, partition_by, order_by).transform("size")
-            data[feature_name] = (((rank_col - 1) * ntile_n) // group_size + 1).astype("int64")
+            rank_col = grouped.rank(method="first", ascending=True, na_option="bottom")
+            group_size = grouping.sizes[grouping.codes]
+            result = (((rank_col - 1) * ntile_n) // group_size + 1).astype("int64")
         elif rank_type.startswith("top_"):
             top_n = int(rank_type[len("top_") :])
-            row_num = null_safe_groupby(data, partition_by, order_by).rank(
-                method="first", ascending=False, na_option="bottom"
-            )
-            data[feature_name] = row_num <= top_n
+            row_num = grouped.rank(method="first", ascending=False, na_option="bottom")
+            result = row_num <= top_n
         elif rank_type.startswith("bottom_"):
             bottom_n = int(rank_type[len("bottom_") :])
-            row_num = null_safe_groupby(data, partition_by, order_by).rank(
-                method="first", ascending=True, na_option="bottom"
-            )
-            data[feature_name] = row_num <= bottom_n
+            row_num = grouped.rank(method="first", ascending=True, na_option="bottom")
+            result = row_num <= bottom_n
         else:
             raise ValueError(f"Unsupported rank type: {rank_type}")
 
-        return data
+        return with_columns(data, {feature_name: result})
@@ -0,0 +1,133 @@
+"""PyArrow implementation for rank feature groups.
+
+One stable sort by ``[*partition_by, order_by]`` ascending, nulls last
+(``sort_permutation``), turns every partition into a contiguous segment of
+sorted rows. Each rank type is then a handful of whole-column kernels over
+that order, with no per-partition or per-row Python:
+
+- ``row_number`` is the position within the segment, ``ntile_N``,
+  ``top_N`` and ``bottom_N`` are arithmetic on that position and the
+  segment's size (and, for ``top_N``, its non-null count).
+- ``rank`` is the start of the row's run of equal ``order_by`` values,
+  a running maximum over the run starts; ``dense_rank`` is a running count
+  of them; ``percent_rank`` derives from ``rank`` and the segment size.
+
+As in the other backends, null and NaN ``order_by`` values form one tied
+tier that ranks last. Results are scattered back to the input row order.
+"""
+
+from __future__ import annotations
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from mloda.provider import ComputeFramework
+from mloda_plugins.compute_framework.base_implementations.pyarrow.table import PyArrowTable
+
+from mloda.community.feature_groups.data_operations.pyarrow_helpers import (
+    nan_as_null,
+    row_positions,
+    scatter_to_rows,
+    segment_size_per_row,
+    segment_start_per_row,
+    segment_sum_per_row,
+    sort_permutation,
+)
+from mloda.community.feature_groups.data_operations.row_preserving.rank.base import (
+    RankFeatureGroup,
+)
+
+
+def _int64(value: int) -> pa.Scalar:
+    return pa.scalar(value, type=pa.int64())
+
+
+class PyArrowRank(RankFeatureGroup):
+    @classmethod
+    def compute_framework_rule(cls) -> set[type[ComputeFramework]] | None:
+        return {PyArrowTable}
+
+    @classmethod
+    def _compute_rank(
+        cls,
+        data: pa.Table,
+        feature_name: str,
+        partition_by: list[str],
+        order_by: str,
+        rank_type: str,
+    ) -> pa.Table:
+        num_rows = data.num_rows
+        # NaN ties with null: sort_permutation orders them as one tier, and the peer runs
+        # below compare the same NaN -> null values.
+        order_col = nan_as_null(data.column(order_by))
+        perm = sort_permutation(data, partition_by, order_by)
+        positions = row_positions(num_rows)
+        segment_start = segment_start_per_row(perm.boundaries, num_rows)
+        pos_in_segment = pc.subtract(positions, segment_start)
+
+        if rank_type == "row_number":
+            result = pc.add(pos_in_segment, _int64(1))
+        elif rank_type in ("rank", "dense_rank", "percent_rank"):
+            result = cls._tie_rank(pc.take(order_col, perm.forward), positions, segment_start, rank_type, num_rows)
+            if rank_type == "percent_rank":
+                # (rank - 1) / (n - 1), or 0.0 for a single-row partition.
+                denominator = pc.subtract(segment_size_per_row(perm.boundaries, num_rows), _int64(1))
+                result = pc.if_else(
+                    pc.equal(denominator, _int64(0)),
+                    0.0,
+                    pc.divide(
+                        pc.cast(pc.subtract(result, _int64(1)), pa.float64()), pc.cast(denominator, pa.float64())
+                    ),
+                )
+        elif rank_type.startswith("ntile_"):
+            ntile_n = int(rank_type[len("ntile_") :])
+            # SQL-standard NTILE: (pos * N) // n + 1 puts the larger tiles first.
+            sizes = segment_size_per_row(perm.boundaries, num_rows)
+            result = pc.add(pc.divide(pc.multiply(pos_in_segment, _int64(ntile_n)), sizes), _int64(1))
+        elif rank_type.startswith("top_"):
+            top_n = int(rank_type[len("top_") :])
+            # Descending order reverses the non-null rows and keeps the nulls last, so a
+            # non-null row's 0-based descending position is (non-null count - 1 - pos).
+            valid = pc.cast(pc.is_valid(pc.take(order_col, perm.forward)), pa.int64())
+            non_null = segment_sum_per_row(valid, perm.boundaries)
+            desc_position = pc.if_else(
+                pc.equal(valid, _int64(1)),
+                pc.subtract(pc.subtract(non_null, _int64(1)), pos_in_segment),
+                pos_in_segment,
+            )
+            result = pc.less(desc_position, _int64(top_n))
+        elif rank_type.startswith("bottom_"):
+            bottom_n = int(rank_type[len("bottom_") :])
+            result = pc.less(pos_in_segment, _int64(bottom_n))
+        else:
+            raise ValueError(f"Unsupported rank type: {rank_type}")
+
+        return data.append_column(feature_name, scatter_to_rows(result, perm.forward))
+
+    @classmethod
+    def _tie_rank(
+        cls,
+        sorted_order: pa.Array | pa.ChunkedArray,
+        positions: pa.Array,
+        segment_start: pa.Array,
+        rank_type: str,
+        num_rows: int,
+    ) -> pa.Array:
+        """``rank`` (``percent_rank`` before scaling) or ``dense_rank`` over the sorted rows.
+
+        A run of peers starts at every segment start and wherever ``order_by`` differs
+        from the previous sorted row; two nulls are peers.
+        """
+        if isinstance(sorted_order, pa.ChunkedArray):
+            sorted_order = sorted_order.combine_chunks()
+        if num_rows == 0:
+            return pa.array([], type=pa.int64())
+        prev = sorted_order.slice(0, num_rows - 1)
+        curr = sorted_order.slice(1, num_rows - 1)
+        differs = pc.coalesce(pc.not_equal(curr, prev), pc.xor(pc.is_null(curr), pc.is_null(prev)))
+        run_start = pc.or_(pc.equal(positions, segment_start), pa.concat_arrays([pa.array([True]), differs]))
+        if rank_type == "dense_rank":
+            runs = pc.cumulative_sum(pc.cast(run_start, pa.int64()))
+            return pc.add(pc.subtract(runs, pc.take(runs, segment_start)), _int64(1))
+        run_position = pc.cumulative_max(pc.if_else(run_start, positions, _int64(0)))
+        return pc.add(pc.subtract(run_position, segment_start), _int64(1))
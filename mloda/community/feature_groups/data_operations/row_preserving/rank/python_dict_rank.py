@@ -26,9 +26,12 @@ from mloda.community.feature_groups.data_operations.python_dict_helpers import (
 from mloda.community.feature_groups.data_operations.row_preserving.rank.base import (
     RankFeatureGroup,
 )
+from mloda.community.feature_groups.data_operations.sharded_execution import PythonDictShardFrame
 
 
 class PythonDictRank(RankFeatureGroup):
+    SHARD_FRAME_OPS = PythonDictShardFrame
+
     @classmethod
     def compute_framework_rule(cls) -> set[type[ComputeFramework]] | None:
         return {PythonDictFramework}
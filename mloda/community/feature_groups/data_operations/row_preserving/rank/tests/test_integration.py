@@ -1,7 +1,7 @@
 """Integration tests for rank through mloda's full pipeline.
 
 Uses the ReferenceRank implementation (a test utility that accepts PyArrow
-tables and computes in Python) because PyArrow lacks native ranking functions.
+tables and computes in Python) as the per-row oracle for the native backends.
 The tests verify that rank operations work end-to-end through mloda's
 runtime, including plugin discovery, feature resolution, and PluginCollector.
 """
@@ -0,0 +1,85 @@
+"""Tests for PyArrowRank compute implementation."""
+
+from __future__ import annotations
+
+import random
+from typing import Any
+
+import pyarrow as pa
+import pytest
+
+from mloda.core.abstract_plugins.components.options import Options
+from mloda.community.feature_groups.data_operations.row_preserving.rank.pyarrow_rank import (
+    PyArrowRank,
+)
+from mloda.testing.feature_groups.data_operations.mixins.capability import CapabilityHookTestMixin
+from mloda.testing.feature_groups.data_operations.mixins.pyarrow import PyArrowTestMixin
+from mloda.testing.feature_groups.data_operations.mixins.reserved_columns import ReservedColumnsTestMixin
+from mloda.testing.feature_groups.data_operations.row_preserving.rank.rank import (
+    RankTestBase,
+)
+from mloda.testing.feature_groups.data_operations.row_preserving.rank.reference import ReferenceRank
+
+
+class TestPyArrowRank(CapabilityHookTestMixin, ReservedColumnsTestMixin, PyArrowTestMixin, RankTestBase):
+    """All tests inherited from the base class."""
+
+    @classmethod
+    def implementation_class(cls) -> Any:
+        return PyArrowRank
+
+    @classmethod
+    def capability_supported(cls) -> tuple[tuple[str, Options], ...]:
+        return (
+            ("value__percent_rank_ranked", Options()),
+            ("value__dense_rank_ranked", Options()),
+        )
+
+    @classmethod
+    def reserved_columns_feature_name(cls) -> str:
+        return "value_int__row_number_ranked"
+
+    @classmethod
+    def reserved_columns_order_by(cls) -> str | None:
+        return "value_int"
+
+
+class TestPyArrowRankMatchesReference:
+    """The segmented kernels must reproduce the per-partition Python ranking.
+
+    Few distinct order values per partition, so ties, runs that straddle partition
+    boundaries and null ``order_by`` rows all occur; null partition keys form a group.
+    """
+
+    @pytest.mark.parametrize(
+        "rank_type",
+        ["row_number", "rank", "dense_rank", "percent_rank", "ntile_3", "ntile_7", "top_2", "bottom_4", "top_50"],
+    )
+    def test_matches_reference(self, rank_type: str) -> None:
+        rng = random.Random(5)
+        num_rows = 600
+        table = pa.table(
+            {
+                "grp": pa.array([rng.choice(["a", "b", "c", None]) for _ in range(num_rows)]),
+                "sub": pa.array([rng.randint(0, 9) for _ in range(num_rows)], type=pa.int64()),
+                "val": pa.array([None if rng.random() < 0.15 else rng.randint(0, 5) for _ in range(num_rows)]),
+            }
+        )
+        result = PyArrowRank._compute_rank(table, "r", ["grp", "sub"], "val", rank_type)
+        expected = ReferenceRank._compute_rank(table, "r", ["grp", "sub"], "val", rank_type)
+        assert result.column("r").to_pylist() == expected.column("r").to_pylist()
+
+    def test_nan_ties_with_null_and_ranks_last(self) -> None:
+        table = pa.table({"grp": [1, 1, 1, 1], "val": [float("nan"), 2.0, None, 1.0]})
+        assert PyArrowRank._compute_rank(table, "r", ["grp"], "val", "rank").column("r").to_pylist() == [3, 2, 3, 1]
+        assert PyArrowRank._compute_rank(table, "r", ["grp"], "val", "row_number").column("r").to_pylist() == [
+            3,
+            2,
+            4,
+            1,
+        ]
+
+    def test_empty_table(self) -> None:
+        table = pa.table({"grp": pa.array([], type=pa.int64()), "val": pa.array([], type=pa.float64())})
+        for rank_type in ("row_number", "dense_rank", "percent_rank", "ntile_2", "top_1"):
+            assert PyArrowRank._compute_rank(table, "r", ["grp"], "val", rank_type).num_rows == 0
@@ -8,6 +8,10 @@ Pattern: ``{col}__{agg}_scalar``
 
 Example: ``value_int__sum_scalar`` computes the sum of the ``value_int``
 column and fills every row with that scalar result.
+
+The opt-in ``approximate`` flag lets ``median`` use the backend's approximate
+kernel where it has one (see ``approximate``). The opt-in ``statistics_version``
+label serves the value fitted by a training run instead (see ``fitted_statistics``).
 """
 
 from __future__ import annotations
@@ -19,11 +23,20 @@ from mloda.core.abstract_plugins.components.feature_chainer.feature_chain_parser
 from mloda.core.abstract_plugins.components.feature_name import FeatureName
 from mloda.core.abstract_plugins.components.feature_set import FeatureSet
 from mloda.core.abstract_plugins.components.options import Options
-from mloda.provider import DefaultOptionKeys, property_spec
+from mloda.provider import BaseArtifact, DefaultOptionKeys, property_spec
 
 from mloda.community.feature_groups.data_operations.aggregation_base import AggregationFeatureGroupBase
+from mloda.community.feature_groups.data_operations.approximate import APPROXIMATE, approximate_requested
+from mloda.community.feature_groups.data_operations.base import is_flag, is_op_token
+from mloda.community.feature_groups.data_operations.fitted_statistics import (
+    STATISTICS_VERSION,
+    FittedStatisticsOps,
+    StatisticsArtifact,
+    compute_with_fitted_statistics,
+    fitted_statistics_supported,
+)
+from mloda.community.feature_groups.data_operations.json_artifact import load_json_artifact, save_json_artifact
 from mloda.community.feature_groups.data_operations.mask_utils import MASK_KEY, parse_mask_spec
-from mloda.community.feature_groups.data_operations.base import is_op_token
 
 AGGREGATION_TYPES = {
     "sum": "Sum of values",
@@ -55,6 +68,15 @@ class ScalarAggregateFeatureGroup(AggregationFeatureGroupBase):
 
     _SUPPORTED_AGG_TYPES: ClassVar[frozenset[str]] = frozenset(AGGREGATION_TYPES)
 
+    APPROXIMATE = APPROXIMATE
+    STATISTICS_VERSION = STATISTICS_VERSION
+
+    # Aggregation types the backend computes approximately when ``approximate`` is set.
+    APPROXIMATE_KERNELS: ClassVar[frozenset[str]] = frozenset()
+
+    # Backends that can serve fitted statistics set this; see fitted_statistics.
+    FITTED_STATISTICS_OPS: ClassVar[type[FittedStatisticsOps] | None] = None
+
     PROPERTY_MAPPING = {
         AggregationFeatureGroupBase.AGGREGATION_TYPE: property_spec(
             "Aggregation applied over the whole column",
@@ -69,8 +91,35 @@ class ScalarAggregateFeatureGroup(AggregationFeatureGroupBase):
             "Conditional mask: (column, operator, value) tuple or list of tuples",
             default=None,
         ),
+        APPROXIMATE: property_spec(
+            "Allow median to use an approximate kernel (opt-in)",
+            default=None,
+            match_guard=is_flag,
+        ),
+        STATISTICS_VERSION: property_spec(
+            "Label of the fitted value to save and serve across runs (opt-in)",
+            default=None,
+            match_guard=is_op_token,
+        ),
     }
 
+    @classmethod
+    def match_feature_group_criteria(
+        cls,
+        feature_name: Any,
+        options: Any,
+        _data_access_collection: Any = None,
+    ) -> bool:
+        """Extend mixin matching: ``statistics_version`` needs a backend that serves fitted statistics."""
+        if not super().match_feature_group_criteria(feature_name, options, _data_access_collection):
+            return False
+        return fitted_statistics_supported(cls, options)
+
+    @staticmethod
+    def artifact() -> type[BaseArtifact] | None:
+        """Values fitted for features with ``statistics_version``; see ``fitted_statistics``."""
+        return StatisticsArtifact
+
     def input_features(self, options: Options, feature_name: FeatureName) -> set[Feature] | None:
         _feature_name = str(feature_name)
 
@@ -120,6 +169,8 @@ class ScalarAggregateFeatureGroup(AggregationFeatureGroupBase):
         column per feature is supported (enforced by MAX_IN_FEATURES = 1).
         """
         table = data
+        fitted = load_json_artifact(features)
+        saved: dict[str, Any] | None = {} if features.artifact_to_save is not None else None
 
         for feature in features.features:
             feature_name = feature.name
@@ -129,8 +180,23 @@ class ScalarAggregateFeatureGroup(AggregationFeatureGroupBase):
             agg_type = cls._extract_aggregation_type(feature)
             mask_spec = parse_mask_spec(feature.options.get(MASK_KEY))
 
-            table = cls._compute_aggregation(table, feature_name, source_col, agg_type, mask_spec)
+            if approximate_requested(cls, feature, agg_type):
+                compute = cls._compute_approximate_aggregation
+            else:
+                compute = cls._compute_aggregation
+            table = compute_with_fitted_statistics(
+                cls.FITTED_STATISTICS_OPS,
+                fitted,
+                saved,
+                table,
+                feature,
+                source_col,
+                agg_type,
+                [],
+                lambda data: compute(data, feature_name, source_col, agg_type, mask_spec),
+            )
 
+        save_json_artifact(features, saved)
         return table
 
     @classmethod
@@ -143,3 +209,15 @@ class ScalarAggregateFeatureGroup(AggregationFeatureGroupBase):
         mask_spec: list[tuple[str, str, Any]] | None = None,
     ) -> Any:
         raise NotImplementedError
+
+    @classmethod
+    def _compute_approximate_aggregation(
+        cls,
+        data: Any,
+        feature_name: str,
+        source_col: str,
+        agg_type: str,
+        mask_spec: list[tuple[str, str, Any]] | None = None,
+    ) -> Any:
+        """Backends listing ``agg_type`` in ``APPROXIMATE_KERNELS`` implement its approximate kernel."""
+        raise NotImplementedError
@@ -9,6 +9,7 @@ from mloda_plugins.compute_framework.base_implementations.duckdb.duckdb_framewor
 from mloda_plugins.compute_framework.base_implementations.duckdb.duckdb_relation import DuckdbRelation
 from mloda_plugins.compute_framework.base_implementations.sql.sql_utils import quote_ident
 
+from mloda.community.feature_groups.data_operations.duckdb_helpers import DuckdbFittedStatistics
 from mloda.community.feature_groups.data_operations.errors import unsupported_agg_type_error
 from mloda.community.feature_groups.data_operations.mask_utils import build_sql_case_when
 from mloda.community.feature_groups.data_operations.row_preserving.scalar_aggregate.base import (
@@ -33,6 +34,9 @@ _DUCKDB_AGG_FUNCS: dict[str, str] = {
 
 
 class DuckdbScalarAggregate(ScalarAggregateFeatureGroup):
+    APPROXIMATE_KERNELS = frozenset({"median"})
+    FITTED_STATISTICS_OPS = DuckdbFittedStatistics
+
     @classmethod
     def compute_framework_rule(cls) -> set[type[ComputeFramework]] | None:
         return {DuckDBFramework}
@@ -50,11 +54,28 @@ class DuckdbScalarAggregate(ScalarAggregateFeatureGroup):
         if agg_func is None:
             raise unsupported_agg_type_error(agg_type, _DUCKDB_AGG_FUNCS.keys(), framework="DuckDB")
 
-        quoted_source = quote_ident(source_col)
-
-        source_sql = quoted_source
-        if mask_spec is not None:
-            source_sql = build_sql_case_when(mask_spec, quoted_source)
+        result: DuckdbRelation = data.window(f"{agg_func}({cls._source_sql(source_col, mask_spec)})", feature_name)
+        return result
 
-        result: DuckdbRelation = data.window(f"{agg_func}({source_sql})", feature_name)
+    @classmethod
+    def _compute_approximate_aggregation(
+        cls,
+        data: Any,
+        feature_name: str,
+        source_col: str,
+        agg_type: str,
+        mask_spec: list[tuple[str, str, Any]] | None = None,
+    ) -> DuckdbRelation:
+        """Median through DuckDB's t-digest ``APPROX_QUANTILE``."""
+        result: DuckdbRelation = data.window(
+            f"APPROX_QUANTILE({cls._source_sql(source_col, mask_spec)}, 0.5)", feature_name
+        )
         return result
+
+    @staticmethod
+    def _source_sql(source_col: str, mask_spec: list[tuple[str, str, Any]] | None) -> str:
+        """The quoted source column, wrapped in the mask's CASE WHEN when there is one."""
+        quoted_source = quote_ident(source_col)
+        if mask_spec is not None:
+            return build_sql_case_when(mask_spec, quoted_source)
+        return quoted_source
@@ -1,24 +1,23 @@
 """Entry-point manifest for mloda-community-scalar-aggregate.
 
-Lists the concrete FeatureGroup classes that mloda discovers via the
-``mloda.feature_groups`` entry point. Backends whose optional framework is not
-installed are skipped so the rest still register. See issue #271.
+Declares the concrete FeatureGroup classes that mloda discovers via the
+``mloda.feature_groups`` entry point as (module, class, framework) triples;
+importing this module imports no backend. Backends whose optional framework is
+not installed are skipped so the rest still register. See issue #271.
 """
 
 from __future__ import annotations
 
-from mloda.provider import FeatureGroup
+from mloda.community.feature_groups.data_operations.manifest_utils import LazyPluginManifest
 
-from mloda.community.feature_groups.data_operations.manifest_utils import load_plugin_classes
-
-FEATURE_GROUPS: list[type[FeatureGroup]] = load_plugin_classes(
+FEATURE_GROUPS = LazyPluginManifest(
     __package__ or __name__.rpartition(".")[0],
     [
-        ("duckdb_scalar_aggregate", "DuckdbScalarAggregate"),
-        ("pandas_scalar_aggregate", "PandasScalarAggregate"),
-        ("polars_lazy_scalar_aggregate", "PolarsLazyScalarAggregate"),
-        ("pyarrow_scalar_aggregate", "PyArrowScalarAggregate"),
-        ("python_dict_scalar_aggregate", "PythonDictScalarAggregate"),
-        ("sqlite_scalar_aggregate", "SqliteScalarAggregate"),
+        ("duckdb_scalar_aggregate", "DuckdbScalarAggregate", "DuckDBFramework"),
+        ("pandas_scalar_aggregate", "PandasScalarAggregate", "PandasDataFrame"),
+        ("polars_lazy_scalar_aggregate", "PolarsLazyScalarAggregate", "PolarsLazyDataFrame"),
+        ("pyarrow_scalar_aggregate", "PyArrowScalarAggregate", "PyArrowTable"),
+        ("python_dict_scalar_aggregate", "PythonDictScalarAggregate", "PythonDictFramework"),
+        ("sqlite_scalar_aggregate", "SqliteScalarAggregate", "SqliteFramework"),
     ],
 )
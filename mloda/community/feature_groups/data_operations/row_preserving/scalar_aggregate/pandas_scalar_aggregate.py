@@ -11,6 +11,7 @@ from mloda_plugins.compute_framework.base_implementations.pandas.dataframe impor
 
 from mloda.community.feature_groups.data_operations.errors import unsupported_agg_type_error
 from mloda.community.feature_groups.data_operations.mask_utils import build_mask_from_spec
+from mloda.community.feature_groups.data_operations.pandas_helpers import PandasFittedStatistics, with_columns
 from mloda.community.feature_groups.data_operations.row_preserving.scalar_aggregate.base import (
     ScalarAggregateFeatureGroup,
 )
@@ -20,6 +21,8 @@ from mloda_plugins.compute_framework.base_implementations.pandas.pandas_mask_eng
 
 
 class PandasScalarAggregate(ScalarAggregateFeatureGroup):
+    FITTED_STATISTICS_OPS = PandasFittedStatistics
+
     @classmethod
     def compute_framework_rule(cls) -> set[type[ComputeFramework]] | None:
         return {PandasDataFrame}
@@ -33,13 +36,9 @@ class PandasScalarAggregate(ScalarAggregateFeatureGroup):
         agg_type: str,
         mask_spec: list[tuple[str, str, Any]] | None = None,
     ) -> pd.DataFrame:
-        if mask_spec is not None:
-            mask = build_mask_from_spec(PandasMaskEngine, data, mask_spec)
-            data = data.copy()
-            data[source_col] = data[source_col].where(mask)
-        else:
-            data = data.copy()
         col = data[source_col]
+        if mask_spec is not None:
+            col = col.where(build_mask_from_spec(PandasMaskEngine, data, mask_spec))
 
         if agg_type == "sum":
             result = col.sum(min_count=1)
@@ -67,5 +66,4 @@ class PandasScalarAggregate(ScalarAggregateFeatureGroup):
         else:
             raise unsupported_agg_type_error(agg_type, cls._SUPPORTED_AGG_TYPES, framework="Pandas")
 
-        data[feature_name] = result
-        return data
+        return with_columns(data, {feature_name: result})
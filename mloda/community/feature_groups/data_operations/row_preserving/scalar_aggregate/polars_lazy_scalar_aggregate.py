@@ -11,12 +11,15 @@ from mloda_plugins.compute_framework.base_implementations.polars.lazy_dataframe
 
 from mloda.community.feature_groups.data_operations.errors import unsupported_agg_type_error
 from mloda.community.feature_groups.data_operations.mask_utils import _POLARS_MASK_TMP, apply_polars_mask
+from mloda.community.feature_groups.data_operations.polars_helpers import PolarsLazyFittedStatistics
 from mloda.community.feature_groups.data_operations.row_preserving.scalar_aggregate.base import (
     ScalarAggregateFeatureGroup,
 )
 
 
 class PolarsLazyScalarAggregate(ScalarAggregateFeatureGroup):
+    FITTED_STATISTICS_OPS = PolarsLazyFittedStatistics
+
     @classmethod
     def compute_framework_rule(cls) -> set[type[ComputeFramework]] | None:
         return {PolarsLazyDataFrame}
@@ -12,12 +12,16 @@ from mloda_plugins.compute_framework.base_implementations.pyarrow.table import P
 
 from mloda.community.feature_groups.data_operations.errors import unsupported_agg_type_error
 from mloda.community.feature_groups.data_operations.mask_utils import apply_pyarrow_mask
+from mloda.community.feature_groups.data_operations.pyarrow_helpers import PyArrowFittedStatistics
 from mloda.community.feature_groups.data_operations.row_preserving.scalar_aggregate.base import (
     ScalarAggregateFeatureGroup,
 )
 
 
 class PyArrowScalarAggregate(ScalarAggregateFeatureGroup):
+    APPROXIMATE_KERNELS = frozenset({"median"})
+    FITTED_STATISTICS_OPS = PyArrowFittedStatistics
+
     @classmethod
     def compute_framework_rule(cls) -> set[type[ComputeFramework]] | None:
         return {PyArrowTable}
@@ -64,3 +68,20 @@ class PyArrowScalarAggregate(ScalarAggregateFeatureGroup):
 
         repeated = pa.array([result] * table.num_rows)
         return table.append_column(feature_name, repeated)
+
+    @classmethod
+    def _compute_approximate_aggregation(
+        cls,
+        table: pa.Table,
+        feature_name: str,
+        source_col: str,
+        agg_type: str,
+        mask_spec: list[tuple[str, str, Any]] | None = None,
+    ) -> pa.Table:
+        """Median through PyArrow's t-digest; null when there is no non-null value."""
+        if mask_spec is not None:
+            table = apply_pyarrow_mask(table, source_col, mask_spec)
+
+        result = pc.tdigest(table.column(source_col), q=0.5)[0].as_py()
+        repeated = pa.array([result] * table.num_rows, type=pa.float64())
+        return table.append_column(feature_name, repeated)
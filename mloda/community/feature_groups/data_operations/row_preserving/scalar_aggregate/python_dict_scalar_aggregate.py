@@ -20,6 +20,7 @@ from mloda_plugins.compute_framework.base_implementations.python_dict.python_dic
 from mloda_plugins.compute_framework.base_implementations.python_dict.python_dict_utils import row_count
 
 from mloda.community.feature_groups.data_operations.errors import unsupported_agg_type_error
+from mloda.community.feature_groups.data_operations.fitted_statistics import PythonDictFittedStatistics
 from mloda.community.feature_groups.data_operations.mask_utils import build_mask_from_spec
 from mloda.community.feature_groups.data_operations.python_dict_helpers import (
     STD_AGG_TYPES,
@@ -33,6 +34,8 @@ from mloda.community.feature_groups.data_operations.row_preserving.scalar_aggreg
 
 
 class PythonDictScalarAggregate(ScalarAggregateFeatureGroup):
+    FITTED_STATISTICS_OPS = PythonDictFittedStatistics
+
     @classmethod
     def compute_framework_rule(cls) -> set[type[ComputeFramework]] | None:
         return {PythonDictFramework}
@@ -6,6 +6,7 @@ option-based configuration (aggregation_type + in_features via Options).
 
 from __future__ import annotations
 
+import json
 from typing import Any
 
 import pyarrow as pa
@@ -294,3 +295,55 @@ class TestIntegrationOptionBasedConfig:
 
         assert sum_found, "string-pattern sum result not found"
         assert avg_found, "option-based avg result not found"
+
+
+class TestIntegrationFittedStatistics:
+    """Statistics fitted by a training run and served by the next."""
+
+    @staticmethod
+    def _column(results: list[Any], name: str) -> list[Any]:
+        for table in results:
+            if isinstance(table, pa.Table) and name in table.column_names:
+                return list(table.column(name).to_pylist())
+        raise AssertionError(f"{name} result not found")
+
+    def _session(self, *feature_names: str, version: str = "v1") -> Any:
+        plugin_collector = PluginCollector.enabled_feature_groups(
+            {PyArrowDataOpsTestDataCreator, PyArrowScalarAggregate}
+        )
+        return mloda.prepare(
+            [Feature(name, options=Options(context={"statistics_version": version})) for name in feature_names],
+            compute_frameworks={PyArrowTable},
+            plugin_collector=plugin_collector,
+        )
+
+    def test_saved_statistics_round_trip(self) -> None:
+        """The artifact a run saves reproduces that run's statistics when loaded."""
+        session = self._session("value_int__sum_scalar", "value_int__max_scalar")
+        session.run()
+        artifacts = session.get_artifacts()
+        assert len(artifacts) == 1
+        (saved,) = artifacts.values()
+        assert set(json.loads(saved)) == {"value_int__sum_scalar", "value_int__max_scalar"}
+
+        results = self._session("value_int__sum_scalar", "value_int__max_scalar").run(artifacts=artifacts)
+        assert self._column(results, "value_int__sum_scalar") == [EXPECTED_SUM] * 12
+        assert self._column(results, "value_int__max_scalar") == [EXPECTED_MAX] * 12
+
+    def test_loaded_statistics_replace_the_computation(self) -> None:
+        """A run given an artifact serves its value instead of aggregating its own rows."""
+        fitted = {
+            "value_int__sum_scalar": {
+                "version": "v1",
+                "source": "value_int",
+                "statistic": "sum",
+                "partition_by": [],
+                "rows": [[1000]],
+            }
+        }
+        artifacts = {"value_int__sum_scalar": json.dumps(fitted)}
+        results = self._session("value_int__sum_scalar").run(artifacts=artifacts)
+        assert self._column(results, "value_int__sum_scalar") == [1000] * 12
+
+        with pytest.raises(ValueError, match="Run without the artifact to refit"):
+            self._session("value_int__sum_scalar", version="v2").run(artifacts=artifacts)
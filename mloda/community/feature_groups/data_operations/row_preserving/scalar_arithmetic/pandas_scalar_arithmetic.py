@@ -5,6 +5,7 @@ from __future__ import annotations
 import pandas as pd
 
 from mloda.community.feature_groups.data_operations.errors import unsupported_op_error
+from mloda.community.feature_groups.data_operations.pandas_helpers import with_columns
 from mloda.community.feature_groups.data_operations.row_preserving.arithmetic.pandas_mixin import PandasArithmeticMixin
 from mloda.community.feature_groups.data_operations.row_preserving.scalar_arithmetic.base import (
     ARITHMETIC_OPERATIONS,
@@ -22,18 +23,17 @@ class PandasScalarArithmetic(PandasArithmeticMixin, ScalarArithmeticFeatureGroup
         op: str,
         constant: int | float,
     ) -> pd.DataFrame:
-        data = data.copy()
         col = data[source_col]
 
         if op == "add":
-            data[feature_name] = col + constant
+            result = col + constant
         elif op == "subtract":
-            data[feature_name] = col - constant
+            result = col - constant
         elif op == "multiply":
-            data[feature_name] = col * constant
+            result = col * constant
         elif op == "divide":
-            data[feature_name] = col / constant
+            result = col / constant
         else:
             raise unsupported_op_error(op, ARITHMETIC_OPERATIONS, framework="Pandas")
 
-        return data
+        return with_columns(data, {feature_name: result})
@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
+import pyarrow as pa
+
 from mloda_plugins.compute_framework.base_implementations.sql.sql_utils import quote_ident
 from mloda_plugins.compute_framework.base_implementations.sqlite.sqlite_relation import SqliteRelation
 
 from mloda.community.feature_groups.data_operations.errors import unsupported_op_error
+from mloda.community.feature_groups.data_operations.sqlite_helpers import (
+    append_sql_column,
+    arithmetic_result_type,
+    column_type,
+)
 from mloda.community.feature_groups.data_operations.row_preserving.scalar_arithmetic.base import (
     ScalarArithmeticFeatureGroup,
 )
@@ -30,7 +37,6 @@ class SqliteScalarArithmetic(SqliteArithmeticMixin, ScalarArithmeticFeatureGroup
             raise unsupported_op_error(op, SQLITE_ARITHMETIC_OPS, framework="SQLite")
 
         quoted_source = quote_ident(source_col)
-        quoted_feature = quote_ident(feature_name)
         # Preserve int-vs-float in SQL literal so int + int stays int.
         literal = repr(constant) if isinstance(constant, int) else repr(float(constant))
 
@@ -42,21 +48,9 @@ class SqliteScalarArithmetic(SqliteArithmeticMixin, ScalarArithmeticFeatureGroup
         else:
             source_expr = quoted_source
 
-        # Row-preserving contract: append_column below aligns result_values to
-        # the existing rows by position, so this bare SELECT must return rows in
-        # the relation's stored order. Keep it free of ORDER BY / JOIN / GROUP BY
-        # / DISTINCT, any of which could reorder rows and silently misalign the
-        # appended column. See docs/guides/data-operation-patterns/02-row-preserving-contract.md.
-        sql = " ".join(
-            [
-                "SELECT",
-                f"({source_expr} {sql_op} {literal}) AS {quoted_feature}",
-                "FROM",
-                f"{quote_ident(data.table_name)}",
-            ]
-        )
-        cursor = data.connection.execute(sql)
-        rows = cursor.fetchall()
-
-        result_values = [row[0] for row in rows]
-        return data.append_column(feature_name, result_values)
+        # Row-preserving contract: the column is projected as ``*, expr`` over the
+        # relation, which keeps its stored row order. See
+        # docs/guides/data-operation-patterns/02-row-preserving-contract.md.
+        literal_type = pa.int64() if isinstance(constant, int) else pa.float64()
+        arrow_type = arithmetic_result_type(op, column_type(data, source_col), literal_type)
+        return append_sql_column(data, feature_name, f"({source_expr} {sql_op} {literal})", arrow_type)
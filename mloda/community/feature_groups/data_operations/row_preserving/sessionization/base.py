@@ -34,6 +34,9 @@ Options context:
 - ``partition_by``: OPTIONAL list of columns; default ``[]`` treats the whole
   table as a single stream.
 - ``in_features``: the single source column (when not derivable from the name).
+- ``state_store``: OPTIONAL name of a ``recurrence_state`` store; when set, each run
+  continues every partition from the tail the previous run left there instead of
+  recomputing from scratch (see ``recurrence_state``).
 
 Every backend (pandas, polars-lazy, PyArrow, DuckDB, SQLite) computes
 sessionization NATIVELY; there is no rejection of supported inputs. PyArrow is
@@ -53,7 +56,22 @@ from mloda.core.abstract_plugins.components.feature_set import FeatureSet
 from mloda.core.abstract_plugins.components.options import Options
 from mloda.provider import DefaultOptionKeys, FeatureGroup, property_spec
 
-from mloda.community.feature_groups.data_operations.base import RejectionReasonMixin, column_ref_value, is_column_ref
+from mloda.community.feature_groups.data_operations.base import (
+    RejectionReasonMixin,
+    column_ref_value,
+    is_column_ref,
+    is_op_token,
+    op_token_value,
+    option_value,
+)
+from mloda.community.feature_groups.data_operations.recurrence_state import (
+    STATE_STORE,
+    StateFrameOps,
+    compute_with_carried_state,
+    get_state_store,
+    state_store_supported,
+)
+from mloda.community.feature_groups.data_operations.sort_cache import sort_permutation_scope
 
 # Supported sessionization units mapped to their length in seconds. The four
 # keys also define the units accepted by the feature-name regex.
@@ -113,6 +131,10 @@ class SessionizationFeatureGroup(RejectionReasonMixin, FeatureGroup):
 
     PARTITION_BY = "partition_by"
     ORDER_BY = "order_by"
+    STATE_STORE = STATE_STORE
+
+    # Backends that can carry recurrence state across runs set this; see recurrence_state.
+    STATE_FRAME_OPS: type[StateFrameOps] | None = None
 
     PROPERTY_MAPPING = {
         DefaultOptionKeys.in_features: property_spec(
@@ -130,8 +152,26 @@ class SessionizationFeatureGroup(RejectionReasonMixin, FeatureGroup):
             default=None,
             match_guard=is_column_ref,
         ),
+        STATE_STORE: property_spec(
+            "Name of the state store to carry per-partition tail state across runs in (opt-in)",
+            strict=False,
+            default=None,
+            match_guard=is_op_token,
+        ),
     }
 
+    @classmethod
+    def match_feature_group_criteria(
+        cls,
+        feature_name: Any,
+        options: Any,
+        _data_access_collection: Any = None,
+    ) -> bool:
+        """Extend the declaration-driven match: ``state_store`` needs a backend that carries state."""
+        if not super().match_feature_group_criteria(feature_name, options, _data_access_collection):
+            return False
+        return state_store_supported(cls, options)
+
     def input_features(self, options: Options, feature_name: FeatureName) -> set[Feature] | None:
         _feature_name = str(feature_name)
 
@@ -210,25 +250,47 @@ class SessionizationFeatureGroup(RejectionReasonMixin, FeatureGroup):
             return source_col
         return column_ref_value(order_by)
 
+    @classmethod
+    def _extract_state_store(cls, feature: Feature) -> str | None:
+        """Return the ``state_store`` name, or None when the feature recomputes from scratch."""
+        return option_value(feature.options, cls.STATE_STORE, op_token_value)
+
     @classmethod
     def calculate_feature(cls, data: Any, features: FeatureSet) -> Any:
         """Compute one session-id column per feature in ``features``."""
         table = data
 
-        for feature in features.features:
-            feature_name = feature.name
-
-            source_features = cls._extract_source_features(feature)
-            source_col = source_features[0]
-            token = cls._extract_threshold_token(feature)
-            n, unit = _parse_sessionize_op(token)
-            threshold_seconds = _sessionize_threshold_seconds(n, unit)
-            partition_by = cls._extract_partition_by(feature)
-            order_by = cls._extract_order_by(feature, source_col)
-
-            cls._assert_source_column_present(table, order_by)
-
-            table = cls._compute_session(table, feature_name, order_by, threshold_seconds, partition_by)
+        with sort_permutation_scope():
+            for feature in features.features:
+                feature_name = feature.name
+
+                source_features = cls._extract_source_features(feature)
+                source_col = source_features[0]
+                token = cls._extract_threshold_token(feature)
+                n, unit = _parse_sessionize_op(token)
+                threshold_seconds = _sessionize_threshold_seconds(n, unit)
+                partition_by = cls._extract_partition_by(feature)
+                order_by = cls._extract_order_by(feature, source_col)
+
+                cls._assert_source_column_present(table, order_by)
+
+                store_name = cls._extract_state_store(feature)
+                if store_name is None:
+                    table = cls._compute_session(table, feature_name, order_by, threshold_seconds, partition_by)
+                else:
+                    table = compute_with_carried_state(
+                        cls.STATE_FRAME_OPS,
+                        get_state_store(store_name),
+                        "sessionize",
+                        table,
+                        feature_name,
+                        order_by,
+                        partition_by,
+                        order_by,
+                        lambda frame: cls._compute_session(
+                            frame, feature_name, order_by, threshold_seconds, partition_by
+                        ),
+                    )
 
         return table
 
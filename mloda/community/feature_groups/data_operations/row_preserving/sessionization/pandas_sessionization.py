@@ -7,13 +7,15 @@ import pandas as pd
 from mloda.provider import ComputeFramework
 from mloda_plugins.compute_framework.base_implementations.pandas.dataframe import PandasDataFrame
 
-from mloda.community.feature_groups.data_operations.helper_columns import unique_helper_name
+from mloda.community.feature_groups.data_operations.pandas_helpers import PandasStateFrame, narrow_frame, with_columns
 from mloda.community.feature_groups.data_operations.row_preserving.sessionization.base import (
     SessionizationFeatureGroup,
 )
 
 
 class PandasSessionization(SessionizationFeatureGroup):
+    STATE_FRAME_OPS = PandasStateFrame
+
     @classmethod
     def compute_framework_rule(cls) -> set[type[ComputeFramework]] | None:
         return {PandasDataFrame}
@@ -34,14 +36,9 @@ class PandasSessionization(SessionizationFeatureGroup):
         threshold_seconds: int,
         partition_by: list[str],
     ) -> pd.DataFrame:
-        data = data.copy()
-
-        rn_col = unique_helper_name("__mloda_rn__", set(data.columns) | {feature_name})
-
-        # Tag original row order so we can restore it after sorting.
-        data[rn_col] = range(len(data))
-
-        ordered = data.sort_values(by=[*partition_by, order_col], na_position="last")
+        ordered = narrow_frame(data, [*partition_by, order_col]).sort_values(
+            by=[*partition_by, order_col], na_position="last"
+        )
 
         if partition_by:
             gap = ordered.groupby(partition_by, dropna=False)[order_col].diff()
@@ -52,6 +49,5 @@ class PandasSessionization(SessionizationFeatureGroup):
         is_new = gap.isna() | (gap > threshold)
         ordered[feature_name] = is_new.cumsum().astype("int64") - 1
 
-        # Restore original row order, drop the helper column.
-        result = ordered.sort_values(by=rn_col).drop(columns=[rn_col])
-        return result
+        # Restore input row order.
+        return with_columns(data, {feature_name: ordered[feature_name].sort_index().set_axis(data.index)})
@@ -6,7 +6,9 @@ rows are sorted by ``[*partition_by, order_col]`` ascending, the gap to the
 previous row and the partition boundary are derived with shifted-slice
 comparisons, the per-row ``is_new`` flag is cumulatively summed
 (``pc.cumulative_sum``) to produce the 0-based session id, then the result is
-scattered back to the original row order.
+scattered back to the original row order. The ordering comes from
+``sort_permutation``, so session features of one FeatureSet over the same keys
+share one sort.
 """
 
 from __future__ import annotations
@@ -17,13 +19,19 @@ import pyarrow.compute as pc
 from mloda.provider import ComputeFramework
 from mloda_plugins.compute_framework.base_implementations.pyarrow.table import PyArrowTable
 
-from mloda.community.feature_groups.data_operations.pyarrow_helpers import nan_safe_not_equal
+from mloda.community.feature_groups.data_operations.pyarrow_helpers import (
+    PyArrowStateFrame,
+    nan_safe_not_equal,
+    sort_permutation,
+)
 from mloda.community.feature_groups.data_operations.row_preserving.sessionization.base import (
     SessionizationFeatureGroup,
 )
 
 
 class PyArrowSessionization(SessionizationFeatureGroup):
+    STATE_FRAME_OPS = PyArrowStateFrame
+
     @classmethod
     def compute_framework_rule(cls) -> set[type[ComputeFramework]] | None:
         return {PyArrowTable}
@@ -52,9 +60,8 @@ class PyArrowSessionization(SessionizationFeatureGroup):
         if n == 0:
             return data.append_column(feature_name, pa.array([], type=pa.int64()))
 
-        sort_keys = [(col, "ascending") for col in (*partition_by, order_col)]
-        perm = pc.sort_indices(data, sort_keys=sort_keys)
-        sorted_tbl = data.take(perm)
+        perm = sort_permutation(data, partition_by, order_col)
+        sorted_tbl = data.select([*partition_by, order_col]).take(perm.forward)
 
         # Normalize to microsecond resolution before the int64 view so any input
         # resolution (s/ms/us/ns) yields microseconds since epoch.
@@ -88,7 +95,6 @@ class PyArrowSessionization(SessionizationFeatureGroup):
         )
 
         # Scatter the session ids back to the original row order.
-        inv = pc.sort_indices(perm)
-        sessions = pc.take(sessions_sorted, inv)
+        sessions = pc.take(sessions_sorted, perm.inverse)
 
         return data.append_column(feature_name, pc.cast(sessions, pa.int64()))
@@ -26,12 +26,15 @@ from mloda.community.feature_groups.data_operations.python_dict_helpers import (
     partition_sort_key,
     values_equal,
 )
+from mloda.community.feature_groups.data_operations.recurrence_state import PythonDictStateFrame
 from mloda.community.feature_groups.data_operations.row_preserving.sessionization.base import (
     SessionizationFeatureGroup,
 )
 
 
 class PythonDictSessionization(SessionizationFeatureGroup):
+    STATE_FRAME_OPS = PythonDictStateFrame
+
     @classmethod
     def compute_framework_rule(cls) -> set[type[ComputeFramework]] | None:
         return {PythonDictFramework}
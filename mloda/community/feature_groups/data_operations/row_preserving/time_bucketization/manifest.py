@@ -1,24 +1,23 @@
 """Entry-point manifest for mloda-community-time-bucketization.
 
-Lists the concrete FeatureGroup classes that mloda discovers via the
-``mloda.feature_groups`` entry point. Backends whose optional framework is not
-installed are skipped so the rest still register. See issue #271.
+Declares the concrete FeatureGroup classes that mloda discovers via the
+``mloda.feature_groups`` entry point as (module, class, framework) triples;
+importing this module imports no backend. Backends whose optional framework is
+not installed are skipped so the rest still register. See issue #271.
 """
 
 from __future__ import annotations
 
-from mloda.provider import FeatureGroup
+from mloda.community.feature_groups.data_operations.manifest_utils import LazyPluginManifest
 
-from mloda.community.feature_groups.data_operations.manifest_utils import load_plugin_classes
-
-FEATURE_GROUPS: list[type[FeatureGroup]] = load_plugin_classes(
+FEATURE_GROUPS = LazyPluginManifest(
     __package__ or __name__.rpartition(".")[0],
     [
-        ("duckdb_time_bucketization", "DuckdbTimeBucketization"),
-        ("pandas_time_bucketization", "PandasTimeBucketization"),
-        ("polars_lazy_time_bucketization", "PolarsLazyTimeBucketization"),
-        ("pyarrow_time_bucketization", "PyArrowTimeBucketization"),
-        ("python_dict_time_bucketization", "PythonDictTimeBucketization"),
-        ("sqlite_time_bucketization", "SqliteTimeBucketization"),
+        ("duckdb_time_bucketization", "DuckdbTimeBucketization", "DuckDBFramework"),
+        ("pandas_time_bucketization", "PandasTimeBucketization", "PandasDataFrame"),
+        ("polars_lazy_time_bucketization", "PolarsLazyTimeBucketization", "PolarsLazyDataFrame"),
+        ("pyarrow_time_bucketization", "PyArrowTimeBucketization", "PyArrowTable"),
+        ("python_dict_time_bucketization", "PythonDictTimeBucketization", "PythonDictFramework"),
+        ("sqlite_time_bucketization", "SqliteTimeBucketization", "SqliteFramework"),
     ],
 )
@@ -17,7 +17,7 @@ import pandas as pd
 from mloda.provider import ComputeFramework
 from mloda_plugins.compute_framework.base_implementations.pandas.dataframe import PandasDataFrame
 
-from mloda.community.feature_groups.data_operations.pandas_helpers import FIXED_FREQ_ALIASES
+from mloda.community.feature_groups.data_operations.pandas_helpers import FIXED_FREQ_ALIASES, with_columns
 from mloda.community.feature_groups.data_operations.row_preserving.time_bucketization.base import (
     TIME_BUCKETIZATION_OPS,
     TimeBucketizationFeatureGroup,
@@ -92,7 +92,6 @@ class PandasTimeBucketization(TimeBucketizationFeatureGroup):
         n: int,
         unit: str,
     ) -> pd.DataFrame:
-        data = data.copy()
         col = data[source_col]
 
         if op == "floor":
@@ -104,8 +103,7 @@ class PandasTimeBucketization(TimeBucketizationFeatureGroup):
         else:
             raise ValueError(f"Unsupported bucket op {op!r} for Pandas; supported: {sorted(TIME_BUCKETIZATION_OPS)}.")
 
-        data[feature_name] = result
-        return data
+        return with_columns(data, {feature_name: result})
 
     # -- Op implementations --------------------------------------------------
 
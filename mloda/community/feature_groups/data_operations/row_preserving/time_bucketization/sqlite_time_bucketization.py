@@ -39,11 +39,14 @@ return results in input order, mirroring the tag-and-restore pattern in
 
 from __future__ import annotations
 
+import pyarrow as pa
+
 from mloda.provider import ComputeFramework
 from mloda_plugins.compute_framework.base_implementations.sql.sql_utils import quote_ident
 from mloda_plugins.compute_framework.base_implementations.sqlite.sqlite_framework import SqliteFramework
 from mloda_plugins.compute_framework.base_implementations.sqlite.sqlite_relation import SqliteRelation
 
+from mloda.community.feature_groups.data_operations.sqlite_helpers import append_sql_column
 from mloda.community.feature_groups.data_operations.row_preserving.time_bucketization.base import (
     TIME_BUCKETIZATION_OPS,
     TimeBucketizationFeatureGroup,
@@ -283,22 +286,10 @@ class SqliteTimeBucketization(TimeBucketizationFeatureGroup):
             round_expr = cls._round_expression(local_src, n, unit, floor_expr)
             bucket_expr = f"({round_expr}) || {tz_suffix}"
 
-        # Project the bucket value directly and re-sort on ``rowid`` so the
-        # results come back in input order, mirroring the tag-and-restore
-        # pattern in ``sqlite_datetime.py``. No window function is needed: the
-        # ordering is fully expressed by ``ORDER BY rowid``.
-        quoted_feature = quote_ident(feature_name)
-        quoted_table = quote_ident(data.table_name)
-
-        sql = (
-            f"SELECT {bucket_expr} AS {quoted_feature} "  # nosec
-            f"FROM {quoted_table} "
-            f"ORDER BY rowid"
-        )
-        cursor = data.connection.execute(sql)
-        result_values = [row[0] for row in cursor.fetchall()]
-
-        return data.append_column(feature_name, result_values)
+        # Project the bucket value next to the existing columns; the projection
+        # keeps the relation's row order, so no window function is needed. The
+        # bucket stays ISO 8601 text with the source tz suffix.
+        return append_sql_column(data, feature_name, bucket_expr, pa.string())
 
     @classmethod
     def _ceil_expression(cls, quoted_source: str, n: int, unit: str, floor_expr: str) -> str:
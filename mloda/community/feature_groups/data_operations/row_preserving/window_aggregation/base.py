@@ -11,6 +11,8 @@ from mloda.provider import DefaultOptionKeys, property_spec
 from mloda.community.feature_groups.data_operations.aggregation_base import (
     AGGREGATION_TYPES as _BASE_AGGREGATION_TYPES,
     AggregationFeatureGroupBase,
+    AggregationRequest,
+    bucket_by_key,
 )
 from mloda.community.feature_groups.data_operations.mask_utils import MASK_KEY, parse_mask_spec
 from mloda.community.feature_groups.data_operations.base import (
@@ -20,6 +22,7 @@ from mloda.community.feature_groups.data_operations.base import (
     op_token_value,
     option_value,
 )
+from mloda.community.feature_groups.data_operations.sort_cache import sort_permutation_scope
 
 # Aggregation types that require an order_by column to be deterministic.
 _ORDER_DEPENDENT_AGG_TYPES = {"first", "last"}
@@ -192,14 +195,20 @@ class WindowAggregationFeatureGroup(AggregationFeatureGroupBase):
 
     @classmethod
     def calculate_feature(cls, data: Any, features: FeatureSet) -> Any:
-        """Shared loop: extract params from each feature, delegate to _compute_window.
+        """Plan the FeatureSet into fused buckets, then delegate each to _compute_window_bucket.
 
         Supports both string-based features (e.g. "value_int__sum_window") and
         configuration-based features (via Options with aggregation_type, in_features,
         partition_by).
+
+        Features sharing ``(partition_by, mask, order_by)`` land in one bucket, so a
+        backend can compute all of them with one grouping pass. ``order_by`` only counts
+        toward the key for the order-dependent types (first/last); every other type
+        ignores it, so it is normalized to None there and does not split a bucket.
         """
         table = data
 
+        planned: list[tuple[tuple[tuple[str, ...], Any, str | None], AggregationRequest]] = []
         for feature in features.features:
             feature_name = feature.name
 
@@ -211,14 +220,42 @@ class WindowAggregationFeatureGroup(AggregationFeatureGroupBase):
                 raise ValueError(
                     f"window_aggregation requires a non-empty partition_by, got {partition_by!r} for feature {feature_name!r}."
                 )
-            partition_by = list(partition_by)
             order_by = option_value(feature.options, cls.ORDER_BY, column_ref_value)
+            if agg_type not in _ORDER_DEPENDENT_AGG_TYPES:
+                order_by = None
             mask_spec = parse_mask_spec(feature.options.get(MASK_KEY))
 
-            table = cls._compute_window(table, feature_name, source_col, partition_by, agg_type, order_by, mask_spec)
+            key = (tuple(partition_by), mask_spec, order_by)
+            planned.append((key, AggregationRequest(feature_name, source_col, agg_type)))
+
+        # Buckets over the same partition_by (differing in mask or order_by) share one
+        # factorization of the keys on backends that cache it; see sort_cache.
+        with sort_permutation_scope():
+            for (partition_key, mask_spec, order_by), requests in bucket_by_key(planned):
+                table = cls._compute_window_bucket(table, requests, list(partition_key), order_by, mask_spec)
 
         return table
 
+    @classmethod
+    def _compute_window_bucket(
+        cls,
+        data: Any,
+        requests: list[AggregationRequest],
+        partition_by: list[str],
+        order_by: str | None = None,
+        mask_spec: list[tuple[str, str, Any]] | None = None,
+    ) -> Any:
+        """Compute every request of one bucket; all share partition_by, order_by and mask_spec.
+
+        The default runs ``_compute_window`` once per request. Backends override this to
+        emit the whole bucket as one multi-aggregate call.
+        """
+        for request in requests:
+            data = cls._compute_window(
+                data, request.feature_name, request.source_col, partition_by, request.agg_type, order_by, mask_spec
+            )
+        return data
+
     @classmethod
     def _compute_window(
         cls,
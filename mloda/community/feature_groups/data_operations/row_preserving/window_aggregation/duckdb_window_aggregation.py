@@ -8,8 +8,13 @@ from mloda.provider import ComputeFramework
 from mloda_plugins.compute_framework.base_implementations.duckdb.duckdb_framework import DuckDBFramework
 from mloda_plugins.compute_framework.base_implementations.duckdb.duckdb_relation import DuckdbRelation
 from mloda_plugins.compute_framework.base_implementations.sql.sql_utils import pick_helper_column_name, quote_ident
-from mloda_plugins.compute_framework.base_implementations.sql.sql_window import Unbounded, WindowFrame
+from mloda_plugins.compute_framework.base_implementations.sql.sql_window import (
+    Unbounded,
+    WindowFrame,
+    render_over_clause,
+)
 
+from mloda.community.feature_groups.data_operations.aggregation_base import AggregationRequest
 from mloda.community.feature_groups.data_operations.errors import unsupported_agg_type_error
 from mloda.community.feature_groups.data_operations.mask_utils import build_sql_case_when
 from mloda.community.feature_groups.data_operations.row_preserving.window_aggregation.base import (
@@ -54,60 +59,93 @@ class DuckdbWindowAggregation(WindowAggregationFeatureGroup):
         order_by: str | None = None,
         mask_spec: list[tuple[str, str, Any]] | None = None,
     ) -> DuckdbRelation:
+        request = AggregationRequest(feature_name, source_col, agg_type)
+        return cls._compute_window_bucket(data, [request], partition_by, order_by, mask_spec)
+
+    @classmethod
+    def _compute_window_bucket(
+        cls,
+        data: Any,
+        requests: list[AggregationRequest],
+        partition_by: list[str],
+        order_by: str | None = None,
+        mask_spec: list[tuple[str, str, Any]] | None = None,
+    ) -> DuckdbRelation:
+        """All window expressions of the bucket in one projection.
+
+        Every expression shares the same OVER clause, so DuckDB partitions the input once
+        for the whole bucket instead of once per feature.
+        """
         # Safety: the projection string is composed entirely from quote_ident()-quoted
         # identifiers and hardcoded SQL function names from _DUCKDB_AGG_FUNCS. No
         # user-controlled strings are interpolated without quoting.
-        quoted_source = quote_ident(source_col)
-
-        source_sql = quoted_source
-        if mask_spec is not None:
-            source_sql = build_sql_case_when(mask_spec, quoted_source)
-
-        if agg_type == "nunique":
-            result: DuckdbRelation = data.window(
-                f"COUNT(DISTINCT {source_sql})", feature_name, partition_by=partition_by
-            )
-            return result
-
-        if agg_type in ("first", "last"):
-            return cls._compute_first_last(data, feature_name, source_sql, partition_by, agg_type, order_by)
-
-        agg_func = _DUCKDB_AGG_FUNCS.get(agg_type)
-        if agg_func is None:
-            raise unsupported_agg_type_error(agg_type, _DUCKDB_AGG_FUNCS.keys(), framework="DuckDB")
-        result = data.window(f"{agg_func}({source_sql})", feature_name, partition_by=partition_by)
+        existing = {c.casefold() for c in data.columns}
+        for request in requests:
+            if request.agg_type not in _DUCKDB_AGG_FUNCS:
+                raise unsupported_agg_type_error(request.agg_type, _DUCKDB_AGG_FUNCS.keys(), framework="DuckDB")
+            if request.feature_name.casefold() in existing:
+                raise ValueError(f"Column {request.feature_name!r} already exists in the relation")
+
+        plain = [request for request in requests if request.agg_type not in ("first", "last")]
+        ordered = [request for request in requests if request.agg_type in ("first", "last")]
+
+        result: DuckdbRelation = data
+        if plain:
+            over_sql = render_over_clause(partition_by, (), None)
+            projections = []
+            for request in plain:
+                source_sql = cls._source_sql(request.source_col, mask_spec)
+                if request.agg_type == "nunique":
+                    func = f"COUNT(DISTINCT {source_sql})"
+                else:
+                    func = f"{_DUCKDB_AGG_FUNCS[request.agg_type]}({source_sql})"
+                projections.append(f"{func} OVER ({over_sql}) AS {quote_ident(request.feature_name)}")
+            result = result.project(f"*, {', '.join(projections)}")
+        if ordered:
+            result = cls._compute_first_last(result, ordered, partition_by, order_by, mask_spec)
         return result
 
+    @staticmethod
+    def _source_sql(source_col: str, mask_spec: list[tuple[str, str, Any]] | None) -> str:
+        quoted_source = quote_ident(source_col)
+        if mask_spec is None:
+            return quoted_source
+        return build_sql_case_when(mask_spec, quoted_source)
+
     @classmethod
     def _compute_first_last(
         cls,
         data: DuckdbRelation,
-        feature_name: str,
-        source_sql: str,
+        requests: list[AggregationRequest],
         partition_by: list[str],
-        agg_type: str,
         order_by: str | None = None,
+        mask_spec: list[tuple[str, str, Any]] | None = None,
     ) -> DuckdbRelation:
         """PyArrow parity: DuckDB's default ordered-window frame is
         ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW, which makes
         LAST_VALUE return the current row instead of the partition-wide
         last. Explicit UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING restores
         full-partition visibility to match PyArrow group_by().aggregate()."""
-        rn = pick_helper_column_name(taken=set(data.columns) | {feature_name})
+        rn = pick_helper_column_name(taken=set(data.columns) | {request.feature_name for request in requests})
         qrn = quote_ident(rn)
-        agg_func = _DUCKDB_AGG_FUNCS[agg_type]
 
         # Step 1: tag rows with their original position
         rel = data.with_row_number(rn)
 
         # Step 2: compute with full frame and ORDER BY for deterministic results
-        rel = rel.window(
-            f"{agg_func}({source_sql} IGNORE NULLS)",
-            feature_name,
-            partition_by=partition_by,
-            order_by=([order_by] if order_by else ()),
-            frame=WindowFrame("rows", Unbounded(), Unbounded()),
+        over_sql = render_over_clause(
+            partition_by,
+            [order_by] if order_by else (),
+            WindowFrame("rows", Unbounded(), Unbounded()),
         )
+        projections = []
+        for request in requests:
+            agg_func = _DUCKDB_AGG_FUNCS[request.agg_type]
+            source_sql = cls._source_sql(request.source_col, mask_spec)
+            projections.append(
+                f"{agg_func}({source_sql} IGNORE NULLS) OVER ({over_sql}) AS {quote_ident(request.feature_name)}"
+            )
+        rel = rel.project(f"*, {', '.join(projections)}")
 
         # Step 3: restore original row order, drop helper column
         rel = rel.order(qrn)
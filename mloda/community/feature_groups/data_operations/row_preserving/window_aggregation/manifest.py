@@ -1,24 +1,23 @@
 """Entry-point manifest for mloda-community-window-aggregation.
 
-Lists the concrete FeatureGroup classes that mloda discovers via the
-``mloda.feature_groups`` entry point. Backends whose optional framework is not
-installed are skipped so the rest still register. See issue #271.
+Declares the concrete FeatureGroup classes that mloda discovers via the
+``mloda.feature_groups`` entry point as (module, class, framework) triples;
+importing this module imports no backend. Backends whose optional framework is
+not installed are skipped so the rest still register. See issue #271.
 """
 
 from __future__ import annotations
 
-from mloda.provider import FeatureGroup
+from mloda.community.feature_groups.data_operations.manifest_utils import LazyPluginManifest
 
-from mloda.community.feature_groups.data_operations.manifest_utils import load_plugin_classes
-
-FEATURE_GROUPS: list[type[FeatureGroup]] = load_plugin_classes(
+FEATURE_GROUPS = LazyPluginManifest(
     __package__ or __name__.rpartition(".")[0],
     [
-        ("duckdb_window_aggregation", "DuckdbWindowAggregation"),
-        ("pandas_window_aggregation", "PandasWindowAggregation"),
-        ("polars_lazy_window_aggregation", "PolarsLazyWindowAggregation"),
-        ("pyarrow_window_aggregation", "PyArrowWindowAggregation"),
-        ("python_dict_window_aggregation", "PythonDictWindowAggregation"),
-        ("sqlite_window_aggregation", "SqliteWindowAggregation"),
+        ("duckdb_window_aggregation", "DuckdbWindowAggregation", "DuckDBFramework"),
+        ("pandas_window_aggregation", "PandasWindowAggregation", "PandasDataFrame"),
+        ("polars_lazy_window_aggregation", "PolarsLazyWindowAggregation", "PolarsLazyDataFrame"),
+        ("pyarrow_window_aggregation", "PyArrowWindowAggregation", "PyArrowTable"),
+        ("python_dict_window_aggregation", "PythonDictWindowAggregation", "PythonDictFramework"),
+        ("sqlite_window_aggregation", "SqliteWindowAggregation", "SqliteFramework"),
     ],
 )
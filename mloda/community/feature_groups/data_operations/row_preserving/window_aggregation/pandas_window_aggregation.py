@@ -9,21 +9,21 @@ import pandas as pd
 from mloda.provider import ComputeFramework
 from mloda_plugins.compute_framework.base_implementations.pandas.dataframe import PandasDataFrame
 
+from mloda.community.feature_groups.data_operations.aggregation_base import AggregationRequest
 from mloda.community.feature_groups.data_operations.errors import unsupported_agg_type_error
 from mloda.community.feature_groups.data_operations.helper_columns import unique_helper_name
-from mloda.community.feature_groups.data_operations.mask_utils import build_mask_from_spec
+from mloda.community.feature_groups.data_operations.mask_utils import apply_pandas_mask_columns
 from mloda.community.feature_groups.data_operations.row_preserving.window_aggregation.base import (
     WindowAggregationFeatureGroup,
 )
 from mloda.community.feature_groups.data_operations.pandas_helpers import (
     PANDAS_AGG_FUNCS,
     apply_null_safe_agg,
-    coerce_count_dtype,
     compute_mode_winners,
+    narrow_frame,
     null_safe_groupby,
-)
-from mloda_plugins.compute_framework.base_implementations.pandas.pandas_mask_engine import (
-    PandasMaskEngine,
+    partition_grouping,
+    with_columns,
 )
 
 _SUPPORTED_AGG_TYPES = {*PANDAS_AGG_FUNCS.keys(), "mode"}
@@ -45,30 +45,51 @@ class PandasWindowAggregation(WindowAggregationFeatureGroup):
         order_by: str | None = None,
         mask_spec: list[tuple[str, str, Any]] | None = None,
     ) -> pd.DataFrame:
-        if mask_spec is not None:
-            mask = build_mask_from_spec(PandasMaskEngine, data, mask_spec)
-            data = data.copy()
-            data[source_col] = data[source_col].where(mask)
-
-        if agg_type == "mode":
-            return cls._compute_mode(data, feature_name, source_col, partition_by)
-
-        if agg_type in ("first", "last") and order_by is not None:
-            return cls._compute_ordered(data, feature_name, source_col, partition_by, agg_type, order_by)
+        request = AggregationRequest(feature_name, source_col, agg_type)
+        return cls._compute_window_bucket(data, [request], partition_by, order_by, mask_spec)
 
-        pandas_func = PANDAS_AGG_FUNCS.get(agg_type)
-        if pandas_func is None:
-            raise unsupported_agg_type_error(agg_type, _SUPPORTED_AGG_TYPES, framework="Pandas")
-
-        grouped = null_safe_groupby(data, partition_by, source_col)
-        result_series = apply_null_safe_agg(grouped, pandas_func, agg_type, method="transform")
-
-        data = data.copy()
-        data[feature_name] = result_series
+    @classmethod
+    def _compute_window_bucket(
+        cls,
+        data: pd.DataFrame,
+        requests: list[AggregationRequest],
+        partition_by: list[str],
+        order_by: str | None = None,
+        mask_spec: list[tuple[str, str, Any]] | None = None,
+    ) -> pd.DataFrame:
+        """Transform every request of the bucket against one shared groupby.
 
-        coerce_count_dtype(data, feature_name, agg_type)
+        Mode and ordered first/last need their own pass and fall back per request;
+        all new columns are attached to *data* at once, without copying it.
+        """
+        for request in requests:
+            if request.agg_type != "mode" and request.agg_type not in PANDAS_AGG_FUNCS:
+                raise unsupported_agg_type_error(request.agg_type, _SUPPORTED_AGG_TYPES, framework="Pandas")
 
-        return data
+        work = data
+        if mask_spec is not None:
+            work = apply_pandas_mask_columns(data, [request.source_col for request in requests], mask_spec)
+
+        # Masking only nulls source values, so the codes of the unmasked keys still apply.
+        grouped = work.groupby(partition_grouping(data, list(partition_by)).codes)
+        new_cols: dict[str, Any] = {}
+        for request in requests:
+            feature_name, source_col, agg_type = request.feature_name, request.source_col, request.agg_type
+            if agg_type == "mode":
+                new_cols[feature_name] = cls._compute_mode(work, feature_name, source_col, partition_by)[
+                    feature_name
+                ].to_numpy()
+            elif agg_type in ("first", "last") and order_by is not None:
+                new_cols[feature_name] = cls._compute_ordered(
+                    work, feature_name, source_col, partition_by, agg_type, order_by
+                )[feature_name]
+            else:
+                series = apply_null_safe_agg(
+                    grouped[source_col], PANDAS_AGG_FUNCS[agg_type], agg_type, method="transform"
+                )
+                new_cols[feature_name] = series.astype("int64") if agg_type == "count" else series
+
+        return with_columns(data, new_cols)
 
     @classmethod
     def _compute_mode(
@@ -81,9 +102,7 @@ class PandasWindowAggregation(WindowAggregationFeatureGroup):
         """Insertion-order tie-breaking for PyArrow parity."""
         partition_by = list(partition_by)
         if source_col in partition_by:
-            data = data.copy()
-            data[feature_name] = data[source_col]
-            return data
+            return with_columns(data, {feature_name: data[source_col]})
 
         is_data_col = unique_helper_name("__mloda_mode_is_data__", data.columns)
 
@@ -102,9 +121,7 @@ class PandasWindowAggregation(WindowAggregationFeatureGroup):
 
         broadcast = combined.loc[combined[is_data_col], feature_name]
 
-        data = data.copy()
-        data[feature_name] = broadcast.to_numpy()
-        return data
+        return with_columns(data, {feature_name: broadcast.to_numpy()})
 
     @classmethod
     def _compute_ordered(
@@ -119,10 +136,9 @@ class PandasWindowAggregation(WindowAggregationFeatureGroup):
         """PyArrow parity: sort within each partition for first/last semantics,
         then restore input row order via sort_index()."""
         pandas_func = PANDAS_AGG_FUNCS[agg_type]
-        sorted_data = data.sort_values(order_by, na_position="last")
+        sorted_data = narrow_frame(data, [*partition_by, order_by, source_col]).sort_values(
+            order_by, na_position="last"
+        )
         grouped = null_safe_groupby(sorted_data, partition_by, source_col)
         result_series = grouped.transform(pandas_func)
-
-        data = data.copy()
-        data[feature_name] = result_series.sort_index()
-        return data
+        return with_columns(data, {feature_name: result_series.sort_index().set_axis(data.index)})
@@ -9,12 +9,12 @@ import polars as pl
 from mloda.provider import ComputeFramework
 from mloda_plugins.compute_framework.base_implementations.polars.lazy_dataframe import PolarsLazyDataFrame
 
+from mloda.community.feature_groups.data_operations.aggregation_base import AggregationRequest
 from mloda.community.feature_groups.data_operations.errors import unsupported_agg_type_error
-from mloda.community.feature_groups.data_operations.mask_utils import _POLARS_MASK_TMP, apply_polars_mask
+from mloda.community.feature_groups.data_operations.mask_utils import apply_polars_mask_columns
 from mloda.community.feature_groups.data_operations.polars_mode_helpers import (
     ModeHelperCols,
     add_mode_helper_cols,
-    drop_mode_helper_cols,
     mode_window_expr,
 )
 from mloda.community.feature_groups.data_operations.row_preserving.window_aggregation.base import (
@@ -59,35 +59,61 @@ class PolarsLazyWindowAggregation(WindowAggregationFeatureGroup):
         order_by: str | None = None,
         mask_spec: list[tuple[str, str, Any]] | None = None,
     ) -> pl.LazyFrame:
-        actual_source = source_col
+        request = AggregationRequest(feature_name, source_col, agg_type)
+        return cls._compute_window_bucket(data, [request], partition_by, order_by, mask_spec)
+
+    @classmethod
+    def _compute_window_bucket(
+        cls,
+        data: pl.LazyFrame,
+        requests: list[AggregationRequest],
+        partition_by: list[str],
+        order_by: str | None = None,
+        mask_spec: list[tuple[str, str, Any]] | None = None,
+    ) -> pl.LazyFrame:
+        """All window expressions of the bucket in a single ``with_columns``.
+
+        Polars evaluates the expressions of one ``with_columns`` together and shares the
+        partition grouping between ``over`` expressions with the same keys.
+        """
+        for request in requests:
+            if request.agg_type not in _SUPPORTED_AGG_TYPES:
+                raise unsupported_agg_type_error(request.agg_type, _SUPPORTED_AGG_TYPES, framework="Polars")
+
+        taken = set(data.collect_schema().names()) | {request.feature_name for request in requests}
+        helper_cols: list[str] = []
+
+        sources = {request.source_col: request.source_col for request in requests}
         if mask_spec is not None:
-            data, actual_source = apply_polars_mask(data, source_col, mask_spec)
-
-        mode_cols: ModeHelperCols | None = None
-        if agg_type == "mode":
-            mode_cols = ModeHelperCols.pick(set(data.collect_schema().names()) | {feature_name})
-            data = add_mode_helper_cols(data, actual_source, partition_by, mode_cols)
-            expr = mode_window_expr(actual_source, partition_by, feature_name, mode_cols)
-        elif agg_type in ("first", "last"):
-            expr = cls._build_first_last_expr(actual_source, partition_by, agg_type, order_by, feature_name)
-        elif agg_type in _POLARS_AGG_EXPRS:
-            raw_expr = _POLARS_AGG_EXPRS[agg_type](actual_source).over(partition_by)
-            if agg_type == "sum":
-                # PyArrow parity: PyArrow sum() returns null for all-null
-                # groups. Polars sum() returns 0; correct to null by
-                # checking whether any non-null values exist.
-                has_values = pl.col(actual_source).count().over(partition_by) > 0
-                expr = pl.when(has_values).then(raw_expr).otherwise(None).alias(feature_name)
+            data, sources = apply_polars_mask_columns(data, list(sources), mask_spec, taken)
+            helper_cols.extend(sources.values())
+
+        exprs: list[pl.Expr] = []
+        for request in requests:
+            actual_source = sources[request.source_col]
+            feature_name = request.feature_name
+            agg_type = request.agg_type
+            if agg_type == "mode":
+                mode_cols = ModeHelperCols.pick(taken | set(helper_cols))
+                data = add_mode_helper_cols(data, actual_source, partition_by, mode_cols)
+                helper_cols.extend(mode_cols.as_list())
+                exprs.append(mode_window_expr(actual_source, partition_by, feature_name, mode_cols))
+            elif agg_type in ("first", "last"):
+                exprs.append(cls._build_first_last_expr(actual_source, partition_by, agg_type, order_by, feature_name))
             else:
-                expr = raw_expr.alias(feature_name)
-        else:
-            raise unsupported_agg_type_error(agg_type, _SUPPORTED_AGG_TYPES, framework="Polars")
+                raw_expr = _POLARS_AGG_EXPRS[agg_type](actual_source).over(partition_by)
+                if agg_type == "sum":
+                    # PyArrow parity: PyArrow sum() returns null for all-null
+                    # groups. Polars sum() returns 0; correct to null by
+                    # checking whether any non-null values exist.
+                    has_values = pl.col(actual_source).count().over(partition_by) > 0
+                    exprs.append(pl.when(has_values).then(raw_expr).otherwise(None).alias(feature_name))
+                else:
+                    exprs.append(raw_expr.alias(feature_name))
 
-        result = data.with_columns(expr)
-        if mode_cols is not None:
-            result = drop_mode_helper_cols(result, mode_cols)
-        if mask_spec is not None:
-            result = result.drop(_POLARS_MASK_TMP)
+        result = data.with_columns(exprs)
+        if helper_cols:
+            result = result.drop(helper_cols)
         return result
 
     @classmethod
@@ -3,7 +3,11 @@
 Uses PyArrow's native ``Table.group_by().aggregate()`` API for vectorized,
 C++-backed aggregation. The aggregate is computed per partition in C++ and
 then broadcast back to every row via an index-list collected during the
-same group_by call.
+same group_by call: the lists are flattened into a per-row group id and the
+aggregated column is gathered with a single ``take`` (see
+``broadcast_group_values``), so no Python object is created per group or row.
+All features of a bucket (shared partition_by, mask and order_by) are
+aggregated by that one group_by call.
 """
 
 from __future__ import annotations
@@ -16,9 +20,11 @@ import pyarrow.compute as pc
 from mloda.provider import ComputeFramework
 from mloda_plugins.compute_framework.base_implementations.pyarrow.table import PyArrowTable
 
+from mloda.community.feature_groups.data_operations.aggregation_base import AggregationRequest
 from mloda.community.feature_groups.data_operations.errors import unsupported_agg_type_error
 from mloda.community.feature_groups.data_operations.helper_columns import unique_helper_name
-from mloda.community.feature_groups.data_operations.mask_utils import apply_pyarrow_mask
+from mloda.community.feature_groups.data_operations.mask_utils import apply_pyarrow_mask_columns
+from mloda.community.feature_groups.data_operations.pyarrow_helpers import broadcast_group_values, fused_group_by
 from mloda.community.feature_groups.data_operations.row_preserving.window_aggregation.base import (
     WindowAggregationFeatureGroup,
 )
@@ -70,94 +76,62 @@ class PyArrowWindowAggregation(WindowAggregationFeatureGroup):
         order_by: str | None = None,
         mask_spec: list[tuple[str, str, Any]] | None = None,
     ) -> pa.Table:
-        # ``idx_col`` itself is collision-free, but the group-by below derives
-        # ``f"{idx_col}_list"`` (and ``agg_col = f"{source_col}_{pa_func}"``) on the
-        # grouped table without re-checking. These derived names are assumed absent
-        # from the input; a user column named exactly ``{idx_col}_list`` could shadow
-        # the list column. This is the same naming assumption as the pre-existing
-        # ``agg_col`` and is not separately guarded.
-        idx_col = unique_helper_name("__mloda_wa_idx__", set(table.column_names) | {feature_name})
-
-        if mask_spec is not None:
-            table = apply_pyarrow_mask(table, source_col, mask_spec)
-
-        num_rows = table.num_rows
-        t_with_idx = table.append_column(idx_col, pa.array(range(num_rows)))
-
-        if agg_type in _PA_AGG_FUNCS:
-            pa_func = _PA_AGG_FUNCS[agg_type]
-            grouped = t_with_idx.group_by(partition_by).aggregate(
-                [
-                    (source_col, pa_func),
-                    (idx_col, "list"),
-                ]
-            )
-            agg_col = f"{source_col}_{pa_func}"
-
-        elif agg_type in _VARIANCE_FUNCS:
-            pa_func, ddof = _VARIANCE_FUNCS[agg_type]
-            grouped = t_with_idx.group_by(partition_by).aggregate(
-                [
-                    (source_col, pa_func, pc.VarianceOptions(ddof=ddof)),
-                    (idx_col, "list"),
-                ]
-            )
-            agg_col = f"{source_col}_{pa_func}"
-
-        elif agg_type in _ORDERED_FUNCS:
-            return cls._compute_ordered(t_with_idx, feature_name, source_col, partition_by, agg_type, order_by, idx_col)
-
-        else:
-            raise unsupported_agg_type_error(agg_type, _SUPPORTED_AGG_TYPES, framework="PyArrow")
-
-        return cls._broadcast(table, grouped, agg_col, feature_name, num_rows, idx_col)
+        request = AggregationRequest(feature_name, source_col, agg_type)
+        return cls._compute_window_bucket(table, [request], partition_by, order_by, mask_spec)
 
     @classmethod
-    def _compute_ordered(
+    def _compute_window_bucket(
         cls,
-        t_with_idx: pa.Table,
-        feature_name: str,
-        source_col: str,
+        table: pa.Table,
+        requests: list[AggregationRequest],
         partition_by: list[str],
-        agg_type: str,
-        order_by: str | None,
-        idx_col: str,
+        order_by: str | None = None,
+        mask_spec: list[tuple[str, str, Any]] | None = None,
     ) -> pa.Table:
-        pa_func = _ORDERED_FUNCS[agg_type]
-        sort_keys = [(col, "ascending") for col in partition_by]
-        if order_by:
-            sort_keys.append((order_by, "ascending"))
-        indices = pc.sort_indices(t_with_idx, sort_keys=sort_keys, null_placement="at_end")
-        sorted_t = t_with_idx.take(indices)
-
-        grouped = sorted_t.group_by(partition_by, use_threads=False).aggregate(
-            [
-                (source_col, pa_func),
-                (idx_col, "list"),
-            ]
-        )
-        agg_col = f"{source_col}_{pa_func}"
+        """One ``group_by`` for the whole bucket, then one broadcast ``take`` per feature.
 
-        original_table = t_with_idx.drop_columns([idx_col])
-        return cls._broadcast(original_table, grouped, agg_col, feature_name, original_table.num_rows, idx_col)
+        The row-index ``list`` aggregate rides along in the same group_by, so the keys are
+        hashed once however many features the bucket holds. Masking and the first/last
+        sort happen on a working table; the results are appended to the input table.
+        """
+        aggregations = [(request.source_col, *cls._pa_aggregation(request.agg_type)) for request in requests]
+        ordered = any(request.agg_type in _ORDERED_FUNCS for request in requests)
 
-    @classmethod
-    def _broadcast(
-        cls,
-        original_table: pa.Table,
-        grouped: pa.Table,
-        agg_col: str,
-        feature_name: str,
-        num_rows: int,
-        idx_col: str,
-    ) -> pa.Table:
-        idx_list_col = f"{idx_col}_list"
-        result_values: list[Any] = [None] * num_rows
+        taken = set(table.column_names) | {request.feature_name for request in requests}
+        idx_col = unique_helper_name("__mloda_wa_idx__", taken)
 
-        for g in range(grouped.num_rows):
-            agg_val = grouped.column(agg_col)[g].as_py()
-            indices = grouped.column(idx_list_col)[g].as_py()
-            for idx in indices:
-                result_values[idx] = agg_val
+        work = table
+        if mask_spec is not None:
+            work = apply_pyarrow_mask_columns(work, [request.source_col for request in requests], mask_spec)
+        work = work.append_column(idx_col, pa.array(range(table.num_rows), type=pa.int64()))
+
+        if ordered:
+            # first/last read the group in row order, so sort by [*partition_by, order_by]
+            # (nulls last) and aggregate single-threaded to keep that order.
+            sort_keys = [(col, "ascending") for col in partition_by]
+            if order_by:
+                sort_keys.append((order_by, "ascending"))
+            work = work.take(pc.sort_indices(work, sort_keys=sort_keys, null_placement="at_end"))
+
+        grouped, output_cols = fused_group_by(
+            work, partition_by, [*aggregations, (idx_col, "list", None)], use_threads=not ordered
+        )
+        row_lists = grouped.column(output_cols[-1])
 
-        return original_table.append_column(feature_name, pa.array(result_values))
+        for request, output_col in zip(requests, output_cols):
+            table = table.append_column(
+                request.feature_name, broadcast_group_values(grouped.column(output_col), row_lists)
+            )
+        return table
+
+    @staticmethod
+    def _pa_aggregation(agg_type: str) -> tuple[str, pc.FunctionOptions | None]:
+        """PyArrow hash-aggregate function name and options for *agg_type*."""
+        if agg_type in _PA_AGG_FUNCS:
+            return _PA_AGG_FUNCS[agg_type], None
+        if agg_type in _VARIANCE_FUNCS:
+            pa_func, ddof = _VARIANCE_FUNCS[agg_type]
+            return pa_func, pc.VarianceOptions(ddof=ddof)
+        if agg_type in _ORDERED_FUNCS:
+            return _ORDERED_FUNCS[agg_type], None
+        raise unsupported_agg_type_error(agg_type, _SUPPORTED_AGG_TYPES, framework="PyArrow")
@@ -20,6 +20,7 @@ from mloda_plugins.compute_framework.base_implementations.python_dict.python_dic
 )
 from mloda_plugins.compute_framework.base_implementations.python_dict.python_dict_utils import row_count
 
+from mloda.community.feature_groups.data_operations.aggregation_base import AggregationRequest
 from mloda.community.feature_groups.data_operations.errors import unsupported_agg_type_error
 from mloda.community.feature_groups.data_operations.mask_utils import build_mask_from_spec
 from mloda.community.feature_groups.data_operations.python_dict_helpers import (
@@ -53,20 +54,37 @@ class PythonDictWindowAggregation(WindowAggregationFeatureGroup):
         order_by: str | None = None,
         mask_spec: list[tuple[str, str, Any]] | None = None,
     ) -> dict[str, list[Any]]:
-        if agg_type not in SUPPORTED_AGG_TYPES:
-            raise unsupported_agg_type_error(agg_type, SUPPORTED_AGG_TYPES, framework="PythonDict")
+        request = AggregationRequest(feature_name, source_col, agg_type)
+        return cls._compute_window_bucket(data, [request], partition_by, order_by, mask_spec)
+
+    @classmethod
+    def _compute_window_bucket(
+        cls,
+        data: dict[str, list[Any]],
+        requests: list[AggregationRequest],
+        partition_by: list[str],
+        order_by: str | None = None,
+        mask_spec: list[tuple[str, str, Any]] | None = None,
+    ) -> dict[str, list[Any]]:
+        """Group the rows once and reduce every request of the bucket against that grouping."""
+        for request in requests:
+            if request.agg_type not in SUPPORTED_AGG_TYPES:
+                raise unsupported_agg_type_error(request.agg_type, SUPPORTED_AGG_TYPES, framework="PythonDict")
 
         partition_by = list(partition_by)
         num_rows = row_count(data)
-        source_values = data[source_col]
 
-        if mask_spec is not None:
-            mask = build_mask_from_spec(PythonDictMaskEngine, data, mask_spec)
-            source_values = [v if m else None for v, m in zip(source_values, mask)]
+        mask = build_mask_from_spec(PythonDictMaskEngine, data, mask_spec) if mask_spec is not None else None
+        source_values: dict[str, list[Any]] = {}
+        for request in requests:
+            if request.source_col not in source_values:
+                values = data[request.source_col]
+                if mask is not None:
+                    values = [v if m else None for v, m in zip(values, mask)]
+                source_values[request.source_col] = values
 
         partition_cols = [data[col] for col in partition_by]
         order_vals: list[Any] | None = data[order_by] if order_by is not None else None
-        needs_order = order_vals is not None and agg_type in _ORDER_DEPENDENT_AGG_TYPES
 
         # order_val is carried along but only consulted below for first/last;
         # every other aggregation type is order-independent.
@@ -76,17 +94,23 @@ class PythonDictWindowAggregation(WindowAggregationFeatureGroup):
             order_val = order_vals[i] if order_vals is not None else None
             groups.setdefault(key, []).append((i, order_val))
 
-        result_values: list[Any] = [None] * num_rows
+        result_values = {request.feature_name: [None] * num_rows for request in requests}
 
         for rows in groups.values():
-            if needs_order:
+            ordered_rows = None
+            if order_vals is not None:
                 # Stable-sort ascending, nulls last, before reducing first/last.
-                rows = sorted(rows, key=lambda r: nulls_last_sort_key(r[1]))
-            values = [source_values[i] for i, _ in rows]
-            reduced = reduce_agg(agg_type, values)
-            for i, _ in rows:
-                result_values[i] = reduced
+                ordered_rows = sorted(rows, key=lambda r: nulls_last_sort_key(r[1]))
+            for request in requests:
+                source = source_values[request.source_col]
+                reduce_rows = rows
+                if ordered_rows is not None and request.agg_type in _ORDER_DEPENDENT_AGG_TYPES:
+                    reduce_rows = ordered_rows
+                reduced = reduce_agg(request.agg_type, [source[i] for i, _ in reduce_rows])
+                feature_values = result_values[request.feature_name]
+                for i, _ in rows:
+                    feature_values[i] = reduced
 
         result = dict(data)
-        result[feature_name] = result_values
+        result.update(result_values)
         return result
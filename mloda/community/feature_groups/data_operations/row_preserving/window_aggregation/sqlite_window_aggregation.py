@@ -6,9 +6,11 @@ from typing import Any
 
 from mloda.provider import ComputeFramework
 from mloda_plugins.compute_framework.base_implementations.sql.sql_utils import pick_helper_column_name, quote_ident
+from mloda_plugins.compute_framework.base_implementations.sql.sql_window import render_over_clause
 from mloda_plugins.compute_framework.base_implementations.sqlite.sqlite_framework import SqliteFramework
 from mloda_plugins.compute_framework.base_implementations.sqlite.sqlite_relation import SqliteRelation
 
+from mloda.community.feature_groups.data_operations.aggregation_base import AggregationRequest
 from mloda.community.feature_groups.data_operations.errors import unsupported_agg_type_error
 from mloda.community.feature_groups.data_operations.mask_utils import build_sql_case_when
 from mloda.community.feature_groups.data_operations.row_preserving.window_aggregation.base import (
@@ -46,22 +48,40 @@ class SqliteWindowAggregation(WindowAggregationFeatureGroup):
         order_by: str | None = None,
         mask_spec: list[tuple[str, str, Any]] | None = None,
     ) -> SqliteRelation:
-        agg_func = _SQLITE_AGG_FUNCS.get(agg_type)
-        if agg_func is None:
-            raise unsupported_agg_type_error(agg_type, _SQLITE_AGG_FUNCS.keys(), framework="SQLite")
+        request = AggregationRequest(feature_name, source_col, agg_type)
+        return cls._compute_window_bucket(data, [request], partition_by, order_by, mask_spec)
 
-        quoted_source = quote_ident(source_col)
-
-        source_sql = quoted_source
-        if mask_spec is not None:
-            source_sql = build_sql_case_when(mask_spec, quoted_source)
+    @classmethod
+    def _compute_window_bucket(
+        cls,
+        data: SqliteRelation,
+        requests: list[AggregationRequest],
+        partition_by: list[str],
+        order_by: str | None = None,
+        mask_spec: list[tuple[str, str, Any]] | None = None,
+    ) -> SqliteRelation:
+        """All window expressions of the bucket in one SELECT sharing one OVER clause."""
+        existing = {c.casefold() for c in data.columns}
+        over_sql = render_over_clause(partition_by, (), None)
+        projections = []
+        for request in requests:
+            agg_func = _SQLITE_AGG_FUNCS.get(request.agg_type)
+            if agg_func is None:
+                raise unsupported_agg_type_error(request.agg_type, _SQLITE_AGG_FUNCS.keys(), framework="SQLite")
+            if request.feature_name.casefold() in existing:
+                raise ValueError(f"Column {request.feature_name!r} already exists in the relation")
+            source_sql = quote_ident(request.source_col)
+            if mask_spec is not None:
+                source_sql = build_sql_case_when(mask_spec, source_sql)
+            projections.append(f"{agg_func}({source_sql}) OVER ({over_sql}) AS {quote_ident(request.feature_name)}")
 
-        # Tag each row with its original (rowid) order so the partitioned aggregate
+        # Tag each row with its original (rowid) order so the partitioned aggregates
         # can be reordered back to the input order, matching the previous append_column
-        # behaviour. The window itself is computed natively by SqliteRelation.window().
+        # behaviour.
         original_cols = list(data.columns)
-        rn = pick_helper_column_name(taken=set(data.columns) | {feature_name})
+        feature_names = [request.feature_name for request in requests]
+        rn = pick_helper_column_name(taken=set(data.columns) | set(feature_names))
         rel = data.with_row_number(rn, order_by=["rowid"])
-        rel = rel.window(f"{agg_func}({source_sql})", feature_name, partition_by=partition_by)
+        rel = rel.select(_raw_sql=f"*, {', '.join(projections)}")
         rel = rel.order(rn)
-        return rel.select(*original_cols, feature_name)
+        return rel.select(*original_cols, *feature_names)
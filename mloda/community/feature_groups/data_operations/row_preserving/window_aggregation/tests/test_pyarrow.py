@@ -4,10 +4,13 @@ from __future__ import annotations
 
 from typing import Any
 
+import pyarrow as pa
+
 from mloda.core.abstract_plugins.components.options import Options
 from mloda.community.feature_groups.data_operations.row_preserving.window_aggregation.pyarrow_window_aggregation import (
     PyArrowWindowAggregation,
 )
+from mloda.testing.feature_groups.data_operations.helpers import make_feature_set
 from mloda.testing.feature_groups.data_operations.mixins.capability import CapabilityHookTestMixin
 from mloda.testing.feature_groups.data_operations.mixins.pyarrow import PyArrowTestMixin
 from mloda.testing.feature_groups.data_operations.row_preserving.window_aggregation.window_aggregation import (
@@ -45,3 +48,25 @@ class TestPyArrowWindowAggregation(CapabilityHookTestMixin, PyArrowTestMixin, Wi
             "first",
             "last",
         }
+
+
+class TestPyArrowWindowAggregationBroadcast:
+    """The Arrow-native broadcast keeps the aggregate's own type and the input row order."""
+
+    def test_broadcast_keeps_aggregate_type(self) -> None:
+        table = pa.table({"g": ["a", "b", "a", "b"], "v": pa.array([3, None, 1, None], type=pa.int32())})
+        fs = make_feature_set("v__min_window", partition_by=["g"])
+        result = PyArrowWindowAggregation.calculate_feature(table, fs)
+        assert result.column("v__min_window").type == pa.int32()
+        assert result.column("v__min_window").to_pylist() == [1, None, 1, None]
+
+    def test_first_broadcast_over_chunked_table(self) -> None:
+        table = pa.concat_tables(
+            [
+                pa.table({"g": ["a", "b"], "t": [2, 1], "v": [10, 20]}),
+                pa.table({"g": ["b", "a"], "t": [0, 1], "v": [30, 40]}),
+            ]
+        )
+        fs = make_feature_set("v__first_window", partition_by=["g"], order_by="t")
+        result = PyArrowWindowAggregation.calculate_feature(table, fs)
+        assert result.column("v__first_window").to_pylist() == [40, 30, 30, 40]
@@ -0,0 +1,179 @@
+"""Hash-partitioned multi-process execution for partitioned data operations.
+
+Aggregation, rank and frame_aggregate compute every ``partition_by`` key independently
+of every other key. Their PythonDict backends run one single-threaded Python loop and
+their pandas backends hold the GIL for much of the work, so one process uses one core.
+Setting the ``shards`` option to K opts a feature into splitting the work instead:
+
+1. the rows are hash-split by their partition key into K shards, so every partition
+   lands whole in one shard (null and NaN keys hash as the partition they form);
+2. the backend's own ``_compute_*`` kernel runs on each non-empty shard, in a process
+   pool shared by all sharded runs;
+3. the shard results are stitched back: row-preserving results into the original row
+   order, group-reducing results into the group order the backend would have produced.
+
+The result is the same as the unsharded run. Shards are shipped to the workers by
+pickling (pandas and plain lists pickle their buffers in bulk), so sharding pays off
+when the per-row compute dominates the copy, i.e. for large tables with many partitions.
+A table with a single partition (or no ``partition_by``) runs in-process.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+from collections.abc import Callable, Hashable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+from mloda.provider import record_match_rejection
+
+from mloda.community.feature_groups.data_operations.python_dict_helpers import group_key_value
+
+SHARDS = "shards"
+"""Config key for the number of hash shards a partitioned operation is split into (opt-in).
+
+Used by: aggregation, rank, frame_aggregate.
+"""
+
+
+@dataclass(frozen=True)
+class ShardPlan:
+    """Rows of each non-empty shard, ascending, and what the backend needs to reorder groups.
+
+    ``group_order`` is backend-specific and only read by ``ShardFrameOps.concat_groups``.
+    """
+
+    row_lists: list[Any]
+    group_order: Any = None
+
+
+class ShardFrameOps:
+    """The few table operations sharding needs, implemented once per backend."""
+
+    @classmethod
+    def plan(cls, data: Any, partition_by: list[str], shards: int) -> ShardPlan:
+        """Hash-split the rows of ``data`` by their ``partition_by`` key into at most ``shards`` shards."""
+        raise NotImplementedError
+
+    @classmethod
+    def take(cls, data: Any, rows: Any) -> Any:
+        """The ``rows`` of ``data``, in that order, as a standalone table."""
+        raise NotImplementedError
+
+    @classmethod
+    def stitch_rows(cls, data: Any, parts: list[Any], plan: ShardPlan) -> Any:
+        """Row-preserving shard results, put back in the row order (and index) of ``data``."""
+        raise NotImplementedError
+
+    @classmethod
+    def concat_groups(cls, parts: list[Any], partition_by: list[str], plan: ShardPlan) -> Any:
+        """Group-reducing shard results as one table, groups in the backend's unsharded order."""
+        raise NotImplementedError
+
+
+class PythonDictShardFrame(ShardFrameOps):
+    """``ShardFrameOps`` for PythonDict; groups come back in first-appearance order."""
+
+    @classmethod
+    def plan(cls, data: dict[str, list[Any]], partition_by: list[str], shards: int) -> ShardPlan:
+        columns = [data[col] for col in partition_by]
+        num_rows = len(columns[0]) if columns else len(next(iter(data.values()), []))
+        row_lists: list[list[int]] = [[] for _ in range(shards)]
+        first_row: dict[Hashable, int] = {}
+        for i in range(num_rows):
+            key = tuple(group_key_value(col[i]) for col in columns)
+            first_row.setdefault(key, i)
+            row_lists[hash(key) % shards].append(i)
+        return ShardPlan([rows for rows in row_lists if rows], first_row)
+
+    @classmethod
+    def take(cls, data: dict[str, list[Any]], rows: list[int]) -> dict[str, list[Any]]:
+        return {col: [values[i] for i in rows] for col, values in data.items()}
+
+    @classmethod
+    def stitch_rows(
+        cls, data: dict[str, list[Any]], parts: list[dict[str, list[Any]]], plan: ShardPlan
+    ) -> dict[str, list[Any]]:
+        num_rows = sum(len(rows) for rows in plan.row_lists)
+        result: dict[str, list[Any]] = {}
+        for col in parts[0]:
+            values: list[Any] = [None] * num_rows
+            for part, rows in zip(parts, plan.row_lists):
+                for row, value in zip(rows, part[col]):
+                    values[row] = value
+            result[col] = values
+        return result
+
+    @classmethod
+    def concat_groups(
+        cls, parts: list[dict[str, list[Any]]], partition_by: list[str], plan: ShardPlan
+    ) -> dict[str, list[Any]]:
+        first_row: dict[Hashable, int] = plan.group_order
+        rows = [(part, i) for part in parts for i in range(len(part[partition_by[0]]))]
+        rows.sort(key=lambda row: first_row[tuple(group_key_value(row[0][col][row[1]]) for col in partition_by)])
+        return {col: [part[col][i] for part, i in rows] for col in parts[0]}
+
+
+def shards_supported(feature_group: type[Any], options: Any) -> bool:
+    """False (with a recorded rejection) when ``shards`` is set but the backend cannot shard."""
+    if options.get(SHARDS) is None or getattr(feature_group, "SHARD_FRAME_OPS", None) is not None:
+        return True
+    record_match_rejection(
+        feature_group.get_class_name(),
+        f"option '{SHARDS}' is set but this compute framework does not run sharded",
+    )
+    return False
+
+
+_POOLS: dict[int, ProcessPoolExecutor] = {}
+
+
+def shard_pool(max_workers: int) -> Executor:
+    """The process pool sharded runs with up to ``max_workers`` workers share; created on first use.
+
+    Workers start through ``forkserver`` where the platform has it (``spawn`` elsewhere),
+    never by forking the calling process, which may hold threads of its own.
+    """
+    pool = _POOLS.get(max_workers)
+    if pool is None:
+        method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        pool = _POOLS[max_workers] = ProcessPoolExecutor(max_workers, mp_context=multiprocessing.get_context(method))
+    return pool
+
+
+def shutdown_shard_pools() -> None:
+    """Stop every shard pool's workers; the next sharded run starts a new pool."""
+    while _POOLS:
+        _, pool = _POOLS.popitem()
+        pool.shutdown()
+
+
+def run_sharded(
+    ops: type[ShardFrameOps] | None,
+    data: Any,
+    partition_by: list[str],
+    shards: int,
+    compute: Callable[[Any], Any],
+    *,
+    reduces_rows: bool,
+) -> Any:
+    """Run ``compute`` (the backend kernel, picklable) on hash shards of ``data`` and stitch the results.
+
+    ``reduces_rows`` selects how results are stitched: one row per group for a
+    group-reducing operation, the input rows in input order otherwise.
+    """
+    if ops is None:
+        raise ValueError(f"this compute framework cannot run sharded ({SHARDS!r}).")
+    if shards < 2 or not partition_by:
+        return compute(data)
+    plan = ops.plan(data, partition_by, shards)
+    if len(plan.row_lists) < 2:
+        return compute(data)
+
+    pool = shard_pool(min(len(plan.row_lists), os.cpu_count() or 1))
+    parts = list(pool.map(compute, [ops.take(data, rows) for rows in plan.row_lists]))
+    if reduces_rows:
+        return ops.concat_groups(parts, partition_by, plan)
+    return ops.stitch_rows(data, parts, plan)
@@ -0,0 +1,166 @@
+"""Scoped cache of sort permutations for ordered row-preserving operations.
+
+Rank, offset, frame_aggregate, ffill, ema and sessionization all order their rows by
+``[*partition_by, order_by]`` before computing and restore the input order afterwards.
+A FeatureSet with N such features over the same keys would pay for N identical sorts.
+Each of those feature groups opens a ``sort_permutation_scope()`` around its
+``calculate_feature`` loop; inside the scope, backends fetch their ordering through
+``cached_sort_permutation``, so only the first feature sorts and the rest reuse the result.
+
+Entries are keyed by the identity of the key columns (never by column name alone, since
+every feature appends a column and hands the next feature a new table object) plus the
+sort specification. The columns themselves are pinned by the entry, so an identity cannot
+be recycled for different data while the entry is alive. The cache is bounded by entry
+count and by approximate byte size (least recently used entries are evicted first) and
+is emptied when the outermost scope exits, so nothing outlives one ``calculate_feature``.
+Outside any scope, ``cached_sort_permutation`` simply computes.
+
+Backends that group rather than sort (the pandas rank, window_aggregation and percentile
+backends) cache a ``Grouping`` the same way through ``cached_grouping``: the partition keys
+are factorized once per FeatureSet and every feature groups by the resulting codes.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, TypeVar, cast
+
+#: Default bounds of one scope's cache.
+DEFAULT_MAX_ENTRIES = 8
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class SortPermutation:
+    """One ordering of a table by ``[*partition_by, order_by]``.
+
+    ``forward[k]`` is the original row at sorted position ``k``; ``inverse[r]`` is the
+    sorted position of original row ``r``; ``boundaries`` holds the sorted position at
+    which each partition segment starts (ascending, first entry 0 for non-empty input).
+    The concrete array types are backend-specific. ``nbytes`` is the approximate memory
+    held by the three arrays and is what the cache budgets against.
+    """
+
+    forward: Any
+    inverse: Any
+    boundaries: Any
+    nbytes: int
+
+
+@dataclass(frozen=True)
+class Grouping:
+    """One grouping of a table's rows by ``partition_by``, null keys kept as a group of their own.
+
+    ``codes[r]`` is the group number of row ``r`` (``0 .. len(sizes) - 1``) and ``sizes[g]``
+    the number of rows of group ``g``. The concrete array types are backend-specific;
+    ``nbytes`` is the approximate memory held by both arrays.
+    """
+
+    codes: Any
+    sizes: Any
+    nbytes: int
+
+
+_Value = TypeVar("_Value", SortPermutation, Grouping)
+
+
+@dataclass
+class _Entry:
+    value: SortPermutation | Grouping
+    pins: tuple[Any, ...]
+
+
+class SortPermutationCache:
+    """LRU cache of ``SortPermutation`` and ``Grouping`` objects bounded by entry count and bytes."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    def get_or_compute(self, key: Hashable, pins: tuple[Any, ...], compute: Callable[[], _Value]) -> _Value:
+        """Return the cached value for ``key``, computing and storing it on a miss.
+
+        ``pins`` are the objects whose identity ``key`` was derived from; the entry keeps
+        them alive so the identity stays unambiguous for as long as the entry exists.
+        Callers put the kind of value in ``key``, so a key always maps to one type.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return cast(_Value, entry.value)
+
+        self.misses += 1
+        value = compute()
+        if value.nbytes > self.max_bytes or self.max_entries <= 0:
+            return value
+        self._entries[key] = _Entry(value, pins)
+        self._nbytes += value.nbytes
+        while len(self._entries) > self.max_entries or self._nbytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._nbytes -= evicted.value.nbytes
+        return value
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._nbytes = 0
+
+
+_ACTIVE_CACHE: ContextVar[SortPermutationCache | None] = ContextVar("mloda_sort_permutation_cache", default=None)
+
+
+@contextmanager
+def sort_permutation_scope(
+    max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES
+) -> Iterator[SortPermutationCache]:
+    """Activate a sort-permutation cache for the enclosed block.
+
+    A nested scope reuses the enclosing cache (and its bounds), so a caller may open a
+    wider scope, e.g. around a whole run, and the per-``calculate_feature`` scopes inside
+    it share one cache. The cache is cleared when the outermost scope exits.
+    """
+    active = _ACTIVE_CACHE.get()
+    if active is not None:
+        yield active
+        return
+
+    cache = SortPermutationCache(max_entries, max_bytes)
+    token = _ACTIVE_CACHE.set(cache)
+    try:
+        yield cache
+    finally:
+        _ACTIVE_CACHE.reset(token)
+        cache.clear()
+
+
+def cached_sort_permutation(
+    key: Hashable, pins: tuple[Any, ...], compute: Callable[[], SortPermutation]
+) -> SortPermutation:
+    """Look ``key`` up in the active scope's cache, or just ``compute()`` outside any scope."""
+    cache = _ACTIVE_CACHE.get()
+    if cache is None:
+        return compute()
+    return cache.get_or_compute(key, pins, compute)
+
+
+def cached_grouping(key: Hashable, pins: tuple[Any, ...], compute: Callable[[], Grouping]) -> Grouping:
+    """Look ``key`` up in the active scope's cache, or just ``compute()`` outside any scope."""
+    cache = _ACTIVE_CACHE.get()
+    if cache is None:
+        return compute()
+    return cache.get_or_compute(key, pins, compute)
@@ -0,0 +1,80 @@
+"""Shared SQLite helper utilities for appending computed columns in-database.
+
+Element-wise SQLite backends used to run ``SELECT expr FROM t``, pull every value
+into Python with ``fetchall()`` and push it back through
+``SqliteRelation.append_column``. ``append_sql_column`` instead projects
+``*, expr AS feature`` as a view, so the values never leave SQLite. A plain
+projection keeps the relation's scan order, which is the same positional
+contract ``append_column`` relies on (it aligns by ``ROW_NUMBER() OVER ()``).
+
+The caller declares the new column's Arrow type, derived from the source column
+types (``column_type``) and the operation, so no data is read to type it.
+"""
+
+from __future__ import annotations
+
+import pyarrow as pa
+from mloda_plugins.compute_framework.base_implementations.sql.sql_utils import quote_ident
+from mloda_plugins.compute_framework.base_implementations.sqlite.sqlite_relation import SqliteRelation, _next_table_name
+
+
+class _AppendedColumnRelation(SqliteRelation):
+    """View over ``source``'s columns plus one computed column of a declared Arrow type.
+
+    Type hints decide how ``to_arrow_table`` types each column (e.g. ISO-text
+    timestamps back to timestamps). A view built from raw SQL has none, so it
+    takes ``source``'s hints followed by ``arrow_type``.
+    """
+
+    def __init__(self, source: SqliteRelation, table_name: str, arrow_type: pa.DataType) -> None:
+        source_types = source._type_hints_for_current_columns()
+        types = None if source_types is None else [*source_types, arrow_type]
+        super().__init__(source.connection, table_name, _is_view=True, _types=types)
+
+    @classmethod
+    def from_query(
+        cls, source: SqliteRelation, feature_name: str, query: str, arrow_type: pa.DataType
+    ) -> SqliteRelation:
+        source._ensure_column_absent(feature_name)
+        new_name = _next_table_name()
+        source.connection.execute(f"CREATE TEMP VIEW {quote_ident(new_name)} AS {query}")  # nosec
+        relation = cls(source, new_name, arrow_type)
+        # A plain column projection hands back an ordinary SqliteRelation carrying the hints.
+        return relation.select(*relation.columns)
+
+
+def column_type(data: SqliteRelation, column: str) -> pa.DataType:
+    """Declared Arrow type of *column*: the relation's type hint, else its SQLite affinity."""
+    return dict(zip(data.columns, data.types, strict=True))[column]
+
+
+def arithmetic_result_type(op: str, *operand_types: pa.DataType) -> pa.DataType:
+    """Arrow type of ``a op b`` in SQLite: ``float64`` for ``divide`` or any float operand, else ``int64``."""
+    if op == "divide" or any(pa.types.is_floating(t) for t in operand_types):
+        return pa.float64()
+    return pa.int64()
+
+
+def append_sql_column(
+    data: SqliteRelation, feature_name: str, expression: str, arrow_type: pa.DataType
+) -> SqliteRelation:
+    """*data* plus ``expression AS feature_name`` of type *arrow_type*, computed lazily inside SQLite.
+
+    ``expression`` is inlined verbatim; callers build it from ``quote_ident``-quoted
+    identifiers and whitelisted SQL fragments only. Raises ``ValueError`` if
+    ``feature_name`` already names a column (case-insensitive), as ``append_column`` does.
+    """
+    query = f"SELECT *, {expression} AS {quote_ident(feature_name)} FROM {quote_ident(data.table_name)}"  # nosec
+    return _AppendedColumnRelation.from_query(data, feature_name, query, arrow_type)
+
+
+def append_sql_query_column(
+    data: SqliteRelation, feature_name: str, query: str, arrow_type: pa.DataType
+) -> SqliteRelation:
+    """*data* plus ``feature_name`` of type *arrow_type*, where *query* selects every column of *data* followed by it.
+
+    For results that need more than a per-row expression (window queries, subqueries).
+    *query* is wrapped in a view as-is and must keep *data*'s row order, e.g. by
+    numbering rows with ``ROW_NUMBER() OVER ()`` and ordering the outer select by it.
+    """
+    return _AppendedColumnRelation.from_query(data, feature_name, query, arrow_type)
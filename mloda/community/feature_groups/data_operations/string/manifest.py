@@ -1,24 +1,23 @@
 """Entry-point manifest for mloda-community-string.
 
-Lists the concrete FeatureGroup classes that mloda discovers via the
-``mloda.feature_groups`` entry point. Backends whose optional framework is not
-installed are skipped so the rest still register. See issue #271.
+Declares the concrete FeatureGroup classes that mloda discovers via the
+``mloda.feature_groups`` entry point as (module, class, framework) triples;
+importing this module imports no backend. Backends whose optional framework is
+not installed are skipped so the rest still register. See issue #271.
 """
 
 from __future__ import annotations
 
-from mloda.provider import FeatureGroup
+from mloda.community.feature_groups.data_operations.manifest_utils import LazyPluginManifest
 
-from mloda.community.feature_groups.data_operations.manifest_utils import load_plugin_classes
-
-FEATURE_GROUPS: list[type[FeatureGroup]] = load_plugin_classes(
+FEATURE_GROUPS = LazyPluginManifest(
     __package__ or __name__.rpartition(".")[0],
     [
-        ("duckdb_string", "DuckdbStringOps"),
-        ("pandas_string", "PandasStringOps"),
-        ("polars_lazy_string", "PolarsLazyStringOps"),
-        ("pyarrow_string", "PyArrowStringOps"),
-        ("python_dict_string", "PythonDictStringOps"),
-        ("sqlite_string", "SqliteStringOps"),
+        ("duckdb_string", "DuckdbStringOps", "DuckDBFramework"),
+        ("pandas_string", "PandasStringOps", "PandasDataFrame"),
+        ("polars_lazy_string", "PolarsLazyStringOps", "PolarsLazyDataFrame"),
+        ("pyarrow_string", "PyArrowStringOps", "PyArrowTable"),
+        ("python_dict_string", "PythonDictStringOps", "PythonDictFramework"),
+        ("sqlite_string", "SqliteStringOps", "SqliteFramework"),
     ],
 )
@@ -7,6 +7,7 @@ import pandas as pd
 from mloda.provider import ComputeFramework
 from mloda_plugins.compute_framework.base_implementations.pandas.dataframe import PandasDataFrame
 
+from mloda.community.feature_groups.data_operations.pandas_helpers import with_columns
 from mloda.community.feature_groups.data_operations.string.base import (
     StringFeatureGroup,
 )
@@ -25,20 +26,19 @@ class PandasStringOps(StringFeatureGroup):
         source_col: str,
         op: str,
     ) -> pd.DataFrame:
-        data = data.copy()
         col = data[source_col]
 
         if op == "upper":
-            data[feature_name] = col.str.upper()
+            result = col.str.upper()
         elif op == "lower":
-            data[feature_name] = col.str.lower()
+            result = col.str.lower()
         elif op == "trim":
-            data[feature_name] = col.str.strip()
+            result = col.str.strip()
         elif op == "length":
-            data[feature_name] = col.str.len()
+            result = col.str.len()
         elif op == "reverse":
-            data[feature_name] = col.str[::-1]
+            result = col.str[::-1]
         else:
             raise ValueError(f"Unsupported string operation: {op}")
 
-        return data
+        return with_columns(data, {feature_name: result})
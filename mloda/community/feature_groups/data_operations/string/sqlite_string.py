@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import pyarrow as pa
+
 from mloda.provider import ComputeFramework
 from mloda_plugins.compute_framework.base_implementations.sql.sql_utils import quote_ident
 from mloda_plugins.compute_framework.base_implementations.sqlite.sqlite_framework import SqliteFramework
 from mloda_plugins.compute_framework.base_implementations.sqlite.sqlite_relation import SqliteRelation
 
+from mloda.community.feature_groups.data_operations.sqlite_helpers import append_sql_column, column_type
 from mloda.community.feature_groups.data_operations.string.base import (
     StringFeatureGroup,
 )
@@ -48,19 +51,5 @@ class SqliteStringOps(StringFeatureGroup):
 
         quoted_source = quote_ident(source_col)
         expr = expr_template.format(col=quoted_source)
-        quoted_feature = quote_ident(feature_name)
-
-        sql = " ".join(
-            [
-                "SELECT",
-                f"{expr} AS {quoted_feature}",
-                "FROM",
-                f"{quote_ident(data.table_name)}",
-                "ORDER BY rowid",
-            ]
-        )
-        cursor = data.connection.execute(sql)
-        rows = cursor.fetchall()
-
-        result_values = [row[0] for row in rows]
-        return data.append_column(feature_name, result_values)
+        arrow_type = pa.int64() if op == "length" else column_type(data, source_col)
+        return append_sql_column(data, feature_name, expr, arrow_type)
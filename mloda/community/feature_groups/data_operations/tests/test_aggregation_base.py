@@ -0,0 +1,20 @@
+"""Unit tests for the shared aggregation planning helpers in ``aggregation_base``."""
+
+from __future__ import annotations
+
+from mloda.community.feature_groups.data_operations.aggregation_base import bucket_by_key
+
+
+class TestBucketByKey:
+    def test_groups_equal_keys_in_first_seen_order(self) -> None:
+        entries = [(("a",), 1), (("b",), 2), (("a",), 3)]
+        assert bucket_by_key(entries) == [(("a",), [1, 3]), (("b",), [2])]
+
+    def test_unhashable_keys(self) -> None:
+        mask = [("region", "is_in", ["A", "C"])]
+        entries = [((("region",), mask), "x"), ((("region",), None), "y"), ((("region",), list(mask)), "z")]
+        buckets = bucket_by_key(entries)
+        assert [items for _, items in buckets] == [["x", "z"], ["y"]]
+
+    def test_empty(self) -> None:
+        assert bucket_by_key([]) == []
@@ -0,0 +1,126 @@
+"""Accuracy of the approximate kernels on tables large enough for the sketches to summarize."""
+
+from __future__ import annotations
+
+import bisect
+import random
+from collections.abc import Iterator
+from typing import Any
+
+import duckdb
+import polars as pl
+import pyarrow as pa
+import pytest
+
+from mloda.testing.feature_groups.data_operations.helpers import extract_column, make_feature_set
+from mloda_plugins.compute_framework.base_implementations.duckdb.duckdb_relation import DuckdbRelation
+
+from mloda.community.feature_groups.data_operations.aggregation.duckdb_aggregation import DuckdbAggregation
+from mloda.community.feature_groups.data_operations.aggregation.polars_lazy_aggregation import (
+    PolarsLazyAggregation,
+)
+from mloda.community.feature_groups.data_operations.aggregation.python_dict_aggregation import (
+    PythonDictAggregation,
+)
+from mloda.community.feature_groups.data_operations.row_preserving.percentile.duckdb_percentile import (
+    DuckdbPercentile,
+)
+from mloda.community.feature_groups.data_operations.row_preserving.percentile.pyarrow_percentile import (
+    PyArrowPercentile,
+)
+from mloda.community.feature_groups.data_operations.row_preserving.scalar_aggregate.pyarrow_scalar_aggregate import (
+    PyArrowScalarAggregate,
+)
+
+_RNG = random.Random(7)
+_NUM_ROWS = 40_000
+# Four partitions of skewed values, with nulls and NaN the kernels must skip.
+_TABLE = pa.table(
+    {
+        "region": [f"r{i % 4}" for i in range(_NUM_ROWS)],
+        "value": [
+            None if i % 97 == 0 else float("nan") if i % 89 == 0 else _RNG.random() ** 3 * 100 for i in range(_NUM_ROWS)
+        ],
+        "code": [_RNG.randrange(_NUM_ROWS) for _ in range(_NUM_ROWS)],
+    }
+)
+
+
+@pytest.fixture
+def duckdb_table() -> Iterator[DuckdbRelation]:
+    conn = duckdb.connect(":memory:")
+    try:
+        yield DuckdbRelation.from_arrow(conn, _TABLE)
+    finally:
+        conn.close()
+
+
+def _sorted_partitions() -> dict[str, list[float]]:
+    groups: dict[str, list[float]] = {}
+    for region, value in zip(_TABLE.column("region").to_pylist(), _TABLE.column("value").to_pylist()):
+        if value is not None and value == value:
+            groups.setdefault(region, []).append(value)
+    return {region: sorted(values) for region, values in groups.items()}
+
+
+def _assert_rank_error_below(result: Any, feature_name: str, quantile: float, bound: float) -> None:
+    """Every row's quantile sits within ``bound`` of the requested rank in its partition."""
+    partitions = _sorted_partitions()
+    regions = extract_column(result, "region")
+    for region, value in set(zip(regions, extract_column(result, feature_name))):
+        ordered = partitions[region]
+        rank = bisect.bisect_left(ordered, value) / len(ordered)
+        assert abs(rank - quantile) < bound, (region, value, rank)
+
+
+def _run(impl: Any, data: Any, feature_name: str, **context: Any) -> Any:
+    return impl.calculate_feature(data, make_feature_set(feature_name, **context))
+
+
+class TestQuantileKernels:
+    @pytest.mark.parametrize("quantile", [0.05, 0.5, 0.95])
+    def test_pyarrow_percentile_rank_error(self, quantile: float) -> None:
+        name = f"value__p{round(quantile * 100)}_percentile"
+        result = _run(PyArrowPercentile, _TABLE, name, partition_by=["region"], approximate=True)
+        _assert_rank_error_below(result, name, quantile, 0.01)
+
+    def test_duckdb_percentile_rank_error(self, duckdb_table: DuckdbRelation) -> None:
+        result = _run(
+            DuckdbPercentile, duckdb_table, "value__p95_percentile", partition_by=["region"], approximate=True
+        )
+        _assert_rank_error_below(result, "value__p95_percentile", 0.95, 0.01)
+
+    def test_duckdb_median_aggregation_rank_error(self, duckdb_table: DuckdbRelation) -> None:
+        result = _run(DuckdbAggregation, duckdb_table, "value__median_agg", partition_by=["region"], approximate=True)
+        _assert_rank_error_below(result, "value__median_agg", 0.5, 0.01)
+
+    def test_pyarrow_scalar_median_rank_error(self) -> None:
+        result = _run(PyArrowScalarAggregate, _TABLE, "value__median_scalar", approximate=True)
+        ordered = sorted(value for values in _sorted_partitions().values() for value in values)
+        median = extract_column(result, "value__median_scalar")[0]
+        assert abs(bisect.bisect_left(ordered, median) / len(ordered) - 0.5) < 0.01
+
+
+class TestDistinctCountKernels:
+    def test_polars_nunique_relative_error(self) -> None:
+        frame = pl.from_arrow(_TABLE)
+        assert isinstance(frame, pl.DataFrame)
+        result = _run(
+            PolarsLazyAggregation, frame.lazy(), "code__nunique_agg", partition_by=["region"], approximate=True
+        )
+        exact = _run(PolarsLazyAggregation, frame.lazy(), "code__nunique_agg", partition_by=["region"])
+        for approximate, expected in zip(
+            extract_column(result, "code__nunique_agg"), extract_column(exact, "code__nunique_agg")
+        ):
+            assert abs(approximate - expected) / expected < 0.02
+
+    def test_duckdb_nunique_stays_exact(self, duckdb_table: DuckdbRelation) -> None:
+        result = _run(DuckdbAggregation, duckdb_table, "code__nunique_agg", partition_by=["region"], approximate=True)
+        exact = _run(DuckdbAggregation, duckdb_table, "code__nunique_agg", partition_by=["region"])
+        assert extract_column(result, "code__nunique_agg") == extract_column(exact, "code__nunique_agg")
+
+
+def test_backend_without_kernel_computes_exactly() -> None:
+    data = {"region": ["a", "a", "b"], "value": [1.0, 2.0, 5.0]}
+    result = _run(PythonDictAggregation, data, "value__median_agg", partition_by=["region"], approximate=True)
+    assert result["value__median_agg"] == [1.5, 5.0]
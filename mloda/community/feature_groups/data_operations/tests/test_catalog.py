@@ -96,7 +96,7 @@ class TestOperationInfoShape:
     def test_operation_info_field_names(self) -> None:
         """OperationInfo exposes exactly the documented fields."""
         field_names = {f.name for f in dataclasses.fields(OperationInfo)}
-        assert field_names == {"name", "prefix_pattern", "subtype_label", "subtypes", "frameworks"}
+        assert field_names == {"name", "prefix_pattern", "subtype_label", "subtypes", "frameworks", "approximate"}
 
     def test_operation_info_is_frozen(self) -> None:
         """OperationInfo instances are immutable (frozen dataclass)."""
@@ -121,6 +121,28 @@ class TestOperationInfoShape:
             info.frameworks["SqliteFramework"] = frozenset()  # type: ignore[index]
 
 
+class TestApproximateSupport:
+    def test_reports_the_approximated_subtypes_per_framework(self) -> None:
+        """Only frameworks with an approximate kernel appear, with the subtypes they approximate."""
+        assert dict(DataOperationsCatalog.get("aggregation").approximate) == {
+            "DuckDBFramework": frozenset({"median"}),
+            "PolarsLazyDataFrame": frozenset({"nunique"}),
+        }
+        assert dict(DataOperationsCatalog.get("scalar_aggregate").approximate) == {
+            "DuckDBFramework": frozenset({"median"}),
+            "PyArrowTable": frozenset({"median"}),
+        }
+
+    def test_subtype_less_operation_maps_to_none(self) -> None:
+        assert dict(DataOperationsCatalog.get("percentile").approximate) == {
+            "DuckDBFramework": None,
+            "PyArrowTable": None,
+        }
+
+    def test_operation_without_approximate_mode_is_empty(self) -> None:
+        assert not DataOperationsCatalog.get("rank").approximate
+
+
 # ---------------------------------------------------------------------------
 # DataOperationsCatalog.list()
 # ---------------------------------------------------------------------------
@@ -236,10 +258,14 @@ class TestEmaCell:
 
 class TestPercentileCell:
     def test_unimplemented_frameworks_are_absent(self) -> None:
-        """percentile has no SQLite or PyArrow implementation, so those keys are absent."""
+        """percentile has no SQLite implementation, so that key is absent."""
         info = DataOperationsCatalog.get("percentile")
         assert "SqliteFramework" not in info.frameworks
-        assert "PyArrowTable" not in info.frameworks
+
+    def test_pyarrow_is_present(self) -> None:
+        """percentile is implemented natively on PyArrow."""
+        info = DataOperationsCatalog.get("percentile")
+        assert "PyArrowTable" in info.frameworks
 
     def test_duckdb_is_present(self) -> None:
         """percentile is implemented on DuckDB."""
@@ -281,6 +307,11 @@ class TestRankCell:
         assert duckdb_set is not None
         assert "percent_rank" in duckdb_set
 
+    def test_pyarrow_supports_full_rank_type_set(self) -> None:
+        """PyArrow computes every rank type natively from one segmented sort."""
+        info = DataOperationsCatalog.get("rank")
+        assert info.frameworks["PyArrowTable"] == RANK_SUBTYPES
+
 
 class TestFrameAggregateCell:
     def test_subtype_label(self) -> None:
@@ -294,15 +325,13 @@ class TestFrameAggregateCell:
         assert len(info.subtypes) == 10
         assert set(info.subtypes) == set(FRAME_AGGREGATE_SUBTYPES)
 
-    def test_pandas_excludes_calendar_time_units(self) -> None:
-        """Pandas supports rolling and day frames but not month or year time units."""
+    def test_pandas_includes_calendar_time_units(self) -> None:
+        """Pandas supports rolling, day and the calendar month/year time units."""
         pytest.importorskip("pandas")
         info = DataOperationsCatalog.get("frame_aggregate")
         pandas_set = info.frameworks["PandasDataFrame"]
         assert pandas_set is not None
-        assert {"rolling", "time:day"} <= pandas_set
-        assert "time:month" not in pandas_set
-        assert "time:year" not in pandas_set
+        assert {"rolling", "time:day", "time:month", "time:year"} <= pandas_set
 
     def test_duckdb_includes_month_time_unit(self) -> None:
         """DuckDB supports calendar time units."""
@@ -312,10 +341,14 @@ class TestFrameAggregateCell:
         assert duckdb_set is not None
         assert "time:month" in duckdb_set
 
-    def test_pyarrow_is_absent(self) -> None:
-        """frame_aggregate has no PyArrow implementation, so the key is absent."""
+    def test_pyarrow_excludes_calendar_time_units(self) -> None:
+        """PyArrow supports every fixed-length frame but not month or year time units."""
         info = DataOperationsCatalog.get("frame_aggregate")
-        assert "PyArrowTable" not in info.frameworks
+        pyarrow_set = info.frameworks["PyArrowTable"]
+        assert pyarrow_set is not None
+        assert {"rolling", "cumulative", "expanding", "time:second", "time:week"} <= pyarrow_set
+        assert "time:month" not in pyarrow_set
+        assert "time:year" not in pyarrow_set
 
 
 class TestOffsetCell:
@@ -330,10 +363,10 @@ class TestOffsetCell:
         assert len(info.subtypes) == 6
         assert set(info.subtypes) == set(OFFSET_SUBTYPES)
 
-    def test_pyarrow_is_absent(self) -> None:
-        """offset has no PyArrow implementation, so the key is absent."""
+    def test_pyarrow_supports_full_offset_type_set(self) -> None:
+        """offset is implemented natively on PyArrow for every offset type."""
         info = DataOperationsCatalog.get("offset")
-        assert "PyArrowTable" not in info.frameworks
+        assert info.frameworks["PyArrowTable"] == frozenset(OFFSET_SUBTYPES)
 
 
 # ---------------------------------------------------------------------------
@@ -391,3 +424,39 @@ class TestIsSupported:
         assert "bogus" in message
         assert "median" in message
         assert "sum" in message
+
+
+# ---------------------------------------------------------------------------
+# DataOperationsCatalog.implementation()
+# ---------------------------------------------------------------------------
+
+
+class TestImplementation:
+    def test_returns_concrete_class_for_framework(self) -> None:
+        from mloda.community.feature_groups.data_operations.aggregation.base import AggregationFeatureGroup
+
+        concrete = DataOperationsCatalog.implementation("aggregation", "PyArrowTable")
+        assert issubclass(concrete, AggregationFeatureGroup)
+        assert concrete is not AggregationFeatureGroup
+
+    def test_framework_matches_case_insensitively(self) -> None:
+        assert DataOperationsCatalog.implementation("string", "sqliteframework") is (
+            DataOperationsCatalog.implementation("string", "SqliteFramework")
+        )
+
+    def test_every_catalog_framework_resolves(self) -> None:
+        for info in DataOperationsCatalog.list():
+            for framework in info.frameworks:
+                concrete = DataOperationsCatalog.implementation(info.name, framework)
+                assert framework in {fw.__name__ for fw in concrete.compute_framework_definition()}
+
+    def test_absent_framework_raises_value_error_listing_frameworks(self) -> None:
+        with pytest.raises(ValueError) as exc_info:
+            DataOperationsCatalog.implementation("percentile", "SqliteFramework")
+        message = str(exc_info.value)
+        assert "SqliteFramework" in message
+        assert "PyArrowTable" in message
+
+    def test_unknown_operation_raises_value_error(self) -> None:
+        with pytest.raises(ValueError, match="no_such_operation"):
+            DataOperationsCatalog.implementation("no_such_operation", "PyArrowTable")
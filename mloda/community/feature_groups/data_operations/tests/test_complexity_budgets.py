@@ -0,0 +1,111 @@
+"""Complexity budgets of data-operation backends and the scaling regression check.
+
+Every catalog cell (operation, subtype, framework) is timed at ``n`` and ``4 * n``
+rows; the fitted log-log slope must stay within the budget the backend class
+declares via ``COMPLEXITY`` / ``SUBTYPE_COMPLEXITY``. Cells declared
+``Complexity.QUADRATIC`` are known slow paths and are not timed.
+
+The timed sweep carries the ``scaling`` marker, which the default run deselects;
+``tox -e scaling`` runs it serially in its own CI job. The unit tests of the
+budgets and the exponent fit run by default.
+"""
+
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from mloda.community.feature_groups.data_operations import DataOperationsCatalog
+from mloda.community.feature_groups.data_operations.complexity import Complexity, complexity_budget
+from mloda.community.feature_groups.data_operations.row_preserving.frame_aggregate.duckdb_frame_aggregate import (
+    DuckdbFrameAggregate,
+)
+from mloda.testing.benchmarks.cases import BenchmarkCase, benchmark_cases
+from mloda.testing.benchmarks.complexity import ScalingMeasurement, fit_exponent, measure_scaling
+
+
+class TestComplexity:
+    def test_exponents(self) -> None:
+        assert Complexity.LINEAR.exponent(1000, 4) == 1.0
+        assert Complexity.QUADRATIC.exponent(1000, 4) == 2.0
+        assert 1.0 < Complexity.LINEARITHMIC.exponent(1000, 4) < 1.2
+
+    def test_default_budget_is_linearithmic(self) -> None:
+        class _Plain:
+            pass
+
+        assert complexity_budget(_Plain) is Complexity.LINEARITHMIC
+        assert complexity_budget(_Plain, "sum") is Complexity.LINEARITHMIC
+
+    def test_subtype_override(self) -> None:
+        class _Declared:
+            COMPLEXITY = Complexity.LINEAR
+            SUBTYPE_COMPLEXITY = {"time:day": Complexity.QUADRATIC}
+
+        assert complexity_budget(_Declared, "time:day") is Complexity.QUADRATIC
+        assert complexity_budget(_Declared, "rolling") is Complexity.LINEAR
+        assert complexity_budget(_Declared) is Complexity.LINEAR
+
+    def test_backend_declaration(self) -> None:
+        assert complexity_budget(DuckdbFrameAggregate, "time:day") is Complexity.QUADRATIC
+        assert complexity_budget(DuckdbFrameAggregate, "rolling") is Complexity.LINEARITHMIC
+
+
+class TestFitExponent:
+    @pytest.mark.parametrize("power", [1.0, 1.5, 2.0])
+    def test_recovers_power_law(self, power: float) -> None:
+        sizes = [100, 400, 1600]
+        assert math.isclose(fit_exponent(sizes, [size**power * 1e-6 for size in sizes]), power)
+
+    def test_needs_two_points(self) -> None:
+        with pytest.raises(ValueError):
+            fit_exponent([100], [0.1])
+
+    def test_quadratic_measurement_exceeds_linearithmic_budget(self) -> None:
+        measurement = ScalingMeasurement(
+            operation="frame_aggregate",
+            subtype="cumulative",
+            framework="PythonDictFramework",
+            sizes=(1000, 4000),
+            seconds=(0.01, 0.16),
+            exponent=fit_exponent((1000, 4000), (0.01, 0.16)),
+            budget=Complexity.LINEARITHMIC,
+            allowed_exponent=Complexity.LINEARITHMIC.exponent(1000, 4) + 0.4,
+        )
+        assert not measurement.within_budget
+        assert "O(n log n)" in measurement.describe()
+
+    def test_too_fast_to_measure_passes(self) -> None:
+        measurement = ScalingMeasurement(
+            operation="binning",
+            subtype="bin",
+            framework="PyArrowTable",
+            sizes=(1000, 4000),
+            seconds=(0.00001, 0.001),
+            exponent=3.3,
+            budget=Complexity.LINEAR,
+            allowed_exponent=1.4,
+        )
+        assert not measurement.measurable
+        assert measurement.within_budget
+
+
+def _budgeted_cells() -> list[tuple[BenchmarkCase, str]]:
+    cells = []
+    for case in benchmark_cases():
+        for framework in case.frameworks:
+            implementation = DataOperationsCatalog.implementation(case.operation, framework)
+            if complexity_budget(implementation, case.subtype) is not Complexity.QUADRATIC:
+                cells.append((case, framework))
+    return cells
+
+
+@pytest.mark.scaling
+@pytest.mark.parametrize(
+    ("case", "framework"),
+    [pytest.param(case, fw, id=f"{case.operation}-{case.subtype}-{fw}") for case, fw in _budgeted_cells()],
+)
+def test_scaling_within_declared_budget(case: BenchmarkCase, framework: str) -> None:
+    measurement = measure_scaling(case, framework)
+    assert measurement.within_budget, measurement.describe()
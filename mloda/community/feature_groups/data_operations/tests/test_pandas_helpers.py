@@ -2,16 +2,28 @@
 
 from __future__ import annotations
 
+from typing import Any
+
+import numpy as np
 import pytest
 
 pd = pytest.importorskip("pandas")
 
+from mloda.community.feature_groups.data_operations import DataOperationsCatalog
 from mloda.community.feature_groups.data_operations.pandas_helpers import (
     PANDAS_AGG_FUNCS,
     apply_null_safe_agg,
     coerce_count_dtype,
+    grouped_variance,
+    narrow_frame,
     null_safe_groupby,
+    partition_grouping,
+    with_columns,
 )
+from mloda.community.feature_groups.data_operations.sort_cache import sort_permutation_scope
+from mloda.testing.benchmarks.cases import benchmark_cases
+from mloda.testing.benchmarks.data import make_benchmark_table
+from mloda.testing.feature_groups.data_operations.helpers import make_feature_set, merge_feature_sets
 
 
 class TestPandasAggFuncs:
@@ -142,3 +154,145 @@ class TestCoerceCountDtype:
         original_dtype = df["feature"].dtype
         coerce_count_dtype(df, "feature", "sum")
         assert df["feature"].dtype == original_dtype
+
+
+def _lambda_variance(grouped: Any, pandas_func: str, ddof: int, method: str) -> Any:
+    """The per-group Python callable ``grouped_variance`` replaces, as the parity reference."""
+    return getattr(grouped, method)(lambda x: getattr(x, pandas_func)(ddof=ddof))
+
+
+class TestGroupedVariance:
+    VARIANTS = [
+        ("std", "std"),
+        ("var", "var"),
+        ("std_pop", "std"),
+        ("var_pop", "var"),
+        ("std_samp", "std"),
+        ("var_samp", "var"),
+    ]
+
+    @staticmethod
+    def _ill_conditioned_frame() -> Any:
+        """Values with a 1e9 offset and unit spread: sum(x**2) - sum(x)**2 / n loses every digit here."""
+        rng = np.random.default_rng(7)
+        n = 5000
+        values = 1e9 + rng.normal(size=n)
+        values[rng.random(n) < 0.1] = np.nan
+        keys = rng.choice(np.array(["a", "b", "c", None], dtype=object), n)
+        frame = pd.DataFrame({"key": keys, "val": values})
+        # A single-row group, and a group whose values are all null.
+        extra = pd.DataFrame({"key": ["single", "empty", "empty"], "val": [1e9 + 0.5, np.nan, np.nan]})
+        return pd.concat([frame, extra], ignore_index=True)
+
+    @pytest.mark.parametrize("method", ["agg", "transform"])
+    @pytest.mark.parametrize(("agg_type", "pandas_func"), VARIANTS)
+    def test_matches_lambda_path_on_ill_conditioned_data(self, agg_type: str, pandas_func: str, method: str) -> None:
+        grouped = self._ill_conditioned_frame().groupby("key", dropna=False)["val"]
+        ddof = 1 if agg_type.endswith("_samp") else 0
+        result = apply_null_safe_agg(grouped, pandas_func, agg_type, method=method)
+        expected = _lambda_variance(grouped, pandas_func, ddof, method)
+        pd.testing.assert_series_equal(result, expected, check_dtype=False, rtol=1e-9)
+
+    def test_ddof_edge_cases(self) -> None:
+        """count <= ddof and all-null groups are NaN; a single row has population variance 0."""
+        df = pd.DataFrame({"key": ["a", "b", "b"], "val": [5.0, np.nan, np.nan]})
+        grouped = df.groupby("key", dropna=False)["val"]
+        assert grouped_variance(grouped, 0).tolist() == [0.0, pytest.approx(np.nan, nan_ok=True)]
+        assert grouped_variance(grouped, 1).isna().all()
+
+    def test_agg_keeps_group_index_and_name(self) -> None:
+        df = pd.DataFrame({"k1": ["a", "a", None], "k2": [1, 1, 2], "val": [1.0, 3.0, 2.0]})
+        grouped = df.groupby(["k1", "k2"], dropna=False)["val"]
+        result = grouped_variance(grouped, 0, sqrt=True)
+        pd.testing.assert_index_equal(result.index, grouped.count().index)
+        assert result.name == "val"
+        assert result.tolist() == [1.0, 0.0]
+
+
+class TestPartitionGrouping:
+    def test_codes_and_sizes_keep_null_keys(self) -> None:
+        df = pd.DataFrame({"p": ["b", "a", None, "a", "b"], "q": [1, 1, 1, 1, 2]})
+        grouping = partition_grouping(df, ["p", "q"])
+        assert grouping.codes.tolist() == [1, 0, 3, 0, 2]
+        assert grouping.sizes.tolist() == [2, 1, 1, 1]
+
+    def test_reused_after_with_columns_and_narrow_frame(self) -> None:
+        df = pd.DataFrame({"p": ["a", "b", "a"], "n": [1, 2, 1], "v": [1.0, 2.0, 3.0]})
+        with sort_permutation_scope() as cache:
+            first = partition_grouping(df, ["p", "n"])
+            extended = with_columns(df, {"f": [0, 0, 0]})
+            assert partition_grouping(extended, ["p", "n"]) is first
+            assert partition_grouping(narrow_frame(extended, ["n", "p"]), ["p", "n"]) is first
+            assert cache.hits == 2
+
+    def test_different_data_is_a_miss(self) -> None:
+        with sort_permutation_scope() as cache:
+            partition_grouping(pd.DataFrame({"p": ["a", "b"]}), ["p"])
+            partition_grouping(pd.DataFrame({"p": ["a", "b"]}), ["p"])
+            assert cache.misses == 2
+
+    def test_rank_features_of_one_feature_set_factorize_once(self) -> None:
+        rank = DataOperationsCatalog.implementation("rank", "PandasDataFrame")
+        df = pd.DataFrame({"p": ["a", "b", "a", None], "t": [3, 1, 2, 5]})
+        features = merge_feature_sets(
+            *(
+                make_feature_set(f"t__{rank_type}_ranked", ["p"], order_by="t")
+                for rank_type in ("rank", "percent_rank", "ntile_2")
+            )
+        )
+        with sort_permutation_scope() as cache:
+            result = rank.calculate_feature(df, features)
+            assert (cache.misses, cache.hits) == (1, 2)
+        assert result["t__percent_rank_ranked"].tolist() == [1.0, 0.0, 0.0, 0.0]
+        assert result["t__ntile_2_ranked"].tolist() == [2, 1, 1, 1]
+
+
+class TestWithColumns:
+    def test_adds_columns_and_leaves_input_untouched(self) -> None:
+        df = pd.DataFrame({"a": [1.0, 2.0], "b": [3.0, 4.0]}, index=[7, 3])
+        result = with_columns(df, {"c": [5, 6], "a": df["a"] * 2})
+        assert list(result.columns) == ["a", "b", "c"]
+        assert result["a"].tolist() == [2.0, 4.0]
+        assert list(df.columns) == ["a", "b"]
+        assert df["a"].tolist() == [1.0, 2.0]
+
+    def test_shares_existing_column_buffers(self) -> None:
+        df = pd.DataFrame({"a": [1.0, 2.0], "b": [3.0, 4.0]})
+        result = with_columns(df, {"c": [5, 6]})
+        assert np.shares_memory(result["b"].to_numpy(), df["b"].to_numpy())
+
+
+class TestNarrowFrame:
+    def test_selects_each_column_once_on_a_range_index(self) -> None:
+        df = pd.DataFrame({"a": [1, 2], "b": [3, 4], "c": [5, 6]}, index=["x", "y"])
+        work = narrow_frame(df, ["b", "a", "b"])
+        assert list(work.columns) == ["b", "a"]
+        assert list(work.index) == [0, 1]
+
+    def test_sort_index_restores_input_order(self) -> None:
+        df = pd.DataFrame({"k": [3, 1, 2]}, index=[5, 5, 9])
+        ordered = narrow_frame(df, ["k"]).sort_values("k")
+        assert ordered["k"].sort_index().set_axis(df.index).tolist() == [3, 1, 2]
+
+
+# Operations whose result has one row per group rather than per input row.
+_ROW_CHANGING = {"aggregation", "resample"}
+
+
+@pytest.mark.parametrize(
+    "case",
+    [
+        case
+        for case in benchmark_cases()
+        if case.operation not in _ROW_CHANGING and "PandasDataFrame" in case.frameworks
+    ],
+    ids=lambda case: f"{case.operation}-{case.subtype}",
+)
+def test_row_preserving_backends_do_not_copy_input_columns(case: object) -> None:
+    """Every pandas row-preserving backend returns the input columns' own buffers plus its output."""
+    data = make_benchmark_table(200, partitions=5, null_ratio=0.1).to_pandas()
+    implementation = DataOperationsCatalog.implementation(case.operation, "PandasDataFrame")  # type: ignore[attr-defined]
+    result = implementation.calculate_feature(data, case.feature_set())  # type: ignore[attr-defined]
+    assert list(result.columns) == [*data.columns, case.feature_name]  # type: ignore[attr-defined]
+    for col in ("value", "a", "b"):
+        assert np.shares_memory(result[col].to_numpy(), data[col].to_numpy()), col
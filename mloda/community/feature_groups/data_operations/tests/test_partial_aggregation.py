@@ -0,0 +1,153 @@
+"""Unit tests for mergeable partial-aggregate states."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pyarrow as pa
+import pytest
+
+from mloda.community.feature_groups.data_operations.aggregation.pyarrow_aggregation import PyArrowAggregation
+from mloda.community.feature_groups.data_operations.aggregation_base import AggregationRequest
+from mloda.community.feature_groups.data_operations.partial_aggregation import (
+    MERGEABLE_AGG_TYPES,
+    broadcast_partials,
+    finalize_partials,
+    merge_partials,
+    partial_aggregate,
+)
+from mloda.community.feature_groups.data_operations.row_preserving.window_aggregation.pyarrow_window_aggregation import (
+    PyArrowWindowAggregation,
+)
+
+_TABLE = pa.table(
+    {
+        "region": ["A", "B", None, "A", "B", "A", None, "C", "A", "B", "A", "B"],
+        "value": [1.0, 2.0, 3.0, None, 5.0, 6.0, float("nan"), None, 9.0, 2.0, -4.5, 0.25],
+        "count": [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 4, 2],
+        "ts": [5, 3, 1, 9, 2, 8, 7, 6, 4, 0, 4, 11],
+    }
+)
+
+_UNORDERED = sorted(MERGEABLE_AGG_TYPES - {"first", "last"})
+_REQUESTS = [AggregationRequest(f"{col}__{agg}", col, agg) for col in ("value", "count") for agg in _UNORDERED]
+_ORDERED_REQUESTS = [
+    AggregationRequest("value__first", "value", "first"),
+    AggregationRequest("value__last", "value", "last"),
+]
+
+# Chunk boundaries cutting every region across chunks, with one single-row chunk.
+_CHUNKS = [_TABLE.slice(0, 3), _TABLE.slice(3, 1), _TABLE.slice(4, 5), _TABLE.slice(9)]
+
+
+def _by_key(table: pa.Table) -> dict[Any, dict[str, Any]]:
+    return {row["region"]: row for row in table.to_pylist()}
+
+
+def _assert_same(actual: Any, expected: Any) -> None:
+    if isinstance(expected, float) and isinstance(actual, float):
+        assert actual == pytest.approx(expected, rel=1e-12, abs=1e-12, nan_ok=True)
+    else:
+        assert actual == expected
+
+
+def _ipc_round_trip(table: pa.Table) -> pa.Table:
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return pa.ipc.open_stream(sink.getvalue()).read_all()
+
+
+class TestMergedStatesMatchOnePass:
+    def test_chunked_merge_matches_pyarrow_aggregation(self) -> None:
+        expected = PyArrowAggregation._compute_group_bucket(_TABLE, _REQUESTS + _ORDERED_REQUESTS, ["region"])
+        states = [partial_aggregate(chunk, ["region"], _REQUESTS + _ORDERED_REQUESTS) for chunk in _CHUNKS]
+        actual = finalize_partials(merge_partials(states))
+
+        assert actual.schema == expected.schema
+        expected_rows, actual_rows = _by_key(expected), _by_key(actual)
+        assert actual_rows.keys() == expected_rows.keys()
+        for key, row in expected_rows.items():
+            for name, value in row.items():
+                _assert_same(actual_rows[key][name], value)
+
+    def test_merge_is_associative(self) -> None:
+        states = [partial_aggregate(chunk, ["region"], _REQUESTS) for chunk in _CHUNKS]
+        flat = finalize_partials(merge_partials(states))
+        nested = finalize_partials(merge_partials([merge_partials(states[:2]), merge_partials(states[2:])]))
+        for key, row in _by_key(flat).items():
+            for name, value in row.items():
+                _assert_same(_by_key(nested)[key][name], value)
+
+    def test_variance_merges_up_to_rounding_on_large_offsets(self) -> None:
+        values = [1e9 + v for v in (4.0, 7.0, 13.0, 16.0)]
+        table = pa.table({"region": ["A"] * 4, "value": values})
+        requests = [AggregationRequest("value__var_samp", "value", "var_samp")]
+        states = [partial_aggregate(table.slice(i, 1), ["region"], requests) for i in range(4)]
+        merged = finalize_partials(merge_partials(states)).column("value__var_samp").to_pylist()
+        assert merged == [pytest.approx(30.0)]
+
+    def test_ordered_first_last_match_one_pass_across_chunks(self) -> None:
+        one_pass = finalize_partials(partial_aggregate(_TABLE, ["region"], _ORDERED_REQUESTS, order_by="ts"))
+        states = [partial_aggregate(chunk, ["region"], _ORDERED_REQUESTS, order_by="ts") for chunk in _CHUNKS]
+        merged = finalize_partials(merge_partials(states))
+        for key, row in _by_key(one_pass).items():
+            for name, value in row.items():
+                _assert_same(_by_key(merged)[key][name], value)
+        # Region A in ts order: 9.0 and -4.5 (ts 4, a tie across chunks kept in chunk
+        # order), 1.0, 6.0, None (ts 9, skipped as null).
+        assert _by_key(merged)["A"]["value__first"] == 9.0
+        assert _by_key(merged)["A"]["value__last"] == 6.0
+
+
+class TestStateSerialization:
+    def test_state_survives_ipc_and_describes_itself(self) -> None:
+        states = [_ipc_round_trip(partial_aggregate(chunk, ["region"], _REQUESTS)) for chunk in _CHUNKS]
+        merged = finalize_partials(merge_partials(states))
+        expected = PyArrowAggregation._compute_group_bucket(_TABLE, _REQUESTS, ["region"])
+        assert _by_key(merged)["A"]["count__nunique"] == _by_key(expected)["A"]["count__nunique"]
+        assert "value__std.m2" in states[0].column_names
+
+    def test_table_without_spec_is_rejected(self) -> None:
+        with pytest.raises(ValueError, match="Not a partial-aggregation state"):
+            merge_partials([_TABLE])
+
+    def test_states_with_different_specs_are_rejected(self) -> None:
+        first = partial_aggregate(_TABLE, ["region"], _REQUESTS[:1])
+        second = partial_aggregate(_TABLE, ["region"], _REQUESTS[1:2])
+        with pytest.raises(ValueError, match="must share"):
+            merge_partials([first, second])
+
+
+class TestBroadcastPartials:
+    def test_broadcast_matches_pyarrow_window_aggregation(self) -> None:
+        state = merge_partials([partial_aggregate(chunk, ["region"], _REQUESTS) for chunk in _CHUNKS])
+        actual = broadcast_partials(state, _TABLE)
+        expected = PyArrowWindowAggregation._compute_window_bucket(_TABLE, _REQUESTS, ["region"], None, None)
+        for request in _REQUESTS:
+            for a, e in zip(
+                actual.column(request.feature_name).to_pylist(), expected.column(request.feature_name).to_pylist()
+            ):
+                _assert_same(a, e)
+
+    def test_unseen_partition_gets_null(self) -> None:
+        requests = [AggregationRequest("value__sum", "value", "sum")]
+        state = partial_aggregate(_TABLE.slice(0, 2), ["region"], requests)
+        rows = broadcast_partials(state, pa.table({"region": ["B", "Z"]}))
+        assert rows.column("value__sum").to_pylist() == [2.0, None]
+
+
+def test_unbounded_agg_type_is_rejected() -> None:
+    with pytest.raises(ValueError, match="partial aggregation"):
+        partial_aggregate(_TABLE, ["region"], [AggregationRequest("value__median", "value", "median")])
+
+
+def test_all_null_group_finalizes_to_null_and_zero_distinct() -> None:
+    table = pa.table({"region": ["A", "A"], "value": pa.array([None, None], type=pa.float64())})
+    requests = [AggregationRequest(f"value__{agg}", "value", agg) for agg in ("avg", "std_samp", "nunique", "first")]
+    row = finalize_partials(
+        merge_partials([partial_aggregate(table.slice(i, 1), ["region"], requests) for i in range(2)])
+    )
+    assert row.to_pylist() == [
+        {"region": "A", "value__avg": None, "value__std_samp": None, "value__nunique": 0, "value__first": None}
+    ]
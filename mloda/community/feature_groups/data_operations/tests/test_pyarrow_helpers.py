@@ -0,0 +1,180 @@
+"""Unit tests for pyarrow_helpers shared utilities."""
+
+from __future__ import annotations
+
+import bisect
+import math
+import random
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from mloda.community.feature_groups.data_operations.pyarrow_helpers import (
+    broadcast_group_values,
+    fused_group_by,
+    row_positions,
+    scatter_to_rows,
+    segment_size_per_row,
+    segment_start_per_row,
+    segment_sum_per_row,
+    segmented_fill_null_forward,
+    segmented_search_left,
+)
+
+
+class TestScatterToRows:
+    def test_scatter_places_each_value_at_its_position(self) -> None:
+        values = pa.array([10, 20, 30, 40])
+        positions = pa.array([2, 0, 3, 1])
+        assert scatter_to_rows(values, positions).to_pylist() == [20, 40, 10, 30]
+
+    def test_scatter_inverts_a_sort_permutation(self) -> None:
+        data = pa.array([3, 1, 2, None])
+        perm = pc.sort_indices(data)
+        sorted_values = pc.take(data, perm)
+        assert scatter_to_rows(sorted_values, perm).to_pylist() == data.to_pylist()
+
+    def test_scatter_empty(self) -> None:
+        empty = pa.array([], type=pa.int64())
+        assert scatter_to_rows(empty, empty).to_pylist() == []
+
+
+class TestSegmentedScans:
+    def test_row_positions(self) -> None:
+        assert row_positions(4).to_pylist() == [0, 1, 2, 3]
+        assert row_positions(0).to_pylist() == []
+
+    def test_segment_start_per_row(self) -> None:
+        boundaries = pa.array([0, 2, 5], type=pa.int64())
+        assert segment_start_per_row(boundaries, 6).to_pylist() == [0, 0, 2, 2, 2, 5]
+
+    def test_segment_size_per_row(self) -> None:
+        boundaries = pa.array([0, 2, 5], type=pa.int64())
+        assert segment_size_per_row(boundaries, 6).to_pylist() == [2, 2, 3, 3, 3, 1]
+        assert segment_size_per_row(pa.array([], type=pa.int64()), 0).to_pylist() == []
+
+    def test_segment_sum_per_row(self) -> None:
+        values = pa.array([1, 0, 1, 1, 0, 1], type=pa.int64())
+        boundaries = pa.array([0, 2, 5], type=pa.int64())
+        assert segment_sum_per_row(values, boundaries).to_pylist() == [1, 1, 2, 2, 2, 1]
+
+    def test_fill_resets_at_each_segment(self) -> None:
+        values = pa.array([None, 1.0, None, None, 2.0, None, None])
+        boundaries = pa.array([0, 3, 6], type=pa.int64())
+        result = segmented_fill_null_forward(values, boundaries)
+        assert result.to_pylist() == [None, 1.0, 1.0, None, 2.0, 2.0, None]
+
+    def test_fill_keeps_nan_and_string_values(self) -> None:
+        values = pa.chunked_array([["a", None], [None, "b", None]])
+        assert segmented_fill_null_forward(values, pa.array([0, 2])).to_pylist() == ["a", "a", None, "b", "b"]
+        floats = pa.array([math.nan, None])
+        assert math.isnan(segmented_fill_null_forward(floats, pa.array([0])).to_pylist()[1])
+
+    def test_fill_empty(self) -> None:
+        empty = pa.array([], type=pa.int64())
+        assert segmented_fill_null_forward(empty, pa.array([], type=pa.int64())).to_pylist() == []
+
+    def test_fill_matches_per_segment_fill_null_forward(self) -> None:
+        rng = random.Random(7)
+        values = pa.array([None if rng.random() < 0.6 else rng.randint(0, 9) for _ in range(500)])
+        starts = sorted({0, *rng.sample(range(1, 500), 60)})
+        expected = [
+            value
+            for start, end in zip(starts, [*starts[1:], 500])
+            for value in pc.fill_null_forward(values.slice(start, end - start)).to_pylist()
+        ]
+        boundaries = pa.array(starts, type=pa.int64())
+        assert segmented_fill_null_forward(values, boundaries).to_pylist() == expected
+
+    def test_search_left_stays_in_segment(self) -> None:
+        segments = pa.array([0, 0, 0, 0, 4, 4, 4], type=pa.int64())
+        keys = pa.array([1, 3, 3, None, 2, 5, 9], type=pa.int64())
+        queries = pa.array([0, 3, 2, None, 3, 5, 10], type=pa.int64())
+        assert segmented_search_left(segments, keys, queries).to_pylist() == [0, 1, 1, 3, 5, 5, 7]
+
+    def test_search_left_matches_bisect_per_segment(self) -> None:
+        rng = random.Random(11)
+        starts = sorted({0, *rng.sample(range(1, 300), 25)})
+        keys: list[int] = []
+        segments: list[int] = []
+        for start, end in zip(starts, [*starts[1:], 300]):
+            keys.extend(sorted(rng.randint(0, 50) for _ in range(end - start)))
+            segments.extend([start] * (end - start))
+        queries = [rng.randint(-5, 55) for _ in range(300)]
+        expected = [
+            segment + bisect.bisect_left(keys[segment:end], query)
+            for segment, query, end in zip(segments, queries, [self._segment_end(segments, s) for s in segments])
+        ]
+        result = segmented_search_left(pa.array(segments, type=pa.int64()), pa.array(keys), pa.array(queries))
+        assert result.to_pylist() == expected
+
+    @staticmethod
+    def _segment_end(segments: list[int], start: int) -> int:
+        return next((s for s in segments if s > start), len(segments))
+
+
+class TestBroadcastGroupValues:
+    @staticmethod
+    def _broadcast(table: pa.Table, keys: list[str]) -> list[object]:
+        with_idx = table.append_column("idx", pa.array(range(table.num_rows), type=pa.int64()))
+        grouped = with_idx.group_by(keys).aggregate([("v", "sum"), ("idx", "list")])
+        return list(broadcast_group_values(grouped.column("v_sum"), grouped.column("idx_list")).to_pylist())
+
+    def test_broadcast_restores_original_row_order(self) -> None:
+        table = pa.table({"k": ["a", "b", "a", "c", "b"], "v": [1, 2, 3, 4, 5]})
+        assert self._broadcast(table, ["k"]) == [4, 7, 4, 4, 7]
+
+    def test_null_keys_form_one_group(self) -> None:
+        table = pa.table({"k": [None, "a", None], "v": [1, 2, 3]})
+        assert self._broadcast(table, ["k"]) == [4, 2, 4]
+
+    def test_nan_keys_merge_distinct_from_null(self) -> None:
+        table = pa.table({"k": [math.nan, None, math.nan, 1.0], "v": [1, 2, 3, 4]})
+        assert self._broadcast(table, ["k"]) == [4, 2, 4, 4]
+
+    def test_multi_column_keys(self) -> None:
+        table = pa.table({"a": ["x", "x", "y", "x"], "b": [1, 2, 1, 1], "v": [1, 2, 3, 4]})
+        assert self._broadcast(table, ["a", "b"]) == [5, 2, 3, 5]
+
+    def test_chunked_input(self) -> None:
+        table = pa.concat_tables([pa.table({"k": ["a", "b"], "v": [1, 2]}), pa.table({"k": ["b", "a"], "v": [3, 4]})])
+        assert self._broadcast(table, ["k"]) == [5, 5, 5, 5]
+
+    def test_preserves_aggregate_type(self) -> None:
+        table = pa.table({"k": ["a", "a"], "v": pa.array([None, None], type=pa.int32())})
+        with_idx = table.append_column("idx", pa.array([0, 1], type=pa.int64()))
+        grouped = with_idx.group_by(["k"]).aggregate([("v", "min"), ("idx", "list")])
+        result = broadcast_group_values(grouped.column("v_min"), grouped.column("idx_list"))
+        assert result.type == pa.int32()
+        assert result.to_pylist() == [None, None]
+
+
+class TestFusedGroupBy:
+    def test_one_output_per_aggregation(self) -> None:
+        table = pa.table({"k": ["a", "b", "a"], "v": [1, 2, 3]})
+        grouped, names = fused_group_by(table, ["k"], [("v", "sum", None), ("v", "max", None)])
+        assert grouped.num_rows == 2
+        by_key = dict(zip(grouped.column("k").to_pylist(), zip(*(grouped.column(n).to_pylist() for n in names))))
+        assert by_key == {"a": (4, 3), "b": (2, 2)}
+
+    def test_ddof_variants_get_distinct_outputs(self) -> None:
+        table = pa.table({"k": ["a", "a", "a"], "v": [1.0, 2.0, 3.0]})
+        aggregations = [
+            ("v", "stddev", pc.VarianceOptions(ddof=0)),
+            ("v", "stddev", pc.VarianceOptions(ddof=1)),
+        ]
+        grouped, names = fused_group_by(table, ["k"], aggregations)
+        assert names[0] != names[1]
+        assert grouped.column(names[0]).to_pylist()[0] == math.sqrt(2 / 3)
+        assert grouped.column(names[1]).to_pylist()[0] == 1.0
+
+    def test_identical_aggregations_share_a_column(self) -> None:
+        table = pa.table({"k": ["a", "b"], "v": [1, 2]})
+        grouped, names = fused_group_by(table, ["k"], [("v", "sum", None), ("v", "sum", None)])
+        assert names[0] == names[1]
+        assert grouped.num_columns == 2
+
+    def test_source_used_as_key(self) -> None:
+        table = pa.table({"k": ["a", "b", "a"]})
+        grouped, names = fused_group_by(table, ["k"], [("k", "count", None)])
+        assert dict(zip(grouped.column("k").to_pylist(), grouped.column(names[0]).to_pylist())) == {"a": 2, "b": 1}
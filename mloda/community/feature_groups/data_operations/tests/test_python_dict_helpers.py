@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import math
+import random
 import statistics
 from datetime import datetime, timezone
 from decimal import Decimal
@@ -11,6 +12,7 @@ from typing import Any
 import pytest
 
 from mloda.community.feature_groups.data_operations.python_dict_helpers import (
+    SlidingWindowReducer,
     group_key_value,
     is_nan,
     mode,
@@ -274,12 +276,95 @@ class TestReduceAgg:
         assert result is not None and math.isnan(result), f"mode={result!r} != PyArrow oracle mode={oracle!r} (nan)"
 
 
+def _same_result(actual: Any, expected: Any) -> bool:
+    if expected is None or actual is None:
+        return actual is expected
+    if isinstance(expected, float) and math.isnan(expected):
+        return isinstance(actual, float) and math.isnan(actual)
+    return bool(actual == pytest.approx(expected, rel=1e-9, abs=1e-9))
+
+
+class TestSlidingWindowReducer:
+    """Every window state must reduce like ``reduce_agg`` over the same values."""
+
+    AGG_TYPES = ["sum", "avg", "count", "min", "max", "std", "var", "median"]
+
+    @staticmethod
+    def _sweep(agg_type: str, values: list[Any], windows: list[tuple[int, int]]) -> None:
+        reducer = SlidingWindowReducer(agg_type)
+        start = end = 0
+        for window_start, window_end in windows:
+            while end < window_end:
+                reducer.push(end, values[end])
+                end += 1
+            while start < window_start:
+                reducer.pop(start, values[start])
+                start += 1
+            expected = reduce_agg(agg_type, values[start:end])
+            actual = reducer.result()
+            assert _same_result(actual, expected), f"{agg_type} over {values[start:end]}: {actual!r} != {expected!r}"
+
+    @pytest.mark.parametrize("agg_type", AGG_TYPES)
+    @pytest.mark.parametrize("seed", range(5))
+    def test_random_sliding_windows_match_reduce_agg(self, agg_type: str, seed: int) -> None:
+        rng = random.Random(seed)
+        pool: list[Any] = [None, float("nan"), float("inf"), -float("inf"), 0, 3, -2]
+        values = [rng.choice(pool) if rng.random() < 0.15 else rng.uniform(-100, 100) for _ in range(300)]
+        windows = []
+        start = 0
+        for end in range(1, len(values) + 1):
+            start = min(end, start + rng.choice([0, 0, 1, 2]))
+            windows.append((start, end))
+        self._sweep(agg_type, values, windows)
+
+    @pytest.mark.parametrize("agg_type", AGG_TYPES)
+    def test_growing_window_of_ints(self, agg_type: str) -> None:
+        values: list[Any] = [5, 1, None, 4, 1, 5, 9, 2, 6]
+        self._sweep(agg_type, values, [(0, end) for end in range(1, len(values) + 1)])
+
+    def test_int_sum_stays_exact(self) -> None:
+        reducer = SlidingWindowReducer("sum")
+        for index, value in enumerate([10**18, 1, 2]):
+            reducer.push(index, value)
+        reducer.pop(0, 10**18)
+        assert reducer.result() == 3
+        assert isinstance(reducer.result(), int)
+
+    def test_compensated_sum_survives_cancellation(self) -> None:
+        reducer = SlidingWindowReducer("sum")
+        reducer.push(0, 1e20)
+        reducer.push(1, 1.0)
+        reducer.pop(0, 1e20)
+        assert reducer.result() == 1.0
+
+    def test_median_is_nan_only_while_a_nan_is_in_the_window(self) -> None:
+        reducer = SlidingWindowReducer("median")
+        for index, value in enumerate([float("nan"), 1.0, 2.0, 3.0]):
+            reducer.push(index, value)
+        assert math.isnan(reducer.result())
+        reducer.pop(0, float("nan"))
+        assert reducer.result() == 2.0
+
+    def test_empty_window(self) -> None:
+        assert SlidingWindowReducer("count").result() == 0
+        assert SlidingWindowReducer("median").result() is None
+        assert SlidingWindowReducer("std").result() is None
+
+    def test_unsupported_agg_type_raises(self) -> None:
+        with pytest.raises(ValueError):
+            SlidingWindowReducer("mode")
+
+
 class TestReduceAggMedianDoesNotSkipNanDocumentedDivergence:
     def test_median_of_value_and_nan_returns_nan(self) -> None:
         """Documented divergence: median does not skip NaN like pandas' skipna median."""
         result = reduce_agg("median", [1.0, float("nan")])
         assert result is not None and math.isnan(result)
 
+    def test_median_with_nan_does_not_depend_on_input_order(self) -> None:
+        for values in ([float("nan"), 1.0, 2.0, 3.0], [1.0, 2.0, float("nan"), 3.0], [3.0, 1.0, 2.0, float("nan")]):
+            assert math.isnan(reduce_agg("median", values))
+
 
 class TestGroupKeyValueMergesSignedZeroDocumentedDivergence:
     def test_positive_and_negative_zero_collide_into_one_group(self) -> None:
@@ -0,0 +1,121 @@
+"""Unit tests for the carried recurrence state store and its run driver."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+from typing import Any
+
+import pytest
+
+from mloda.testing.feature_groups.data_operations.helpers import make_feature_set
+
+from mloda.community.feature_groups.data_operations.recurrence_state import (
+    OutOfOrderRowError,
+    PartitionTail,
+    RecurrenceStateStore,
+    drop_state_store,
+    get_state_store,
+)
+from mloda.community.feature_groups.data_operations.row_preserving.ema.python_dict_ema import PythonDictEma
+from mloda.community.feature_groups.data_operations.row_preserving.ffill.python_dict_ffill import PythonDictFfill
+from mloda.community.feature_groups.data_operations.row_preserving.sessionization.python_dict_sessionization import (
+    PythonDictSessionization,
+)
+
+_T0 = datetime(2024, 1, 1)
+
+
+def _minutes(*offsets: int) -> list[datetime]:
+    return [_T0 + timedelta(minutes=m) for m in offsets]
+
+
+@pytest.fixture
+def store_name() -> Iterator[str]:
+    yield "test-recurrence-state"
+    drop_state_store("test-recurrence-state")
+
+
+class TestRecurrenceStateStore:
+    def test_evicts_least_recently_used_partition(self) -> None:
+        store = RecurrenceStateStore(max_partitions=2)
+        store.put("f", ("a",), PartitionTail(1, 1.0))
+        store.put("f", ("b",), PartitionTail(1, 2.0))
+        store.get("f", ("a",))
+        store.put("f", ("c",), PartitionTail(1, 3.0))
+        assert len(store) == 2
+        assert store.get("f", ("b",)) is None
+        assert store.get("f", ("a",)) == PartitionTail(1, 1.0)
+        assert store.evictions == 1
+
+    def test_session_ids_are_never_reused(self) -> None:
+        store = RecurrenceStateStore(max_partitions=0)
+        assert store.allocate_session_ids("f", 3) == 0
+        assert store.allocate_session_ids("f", 2) == 3
+        assert store.allocate_session_ids("g", 1) == 0
+
+    def test_registry_returns_the_same_store_until_dropped(self, store_name: str) -> None:
+        store = get_state_store(store_name)
+        assert get_state_store(store_name) is store
+        drop_state_store(store_name)
+        assert get_state_store(store_name) is not store
+
+
+class TestCarriedRuns:
+    def _run(self, impl: Any, feature_name: str, data: dict[str, list[Any]], store: str) -> list[Any]:
+        fs = make_feature_set(feature_name, partition_by=["user"], order_by="ts", state_store=store)
+        return list(impl.calculate_feature(data, fs)[feature_name])
+
+    def test_ffill_carries_last_value_across_three_runs(self, store_name: str) -> None:
+        runs: list[dict[str, list[Any]]] = [
+            {"user": ["u", "v"], "ts": _minutes(0, 0), "value": [1.0, None]},
+            {"user": ["u", "v"], "ts": _minutes(1, 1), "value": [None, 7.0]},
+            {"user": ["v", "u"], "ts": _minutes(2, 2), "value": [None, None]},
+        ]
+        results = [self._run(PythonDictFfill, "value__ffill", run, store_name) for run in runs]
+        assert results == [[1.0, None], [1.0, 7.0], [7.0, 1.0]]
+
+    def test_ema_continues_the_recurrence(self, store_name: str) -> None:
+        first = self._run(PythonDictEma, "value__ema_3", {"user": ["u"], "ts": _minutes(0), "value": [2.0]}, store_name)
+        second = self._run(
+            PythonDictEma, "value__ema_3", {"user": ["u", "u"], "ts": _minutes(2, 1), "value": [None, 4.0]}, store_name
+        )
+        # alpha = 0.5: the seed 2.0 and 4.0 give 3.0; the null row stays null.
+        assert first == [2.0]
+        assert second == [None, 3.0]
+
+    def test_sessionize_keeps_ids_of_continued_sessions(self, store_name: str) -> None:
+        name = "ts__sessionize_30_minute"
+        first = self._run(PythonDictSessionization, name, {"user": ["u", "v"], "ts": _minutes(0, 0)}, store_name)
+        second = self._run(
+            PythonDictSessionization, name, {"user": ["u", "v", "w"], "ts": _minutes(20, 90, 5)}, store_name
+        )
+        assert first == [0, 1]
+        # u continues session 0; v's gap exceeds 30 minutes and w is new: both get fresh ids.
+        assert second[0] == 0
+        assert sorted(second[1:]) == [2, 3]
+
+    def test_row_equal_to_the_tail_is_not_late(self, store_name: str) -> None:
+        self._run(PythonDictFfill, "value__ffill", {"user": ["u"], "ts": _minutes(5), "value": [1.0]}, store_name)
+        result = self._run(
+            PythonDictFfill, "value__ffill", {"user": ["u"], "ts": _minutes(5), "value": [None]}, store_name
+        )
+        assert result == [1.0]
+
+    def test_late_row_raises(self, store_name: str) -> None:
+        self._run(PythonDictFfill, "value__ffill", {"user": ["u"], "ts": _minutes(5), "value": [1.0]}, store_name)
+        with pytest.raises(OutOfOrderRowError, match="earlier than the last row"):
+            self._run(PythonDictFfill, "value__ffill", {"user": ["u"], "ts": _minutes(4), "value": [2.0]}, store_name)
+
+    def test_null_order_by_raises(self, store_name: str) -> None:
+        with pytest.raises(ValueError, match="non-null order_by"):
+            self._run(PythonDictFfill, "value__ffill", {"user": ["u"], "ts": [None], "value": [1.0]}, store_name)
+
+    def test_evicted_partition_starts_over(self, store_name: str) -> None:
+        get_state_store(store_name, max_partitions=1)
+        self._run(PythonDictFfill, "value__ffill", {"user": ["u"], "ts": _minutes(0), "value": [1.0]}, store_name)
+        self._run(PythonDictFfill, "value__ffill", {"user": ["v"], "ts": _minutes(0), "value": [2.0]}, store_name)
+        result = self._run(
+            PythonDictFfill, "value__ffill", {"user": ["u"], "ts": _minutes(1), "value": [None]}, store_name
+        )
+        assert result == [None]
@@ -0,0 +1,99 @@
+"""Unit tests for hash-partitioned multi-process execution."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pandas as pd
+import pytest
+
+from mloda.testing.feature_groups.data_operations.helpers import make_feature_set
+
+from mloda.community.feature_groups.data_operations.aggregation.pandas_aggregation import PandasAggregation
+from mloda.community.feature_groups.data_operations.aggregation.python_dict_aggregation import (
+    PythonDictAggregation,
+)
+from mloda.community.feature_groups.data_operations.pandas_helpers import PandasShardFrame
+from mloda.community.feature_groups.data_operations.row_preserving.frame_aggregate.pandas_frame_aggregate import (
+    PandasFrameAggregate,
+)
+from mloda.community.feature_groups.data_operations.row_preserving.rank.python_dict_rank import PythonDictRank
+from mloda.community.feature_groups.data_operations.sharded_execution import (
+    PythonDictShardFrame,
+    run_sharded,
+)
+
+# 40 partitions (one of them null) over 200 rows, in interleaved order.
+_KEYS: list[Any] = [None if i % 40 == 39 else f"k{i % 40}" for i in range(200)]
+_DATA: dict[str, list[Any]] = {
+    "region": _KEYS,
+    "value": [float((i * 7) % 13) if i % 11 else None for i in range(200)],
+    "ts": [(i * 31) % 200 for i in range(200)],
+}
+
+
+class TestShardPlans:
+    def test_python_dict_plan_keeps_each_partition_in_one_shard(self) -> None:
+        data = {"region": ["a", None, float("nan"), "a", None, "b"]}
+        plan = PythonDictShardFrame.plan(data, ["region"], 8)
+        shard_of = {row: shard for shard, rows in enumerate(plan.row_lists) for row in rows}
+        assert sorted(shard_of) == list(range(6))
+        assert shard_of[0] == shard_of[3]
+        assert shard_of[1] == shard_of[4]
+        assert all(rows == sorted(rows) for rows in plan.row_lists)
+
+    def test_pandas_plan_hashes_none_and_nan_as_one_partition(self) -> None:
+        frame = pd.DataFrame({"region": ["a", None, float("nan"), "a"]})
+        plan = PandasShardFrame.plan(frame, ["region"], 8)
+        shard_of = {int(row): shard for shard, rows in enumerate(plan.row_lists) for row in rows}
+        assert shard_of[0] == shard_of[3]
+        assert shard_of[1] == shard_of[2]
+
+    def test_pandas_stitch_restores_row_order_and_index(self) -> None:
+        frame = pd.DataFrame({"region": ["a", "b", "a", "c"], "v": [1, 2, 3, 4]}, index=[10, 20, 30, 40])
+        plan = PandasShardFrame.plan(frame, ["region"], 4)
+        parts = [PandasShardFrame.take(frame, rows) for rows in plan.row_lists]
+        pd.testing.assert_frame_equal(PandasShardFrame.stitch_rows(frame, parts, plan), frame)
+
+
+class TestRunSharded:
+    def test_single_partition_runs_in_process(self) -> None:
+        calls: list[Any] = []
+
+        def compute(data: dict[str, list[Any]]) -> dict[str, list[Any]]:
+            calls.append(data)
+            return data
+
+        data = {"region": ["a", "a"], "value": [1, 2]}
+        assert run_sharded(PythonDictShardFrame, data, ["region"], 4, compute, reduces_rows=False) is data
+        assert calls == [data]
+
+    def test_backend_without_shard_ops_raises(self) -> None:
+        with pytest.raises(ValueError, match="cannot run sharded"):
+            run_sharded(None, {}, ["region"], 4, lambda data: data, reduces_rows=False)
+
+
+def _run(impl: Any, data: Any, feature_name: str, shards: int | None, **context: Any) -> Any:
+    extra: dict[str, Any] = {} if shards is None else {"shards": shards}
+    return impl.calculate_feature(data, make_feature_set(feature_name, partition_by=["region"], **context, **extra))
+
+
+class TestShardedMatchesInProcess:
+    def test_python_dict_aggregation_keeps_first_appearance_group_order(self) -> None:
+        sharded = _run(PythonDictAggregation, _DATA, "value__median_agg", 8)
+        assert sharded == _run(PythonDictAggregation, _DATA, "value__median_agg", None)
+
+    def test_python_dict_rank(self) -> None:
+        sharded = _run(PythonDictRank, _DATA, "value__dense_rank_ranked", 8, order_by="value")
+        assert sharded == _run(PythonDictRank, _DATA, "value__dense_rank_ranked", None, order_by="value")
+
+    def test_pandas_aggregation_keeps_sorted_group_order(self) -> None:
+        frame = pd.DataFrame(_DATA)
+        sharded = _run(PandasAggregation, frame, "value__mode_agg", 8)
+        pd.testing.assert_frame_equal(sharded, _run(PandasAggregation, frame, "value__mode_agg", None))
+
+    def test_pandas_frame_aggregate(self) -> None:
+        frame = pd.DataFrame(_DATA)
+        sharded = _run(PandasFrameAggregate, frame, "value__avg_rolling_3", 8, order_by="ts")
+        expected = _run(PandasFrameAggregate, frame, "value__avg_rolling_3", None, order_by="ts")
+        pd.testing.assert_frame_equal(sharded, expected)
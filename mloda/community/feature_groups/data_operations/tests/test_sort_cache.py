@@ -0,0 +1,126 @@
+"""Unit tests for the scoped sort-permutation cache and its backend helpers."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pyarrow as pa
+
+from mloda.community.feature_groups.data_operations import pyarrow_helpers, python_dict_helpers
+from mloda.community.feature_groups.data_operations.sort_cache import (
+    Grouping,
+    SortPermutation,
+    SortPermutationCache,
+    cached_grouping,
+    cached_sort_permutation,
+    sort_permutation_scope,
+)
+
+
+def _perm(nbytes: int = 8) -> SortPermutation:
+    return SortPermutation([0], [0], [0], nbytes)
+
+
+class TestSortPermutationCache:
+    def test_hit_returns_same_object(self) -> None:
+        cache = SortPermutationCache()
+        first = cache.get_or_compute("k", (), _perm)
+        assert cache.get_or_compute("k", (), _perm) is first
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_evicts_least_recently_used_by_entries(self) -> None:
+        cache = SortPermutationCache(max_entries=2)
+        cache.get_or_compute("a", (), _perm)
+        cache.get_or_compute("b", (), _perm)
+        cache.get_or_compute("a", (), _perm)
+        cache.get_or_compute("c", (), _perm)
+        assert len(cache) == 2
+        cache.get_or_compute("a", (), _perm)
+        assert cache.misses == 3
+
+    def test_bounded_by_bytes(self) -> None:
+        cache = SortPermutationCache(max_bytes=20)
+        cache.get_or_compute("a", (), lambda: _perm(8))
+        cache.get_or_compute("b", (), lambda: _perm(8))
+        cache.get_or_compute("c", (), lambda: _perm(8))
+        assert cache.nbytes <= 20
+        assert len(cache) == 2
+
+    def test_oversized_value_is_not_stored(self) -> None:
+        cache = SortPermutationCache(max_bytes=4)
+        cache.get_or_compute("a", (), lambda: _perm(8))
+        assert len(cache) == 0
+
+
+class TestSortPermutationScope:
+    def test_cleared_when_scope_exits(self) -> None:
+        with sort_permutation_scope() as cache:
+            cached_sort_permutation("k", (), _perm)
+            assert len(cache) == 1
+        assert len(cache) == 0
+
+    def test_nested_scope_shares_cache(self) -> None:
+        with sort_permutation_scope() as outer:
+            with sort_permutation_scope() as inner:
+                assert inner is outer
+                cached_sort_permutation("k", (), _perm)
+            assert len(outer) == 1
+
+    def test_outside_scope_always_computes(self) -> None:
+        calls: list[int] = []
+
+        def compute() -> SortPermutation:
+            calls.append(1)
+            return _perm()
+
+        cached_sort_permutation("k", (), compute)
+        cached_sort_permutation("k", (), compute)
+        assert len(calls) == 2
+
+
+class TestPyArrowSortPermutation:
+    def test_permutation_inverse_and_boundaries(self) -> None:
+        table = pa.table({"p": ["b", "a", None, "a", "b"], "t": [2, 3, 1, 1, None]})
+        perm = pyarrow_helpers.sort_permutation(table, ["p"], "t")
+        assert perm.forward.to_pylist() == [3, 1, 0, 4, 2]
+        assert perm.inverse.to_pylist() == [2, 1, 4, 0, 3]
+        assert perm.boundaries.to_pylist() == [0, 2, 4]
+
+    def test_reused_after_append_column(self) -> None:
+        table = pa.table({"p": ["a", "b", "a"], "t": [3, 2, 1]})
+        with sort_permutation_scope() as cache:
+            first = pyarrow_helpers.sort_permutation(table, ["p"], "t")
+            extended = table.append_column("f", pa.array([1, 2, 3]))
+            assert pyarrow_helpers.sort_permutation(extended, ["p"], "t") is first
+            assert cache.hits == 1
+
+    def test_different_data_is_a_miss(self) -> None:
+        with sort_permutation_scope() as cache:
+            pyarrow_helpers.sort_permutation(pa.table({"p": ["a"], "t": [1]}), ["p"], "t")
+            pyarrow_helpers.sort_permutation(pa.table({"p": ["a"], "t": [1]}), ["p"], "t")
+            assert cache.misses == 2
+
+
+class TestPythonDictSortPermutation:
+    def test_groups_in_first_seen_order_sorted_nulls_last(self) -> None:
+        data: dict[str, list[Any]] = {"p": ["b", "a", "b", "a"], "t": [None, 2, 1, 1]}
+        perm = python_dict_helpers.sort_permutation(data, ["p"], "t")
+        assert python_dict_helpers.sorted_groups(perm) == [[2, 0], [3, 1]]
+        assert perm.inverse == [1, 3, 0, 2]
+
+    def test_reused_while_columns_are_shared(self) -> None:
+        data: dict[str, list[Any]] = {"p": ["a", "b"], "t": [1, 2]}
+        with sort_permutation_scope():
+            first = python_dict_helpers.sort_permutation(data, ["p"], "t")
+            result = dict(data)
+            result["f"] = [0, 0]
+            assert python_dict_helpers.sort_permutation(result, ["p"], "t") is first
+
+
+class TestCachedGrouping:
+    def test_shares_the_scope_cache_with_permutations(self) -> None:
+        with sort_permutation_scope() as cache:
+            cached_sort_permutation("perm", (), _perm)
+            first = cached_grouping("grouping", (), lambda: Grouping([0], [1], 8))
+            assert cached_grouping("grouping", (), lambda: Grouping([0], [1], 8)) is first
+            assert (len(cache), cache.hits) == (2, 1)
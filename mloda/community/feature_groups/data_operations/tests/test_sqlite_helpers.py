@@ -0,0 +1,122 @@
+"""Unit tests for shared SQLite helper utilities (in-database column appends)."""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Iterator
+import pyarrow as pa
+import pytest
+from mloda_plugins.compute_framework.base_implementations.sqlite.sqlite_relation import SqliteRelation
+
+from mloda.community.feature_groups.data_operations.sqlite_helpers import (
+    append_sql_column,
+    append_sql_query_column,
+    arithmetic_result_type,
+    column_type,
+)
+
+
+@pytest.fixture
+def connection() -> Iterator[sqlite3.Connection]:
+    conn = sqlite3.connect(":memory:")
+    yield conn
+    conn.close()
+
+
+def _relation(conn: sqlite3.Connection) -> SqliteRelation:
+    table = pa.table(
+        {
+            "a": pa.array([3, None, 1, 2], type=pa.int64()),
+            "s": pa.array(["x", "y", None, "z"], type=pa.string()),
+            "ts": pa.array([1_700_000_000_000_000, None, 1_700_000_100_000_000, 1_700_000_200_000_000]).cast(
+                pa.timestamp("us", tz="UTC")
+            ),
+        }
+    )
+    return SqliteRelation.from_arrow(conn, table)
+
+
+class TestColumnType:
+    def test_reads_declared_types(self, connection: sqlite3.Connection) -> None:
+        relation = _relation(connection)
+        assert column_type(relation, "a") == pa.int64()
+        assert column_type(relation, "ts") == pa.timestamp("us", tz="UTC")
+
+    @pytest.mark.parametrize(
+        ("op", "operand_types", "expected"),
+        [
+            ("add", (pa.int64(), pa.int64()), pa.int64()),
+            ("multiply", (pa.int64(), pa.float64()), pa.float64()),
+            ("divide", (pa.int64(), pa.int64()), pa.float64()),
+            ("subtract", (pa.float32(),), pa.float64()),
+        ],
+    )
+    def test_arithmetic_result_type(
+        self, op: str, operand_types: tuple[pa.DataType, ...], expected: pa.DataType
+    ) -> None:
+        assert arithmetic_result_type(op, *operand_types) == expected
+
+
+class TestAppendSqlColumn:
+    @pytest.mark.parametrize(
+        ("expression", "arrow_type"),
+        [('("a" * 2)', pa.int64()), ('("a" / 2.0)', pa.float64()), ('UPPER("s")', pa.string())],
+    )
+    def test_matches_fetch_and_append_column(
+        self, connection: sqlite3.Connection, expression: str, arrow_type: pa.DataType
+    ) -> None:
+        relation = _relation(connection)
+        values = [row[0] for row in connection.execute(f'SELECT {expression} FROM "{relation.table_name}"')]  # nosec
+
+        expected = relation.append_column("feat", values).to_arrow_table()
+        result = append_sql_column(relation, "feat", expression, arrow_type).to_arrow_table()
+
+        assert result.schema == expected.schema
+        assert result.to_pylist() == expected.to_pylist()
+
+    def test_keeps_source_type_hints_and_declared_type(self, connection: sqlite3.Connection) -> None:
+        result = append_sql_column(_relation(connection), "feat", '"a" + 1', pa.int64())
+        assert result.types == [pa.int64(), pa.string(), pa.timestamp("us", tz="UTC"), pa.int64()]
+
+    def test_declared_type_holds_for_an_all_null_column(self, connection: sqlite3.Connection) -> None:
+        result = append_sql_column(_relation(connection), "feat", "NULL", pa.float64()).to_arrow_table()
+        assert result.schema.field("feat").type == pa.float64()
+        assert result.column("feat").to_pylist() == [None] * 4
+
+    def test_does_not_read_the_data(self, connection: sqlite3.Connection) -> None:
+        relation = _relation(connection)
+        statements: list[str] = []
+        connection.set_trace_callback(statements.append)
+
+        append_sql_column(relation, "feat", '"a" + 1', pa.int64()).types
+
+        connection.set_trace_callback(None)
+        assert not [sql for sql in statements if sql.lstrip().upper().startswith("SELECT") and "LIMIT 0" not in sql]
+
+    def test_result_is_a_view(self, connection: sqlite3.Connection) -> None:
+        result = append_sql_column(_relation(connection), "feat", '"a" + 1', pa.int64())
+        kind = connection.execute("SELECT type FROM sqlite_temp_master WHERE name = ?", (result.table_name,)).fetchone()
+        assert kind == ("view",)
+
+    def test_rejects_existing_column_case_insensitively(self, connection: sqlite3.Connection) -> None:
+        with pytest.raises(ValueError, match="already exists"):
+            append_sql_column(_relation(connection), "A", "1", pa.int64())
+
+
+class TestAppendSqlQueryColumn:
+    def test_appends_query_result_in_row_order(self, connection: sqlite3.Connection) -> None:
+        relation = _relation(connection)
+        query = (
+            'SELECT "a", "s", "ts", SUM("a") OVER (ORDER BY rn ROWS UNBOUNDED PRECEDING) AS "feat" '
+            f'FROM (SELECT *, ROW_NUMBER() OVER () AS rn FROM "{relation.table_name}") ORDER BY rn'
+        )
+
+        result = append_sql_query_column(relation, "feat", query, pa.int64()).to_arrow_table()
+
+        assert result.column("a").to_pylist() == [3, None, 1, 2]
+        assert result.column("feat").to_pylist() == [3, 3, 4, 6]
+        assert result.schema.field("ts").type == pa.timestamp("us", tz="UTC")
+
+    def test_rejects_existing_column(self, connection: sqlite3.Connection) -> None:
+        with pytest.raises(ValueError, match="already exists"):
+            append_sql_query_column(_relation(connection), "s", "SELECT 1", pa.int64())
@@ -0,0 +1,68 @@
+"""Command-line entry point: ``python -m mloda.testing.benchmarks``.
+
+Example::
+
+    python -m mloda.testing.benchmarks --rows 10000 1000000 --partitions 10 10000 \\
+        --null-ratios 0 0.2 --operations rank window_aggregation --format csv --output bench.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+
+from mloda.testing.benchmarks.runner import (
+    BenchmarkConfig,
+    BenchmarkResult,
+    results_to_csv,
+    results_to_json,
+    run_benchmarks,
+)
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m mloda.testing.benchmarks", description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000], help="row counts to benchmark")
+    parser.add_argument("--partitions", type=int, nargs="+", default=[100], help="partition cardinalities")
+    parser.add_argument("--null-ratios", type=float, nargs="+", default=[0.0], help="null ratios of the measures")
+    parser.add_argument("--operations", nargs="+", default=None, help="operations to run (default: all)")
+    parser.add_argument("--frameworks", nargs="+", default=None, help="frameworks to run (default: all)")
+    parser.add_argument("--repeats", type=int, default=3, help="timed runs per cell; the best is reported")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the generated input")
+    parser.add_argument("--format", choices=("json", "csv"), default="json", help="output format")
+    parser.add_argument("--output", default=None, help="output file (default: stdout)")
+    return parser.parse_args(argv)
+
+
+def _report(result: BenchmarkResult) -> None:
+    timing = f"{result.wall_time_s:.4f}s" if result.wall_time_s is not None else result.error
+    print(
+        f"{result.operation}/{result.subtype or '-'} {result.framework} rows={result.rows} "
+        f"partitions={result.partitions} nulls={result.null_ratio}: {timing}",
+        file=sys.stderr,
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    config = BenchmarkConfig(
+        rows=tuple(args.rows),
+        partitions=tuple(args.partitions),
+        null_ratios=tuple(args.null_ratios),
+        operations=tuple(args.operations) if args.operations else None,
+        frameworks=tuple(args.frameworks) if args.frameworks else None,
+        repeats=args.repeats,
+        seed=args.seed,
+    )
+    results = run_benchmarks(config, progress=_report)
+    output = results_to_csv(results) if args.format == "csv" else results_to_json(results) + "\n"
+    if args.output is None:
+        sys.stdout.write(output)
+    else:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
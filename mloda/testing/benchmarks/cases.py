@@ -0,0 +1,115 @@
+"""One benchmark case per data operation and subtype listed by ``DataOperationsCatalog``.
+
+The catalog owns the operation and subtype universes and which framework supports
+which subtype; this module only adds, per operation, the feature name and options
+that exercise a subtype on the columns of ``make_benchmark_table``. An operation
+the catalog lists without a builder here raises, so new operations cannot silently
+drop out of the benchmark matrix.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from mloda.community.feature_groups.data_operations import DataOperationsCatalog
+from mloda.core.abstract_plugins.components.feature_set import FeatureSet
+
+from mloda.testing.feature_groups.data_operations.helpers import make_feature_set
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """A single feature to compute, and the frameworks the catalog says support it."""
+
+    operation: str
+    subtype: str | None
+    feature_name: str
+    frameworks: tuple[str, ...]
+    context: dict[str, Any] = field(default_factory=dict, hash=False)
+
+    def feature_set(self) -> FeatureSet:
+        return make_feature_set(self.feature_name, **self.context)
+
+
+_CaseBuilder = Callable[[str | None], tuple[str, dict[str, Any]]]
+
+
+def _partitioned() -> dict[str, Any]:
+    return {"partition_by": ["region"]}
+
+
+def _ordered(order_by: str = "ts") -> dict[str, Any]:
+    return {"partition_by": ["region"], "order_by": order_by}
+
+
+#: N used for the parametric offset and rank families.
+_OFFSET_N: dict[str, int] = {"lag": 1, "lead": 1, "diff": 1, "pct_change": 1}
+_RANK_N: dict[str, int] = {"ntile": 4, "top": 10, "bottom": 10}
+
+
+def _frame_aggregate(subtype: str | None) -> tuple[str, dict[str, Any]]:
+    if subtype == "rolling":
+        return "value__sum_rolling_10", _ordered()
+    context: dict[str, Any] = {"aggregation_type": "sum", "in_features": "value", **_ordered()}
+    if subtype is not None and subtype.startswith("time:"):
+        context.update({"frame_type": "time", "frame_size": 1, "frame_unit": subtype.split(":", 1)[1]})
+    else:
+        context["frame_type"] = subtype
+    return f"value_sum_{str(subtype).replace(':', '_')}_frame", context
+
+
+def _offset(subtype: str | None) -> tuple[str, dict[str, Any]]:
+    token = f"{subtype}_{_OFFSET_N[subtype]}" if subtype in _OFFSET_N else str(subtype)
+    return f"value__{token}_offset", _ordered()
+
+
+def _rank(subtype: str | None) -> tuple[str, dict[str, Any]]:
+    token = f"{subtype}_{_RANK_N[subtype]}" if subtype in _RANK_N else str(subtype)
+    return f"value__{token}_ranked", _ordered("value")
+
+
+_CASE_BUILDERS: dict[str, _CaseBuilder] = {
+    "aggregation": lambda st: (f"value__{st}_agg", _partitioned()),
+    "binning": lambda st: (f"value__{st}_10", {}),
+    "datetime": lambda st: (f"ts__{st}", {}),
+    "ema": lambda st: ("value__ema_5", _ordered()),
+    "ffill": lambda st: ("value__ffill", _ordered()),
+    "frame_aggregate": _frame_aggregate,
+    "offset": _offset,
+    "percentile": lambda st: ("value__p50_percentile", _partitioned()),
+    "point_arithmetic": lambda st: (f"a&b__{st}_point", {}),
+    "rank": _rank,
+    "resample": lambda st: ("value__resample_1_hour_mean", {**_partitioned(), "time_column": "ts"}),
+    "scalar_aggregate": lambda st: (f"value__{st}_scalar", {}),
+    "scalar_arithmetic": lambda st: (f"value__{st}_constant", {"constant": 3}),
+    "sessionization": lambda st: ("ts__sessionize_30_minute", _partitioned()),
+    "string": lambda st: (f"name__{st}", {}),
+    "time_bucketization": lambda st: (f"ts__{st}_1_hour", {}),
+    "window_aggregation": lambda st: (f"value__{st}_window", _ordered()),
+}
+
+
+def benchmark_cases(operations: Iterable[str] | None = None) -> list[BenchmarkCase]:
+    """Cases for every subtype of the given operations (all catalog operations by default).
+
+    Operations without a subtype axis yield a single case with ``subtype=None``.
+    Unknown operation names raise ValueError, as ``DataOperationsCatalog.get`` does.
+    """
+    infos = DataOperationsCatalog.list() if operations is None else [DataOperationsCatalog.get(o) for o in operations]
+    cases: list[BenchmarkCase] = []
+    for info in infos:
+        builder = _CASE_BUILDERS.get(info.name)
+        if builder is None:
+            raise ValueError(f"No benchmark case defined for operation {info.name!r}")
+        subtypes: tuple[str | None, ...] = info.subtypes if info.subtypes is not None else (None,)
+        for subtype in subtypes:
+            frameworks = tuple(
+                framework
+                for framework, supported in info.frameworks.items()
+                if supported is None or subtype in supported
+            )
+            feature_name, context = builder(subtype)
+            cases.append(BenchmarkCase(info.name, subtype, feature_name, frameworks, context))
+    return cases
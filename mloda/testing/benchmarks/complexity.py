@@ -0,0 +1,113 @@
+"""Empirical scaling exponents of data-operation backends, checked against their budgets.
+
+``measure_scaling`` times one benchmark case on one framework at ``n`` and ``factor * n``
+rows with a fixed number of partitions, so partitions grow with ``n`` and per-partition
+quadratic work shows up. It fits the slope of log(time) over log(rows) and compares it
+with the exponent the backend's declared ``Complexity`` predicts, plus a tolerance for
+timer noise. Constant per-call overhead only flattens the slope, so it cannot cause a
+false failure.
+
+Times are CPU seconds of this process (``time.process_time``), which includes the
+worker threads of multi-threaded engines and is far less sensitive to other processes
+on a shared CI host than wall time. After one untimed warm-up run, each size is
+timed ``repeats`` times and the fastest run is kept.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from mloda.community.feature_groups.data_operations import DataOperationsCatalog
+from mloda.community.feature_groups.data_operations.complexity import Complexity, complexity_budget
+
+from mloda.testing.benchmarks.cases import BenchmarkCase
+from mloda.testing.benchmarks.data import make_benchmark_table
+from mloda.testing.benchmarks.runner import run_once
+
+#: Default sizes and slack of the complexity regression tests.
+DEFAULT_ROWS = 1_000
+DEFAULT_FACTOR = 4
+DEFAULT_PARTITIONS = 2
+DEFAULT_TOLERANCE = 0.4
+
+#: Below this many CPU seconds at the largest size, timer resolution and fixed
+#: per-call overhead dominate and the fitted exponent says nothing about growth.
+MIN_MEASURABLE_SECONDS = 0.002
+
+
+def fit_exponent(sizes: Sequence[int], seconds: Sequence[float]) -> float:
+    """Least-squares slope of log(seconds) over log(sizes)."""
+    if len(sizes) != len(seconds) or len(sizes) < 2:
+        raise ValueError("fit_exponent needs at least two (size, seconds) pairs of equal length")
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(max(value, 1e-9)) for value in seconds]
+    x_mean = sum(xs) / len(xs)
+    y_mean = sum(ys) / len(ys)
+    covariance = sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys))
+    variance = sum((x - x_mean) ** 2 for x in xs)
+    return covariance / variance
+
+
+@dataclass(frozen=True)
+class ScalingMeasurement:
+    """Fitted scaling of one (operation, subtype, framework) cell against its budget."""
+
+    operation: str
+    subtype: str | None
+    framework: str
+    sizes: tuple[int, ...]
+    seconds: tuple[float, ...]
+    exponent: float
+    budget: Complexity
+    allowed_exponent: float
+
+    @property
+    def measurable(self) -> bool:
+        return self.seconds[-1] >= MIN_MEASURABLE_SECONDS
+
+    @property
+    def within_budget(self) -> bool:
+        return not self.measurable or self.exponent <= self.allowed_exponent
+
+    def describe(self) -> str:
+        timings = ", ".join(f"{size} rows: {value * 1000:.1f} ms" for size, value in zip(self.sizes, self.seconds))
+        return (
+            f"{self.operation}/{self.subtype or '-'} on {self.framework}: fitted exponent {self.exponent:.2f} "
+            f"exceeds {self.allowed_exponent:.2f} allowed for declared O({self.budget.value}) ({timings})"
+        )
+
+
+def measure_scaling(
+    case: BenchmarkCase,
+    framework: str,
+    rows: int = DEFAULT_ROWS,
+    factor: int = DEFAULT_FACTOR,
+    partitions: int = DEFAULT_PARTITIONS,
+    repeats: int = 2,
+    tolerance: float = DEFAULT_TOLERANCE,
+    seed: int = 0,
+) -> ScalingMeasurement:
+    """Time ``case`` on ``framework`` at ``rows`` and ``factor * rows`` and fit the exponent."""
+    sizes = (rows, rows * factor)
+    # Untimed warm-up: first calls pay for lazy imports and caches, which would
+    # inflate the smallest size and flatten the fitted exponent.
+    run_once(case, framework, make_benchmark_table(sizes[0], partitions, seed=seed))
+    seconds = []
+    for size in sizes:
+        table = make_benchmark_table(size, partitions, seed=seed)
+        seconds.append(min(run_once(case, framework, table, time.process_time) for _ in range(max(repeats, 1))))
+
+    budget = complexity_budget(DataOperationsCatalog.implementation(case.operation, framework), case.subtype)
+    return ScalingMeasurement(
+        operation=case.operation,
+        subtype=case.subtype,
+        framework=framework,
+        sizes=sizes,
+        seconds=tuple(seconds),
+        exponent=fit_exponent(sizes, seconds),
+        budget=budget,
+        allowed_exponent=budget.exponent(rows, factor) + tolerance,
+    )
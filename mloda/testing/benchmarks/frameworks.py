@@ -0,0 +1,50 @@
+"""Framework adapters for the benchmarks, built from the data-operations test mixins.
+
+The per-framework mixins already know how to turn an Arrow table into native input
+(``create_test_data``) and how to force a lazy result (``get_row_count`` collects a
+Polars frame and executes a DuckDB/SQLite relation). The benchmarks reuse them
+unchanged by composing each mixin with a terminal ``setup_method``, which is where
+the DuckDB and SQLite mixins open their connection.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from mloda.testing.feature_groups.data_operations.mixins.duckdb import DuckdbTestMixin
+from mloda.testing.feature_groups.data_operations.mixins.pandas import PandasTestMixin
+from mloda.testing.feature_groups.data_operations.mixins.polars_lazy import PolarsLazyTestMixin
+from mloda.testing.feature_groups.data_operations.mixins.pyarrow import PyArrowTestMixin
+from mloda.testing.feature_groups.data_operations.mixins.python_dict import PythonDictTestMixin
+from mloda.testing.feature_groups.data_operations.mixins.sqlite import SqliteTestMixin
+
+#: Test mixin per compute framework, keyed like ``OperationInfo.frameworks``.
+FRAMEWORK_MIXINS: dict[str, type[Any]] = {
+    "PyArrowTable": PyArrowTestMixin,
+    "PandasDataFrame": PandasTestMixin,
+    "PolarsLazyDataFrame": PolarsLazyTestMixin,
+    "DuckDBFramework": DuckdbTestMixin,
+    "SqliteFramework": SqliteTestMixin,
+    "PythonDictFramework": PythonDictTestMixin,
+}
+
+
+class _AdapterBase:
+    def setup_method(self) -> None:
+        """End of the mixins' ``super().setup_method()`` chain."""
+
+
+def framework_adapter(framework: str) -> Any:
+    """Return a set-up adapter for ``framework``; unknown names raise ValueError.
+
+    Every call builds a fresh adapter, so DuckDB and SQLite get a new in-memory
+    connection and one case cannot leave tables behind for the next.
+    """
+    mixin = FRAMEWORK_MIXINS.get(framework)
+    if mixin is None:
+        raise ValueError(
+            f"No benchmark adapter for framework {framework!r}. Supported frameworks: {', '.join(sorted(FRAMEWORK_MIXINS))}."
+        )
+    adapter = type(f"{framework}BenchmarkAdapter", (mixin, _AdapterBase), {})()
+    adapter.setup_method()
+    return adapter
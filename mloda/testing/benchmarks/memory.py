@@ -0,0 +1,118 @@
+"""Peak memory of the pandas row-preserving backends relative to their input frame.
+
+A row-preserving backend should allocate its output column(s) and the working
+state of the computation, not a second copy of the frame it was given. For each
+case this module converts the benchmark table to a pandas frame (untraced), then
+computes the feature and records the peak bytes allocated while doing so: the
+``tracemalloc`` peak (NumPy buffers, which hold numeric and datetime columns)
+plus the peak of a proxy Arrow memory pool (Arrow-backed string columns). Peak
+RSS cannot be reset within a process, so these traced allocations stand in for
+it; the input frame already lives before tracing starts, so a peak near the
+output size means the input was not duplicated.
+
+``overhead`` is the peak beyond the output columns as a fraction of the input
+size: a backend that copies its input reports at least 1.0.
+
+Run as ``python -m mloda.testing.benchmarks.memory --rows 1000000``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tracemalloc
+from dataclasses import dataclass
+
+import pyarrow as pa
+
+from mloda.community.feature_groups.data_operations import DataOperationsCatalog
+
+from mloda.testing.benchmarks.cases import BenchmarkCase, benchmark_cases
+from mloda.testing.benchmarks.data import make_benchmark_table
+from mloda.testing.benchmarks.frameworks import framework_adapter
+
+FRAMEWORK = "PandasDataFrame"
+
+#: Operations whose result has one row per group; their output is not the input plus a column.
+ROW_CHANGING_OPERATIONS = frozenset({"aggregation", "resample"})
+
+
+@dataclass(frozen=True)
+class MemoryResult:
+    """Peak allocation of one case against the sizes of its input and output."""
+
+    operation: str
+    subtype: str | None
+    rows: int
+    input_bytes: int
+    output_bytes: int
+    peak_bytes: int
+
+    @property
+    def overhead(self) -> float:
+        """Peak bytes beyond the output columns, as a fraction of the input frame's size."""
+        return (self.peak_bytes - self.output_bytes) / max(self.input_bytes, 1)
+
+
+def measure_memory(case: BenchmarkCase, table: pa.Table) -> MemoryResult:
+    """Peak bytes allocated by computing ``case`` on the pandas backend over ``table``."""
+    data = framework_adapter(FRAMEWORK).create_test_data(table)
+    concrete = DataOperationsCatalog.implementation(case.operation, FRAMEWORK)
+    features = case.feature_set()
+
+    previous_pool = pa.default_memory_pool()
+    pool = pa.proxy_memory_pool(previous_pool)
+    pa.set_memory_pool(pool)
+    tracemalloc.start()
+    try:
+        result = concrete.calculate_feature(data, features)
+        _, python_peak = tracemalloc.get_traced_memory()
+        new_columns = [col for col in result.columns if col not in data.columns]
+        output_bytes = int(result[new_columns].memory_usage(deep=True, index=False).sum())
+        # Arrow buffers of the result were allocated from the proxy pool; free them while it exists.
+        del result
+    finally:
+        tracemalloc.stop()
+        pa.set_memory_pool(previous_pool)
+
+    return MemoryResult(
+        case.operation,
+        case.subtype,
+        table.num_rows,
+        input_bytes=int(data.memory_usage(deep=True).sum()),
+        output_bytes=output_bytes,
+        peak_bytes=python_peak + (pool.max_memory() or 0),
+    )
+
+
+def run_memory_benchmarks(rows: int, operations: tuple[str, ...] | None = None, seed: int = 0) -> list[MemoryResult]:
+    """Measure every pandas case of the row-preserving ``operations`` (all of them by default)."""
+    table = make_benchmark_table(rows, seed=seed)
+    return [
+        measure_memory(case, table)
+        for case in benchmark_cases(operations)
+        if case.operation not in ROW_CHANGING_OPERATIONS and FRAMEWORK in case.frameworks
+    ]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m mloda.testing.benchmarks.memory", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument("--rows", type=int, default=1_000_000, help="rows of the input frame")
+    parser.add_argument("--operations", nargs="+", default=None, help="operations to run (default: all)")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the generated input")
+    args = parser.parse_args(argv)
+
+    results = run_memory_benchmarks(args.rows, tuple(args.operations) if args.operations else None, args.seed)
+    sys.stdout.write("operation,subtype,rows,input_bytes,output_bytes,peak_bytes,overhead\n")
+    for result in results:
+        sys.stdout.write(
+            f"{result.operation},{result.subtype or ''},{result.rows},{result.input_bytes},"
+            f"{result.output_bytes},{result.peak_bytes},{result.overhead:.3f}\n"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
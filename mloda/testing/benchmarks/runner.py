@@ -0,0 +1,150 @@
+"""Time every benchmark case on every supporting framework over a grid of input sizes.
+
+For each ``(rows, partitions, null_ratio)`` point of a ``BenchmarkConfig`` the runner
+builds one input table, then, per case and framework, converts it to native input
+(untimed) and times ``calculate_feature`` plus materialization of the result. The
+wall time is the best of ``repeats`` runs. Peak memory comes from one further run
+under ``tracemalloc`` (Python and NumPy heap) and a proxy Arrow memory pool (Arrow
+buffers); allocations made inside Polars, DuckDB or SQLite are not visible to
+either and are not counted. A failing case is recorded with its error instead of
+aborting the matrix.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass, fields, replace
+
+import pyarrow as pa
+
+from mloda.community.feature_groups.data_operations import DataOperationsCatalog
+
+from mloda.testing.benchmarks.cases import BenchmarkCase, benchmark_cases
+from mloda.testing.benchmarks.data import make_benchmark_table
+from mloda.testing.benchmarks.frameworks import framework_adapter
+
+
+@dataclass(frozen=True)
+class BenchmarkConfig:
+    """The benchmark grid; ``None`` for operations or frameworks means all of them."""
+
+    rows: tuple[int, ...] = (10_000,)
+    partitions: tuple[int, ...] = (100,)
+    null_ratios: tuple[float, ...] = (0.0,)
+    operations: tuple[str, ...] | None = None
+    frameworks: tuple[str, ...] | None = None
+    repeats: int = 3
+    seed: int = 0
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """One cell of the result matrix (operation x subtype x framework x size)."""
+
+    operation: str
+    subtype: str | None
+    framework: str
+    rows: int
+    partitions: int
+    null_ratio: float
+    status: str
+    wall_time_s: float | None = None
+    peak_python_bytes: int | None = None
+    peak_arrow_bytes: int | None = None
+    error: str | None = None
+
+
+def run_once(
+    case: BenchmarkCase, framework: str, table: pa.Table, clock: Callable[[], float] = time.perf_counter
+) -> float:
+    """Seconds by ``clock`` to compute ``case`` on ``framework`` and materialize the result.
+
+    Converting ``table`` to the framework's native input happens before the clock starts.
+    """
+    adapter = framework_adapter(framework)
+    concrete = DataOperationsCatalog.implementation(case.operation, framework)
+    data = adapter.create_test_data(table)
+    features = case.feature_set()
+    start = clock()
+    result = concrete.calculate_feature(data, features)
+    adapter.get_row_count(result)
+    return clock() - start
+
+
+def _peak_memory(case: BenchmarkCase, framework: str, table: pa.Table) -> tuple[int, int]:
+    previous_pool = pa.default_memory_pool()
+    pool = pa.proxy_memory_pool(previous_pool)
+    pa.set_memory_pool(pool)
+    tracemalloc.start()
+    try:
+        run_once(case, framework, table)
+        _, python_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        pa.set_memory_pool(previous_pool)
+    return python_peak, pool.max_memory() or 0
+
+
+def run_case(case: BenchmarkCase, framework: str, table: pa.Table, repeats: int = 3) -> tuple[float, int, int]:
+    """Measure ``case`` on ``framework`` over ``table``.
+
+    Returns ``(wall_time_s, peak_python_bytes, peak_arrow_bytes)``.
+    """
+    wall_time_s = min(run_once(case, framework, table) for _ in range(max(repeats, 1)))
+    peak_python_bytes, peak_arrow_bytes = _peak_memory(case, framework, table)
+    return wall_time_s, peak_python_bytes, peak_arrow_bytes
+
+
+def run_benchmarks(
+    config: BenchmarkConfig, progress: Callable[[BenchmarkResult], None] | None = None
+) -> list[BenchmarkResult]:
+    """Run the whole grid of ``config``; ``progress`` is called with each result as it lands."""
+    cases = benchmark_cases(config.operations)
+    results: list[BenchmarkResult] = []
+    for rows in config.rows:
+        for partitions in config.partitions:
+            for null_ratio in config.null_ratios:
+                table = make_benchmark_table(rows, partitions, null_ratio, config.seed)
+                for case in cases:
+                    for framework in case.frameworks:
+                        if config.frameworks is not None and framework not in config.frameworks:
+                            continue
+                        cell = BenchmarkResult(
+                            case.operation, case.subtype, framework, rows, partitions, null_ratio, status="ok"
+                        )
+                        try:
+                            wall_time_s, peak_python_bytes, peak_arrow_bytes = run_case(
+                                case, framework, table, config.repeats
+                            )
+                            result = replace(
+                                cell,
+                                wall_time_s=wall_time_s,
+                                peak_python_bytes=peak_python_bytes,
+                                peak_arrow_bytes=peak_arrow_bytes,
+                            )
+                        except Exception as exc:  # noqa: BLE001 - recorded in the matrix
+                            result = replace(cell, status="error", error=f"{type(exc).__name__}: {exc}")
+                        results.append(result)
+                        if progress is not None:
+                            progress(result)
+    return results
+
+
+def results_to_json(results: Iterable[BenchmarkResult]) -> str:
+    """Serialize results as a JSON array of flat records."""
+    return json.dumps([asdict(result) for result in results], indent=2)
+
+
+def results_to_csv(results: Iterable[BenchmarkResult]) -> str:
+    """Serialize results as CSV with one header row; missing values are empty cells."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=[f.name for f in fields(BenchmarkResult)], lineterminator="\n")
+    writer.writeheader()
+    for result in results:
+        writer.writerow(asdict(result))
+    return buffer.getvalue()
@@ -5,6 +5,8 @@ gaps, empty strings, all-null columns) that data-operations plugins can use as
 a shared test fixture. Follows the ATestDataCreator pattern from mloda core:
 a FeatureGroup with input_data() -> DataCreator(...) that serves as a root
 data source in mloda's pipeline.
+
+For the same schema at benchmark scale, see ``synthetic.SyntheticDataGenerator``.
 """
 
 from __future__ import annotations
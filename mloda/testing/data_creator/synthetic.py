@@ -0,0 +1,325 @@
+"""Scalable, seeded synthetic version of the data-operations test dataset.
+
+``DataOperationsTestDataCreator`` ships 12 hand-written rows. ``SyntheticDataGenerator``
+produces the same schema (region, category, timestamp, event_date, value_int,
+value_float, amount, name, is_active, score) at any row count, streamed as Arrow
+record batches, so 10^8 rows never exist as 10^8 Python objects.
+
+Every random draw is a counter-based hash (splitmix64) of ``(seed, column, row index)``
+evaluated with Arrow compute kernels. A row's values therefore depend only on the seed
+and its index: the output is identical for every ``batch_size`` and any slice of rows
+can be regenerated on its own.
+
+Knobs (all on ``SyntheticDataSpec``):
+
+- ``partitions`` / ``categories``: cardinality of ``region`` (``A``, ``B``, ...) and ``category``.
+- ``zipf_s``: skew of ``region``; 0 is uniform, larger values concentrate rows on ``A``.
+- ``null_ratio``: null density of the non-key columns; ``key_null_ratio`` that of
+  ``region`` and ``timestamp``; ``nan_ratio`` the NaN density of ``value_float``.
+- ``duplicate_timestamp_ratio``: fraction of rows that repeat the previous timestamp.
+- ``timezone`` / ``start`` / ``step``: timestamps advance by ``step`` from the wall-clock
+  ``start`` in ``timezone``, so ``timezone="Europe/Berlin", start=datetime(2023, 3, 26)``
+  crosses the spring-forward transition.
+- ``name_cardinality`` / ``name_length``: ``name`` is drawn from a pool of that many
+  strings whose lengths are uniform in the inclusive ``name_length`` range.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+from zoneinfo import ZoneInfo
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+_MASK64 = (1 << 64) - 1
+_GOLDEN = 0x9E3779B97F4A7C15
+_NAME_ALPHABET = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ  éü"
+
+# One independent random stream per drawn quantity.
+(
+    _REGION,
+    _REGION_NULL,
+    _CATEGORY,
+    _CATEGORY_NULL,
+    _TIMESTAMP_NULL,
+    _EVENT_DATE_NULL,
+    _VALUE_INT,
+    _VALUE_INT_NULL,
+    _VALUE_FLOAT,
+    _VALUE_FLOAT_NULL,
+    _VALUE_FLOAT_NAN,
+    _AMOUNT,
+    _AMOUNT_NULL,
+    _NAME,
+    _NAME_NULL,
+    _IS_ACTIVE,
+    _IS_ACTIVE_NULL,
+) = range(17)
+
+SCHEMA_FIELDS: tuple[str, ...] = (
+    "region",
+    "category",
+    "timestamp",
+    "event_date",
+    "value_int",
+    "value_float",
+    "amount",
+    "name",
+    "is_active",
+    "score",
+)
+
+
+def _mix64(value: int) -> int:
+    """splitmix64 finalizer on a Python int."""
+    value = (value ^ (value >> 30)) * 0xBF58476D1CE4E5B9 & _MASK64
+    value = (value ^ (value >> 27)) * 0x94D049BB133111EB & _MASK64
+    return value ^ (value >> 31)
+
+
+def _mix64_array(values: pa.Array) -> pa.Array:
+    """splitmix64 finalizer on a uint64 array (Arrow's unchecked multiply wraps modulo 2**64)."""
+    for shift, multiplier in ((30, 0xBF58476D1CE4E5B9), (27, 0x94D049BB133111EB)):
+        values = pc.bit_wise_xor(values, pc.shift_right(values, pa.scalar(shift, pa.uint64())))
+        values = pc.multiply(values, pa.scalar(multiplier, pa.uint64()))
+    return pc.bit_wise_xor(values, pc.shift_right(values, pa.scalar(31, pa.uint64())))
+
+
+def _label(index: int) -> str:
+    """Spreadsheet-style key label: A, B, ..., Z, AA, AB, ..."""
+    label = ""
+    index += 1
+    while index:
+        index, rem = divmod(index - 1, 26)
+        label = chr(ord("A") + rem) + label
+    return label
+
+
+@dataclass(frozen=True)
+class SyntheticDataSpec:
+    """Shape and distributions of a synthetic dataset; see the module docstring."""
+
+    rows: int = 1_000
+    partitions: int = 3
+    categories: int = 2
+    zipf_s: float = 0.0
+    null_ratio: float = 0.0
+    key_null_ratio: float = 0.0
+    nan_ratio: float = 0.0
+    duplicate_timestamp_ratio: float = 0.0
+    timezone: str = "UTC"
+    start: datetime = datetime(2023, 1, 1)
+    step: timedelta = timedelta(minutes=1)
+    name_cardinality: int = 1_000
+    name_length: tuple[int, int] = (0, 12)
+    batch_size: int = 65_536
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        if self.rows < 0:
+            raise ValueError(f"rows must be non-negative, got {self.rows}")
+        for name in ("partitions", "categories", "name_cardinality", "batch_size"):
+            if getattr(self, name) < 1:
+                raise ValueError(f"{name} must be at least 1, got {getattr(self, name)}")
+        for name in ("null_ratio", "key_null_ratio", "nan_ratio", "duplicate_timestamp_ratio"):
+            if not 0.0 <= getattr(self, name) < 1.0:
+                raise ValueError(f"{name} must be in [0, 1), got {getattr(self, name)}")
+        if self.zipf_s < 0:
+            raise ValueError(f"zipf_s must be non-negative, got {self.zipf_s}")
+        if not 0 <= self.name_length[0] <= self.name_length[1]:
+            raise ValueError(f"name_length must be an increasing (min, max) pair, got {self.name_length}")
+        if self.step <= timedelta(0):
+            raise ValueError(f"step must be positive, got {self.step}")
+
+
+class SyntheticDataGenerator:
+    """Generate ``spec.rows`` rows of the data-operations schema in Arrow record batches."""
+
+    def __init__(self, spec: SyntheticDataSpec | None = None) -> None:
+        self.spec = spec if spec is not None else SyntheticDataSpec()
+        self.schema = pa.schema(
+            [
+                ("region", pa.string()),
+                ("category", pa.string()),
+                ("timestamp", pa.timestamp("us", tz=self.spec.timezone)),
+                ("event_date", pa.date32()),
+                ("value_int", pa.int64()),
+                ("value_float", pa.float64()),
+                ("amount", pa.float64()),
+                ("name", pa.string()),
+                ("is_active", pa.bool_()),
+                ("score", pa.float64()),
+            ]
+        )
+        self._regions = pa.array([_label(i) for i in range(self.spec.partitions)])
+        self._categories = pa.array([chr(ord("X") + i) if i < 3 else f"X{i}" for i in range(self.spec.categories)])
+        self._names = pa.array(self._name_pool())
+        start = self.spec.start
+        if start.tzinfo is None:
+            start = start.replace(tzinfo=ZoneInfo(self.spec.timezone))
+        self._start_us = round(start.timestamp() * 1_000_000)
+        self._step_us = self.spec.step // timedelta(microseconds=1)
+
+    # -- random streams ---------------------------------------------------------
+
+    def _key(self, stream: int) -> pa.Scalar:
+        return pa.scalar(_mix64((self.spec.seed * 64 + stream) * _GOLDEN & _MASK64), pa.uint64())
+
+    def _uniform(self, index: pa.Array, stream: int) -> pa.Array:
+        """Uniform ``[0, 1)`` doubles, one per row index, independent across streams."""
+        state = pc.add(pc.multiply(index, pa.scalar(_GOLDEN, pa.uint64())), self._key(stream))
+        top53 = pc.shift_right(_mix64_array(state), pa.scalar(11, pa.uint64()))
+        return pc.multiply(pc.cast(top53, pa.float64()), 2.0**-53)
+
+    def _choice(self, index: pa.Array, stream: int, cardinality: int) -> pa.Array:
+        return pc.cast(pc.floor(pc.multiply(self._uniform(index, stream), cardinality)), pa.int64())
+
+    def _nulls(self, column: pa.Array, index: pa.Array, stream: int, ratio: float) -> pa.Array:
+        if ratio == 0.0:
+            return column
+        return pc.if_else(pc.less(self._uniform(index, stream), ratio), pa.scalar(None, column.type), column)
+
+    def _zipf_choice(self, index: pa.Array, stream: int, cardinality: int) -> pa.Array:
+        """Key indices with P(k) roughly proportional to (k + 1) ** -zipf_s.
+
+        Inverse CDF of the continuous power law over ``[1, cardinality + 1)``, floored;
+        ``zipf_s == 0`` reduces to the uniform choice.
+        """
+        s = self.spec.zipf_s
+        if s == 0.0:
+            return self._choice(index, stream, cardinality)
+        uniform = self._uniform(index, stream)
+        if s == 1.0:
+            rank = pc.power(float(cardinality + 1), uniform)
+        else:
+            scale = (cardinality + 1) ** (1.0 - s) - 1.0
+            rank = pc.power(pc.add(pc.multiply(uniform, scale), 1.0), 1.0 / (1.0 - s))
+        rank = pc.min_element_wise(pc.cast(pc.floor(rank), pa.int64()), cardinality)
+        return pc.subtract(rank, 1)
+
+    def _name_pool(self) -> list[str]:
+        low, high = self.spec.name_length
+        pool: list[str] = []
+        for j in range(self.spec.name_cardinality):
+            state = _mix64((self.spec.seed * 64 + _NAME) * _GOLDEN + j & _MASK64)
+            length = low + state % (high - low + 1)
+            chars = []
+            for _ in range(length):
+                state = _mix64(state + _GOLDEN & _MASK64)
+                chars.append(_NAME_ALPHABET[state % len(_NAME_ALPHABET)])
+            pool.append("".join(chars))
+        return pool
+
+    # -- columns ----------------------------------------------------------------
+
+    def _timestamps(self, index: pa.Array) -> pa.Array:
+        ticks = pc.cast(index, pa.float64())
+        if self.spec.duplicate_timestamp_ratio:
+            ticks = pc.floor(pc.multiply(ticks, 1.0 - self.spec.duplicate_timestamp_ratio))
+        offsets = pc.multiply(pc.cast(ticks, pa.int64()), self._step_us)
+        return pc.add(offsets, self._start_us).cast(self.schema.field("timestamp").type)
+
+    def _batch(self, start: int, stop: int) -> pa.RecordBatch:
+        spec = self.spec
+        one = pa.scalar(1, pa.uint64())
+        index = pc.subtract(pc.add(pc.cumulative_sum(pa.repeat(one, stop - start)), pa.scalar(start, pa.uint64())), one)
+
+        region = pc.take(self._regions, self._zipf_choice(index, _REGION, spec.partitions))
+        category = pc.take(self._categories, self._choice(index, _CATEGORY, spec.categories))
+        timestamp = self._timestamps(index)
+        event_date = pc.cast(pc.local_timestamp(timestamp), pa.date32())
+        value_int = pc.subtract(self._choice(index, _VALUE_INT, 200), 50)
+        value_float = pc.subtract(pc.multiply(self._uniform(index, _VALUE_FLOAT), 200.0), 100.0)
+        if spec.nan_ratio:
+            nan = pc.less(self._uniform(index, _VALUE_FLOAT_NAN), spec.nan_ratio)
+            value_float = pc.if_else(nan, float("nan"), value_float)
+        amount = pc.round(pc.multiply(self._uniform(index, _AMOUNT), 500.0), 2)
+        name = pc.take(self._names, self._choice(index, _NAME, spec.name_cardinality))
+        is_active = pc.less(self._uniform(index, _IS_ACTIVE), 0.5)
+
+        columns = [
+            self._nulls(region, index, _REGION_NULL, spec.key_null_ratio),
+            self._nulls(category, index, _CATEGORY_NULL, spec.null_ratio),
+            self._nulls(timestamp, index, _TIMESTAMP_NULL, spec.key_null_ratio),
+            self._nulls(event_date, index, _EVENT_DATE_NULL, spec.null_ratio),
+            self._nulls(value_int, index, _VALUE_INT_NULL, spec.null_ratio),
+            self._nulls(value_float, index, _VALUE_FLOAT_NULL, spec.null_ratio),
+            self._nulls(amount, index, _AMOUNT_NULL, spec.null_ratio),
+            self._nulls(name, index, _NAME_NULL, spec.null_ratio),
+            self._nulls(is_active, index, _IS_ACTIVE_NULL, spec.null_ratio),
+            pa.nulls(stop - start, pa.float64()),
+        ]
+        return pa.RecordBatch.from_arrays(columns, schema=self.schema)
+
+    # -- outputs ----------------------------------------------------------------
+
+    def iter_batches(self, start: int = 0, stop: int | None = None) -> Iterator[pa.RecordBatch]:
+        """Yield rows ``[start, stop)`` in batches of at most ``spec.batch_size`` rows."""
+        stop = self.spec.rows if stop is None else min(stop, self.spec.rows)
+        for offset in range(start, stop, self.spec.batch_size):
+            yield self._batch(offset, min(offset + self.spec.batch_size, stop))
+
+    def reader(self) -> pa.RecordBatchReader:
+        """A one-shot stream over all rows."""
+        return pa.RecordBatchReader.from_batches(self.schema, self.iter_batches())
+
+    def to_table(self) -> pa.Table:
+        return pa.Table.from_batches(list(self.iter_batches()), schema=self.schema)
+
+    def to_native(self, framework: str, connection: Any = None) -> Any:
+        """Return the data in the native format of ``framework`` (a compute framework class name).
+
+        DuckDB and SQLite load the stream batch by batch into a temp table of ``connection``
+        (a new in-memory connection when omitted). PythonDict necessarily materializes
+        every value as a Python object.
+        """
+        if framework == "PyArrowTable":
+            return self.to_table()
+        if framework == "PandasDataFrame":
+            return self.reader().read_pandas()
+        if framework == "PolarsLazyDataFrame":
+            import polars as pl
+
+            return pl.from_arrow(self.to_table()).lazy()  # type: ignore[union-attr]
+        if framework == "PythonDictFramework":
+            table = self.to_table()
+            return {name: table.column(name).to_pylist() for name in table.column_names}
+        if framework == "DuckDBFramework":
+            return self._to_duckdb(connection)
+        if framework == "SqliteFramework":
+            return self._to_sqlite(connection)
+        supported = (
+            "DuckDBFramework, PandasDataFrame, PolarsLazyDataFrame, PyArrowTable, PythonDictFramework, SqliteFramework"
+        )
+        raise ValueError(f"Unsupported framework: {framework!r}. Supported frameworks: {supported}.")
+
+    def _to_duckdb(self, connection: Any) -> Any:
+        import uuid
+
+        from mloda_plugins.compute_framework.base_implementations.duckdb.duckdb_relation import DuckdbRelation
+
+        if connection is None:
+            import duckdb
+
+            connection = duckdb.connect()
+        table_name = f"synthetic_{uuid.uuid4().hex}"
+        connection.from_arrow(self.reader()).create(table_name)
+        return DuckdbRelation(connection, connection.table(table_name))
+
+    def _to_sqlite(self, connection: Any) -> Any:
+        from mloda_plugins.compute_framework.base_implementations.sqlite.sqlite_relation import SqliteRelation
+
+        if connection is None:
+            import sqlite3
+
+            connection = sqlite3.connect(":memory:")
+        relation = SqliteRelation.from_arrow(connection, self.schema.empty_table())
+        placeholders = ", ".join("?" for _ in self.schema.names)
+        insert_sql = f'INSERT INTO "{relation.table_name}" VALUES ({placeholders})'  # nosec
+        for batch in self.iter_batches():
+            connection.executemany(insert_sql, zip(*(column.to_pylist() for column in batch.columns)))
+        return relation
@@ -20,8 +20,14 @@ from typing import Any
 import pytest
 
 from mloda.testing.feature_groups.data_operations.base import DataOpsTestBase
-from mloda.testing.feature_groups.data_operations.helpers import extract_column, make_feature_set
+from mloda.testing.feature_groups.data_operations.helpers import (
+    extract_column,
+    make_feature_set,
+    merge_feature_sets,
+)
+from mloda.testing.feature_groups.data_operations.mixins.approximate import ApproximateTestMixin
 from mloda.testing.feature_groups.data_operations.mixins.mask import MaskTestMixin
+from mloda.testing.feature_groups.data_operations.mixins.sharded_execution import ShardedExecutionTestMixin
 
 
 # ---------------------------------------------------------------------------
@@ -110,7 +116,7 @@ def _build_result_map(
 # ---------------------------------------------------------------------------
 
 
-class AggregationTestBase(MaskTestMixin, DataOpsTestBase):
+class AggregationTestBase(ApproximateTestMixin, ShardedExecutionTestMixin, MaskTestMixin, DataOpsTestBase):
     """Abstract base class for aggregation framework tests.
 
     Subclasses implement 5 abstract methods to wire up their framework,
@@ -147,6 +153,18 @@ class AggregationTestBase(MaskTestMixin, DataOpsTestBase):
         """Aggregation types this framework supports. Override to restrict."""
         return cls.ALL_AGG_TYPES
 
+    # -- ShardedExecutionTestMixin configuration -------------------------------
+
+    @classmethod
+    def sharded_feature_name(cls) -> str:
+        return "value_int__sum_agg"
+
+    # -- ApproximateTestMixin configuration ------------------------------------
+
+    @classmethod
+    def approximate_cases(cls) -> list[tuple[str, str, float | None]]:
+        return [("value_int__median_agg", "median", 0.5), ("value_int__nunique_agg", "nunique", None)]
+
     # -- MaskTestMixin configuration -------------------------------------------
 
     @classmethod
@@ -813,3 +831,47 @@ class AggregationTestBase(MaskTestMixin, DataOpsTestBase):
         assert result_map["B"] == 60
         assert result_map["C"] == 15
         assert result_map[None] == -10
+
+    # -- Several features in one FeatureSet ------------------------------------
+
+    def test_multi_feature_same_partition(self) -> None:
+        """Features sharing partition_by come back as columns of one grouped result."""
+        fs = merge_feature_sets(
+            make_feature_set("value_int__sum_agg", ["region"]),
+            make_feature_set("value_int__count_agg", ["region"]),
+            make_feature_set("value_int__max_agg", ["region"]),
+        )
+        result = self.implementation_class().calculate_feature(self.test_data, fs)
+
+        assert self.get_row_count(result) == 4
+        region_col = self.extract_column(result, "region")
+        for feature_name, expected_map in (
+            ("value_int__sum_agg", EXPECTED_SUM_BY_REGION),
+            ("value_int__count_agg", EXPECTED_COUNT_BY_REGION),
+            ("value_int__max_agg", EXPECTED_MAX_BY_REGION),
+        ):
+            result_map = _build_result_map(region_col, self.extract_column(result, feature_name))
+            assert result_map == expected_map, feature_name
+
+    def test_multi_feature_shared_mask(self) -> None:
+        """Masked features sharing partition_by and mask are reduced together."""
+        fs = merge_feature_sets(
+            make_feature_set("value_int__sum_agg", ["region"], mask=("category", "equal", "X")),
+            make_feature_set("value_int__count_agg", ["region"], mask=("category", "equal", "X")),
+        )
+        result = self.implementation_class().calculate_feature(self.test_data, fs)
+
+        region_col = self.extract_column(result, "region")
+        sum_map = _build_result_map(region_col, self.extract_column(result, "value_int__sum_agg"))
+        count_map = _build_result_map(region_col, self.extract_column(result, "value_int__count_agg"))
+        assert sum_map == {"A": 10, "B": 60, "C": 15, None: -10}
+        assert count_map == {"A": 2, "B": 1, "C": 1, None: 1}
+
+    def test_multi_feature_different_partitions_raise(self) -> None:
+        """Reducing features cannot share one output table unless partition_by matches."""
+        fs = merge_feature_sets(
+            make_feature_set("value_int__sum_agg", ["region"]),
+            make_feature_set("value_int__sum_agg", ["region", "category"]),
+        )
+        with pytest.raises(ValueError, match="partition_by"):
+            self.implementation_class().calculate_feature(self.test_data, fs)
@@ -4,6 +4,7 @@ Provides:
 - ``extract_column``: Extract a column from any framework result as a Python list.
 - ``make_feature_set``: Build a FeatureSet with optional partition_by/order_by.
 - ``feature_set_for``: Build a FeatureSet around an Options that already exists.
+- ``merge_feature_sets``: Combine several single-feature FeatureSets into one.
 """
 
 from __future__ import annotations
@@ -73,3 +74,12 @@ def feature_set_for(feature_name: str, options: Options) -> FeatureSet:
     fs = FeatureSet()
     fs.add(Feature(feature_name, options=options))
     return fs
+
+
+def merge_feature_sets(*feature_sets: FeatureSet) -> FeatureSet:
+    """Build one FeatureSet holding every feature of ``feature_sets``.
+
+    mloda hands a feature group all requested features of one compute framework in a
+    single FeatureSet; this reproduces that shape from ``make_feature_set`` building blocks.
+    """
+    return FeatureSet(feature for fs in feature_sets for feature in fs.features)
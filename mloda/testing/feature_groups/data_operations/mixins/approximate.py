@@ -0,0 +1,111 @@
+"""Reusable approximate-mode test mixin for aggregation, scalar_aggregate and percentile.
+
+Provides standardized tests for the opt-in ``approximate`` option, run across every
+framework implementation of the operation:
+
+- ``test_mixin_approximate_stays_within_bound``: with ``approximate=True`` a backend
+  without a kernel for the aggregate returns exactly the exact result; a backend with
+  one stays within one value step of the exact quantile rank (or within 2% of the
+  exact distinct count), and is null exactly where the exact result is null.
+- ``test_mixin_approximate_requires_a_bool``: ``approximate`` matches only as a bool.
+
+Cases whose aggregate the backend does not support are skipped.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any
+
+import pytest
+
+from mloda.core.abstract_plugins.components.options import Options
+from mloda.testing.feature_groups.data_operations.helpers import make_feature_set
+
+
+class ApproximateTestMixin:
+    """Mixin providing the standardized ``approximate`` tests.
+
+    Requires the host class to provide (from DataOpsTestBase):
+    - ``implementation_class()``
+    - ``test_data`` and ``_arrow_table`` attributes (set in setup_method)
+    - ``extract_column(result, name)``
+    """
+
+    # -- Configuration methods (override per feature group) --------------------
+
+    @classmethod
+    def approximate_cases(cls) -> list[tuple[str, str, float | None]]:
+        """``(feature_name, kernel, quantile)`` per case; quantile None for a distinct count."""
+        raise NotImplementedError
+
+    @classmethod
+    def approximate_context(cls) -> dict[str, Any]:
+        """Options context of the approximate features, without ``approximate``."""
+        return {"partition_by": ["region"]}
+
+    # -- Helpers ------------------------------------------------------------------
+
+    def _run_approximate(self, feature_name: str, approximate: bool) -> tuple[list[Any], list[tuple[Any, ...]]]:
+        """The feature's values and, aligned with them, each result row's partition key."""
+        context = self.approximate_context()
+        options: dict[str, Any] = {"approximate": True} if approximate else {}
+        feature_set = make_feature_set(feature_name, **context, **options)
+        result = self.implementation_class().calculate_feature(self.test_data, feature_set)  # type: ignore[attr-defined]
+        values = list(self.extract_column(result, feature_name))  # type: ignore[attr-defined]
+        key_columns = [list(self.extract_column(result, col)) for col in context.get("partition_by", [])]  # type: ignore[attr-defined]
+        return values, [tuple(col[i] for col in key_columns) for i in range(len(values))]
+
+    def _partition_values(self, source_col: str) -> dict[tuple[Any, ...], list[Any]]:
+        table = self._arrow_table  # type: ignore[attr-defined]
+        key_columns = [table.column(col).to_pylist() for col in self.approximate_context().get("partition_by", [])]
+        groups: dict[tuple[Any, ...], list[Any]] = {}
+        for i, value in enumerate(table.column(source_col).to_pylist()):
+            groups.setdefault(tuple(col[i] for col in key_columns), []).append(value)
+        return groups
+
+    def _supported_cases(self) -> list[tuple[str, str, float | None]]:
+        """The cases whose aggregate the backend supports (per ``supported_agg_types`` where the base has it)."""
+        supported_agg_types = getattr(self, "supported_agg_types", None)
+        if supported_agg_types is None:
+            return self.approximate_cases()
+        return [case for case in self.approximate_cases() if case[1] in supported_agg_types()]
+
+    @staticmethod
+    def _assert_quantile_within_one_step(actual: float, values: list[Any], quantile: float) -> None:
+        ordered = sorted(v for v in values if v is not None and not (isinstance(v, float) and math.isnan(v)))
+        rank = quantile * (len(ordered) - 1)
+        low = ordered[max(math.floor(rank) - 1, 0)]
+        high = ordered[min(math.ceil(rank) + 1, len(ordered) - 1)]
+        assert low <= actual <= high, (actual, ordered, quantile)
+
+    # -- Tests ----------------------------------------------------------------------
+
+    def test_mixin_approximate_stays_within_bound(self) -> None:
+        impl = self.implementation_class()  # type: ignore[attr-defined]
+        for feature_name, kernel, quantile in self._supported_cases():
+            approximate, keys = self._run_approximate(feature_name, approximate=True)
+            exact, _ = self._run_approximate(feature_name, approximate=False)
+            if kernel not in impl.APPROXIMATE_KERNELS:
+                assert approximate == pytest.approx(exact, nan_ok=True), feature_name
+                continue
+
+            groups = self._partition_values(feature_name.split("__", 1)[0])
+            for actual, expected, key in zip(approximate, exact, keys):
+                assert (actual is None) == (expected is None), (feature_name, key)
+                if actual is None:
+                    continue
+                if quantile is None:
+                    assert abs(actual - expected) <= max(1, 0.02 * expected), (feature_name, key)
+                else:
+                    self._assert_quantile_within_one_step(actual, groups[key], quantile)
+
+    def test_mixin_approximate_requires_a_bool(self) -> None:
+        impl = self.implementation_class()  # type: ignore[attr-defined]
+        context = self.approximate_context()
+        supported = self._supported_cases()
+        if not supported:
+            pytest.skip("backend supports none of the approximate cases")
+        feature_name = supported[0][0]
+        assert impl.match_feature_group_criteria(feature_name, Options(context={**context, "approximate": True}))
+        assert not impl.match_feature_group_criteria(feature_name, Options(context={**context, "approximate": "yes"}))
@@ -0,0 +1,115 @@
+"""Reusable fitted-statistics test mixin for scalar_aggregate and percentile.
+
+Provides standardized tests for the opt-in ``statistics_version`` option, run across
+every framework implementation of the operation:
+
+- ``test_mixin_fitted_statistics_serve_training_values``: a run with an artifact
+  requested saves the statistic fitted on the canonical data; a run given that
+  artifact serves it to a small request table instead of computing on the request,
+  with null for a partition the training data did not have.
+- ``test_mixin_fitted_statistics_version_mismatch_raises``: serving under another
+  ``statistics_version`` label raises instead of serving stale values.
+- ``test_mixin_fitted_statistics_match_follows_backend_support``: a backend without
+  ``FITTED_STATISTICS_OPS`` rejects a feature carrying ``statistics_version``.
+- ``test_mixin_fitted_statistics_without_version_saves_nothing``: with an artifact
+  requested but no ``statistics_version``, the run withdraws the request instead of
+  saving an empty artifact.
+
+The first two skip for backends that do not serve fitted statistics.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pyarrow as pa
+import pytest
+
+from mloda.core.abstract_plugins.components.options import Options
+from mloda.testing.feature_groups.data_operations.helpers import make_feature_set
+
+# The request rows served from the artifact: two training regions, one unseen, one null.
+FITTED_STATISTICS_REQUEST = pa.table(
+    {
+        "region": pa.array(["C", "A", "Z", None], type=pa.string()),
+        "value_int": pa.array([1, 2, 3, 4], type=pa.int64()),
+    }
+)
+
+
+class FittedStatisticsTestMixin:
+    """Mixin providing the standardized ``statistics_version`` tests.
+
+    Requires the host class to provide (from DataOpsTestBase):
+    - ``implementation_class()``
+    - ``create_test_data(arrow_table)``
+    - ``test_data`` attribute (set in setup_method)
+    - ``extract_column(result, name)``
+    """
+
+    # -- Configuration methods (override per feature group) --------------------
+
+    @classmethod
+    def fitted_statistics_feature_name(cls) -> str:
+        """Feature name for the fitted-statistics tests (e.g. 'value_int__sum_scalar')."""
+        raise NotImplementedError
+
+    @classmethod
+    def fitted_statistics_context(cls) -> dict[str, Any]:
+        """Options context of the feature, without ``statistics_version``."""
+        return {}
+
+    @classmethod
+    def fitted_statistics_expected(cls) -> list[Any]:
+        """The training statistic served to each row of ``FITTED_STATISTICS_REQUEST``."""
+        raise NotImplementedError
+
+    # -- Helpers ------------------------------------------------------------------
+
+    def _skip_without_fitted_statistics(self) -> None:
+        if getattr(self.implementation_class(), "FITTED_STATISTICS_OPS", None) is None:  # type: ignore[attr-defined]
+            pytest.skip("backend does not serve fitted statistics")
+
+    def _fit_statistics(self, version: str) -> Any:
+        """Compute the feature on the canonical data with an artifact requested; return the saved artifact."""
+        name = self.fitted_statistics_feature_name()
+        fs = make_feature_set(name, **self.fitted_statistics_context(), statistics_version=version)
+        fs.add_artifact_name()
+        impl = self.implementation_class()  # type: ignore[attr-defined]
+        impl.calculate_feature(self.test_data, fs)  # type: ignore[attr-defined]
+        return impl.artifact().save(fs, fs.save_artifact)
+
+    def _serve_statistics(self, version: str, artifact: Any) -> list[Any]:
+        """Serve the feature to ``FITTED_STATISTICS_REQUEST`` from ``artifact``."""
+        name = self.fitted_statistics_feature_name()
+        fs = make_feature_set(name, **self.fitted_statistics_context(), statistics_version=version, **{name: artifact})
+        fs.add_artifact_name()
+        request = self.create_test_data(FITTED_STATISTICS_REQUEST)  # type: ignore[attr-defined]
+        result = self.implementation_class().calculate_feature(request, fs)  # type: ignore[attr-defined]
+        return list(self.extract_column(result, name))  # type: ignore[attr-defined]
+
+    # -- Tests ----------------------------------------------------------------------
+
+    def test_mixin_fitted_statistics_serve_training_values(self) -> None:
+        self._skip_without_fitted_statistics()
+        served = self._serve_statistics("v1", self._fit_statistics("v1"))
+        assert served == pytest.approx(self.fitted_statistics_expected())
+
+    def test_mixin_fitted_statistics_version_mismatch_raises(self) -> None:
+        self._skip_without_fitted_statistics()
+        artifact = self._fit_statistics("v1")
+        with pytest.raises(ValueError, match="Run without the artifact to refit"):
+            self._serve_statistics("v2", artifact)
+
+    def test_mixin_fitted_statistics_match_follows_backend_support(self) -> None:
+        impl = self.implementation_class()  # type: ignore[attr-defined]
+        options = Options(context={**self.fitted_statistics_context(), "statistics_version": "v1"})
+        matched = impl.match_feature_group_criteria(self.fitted_statistics_feature_name(), options, None)
+        assert matched is (getattr(impl, "FITTED_STATISTICS_OPS", None) is not None)
+
+    def test_mixin_fitted_statistics_without_version_saves_nothing(self) -> None:
+        fs = make_feature_set(self.fitted_statistics_feature_name(), **self.fitted_statistics_context())
+        fs.add_artifact_name()
+        self.implementation_class().calculate_feature(self.test_data, fs)  # type: ignore[attr-defined]
+        assert fs.artifact_to_save is None
+        assert fs.save_artifact is None
@@ -0,0 +1,140 @@
+"""Reusable carried-state test mixin for sequential recurrences (ema, ffill, sessionize).
+
+Provides standardized tests for the opt-in ``state_store`` option, run across every
+framework implementation of the operation:
+
+- ``test_mixin_state_store_split_run_matches_full_run``: the rows split into two runs
+  by time, the second run only receiving the new rows, give the same result as one
+  run over all rows. Session ids are compared as groupings: a split run numbers the
+  sessions of its second batch after every session of the first.
+- ``test_mixin_state_store_out_of_order_row_raises``: a row earlier than its
+  partition's carried tail raises ``OutOfOrderRowError``.
+- ``test_mixin_state_store_match_follows_backend_support``: a backend without
+  ``STATE_FRAME_OPS`` rejects a feature carrying ``state_store`` at match time.
+
+The first two skip for backends that do not carry state.
+"""
+
+from __future__ import annotations
+
+import uuid
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pytest
+
+from mloda.core.abstract_plugins.components.options import Options
+from mloda.testing.feature_groups.data_operations.helpers import make_feature_set
+
+
+class RecurrenceStateTestMixin:
+    """Mixin providing the standardized ``state_store`` tests.
+
+    Requires the host class to provide (from DataOpsTestBase):
+    - ``implementation_class()``
+    - ``_arrow_table`` attribute (set in setup_method), without null ``order_by`` values
+    - ``create_test_data(arrow_table)`` and ``extract_column(result, name)``
+    """
+
+    # -- Configuration methods (override per feature group) --------------------
+
+    @classmethod
+    def recurrence_state_feature_name(cls) -> str:
+        """Feature name for the carried-state tests (e.g. 'value__ffill')."""
+        raise NotImplementedError
+
+    @classmethod
+    def recurrence_state_partition_by(cls) -> list[str]:
+        return ["region"]
+
+    @classmethod
+    def recurrence_state_order_by(cls) -> str:
+        return "ts"
+
+    @classmethod
+    def recurrence_state_compares_groupings(cls) -> bool:
+        """True when results are ids whose grouping, not numbering, must match (sessionize)."""
+        return False
+
+    # -- Helpers ------------------------------------------------------------------
+
+    def _state_feature_set(self, store: str | None) -> Any:
+        extra: dict[str, Any] = {} if store is None else {"state_store": store}
+        return make_feature_set(
+            self.recurrence_state_feature_name(),
+            partition_by=self.recurrence_state_partition_by(),
+            order_by=self.recurrence_state_order_by(),
+            **extra,
+        )
+
+    def _run(self, table: pa.Table, store: str | None) -> list[Any]:
+        data = self.create_test_data(table)  # type: ignore[attr-defined]
+        result = self.implementation_class().calculate_feature(data, self._state_feature_set(store))  # type: ignore[attr-defined]
+        return list(self.extract_column(result, self.recurrence_state_feature_name()))  # type: ignore[attr-defined]
+
+    @staticmethod
+    def _drop_store(store: str) -> None:
+        # Lazy import, as for the reference implementations: this testing module must
+        # import cleanly without the production package.
+        from mloda.community.feature_groups.data_operations.recurrence_state import drop_state_store
+
+        drop_state_store(store)
+
+    def _skip_without_state_support(self) -> None:
+        if getattr(self.implementation_class(), "STATE_FRAME_OPS", None) is None:  # type: ignore[attr-defined]
+            pytest.skip("backend does not carry recurrence state")
+
+    # -- Tests ----------------------------------------------------------------------
+
+    def test_mixin_state_store_split_run_matches_full_run(self) -> None:
+        self._skip_without_state_support()
+        table: pa.Table = self._arrow_table  # type: ignore[attr-defined]
+        order = table.column(self.recurrence_state_order_by())
+        time_rank = pc.rank(order, sort_keys="ascending", tiebreaker="first")
+        first_rows = pc.less_equal(time_rank, table.num_rows // 2)
+
+        store = f"test-{uuid.uuid4()}"
+        try:
+            first = self._run(table.filter(first_rows), store)
+            second = self._run(table.filter(pc.invert(first_rows)), store)
+        finally:
+            self._drop_store(store)
+
+        first_iter, second_iter = iter(first), iter(second)
+        split = [next(first_iter) if is_first else next(second_iter) for is_first in first_rows.to_pylist()]
+        full = self._run(table, None)
+
+        if self.recurrence_state_compares_groupings():
+            assert len(set(split)) == len(set(full))
+            assert len(set(zip(split, full))) == len(set(full)), f"split {split} does not group like {full}"
+        else:
+            assert split == pytest.approx(full, nan_ok=True)
+
+    def test_mixin_state_store_out_of_order_row_raises(self) -> None:
+        self._skip_without_state_support()
+        table: pa.Table = self._arrow_table  # type: ignore[attr-defined]
+        order = table.column(self.recurrence_state_order_by())
+        latest = pc.equal(order, pc.max(order))
+
+        from mloda.community.feature_groups.data_operations.recurrence_state import OutOfOrderRowError
+
+        store = f"test-{uuid.uuid4()}"
+        try:
+            self._run(table.filter(latest), store)
+            with pytest.raises(OutOfOrderRowError, match="earlier than the last row"):
+                self._run(table.filter(pc.invert(latest)), store)
+        finally:
+            self._drop_store(store)
+
+    def test_mixin_state_store_match_follows_backend_support(self) -> None:
+        impl = self.implementation_class()  # type: ignore[attr-defined]
+        options = Options(
+            context={
+                "partition_by": self.recurrence_state_partition_by(),
+                "order_by": self.recurrence_state_order_by(),
+                "state_store": "unused",
+            }
+        )
+        matched = impl.match_feature_group_criteria(self.recurrence_state_feature_name(), options, None)
+        assert matched is (getattr(impl, "STATE_FRAME_OPS", None) is not None)
@@ -0,0 +1,70 @@
+"""Reusable sharded-execution test mixin for partitioned operations (aggregation, rank, frame_aggregate).
+
+Provides standardized tests for the opt-in ``shards`` option, run across every
+framework implementation of the operation:
+
+- ``test_mixin_shards_match_in_process_run``: the result with the rows hash-split
+  into shards and computed in worker processes equals the in-process result,
+  values and row order alike.
+- ``test_mixin_shards_match_follows_backend_support``: a backend without
+  ``SHARD_FRAME_OPS`` rejects a feature carrying ``shards`` at match time.
+
+The first skips for backends that do not run sharded.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from mloda.core.abstract_plugins.components.options import Options
+from mloda.testing.feature_groups.data_operations.helpers import make_feature_set
+
+
+class ShardedExecutionTestMixin:
+    """Mixin providing the standardized ``shards`` tests.
+
+    Requires the host class to provide (from DataOpsTestBase):
+    - ``implementation_class()``
+    - ``test_data`` attribute (set in setup_method)
+    - ``extract_column(result, name)``
+    """
+
+    # -- Configuration methods (override per feature group) --------------------
+
+    @classmethod
+    def sharded_feature_name(cls) -> str:
+        """Feature name for the sharded tests (e.g. 'value_int__sum_agg')."""
+        raise NotImplementedError
+
+    @classmethod
+    def sharded_context(cls) -> dict[str, Any]:
+        """Options context of the sharded feature, without ``shards``."""
+        return {"partition_by": ["region"]}
+
+    # -- Helpers ------------------------------------------------------------------
+
+    def _run_with_shards(self, shards: int | None) -> dict[str, list[Any]]:
+        extra: dict[str, Any] = {} if shards is None else {"shards": shards}
+        feature_set = make_feature_set(self.sharded_feature_name(), **self.sharded_context(), **extra)
+        result = self.implementation_class().calculate_feature(self.test_data, feature_set)  # type: ignore[attr-defined]
+        columns = [*self.sharded_context()["partition_by"], self.sharded_feature_name()]
+        return {col: list(self.extract_column(result, col)) for col in columns}  # type: ignore[attr-defined]
+
+    # -- Tests ----------------------------------------------------------------------
+
+    def test_mixin_shards_match_in_process_run(self) -> None:
+        if getattr(self.implementation_class(), "SHARD_FRAME_OPS", None) is None:  # type: ignore[attr-defined]
+            pytest.skip("backend does not run sharded")
+        # More shards than the four regions: some shards stay empty and are skipped.
+        sharded = self._run_with_shards(16)
+        in_process = self._run_with_shards(None)
+        for col, values in in_process.items():
+            assert sharded[col] == pytest.approx(values, nan_ok=True), col
+
+    def test_mixin_shards_match_follows_backend_support(self) -> None:
+        impl = self.implementation_class()  # type: ignore[attr-defined]
+        options = Options(context={**self.sharded_context(), "shards": 4})
+        matched = impl.match_feature_group_criteria(self.sharded_feature_name(), options, None)
+        assert matched is (getattr(impl, "SHARD_FRAME_OPS", None) is not None)
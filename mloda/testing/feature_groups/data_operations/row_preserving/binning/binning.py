@@ -12,6 +12,7 @@ framework implementation inherits by subclassing and implementing
 
 from __future__ import annotations
 
+import json
 from typing import Any
 
 import pyarrow as pa
@@ -63,6 +64,19 @@ EXPECTED_QBIN_3: list[Any] = [0, 0, 0, 1, None, 2, 1, 2, 1, 1, 2, 0]
 EXPECTED_QBIN_5: list[Any] = [1, 0, 0, 2, None, 4, 3, 4, 1, 2, 3, 0]
 
 
+# ---------------------------------------------------------------------------
+# Fitted bin edges
+# ---------------------------------------------------------------------------
+# bin_3: min + k * 70 / 3 for k = 1, 2.
+FITTED_BIN_3_EDGES = [-10 + 70 / 3, -10 + 2 * 70 / 3]
+
+# qbin_3: the sorted value at rank ceil(k * 11 / 3) for k = 1, 2, i.e. ranks 4 and 8.
+FITTED_QBIN_3_EDGES = [15, 40]
+
+# Edges [0, 25] applied to value_int, independent of its own quantiles.
+EXPECTED_EDGES_0_25: list[Any] = [1, 0, 1, 1, None, 2, 2, 2, 1, 1, 2, 0]
+
+
 # ---------------------------------------------------------------------------
 # Reusable test base class
 # ---------------------------------------------------------------------------
@@ -478,3 +492,88 @@ class BinningTestBase(DataOpsTestBase):
             )
         )
         assert output_id == input_id
+
+    # -- Fitted bin edges ------------------------------------------------------
+
+    @staticmethod
+    def _version_context(version: str | None) -> dict[str, Any]:
+        """The ``bin_edges_version`` option, or no option when ``version`` is None."""
+        return {} if version is None else {"bin_edges_version": version}
+
+    def _fit(self, feature_name: str, version: str | None = "v1") -> Any:
+        """Bin ``feature_name`` with an artifact requested and return the saved edges (None if none)."""
+        fs = make_feature_set(feature_name, **self._version_context(version))
+        fs.add_artifact_name()
+        self.implementation_class().calculate_feature(self.test_data, fs)
+        saved = self.implementation_class().artifact().save(fs, fs.save_artifact)
+        return None if saved is None else json.loads(saved)
+
+    def _apply(self, feature_name: str, fitted: Any, data: Any = None, version: str | None = "v1") -> list[Any]:
+        """Bin ``feature_name`` against the loaded artifact ``fitted``."""
+        fs = make_feature_set(feature_name, **{feature_name: fitted}, **self._version_context(version))
+        fs.add_artifact_name()
+        result = self.implementation_class().calculate_feature(self.test_data if data is None else data, fs)
+        return list(self.extract_column(result, feature_name))
+
+    def test_fit_saves_bin_edges(self) -> None:
+        """Binning with ``bin_edges_version`` and an artifact requested saves the edges it fitted."""
+        fitted = self._fit("value_int__bin_3")
+        assert fitted["value_int__bin_3"]["edges"] == pytest.approx(FITTED_BIN_3_EDGES)
+        assert {k: v for k, v in fitted["value_int__bin_3"].items() if k != "edges"} == {
+            "version": "v1",
+            "source": "value_int",
+            "op": "bin",
+            "n_bins": 3,
+        }
+        if "qbin" in self.supported_ops():
+            assert self._fit("value_int__qbin_3")["value_int__qbin_3"]["edges"] == FITTED_QBIN_3_EDGES
+
+    def test_fitted_edges_reproduce_training_bins(self) -> None:
+        """Applying the edges fitted on the data reproduces the bins computed on it."""
+        assert self._apply("value_int__bin_3", self._fit("value_int__bin_3")) == EXPECTED_BIN_3
+        if "qbin" in self.supported_ops():
+            assert self._apply("value_int__qbin_3", self._fit("value_int__qbin_3")) == EXPECTED_QBIN_3
+
+    def test_loaded_edges_are_not_refitted(self) -> None:
+        """Loaded edges bin the rows as stored, whatever the rows' own range."""
+        fitted = {
+            "value_int__bin_3": {"version": "v1", "source": "value_int", "op": "bin", "n_bins": 3, "edges": [0, 25]}
+        }
+        assert self._apply("value_int__bin_3", json.dumps(fitted)) == EXPECTED_EDGES_0_25
+
+    def test_loaded_edges_apply_to_unseen_values(self) -> None:
+        """Values outside the fitted range clamp to the first and last bin; NaN and null stay null."""
+        fitted = {
+            "value_int__bin_3": {"version": "v1", "source": "value_int", "op": "bin", "n_bins": 3, "edges": [0.0, 25.0]}
+        }
+        data = self.create_test_data(pa.table({"value_int": pa.array([-100.0, 0.0, float("nan"), None, 1e9])}))
+        assert self._apply("value_int__bin_3", fitted, data) == [0, 1, None, None, 2]
+
+    def test_loaded_edges_must_match_the_feature(self) -> None:
+        """An artifact fitted for another op or bin count is rejected."""
+        fitted = {
+            "value_int__bin_3": {"version": "v1", "source": "value_int", "op": "qbin", "n_bins": 3, "edges": [0, 25]}
+        }
+        with pytest.raises(ValueError, match="source/op/n_bins"):
+            self._apply("value_int__bin_3", fitted)
+
+    def test_loaded_edges_must_match_the_version(self) -> None:
+        """Edges fitted under another ``bin_edges_version`` label are rejected instead of served."""
+        with pytest.raises(ValueError, match="Run without the artifact to refit"):
+            self._apply("value_int__bin_3", self._fit("value_int__bin_3", version="v1"), version="v2")
+
+    def test_fit_without_version_saves_and_sorts_nothing(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Without ``bin_edges_version`` an artifact request fits nothing: no sort, no saved edges."""
+
+        def fail(*args: Any) -> Any:
+            raise AssertionError("the source was sorted for a fit nobody asked for")
+
+        monkeypatch.setattr(self.implementation_class(), "_sorted_source_values", fail)
+        assert self._fit("value_int__bin_3", version=None) is None
+
+    def test_loaded_edges_are_ignored_without_version(self) -> None:
+        """Without ``bin_edges_version`` a passed-in artifact does not switch the feature to serving."""
+        fitted = {
+            "value_int__bin_3": {"version": "v1", "source": "value_int", "op": "bin", "n_bins": 3, "edges": [0, 25]}
+        }
+        assert self._apply("value_int__bin_3", fitted, version=None) == EXPECTED_BIN_3
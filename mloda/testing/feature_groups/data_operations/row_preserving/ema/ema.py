@@ -80,6 +80,7 @@ from mloda.core.abstract_plugins.components.feature_set import FeatureSet
 from mloda.core.abstract_plugins.components.options import Options
 from mloda.testing.feature_groups.data_operations.base import DataOpsTestBase
 from mloda.testing.feature_groups.data_operations.helpers import make_feature_set
+from mloda.testing.feature_groups.data_operations.mixins.recurrence_state import RecurrenceStateTestMixin
 from mloda.testing.feature_groups.data_operations.mixins.reserved_columns import ReservedColumnsTestMixin
 from mloda.user import Feature
 
@@ -213,7 +214,7 @@ EXPECTED_EMA_WHOLE_SPAN3: list[Any] = [
 # ---------------------------------------------------------------------------
 
 
-class EmaTestBase(ReservedColumnsTestMixin, DataOpsTestBase):
+class EmaTestBase(RecurrenceStateTestMixin, ReservedColumnsTestMixin, DataOpsTestBase):
     """Reusable test base for EMA on backends that compute it NATIVELY.
 
     Subclasses combine this with a framework mixin (``PandasTestMixin``,
@@ -227,6 +228,12 @@ class EmaTestBase(ReservedColumnsTestMixin, DataOpsTestBase):
     here.
     """
 
+    # -- RecurrenceStateTestMixin configuration --------------------------------
+
+    @classmethod
+    def recurrence_state_feature_name(cls) -> str:
+        return "value__ema_2"
+
     # -- ReservedColumnsTestMixin configuration --------------------------------
 
     @classmethod
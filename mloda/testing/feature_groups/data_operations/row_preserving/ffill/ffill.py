@@ -59,6 +59,7 @@ from mloda.core.abstract_plugins.components.feature_set import FeatureSet
 from mloda.core.abstract_plugins.components.options import Options
 from mloda.testing.feature_groups.data_operations.base import DataOpsTestBase
 from mloda.testing.feature_groups.data_operations.helpers import make_feature_set
+from mloda.testing.feature_groups.data_operations.mixins.recurrence_state import RecurrenceStateTestMixin
 from mloda.testing.feature_groups.data_operations.mixins.reserved_columns import ReservedColumnsTestMixin
 from mloda.user import Feature
 
@@ -157,7 +158,7 @@ NAIVE_WHOLE_TABLE_FFILL: list[Any] = [
 # ---------------------------------------------------------------------------
 
 
-class FfillTestBase(ReservedColumnsTestMixin, DataOpsTestBase):
+class FfillTestBase(RecurrenceStateTestMixin, ReservedColumnsTestMixin, DataOpsTestBase):
     """Abstract base class for ffill-by-time framework tests.
 
     Subclasses combine this with a framework mixin (``PyArrowTestMixin``,
@@ -169,6 +170,12 @@ class FfillTestBase(ReservedColumnsTestMixin, DataOpsTestBase):
     natively; there are no rejections of supported inputs.
     """
 
+    # -- RecurrenceStateTestMixin configuration --------------------------------
+
+    @classmethod
+    def recurrence_state_feature_name(cls) -> str:
+        return "value__ffill"
+
     # -- ReservedColumnsTestMixin configuration --------------------------------
 
     @classmethod
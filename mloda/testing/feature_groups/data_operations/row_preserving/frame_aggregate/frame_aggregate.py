@@ -29,6 +29,7 @@ from mloda.testing.feature_groups.data_operations.helpers import (
 )
 from mloda.testing.feature_groups.data_operations.mixins.mask import MaskTestMixin
 from mloda.testing.feature_groups.data_operations.mixins.reserved_columns import ReservedColumnsTestMixin
+from mloda.testing.feature_groups.data_operations.mixins.sharded_execution import ShardedExecutionTestMixin
 from mloda.user import Feature
 
 
@@ -190,9 +191,19 @@ def _assert_values_with_nulls(actual: list[Any], expected: list[Any]) -> None:
 # ---------------------------------------------------------------------------
 
 
-class FrameAggregateTestBase(ReservedColumnsTestMixin, MaskTestMixin, DataOpsTestBase):
+class FrameAggregateTestBase(ShardedExecutionTestMixin, ReservedColumnsTestMixin, MaskTestMixin, DataOpsTestBase):
     """Abstract base class for frame aggregate framework tests."""
 
+    # -- ShardedExecutionTestMixin configuration -------------------------------
+
+    @classmethod
+    def sharded_feature_name(cls) -> str:
+        return "value_int__sum_rolling_3"
+
+    @classmethod
+    def sharded_context(cls) -> dict[str, Any]:
+        return {"partition_by": ["region"], "order_by": "timestamp"}
+
     # -- ReservedColumnsTestMixin configuration --------------------------------
 
     @classmethod
@@ -387,6 +387,25 @@ class OffsetTestBase(ReservedColumnsTestMixin, DataOpsTestBase):
         # Map back: row 0 (ts=None) -> lag=20, row 1 (ts=1) -> lag=None, row 2 (ts=2) -> lag=10
         assert result_col[1] is None  # first in sorted order has no predecessor
 
+    def test_nan_and_null_order_by_tie_in_input_order(self) -> None:
+        """NaN and null order_by values form one nulls-last tier that keeps input order."""
+        table = pa.table(
+            {
+                "region": ["A", "A", "A", "A"],
+                "ts": pa.array([None, float("nan"), 1.0, None], type=pa.float64()),
+                "value": [10, 20, 30, 40],
+            }
+        )
+        data = self.create_test_data(table)
+        # Sorted: ts=1.0 (30), then the tier None (10), NaN (20), None (40).
+        lag = make_feature_set("value__lag_1_offset", ["region"], "ts")
+        result = self.implementation_class().calculate_feature(data, lag)
+        assert self.extract_column(result, "value__lag_1_offset") == [30, 10, None, 20]
+
+        lead = make_feature_set("value__lead_1_offset", ["region"], "ts")
+        result = self.implementation_class().calculate_feature(self.create_test_data(table), lead)
+        assert self.extract_column(result, "value__lead_1_offset") == [20, 40, 10, None]
+
     # -- Row-order preservation ------------------------------------------------
 
     def test_row_order_preserved(self) -> None:
@@ -16,7 +16,9 @@ import pytest
 from mloda.core.abstract_plugins.components.feature_set import FeatureSet
 from mloda.core.abstract_plugins.components.options import Options
 from mloda.testing.feature_groups.data_operations.base import DataOpsTestBase
-from mloda.testing.feature_groups.data_operations.helpers import make_feature_set
+from mloda.testing.feature_groups.data_operations.helpers import make_feature_set, merge_feature_sets
+from mloda.testing.feature_groups.data_operations.mixins.approximate import ApproximateTestMixin
+from mloda.testing.feature_groups.data_operations.mixins.fitted_statistics import FittedStatisticsTestMixin
 from mloda.testing.feature_groups.data_operations.mixins.mask import MaskTestMixin
 from mloda.user import Feature
 
@@ -56,9 +58,34 @@ EXPECTED_P100_BY_REGION: list[float] = [20.0, 20.0, 20.0, 20.0, 60.0, 60.0, 60.0
 # ---------------------------------------------------------------------------
 
 
-class PercentileTestBase(MaskTestMixin, DataOpsTestBase):
+class PercentileTestBase(ApproximateTestMixin, FittedStatisticsTestMixin, MaskTestMixin, DataOpsTestBase):
     """Abstract base class for percentile framework tests."""
 
+    # -- ApproximateTestMixin configuration ------------------------------------
+
+    @classmethod
+    def approximate_cases(cls) -> list[tuple[str, str, float | None]]:
+        return [
+            ("value_int__p50_percentile", "percentile", 0.5),
+            ("value_int__p25_percentile", "percentile", 0.25),
+            ("value_int__p90_percentile", "percentile", 0.9),
+        ]
+
+    # -- FittedStatisticsTestMixin configuration -------------------------------
+
+    @classmethod
+    def fitted_statistics_feature_name(cls) -> str:
+        return "value_int__p50_percentile"
+
+    @classmethod
+    def fitted_statistics_context(cls) -> dict[str, Any]:
+        return {"partition_by": ["region"]}
+
+    @classmethod
+    def fitted_statistics_expected(cls) -> list[Any]:
+        # Training p50 of C, A, an unseen region, and the null region.
+        return [15.0, 5.0, None, -10.0]
+
     # -- MaskTestMixin configuration -------------------------------------------
 
     @classmethod
@@ -152,6 +179,31 @@ class PercentileTestBase(MaskTestMixin, DataOpsTestBase):
         result_col = self.extract_column(result, "value_int__p100_percentile")
         assert result_col == pytest.approx(EXPECTED_P100_BY_REGION, rel=1e-6)
 
+    def test_several_percentiles_in_one_feature_set(self) -> None:
+        """Percentiles of one source and partition_by, computed together, match their separate results."""
+        fs = merge_feature_sets(
+            make_feature_set("value_int__p25_percentile", ["region"]),
+            make_feature_set("value_int__p50_percentile", ["region"]),
+            make_feature_set("value_int__p75_percentile", ["region"]),
+        )
+        result = self.implementation_class().calculate_feature(self.test_data, fs)
+
+        assert self.get_row_count(result) == 12
+        assert self.extract_column(result, "value_int__p25_percentile") == pytest.approx(EXPECTED_P25_BY_REGION)
+        assert self.extract_column(result, "value_int__p50_percentile") == pytest.approx(EXPECTED_P50_BY_REGION)
+        assert self.extract_column(result, "value_int__p75_percentile") == pytest.approx(EXPECTED_P75_BY_REGION)
+
+    def test_same_percentile_under_two_names(self) -> None:
+        """Two features asking for the same percentile of one bucket each get the column."""
+        fs = merge_feature_sets(
+            make_feature_set("value_int__p50_percentile", ["region"]),
+            make_feature_set("median_by_region", ["region"], percentile=0.5, in_features="value_int"),
+        )
+        result = self.implementation_class().calculate_feature(self.test_data, fs)
+
+        assert self.extract_column(result, "value_int__p50_percentile") == pytest.approx(EXPECTED_P50_BY_REGION)
+        assert self.extract_column(result, "median_by_region") == pytest.approx(EXPECTED_P50_BY_REGION)
+
     def test_null_policy_skip_p50_with_null_values(self) -> None:
         """NullPolicy.SKIP: Group B has a null value_int at row 4. P50 should skip it."""
         fs = make_feature_set("value_int__p50_percentile", ["region"])
@@ -24,6 +24,7 @@ import pyarrow as pa
 
 from mloda.testing.feature_groups.data_operations.base import DataOpsTestBase
 from mloda.testing.feature_groups.data_operations.helpers import make_feature_set
+from mloda.testing.feature_groups.data_operations.mixins.sharded_execution import ShardedExecutionTestMixin
 
 from mloda.community.feature_groups.data_operations.row_preserving.rank.base import RankFeatureGroup
 
@@ -72,7 +73,7 @@ EXPECTED_BOTTOM_2 = [False, True, True, False, False, True, True, False, True, T
 # ---------------------------------------------------------------------------
 
 
-class RankTestBase(DataOpsTestBase):
+class RankTestBase(ShardedExecutionTestMixin, DataOpsTestBase):
     """Abstract base class for rank framework tests.
 
     Subclasses implement the abstract adapter methods from ``DataOpsTestBase``
@@ -86,6 +87,16 @@ class RankTestBase(DataOpsTestBase):
         """Rank types this framework supports. Override to restrict."""
         return cls.ALL_RANK_TYPES
 
+    # -- ShardedExecutionTestMixin configuration -------------------------------
+
+    @classmethod
+    def sharded_feature_name(cls) -> str:
+        return "value_int__rank_ranked"
+
+    @classmethod
+    def sharded_context(cls) -> dict[str, Any]:
+        return {"partition_by": ["region"], "order_by": "value_int"}
+
     # -- Reference implementation override --------------------------------------------
 
     @classmethod
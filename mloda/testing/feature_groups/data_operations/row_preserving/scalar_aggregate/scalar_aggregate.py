@@ -20,6 +20,8 @@ from mloda.core.abstract_plugins.components.feature_set import FeatureSet
 from mloda.core.abstract_plugins.components.options import Options
 from mloda.testing.feature_groups.data_operations.base import DataOpsTestBase
 from mloda.testing.feature_groups.data_operations.helpers import make_feature_set
+from mloda.testing.feature_groups.data_operations.mixins.approximate import ApproximateTestMixin
+from mloda.testing.feature_groups.data_operations.mixins.fitted_statistics import FittedStatisticsTestMixin
 from mloda.testing.feature_groups.data_operations.mixins.mask import MaskTestMixin
 from mloda.user import Feature
 
@@ -54,7 +56,7 @@ EXPECTED_MEDIAN: float = 15.0
 # ---------------------------------------------------------------------------
 
 
-class ScalarAggregateTestBase(MaskTestMixin, DataOpsTestBase):
+class ScalarAggregateTestBase(ApproximateTestMixin, FittedStatisticsTestMixin, MaskTestMixin, DataOpsTestBase):
     """Abstract base class for scalar aggregate framework tests."""
 
     ALL_AGG_TYPES = {
@@ -78,6 +80,27 @@ class ScalarAggregateTestBase(MaskTestMixin, DataOpsTestBase):
         """Override to restrict supported types for a framework."""
         return cls.ALL_AGG_TYPES
 
+    # -- ApproximateTestMixin configuration ------------------------------------
+
+    @classmethod
+    def approximate_cases(cls) -> list[tuple[str, str, float | None]]:
+        return [("value_int__median_scalar", "median", 0.5)]
+
+    @classmethod
+    def approximate_context(cls) -> dict[str, Any]:
+        return {}
+
+    # -- FittedStatisticsTestMixin configuration -------------------------------
+
+    @classmethod
+    def fitted_statistics_feature_name(cls) -> str:
+        return "value_int__sum_scalar"
+
+    @classmethod
+    def fitted_statistics_expected(cls) -> list[Any]:
+        # The training sum, whatever the request rows hold.
+        return [EXPECTED_SUM] * 4
+
     # -- MaskTestMixin configuration -------------------------------------------
 
     @classmethod
@@ -76,6 +76,7 @@ from mloda.core.abstract_plugins.components.feature_set import FeatureSet
 from mloda.core.abstract_plugins.components.options import Options
 from mloda.testing.feature_groups.data_operations.base import DataOpsTestBase
 from mloda.testing.feature_groups.data_operations.helpers import make_feature_set
+from mloda.testing.feature_groups.data_operations.mixins.recurrence_state import RecurrenceStateTestMixin
 from mloda.testing.feature_groups.data_operations.mixins.reserved_columns import ReservedColumnsTestMixin
 from mloda.user import Feature
 
@@ -145,7 +146,7 @@ EXPECTED_SESSION_30_MINUTE_WHOLE: list[int] = [2, 0, 1, 2, 1, 1, 2, 1, 1]
 # ---------------------------------------------------------------------------
 
 
-class SessionizationTestBase(ReservedColumnsTestMixin, DataOpsTestBase):
+class SessionizationTestBase(RecurrenceStateTestMixin, ReservedColumnsTestMixin, DataOpsTestBase):
     """Abstract base class for sessionization framework tests.
 
     Subclasses combine this with a framework mixin (``PandasTestMixin``,
@@ -157,6 +158,20 @@ class SessionizationTestBase(ReservedColumnsTestMixin, DataOpsTestBase):
     sessionization natively; there are no rejections of supported inputs.
     """
 
+    # -- RecurrenceStateTestMixin configuration --------------------------------
+
+    @classmethod
+    def recurrence_state_feature_name(cls) -> str:
+        return "ts__sessionize_30_minute"
+
+    @classmethod
+    def recurrence_state_partition_by(cls) -> list[str]:
+        return ["user"]
+
+    @classmethod
+    def recurrence_state_compares_groupings(cls) -> bool:
+        return True
+
     # -- ReservedColumnsTestMixin configuration --------------------------------
 
     @classmethod
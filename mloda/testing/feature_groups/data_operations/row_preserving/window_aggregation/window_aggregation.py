@@ -19,7 +19,7 @@ import pytest
 
 from mloda.core.abstract_plugins.components.options import Options
 from mloda.testing.feature_groups.data_operations.base import DataOpsTestBase
-from mloda.testing.feature_groups.data_operations.helpers import make_feature_set
+from mloda.testing.feature_groups.data_operations.helpers import make_feature_set, merge_feature_sets
 from mloda.testing.feature_groups.data_operations.mixins.mask import MaskTestMixin
 from mloda.testing.feature_groups.data_operations.mixins.reserved_columns import ReservedColumnsTestMixin
 
@@ -888,3 +888,45 @@ class WindowAggregationTestBase(ReservedColumnsTestMixin, MaskTestMixin, DataOps
             )
         )
         assert output_id == input_id
+
+    # -- Several features in one FeatureSet ------------------------------------
+
+    def test_multi_feature_same_partition(self) -> None:
+        """Features sharing partition_by are computed together and each matches its expected column."""
+        fs = merge_feature_sets(
+            make_feature_set("value_int__sum_window", ["region"]),
+            make_feature_set("value_int__min_window", ["region"]),
+            make_feature_set("value_int__max_window", ["region"]),
+        )
+        result = self.implementation_class().calculate_feature(self.test_data, fs)
+
+        assert self.get_row_count(result) == 12
+        assert self.extract_column(result, "value_int__sum_window") == EXPECTED_SUM_BY_REGION
+        assert self.extract_column(result, "value_int__min_window") == EXPECTED_MIN_BY_REGION
+        assert self.extract_column(result, "value_int__max_window") == EXPECTED_MAX_BY_REGION
+
+    def test_multi_feature_different_partitions_match_single(self) -> None:
+        """Features with different partition_by each equal their single-feature result."""
+        singles = [
+            make_feature_set("value_int__sum_window", ["region"]),
+            make_feature_set("value_float__count_window", ["region", "category"]),
+        ]
+        result = self.implementation_class().calculate_feature(self.test_data, merge_feature_sets(*singles))
+
+        assert self.get_row_count(result) == 12
+        for fs in singles:
+            name = str(fs.get_name_of_one_feature())
+            single = self.implementation_class().calculate_feature(self.test_data, fs)
+            assert self.extract_column(result, name) == self.extract_column(single, name), name
+
+    def test_multi_feature_mask_leaves_source_untouched(self) -> None:
+        """Masked features share one mask evaluation and the source column keeps its values."""
+        fs = merge_feature_sets(
+            make_feature_set("value_int__sum_window", ["region"], mask=("category", "equal", "X")),
+            make_feature_set("value_int__count_window", ["region"], mask=("category", "equal", "X")),
+        )
+        result = self.implementation_class().calculate_feature(self.test_data, fs)
+
+        assert self.extract_column(result, "value_int__sum_window") == [10, 10, 10, 10, 60, 60, 60, 60, 15, 15, 15, -10]
+        assert self.extract_column(result, "value_int__count_window") == [2, 2, 2, 2, 1, 1, 1, 1, 1, 1, 1, 1]
+        assert self.extract_column(result, "value_int") == self.extract_column(self.test_data, "value_int")
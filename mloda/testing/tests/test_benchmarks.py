@@ -0,0 +1,154 @@
+"""Tests for the mloda.testing.benchmarks package."""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa
+import pytest
+
+from mloda.community.feature_groups.data_operations import DataOperationsCatalog
+from mloda.testing.benchmarks import runner
+from mloda.testing.benchmarks.__main__ import main
+from mloda.testing.benchmarks.cases import benchmark_cases
+from mloda.testing.benchmarks.data import make_benchmark_table
+from mloda.testing.benchmarks.frameworks import FRAMEWORK_MIXINS, framework_adapter
+from mloda.testing.benchmarks.memory import run_memory_benchmarks
+from mloda.testing.benchmarks.runner import BenchmarkConfig, results_to_csv, results_to_json, run_benchmarks
+
+_SMALL = BenchmarkConfig(
+    rows=(40,),
+    partitions=(3,),
+    null_ratios=(0.25,),
+    operations=("aggregation", "ffill"),
+    frameworks=("PyArrowTable", "PythonDictFramework"),
+    repeats=1,
+)
+
+
+class TestMakeBenchmarkTable:
+    def test_shape_and_cardinality(self) -> None:
+        table = make_benchmark_table(500, partitions=7)
+        assert table.num_rows == 500
+        assert table.column_names == ["region", "ts", "value", "a", "b", "name"]
+        assert len(table.column("region").unique()) == 7
+        assert table.column("ts").type == pa.timestamp("us", tz="UTC")
+
+    def test_same_seed_same_table(self) -> None:
+        assert make_benchmark_table(200, 5, 0.1, seed=3).equals(make_benchmark_table(200, 5, 0.1, seed=3))
+        assert not make_benchmark_table(200, 5, 0.1, seed=3).equals(make_benchmark_table(200, 5, 0.1, seed=4))
+
+    def test_null_ratio_applies_to_measures_only(self) -> None:
+        table = make_benchmark_table(4000, null_ratio=0.3)
+        for name in ("value", "a", "b", "name"):
+            assert 0.25 < table.column(name).null_count / 4000 < 0.35
+        assert table.column("region").null_count == 0
+        assert table.column("ts").null_count == 0
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            ({"rows": -1}, "rows"),
+            ({"rows": 1, "partitions": 0}, "partitions"),
+            ({"rows": 1, "null_ratio": 1.0}, "null"),
+        ],
+    )
+    def test_invalid_arguments_raise(self, kwargs: dict[str, Any], match: str) -> None:
+        with pytest.raises(ValueError, match=match):
+            make_benchmark_table(**kwargs)
+
+
+class TestBenchmarkCases:
+    def test_every_catalog_operation_and_subtype_has_a_case(self) -> None:
+        expected = {
+            (info.name, subtype)
+            for info in DataOperationsCatalog.list()
+            for subtype in (info.subtypes if info.subtypes is not None else (None,))
+        }
+        assert {(case.operation, case.subtype) for case in benchmark_cases()} == expected
+
+    def test_frameworks_follow_catalog_support(self) -> None:
+        for case in benchmark_cases(["aggregation"]):
+            for framework in case.frameworks:
+                assert DataOperationsCatalog.is_supported("aggregation", case.subtype, framework)
+
+    def test_every_case_matches_its_implementations(self) -> None:
+        for case in benchmark_cases():
+            options = next(iter(case.feature_set().features)).options
+            for framework in case.frameworks:
+                concrete = DataOperationsCatalog.implementation(case.operation, framework)
+                assert concrete.match_feature_group_criteria(case.feature_name, options), (case, framework)
+
+    def test_unknown_operation_raises(self) -> None:
+        with pytest.raises(ValueError, match="no_such_operation"):
+            benchmark_cases(["no_such_operation"])
+
+
+class TestFrameworkAdapter:
+    def test_adapters_cover_every_catalog_framework(self) -> None:
+        catalog_frameworks = {framework for info in DataOperationsCatalog.list() for framework in info.frameworks}
+        assert catalog_frameworks <= set(FRAMEWORK_MIXINS)
+
+    def test_unknown_framework_raises(self) -> None:
+        with pytest.raises(ValueError, match="NoSuchFramework"):
+            framework_adapter("NoSuchFramework")
+
+
+class TestRunBenchmarks:
+    def test_small_matrix(self) -> None:
+        results = run_benchmarks(_SMALL)
+        cells = {(r.operation, r.subtype, r.framework) for r in results}
+        assert ("aggregation", "sum", "PythonDictFramework") in cells
+        assert ("ffill", None, "PyArrowTable") in cells
+        assert {r.framework for r in results} <= {"PyArrowTable", "PythonDictFramework"}
+        for result in results:
+            assert result.status == "ok", result.error
+            assert result.wall_time_s is not None and result.wall_time_s >= 0
+            assert result.peak_python_bytes is not None and result.peak_python_bytes > 0
+            assert (result.rows, result.partitions, result.null_ratio) == (40, 3, 0.25)
+
+    def test_failing_case_is_recorded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        def fail(*args: Any, **kwargs: Any) -> tuple[float, int, int]:
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(runner, "run_case", fail)
+        results = run_benchmarks(_SMALL)
+        assert results
+        assert all(r.status == "error" and r.error == "RuntimeError: boom" for r in results)
+        assert all(r.wall_time_s is None for r in results)
+
+    def test_json_and_csv_round_trip(self) -> None:
+        results = run_benchmarks(BenchmarkConfig(rows=(10,), operations=("string",), frameworks=("PyArrowTable",)))
+        records = json.loads(results_to_json(results))
+        rows = list(csv.DictReader(io.StringIO(results_to_csv(results))))
+        assert len(records) == len(rows) == len(results) == 5
+        assert {record["subtype"] for record in records} == {row["subtype"] for row in rows}
+
+
+class TestMemoryBenchmarks:
+    def test_row_changing_operations_are_skipped(self) -> None:
+        results = run_memory_benchmarks(100, ("aggregation", "string"))
+        assert {r.operation for r in results} == {"string"}
+        assert all(r.rows == 100 and r.input_bytes > 0 for r in results)
+
+    def test_elementwise_backends_do_not_copy_their_input(self) -> None:
+        results = run_memory_benchmarks(5000, ("scalar_arithmetic", "string"))
+        assert results
+        for result in results:
+            assert result.output_bytes > 0
+            assert result.overhead < 0.5, result
+
+
+def test_main_writes_result_matrix(tmp_path: Path) -> None:
+    output = tmp_path / "bench.json"
+    argv = ["--rows", "10", "--operations", "binning", "--frameworks", "PyArrowTable", "--output", str(output)]
+    assert main(argv) == 0
+    records = json.loads(output.read_text(encoding="utf-8"))
+    assert {(r["operation"], r["subtype"], r["framework"], r["rows"]) for r in records} == {
+        ("binning", "bin", "PyArrowTable", 10),
+        ("binning", "qbin", "PyArrowTable", 10),
+    }
@@ -0,0 +1,142 @@
+"""Tests for the synthetic data-operations dataset generator."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pytest
+
+from mloda.testing.data_creator.base import DataOperationsTestDataCreator
+from mloda.testing.data_creator.synthetic import SCHEMA_FIELDS, SyntheticDataGenerator, SyntheticDataSpec
+
+
+def _table(**kwargs: Any) -> pa.Table:
+    return SyntheticDataGenerator(SyntheticDataSpec(**kwargs)).to_table()
+
+
+class TestSchema:
+    def test_same_columns_as_fixture(self) -> None:
+        assert list(SCHEMA_FIELDS) == list(DataOperationsTestDataCreator.get_raw_data())
+        assert _table(rows=5).column_names == list(SCHEMA_FIELDS)
+
+    def test_row_count_and_batches(self) -> None:
+        generator = SyntheticDataGenerator(SyntheticDataSpec(rows=1000, batch_size=300))
+        batches = list(generator.iter_batches())
+        assert [batch.num_rows for batch in batches] == [300, 300, 300, 100]
+        assert all(batch.schema == generator.schema for batch in batches)
+
+    def test_empty(self) -> None:
+        table = _table(rows=0)
+        assert table.num_rows == 0
+        assert table.schema == SyntheticDataGenerator().schema
+
+
+class TestDeterminism:
+    def test_same_seed_same_data(self) -> None:
+        assert _table(rows=500, null_ratio=0.2, seed=7).equals(_table(rows=500, null_ratio=0.2, seed=7))
+        assert not _table(rows=500, seed=7).equals(_table(rows=500, seed=8))
+
+    def test_independent_of_batch_size(self) -> None:
+        options: dict[str, Any] = {"rows": 777, "null_ratio": 0.1, "zipf_s": 1.1, "duplicate_timestamp_ratio": 0.2}
+        assert _table(batch_size=64, **options).equals(_table(batch_size=1000, **options))
+
+    def test_row_ranges_regenerate_the_same_rows(self) -> None:
+        generator = SyntheticDataGenerator(SyntheticDataSpec(rows=1000, batch_size=128))
+        window = pa.Table.from_batches(list(generator.iter_batches(300, 450)))
+        assert window.equals(generator.to_table().slice(300, 150))
+
+
+class TestDistributions:
+    def test_partition_and_category_cardinality(self) -> None:
+        table = _table(rows=5000, partitions=30, categories=4)
+        assert len(pc.unique(table.column("region"))) == 30
+        assert sorted(pc.unique(table.column("category")).to_pylist()) == ["X", "X3", "Y", "Z"]
+
+    def test_zipf_skew_concentrates_on_first_key(self) -> None:
+        uniform = pc.value_counts(_table(rows=20_000, partitions=50).column("region"))
+        skewed = pc.value_counts(_table(rows=20_000, partitions=50, zipf_s=1.5).column("region"))
+        top_uniform = max(count for count in uniform.field("counts").to_pylist())
+        counts = dict(zip(skewed.field("values").to_pylist(), skewed.field("counts").to_pylist()))
+        assert counts["A"] > 5 * top_uniform
+        assert counts["A"] > counts["B"] > counts["E"]
+
+    def test_null_and_nan_ratios(self) -> None:
+        table = _table(rows=10_000, null_ratio=0.2, nan_ratio=0.1)
+        for name in ("category", "event_date", "value_int", "value_float", "amount", "name", "is_active"):
+            assert 0.17 < table.column(name).null_count / 10_000 < 0.23, name
+        assert table.column("region").null_count == 0
+        assert table.column("timestamp").null_count == 0
+        assert table.column("score").null_count == 10_000
+        nan_share = pc.sum(pc.is_nan(table.column("value_float"))).as_py() / 10_000
+        assert 0.06 < nan_share < 0.1
+
+    def test_key_null_ratio(self) -> None:
+        table = _table(rows=10_000, key_null_ratio=0.05)
+        assert 0.03 < table.column("region").null_count / 10_000 < 0.07
+        assert 0.03 < table.column("timestamp").null_count / 10_000 < 0.07
+
+    def test_duplicate_timestamps(self) -> None:
+        timestamps = _table(rows=10_000, duplicate_timestamp_ratio=0.25).column("timestamp")
+        assert len(pc.unique(timestamps)) == 7500
+        assert pc.all(pc.greater_equal(timestamps[1:], timestamps[:-1])).as_py()
+
+    def test_dst_crossing_timestamps(self) -> None:
+        table = _table(rows=5, timezone="Europe/Berlin", start=datetime(2023, 3, 26, 1, 58), step=timedelta(minutes=1))
+        timestamps = table.column("timestamp").to_pylist()
+        assert [ts.hour for ts in timestamps] == [1, 1, 3, 3, 3]
+        assert [ts.utcoffset() for ts in timestamps] == [timedelta(hours=1)] * 2 + [timedelta(hours=2)] * 3
+        assert table.column("event_date").to_pylist() == [date(2023, 3, 26)] * 5
+
+    def test_string_lengths(self) -> None:
+        lengths = pc.utf8_length(_table(rows=2000, name_length=(3, 5)).column("name"))
+        assert pc.min(lengths).as_py() == 3
+        assert pc.max(lengths).as_py() == 5
+
+
+class TestToNative:
+    @pytest.mark.parametrize(
+        ("framework", "requires"),
+        [
+            ("PyArrowTable", None),
+            ("PandasDataFrame", "pandas"),
+            ("PolarsLazyDataFrame", "polars"),
+            ("DuckDBFramework", "duckdb"),
+            ("SqliteFramework", None),
+            ("PythonDictFramework", None),
+        ],
+    )
+    def test_round_trips_values(self, framework: str, requires: str | None) -> None:
+        if requires is not None:
+            pytest.importorskip(requires)
+        from mloda.testing.feature_groups.data_operations.helpers import extract_column
+
+        generator = SyntheticDataGenerator(SyntheticDataSpec(rows=50, null_ratio=0.1, batch_size=16))
+        native = generator.to_native(framework)
+        expected = generator.to_table()
+        for name in ("region", "value_int", "amount"):
+            values = extract_column(native, name)
+            assert [None if v != v else v for v in values] == expected.column(name).to_pylist(), name
+
+    def test_unknown_framework_raises(self) -> None:
+        with pytest.raises(ValueError, match="NoSuchFramework"):
+            SyntheticDataGenerator().to_native("NoSuchFramework")
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"rows": -1},
+        {"partitions": 0},
+        {"null_ratio": 1.0},
+        {"nan_ratio": -0.1},
+        {"zipf_s": -1.0},
+        {"name_length": (4, 2)},
+        {"step": timedelta(0)},
+    ],
+)
+def test_invalid_spec_raises(kwargs: dict[str, Any]) -> None:
+    with pytest.raises(ValueError):
+        SyntheticDataSpec(**kwargs)
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Benchmark the import cost of the data_operations entry-point manifests.
+
+Each scenario runs in a fresh interpreter, so the interpreter start-up and the
+import of mloda itself are paid every time and the numbers compare like for like:
+
+- ``manifests``: import every data_operations ``manifest.py`` (what a job pays
+  when entry-point discovery only needs the declarations).
+- ``one framework``: additionally resolve the backends of one compute framework
+  (``--framework``, default ``PythonDictFramework``).
+- ``all backends``: additionally resolve every backend, which is what importing a
+  manifest cost before manifests became lazy.
+
+Run: python scripts/benchmark_manifest_imports.py [--repeats N] [--framework NAME]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess  # nosec
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DATA_OPERATIONS_ROOT = REPO_ROOT / "mloda" / "community" / "feature_groups" / "data_operations"
+
+
+def manifest_modules() -> list[str]:
+    """Dotted names of every data_operations manifest module in the checkout."""
+    return sorted(
+        ".".join(path.relative_to(REPO_ROOT).with_suffix("").parts)
+        for path in DATA_OPERATIONS_ROOT.rglob("manifest.py")
+    )
+
+
+def scenario_code(modules: list[str], resolve: str | None) -> str:
+    """Python source timing the import of ``modules`` and, optionally, a ``resolve`` step per manifest."""
+    lines = ["import importlib, time", "start = time.perf_counter()"]
+    lines.append(f"manifests = [importlib.import_module(m).FEATURE_GROUPS for m in {modules!r}]")
+    if resolve is not None:
+        lines.append(f"for manifest in manifests: {resolve}")
+    lines.append("print(time.perf_counter() - start)")
+    return "\n".join(lines)
+
+
+def time_scenario(code: str, repeats: int) -> float:
+    """Median seconds reported by ``code`` over ``repeats`` fresh interpreters."""
+    samples = []
+    for _ in range(repeats):
+        result = subprocess.run(  # nosec
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=REPO_ROOT
+        )
+        samples.append(float(result.stdout.strip()))
+    return statistics.median(samples)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the import cost of data_operations manifests")
+    parser.add_argument("--repeats", type=int, default=5, help="Fresh interpreters per scenario (median is reported)")
+    parser.add_argument("--framework", default="PythonDictFramework", help="Compute framework for 'one framework'")
+    args = parser.parse_args()
+    if args.repeats < 1:
+        parser.error("--repeats must be >= 1")
+
+    modules = manifest_modules()
+    scenarios = [
+        ("manifests", None),
+        (f"one framework ({args.framework})", f"manifest.resolve([{args.framework!r}])"),
+        ("all backends", "list(manifest)"),
+    ]
+    print(f"{len(modules)} manifests, median of {args.repeats} fresh interpreters")
+    baseline = None
+    for label, resolve in scenarios:
+        seconds = time_scenario(scenario_code(modules, resolve), args.repeats)
+        baseline = seconds if baseline is None else baseline
+        print(f"{label:<40} {seconds * 1000:8.1f} ms  ({seconds / baseline:5.1f}x manifests)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
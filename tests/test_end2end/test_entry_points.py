@@ -2,8 +2,8 @@
 
 mloda 0.9.0 discovers installed plugins through the entry-point groups
 ``mloda.feature_groups``, ``mloda.compute_frameworks`` and ``mloda.extenders``.
-Each plugin package ships a ``manifest.py`` module exposing a list of concrete
-plugin classes under a per-group attribute (``FEATURE_GROUPS``,
+Each plugin package ships a ``manifest.py`` module exposing a sequence of concrete
+plugin classes (a list, or a ``LazyPluginManifest`` that imports on access) under a per-group attribute (``FEATURE_GROUPS``,
 ``COMPUTE_FRAMEWORKS`` or ``EXTENDERS``). The generator
 ``scripts/generate_pyproject.py`` must emit a
 ``[project.entry-points."<group>"]`` table whose entry name is the distribution
@@ -22,6 +22,7 @@ import importlib
 import inspect
 import re
 import sys
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Any
 
@@ -191,7 +192,9 @@ def test_manifest_modules_list_only_concrete_plugins() -> None:
             assert hasattr(module, attr_name), f"{manifest_name}: missing attribute {attr_name}"
             plugins = getattr(module, attr_name)
 
-            assert isinstance(plugins, list), f"{manifest_name}.{attr_name} must be a list"
+            assert isinstance(plugins, Sequence) and not isinstance(plugins, (str, bytes)), (
+                f"{manifest_name}.{attr_name} must be a list or lazy manifest sequence"
+            )
             assert plugins, f"{manifest_name}.{attr_name} must be non-empty"
 
             for cls in plugins:
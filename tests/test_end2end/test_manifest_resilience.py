@@ -6,7 +6,9 @@ honest: an on-disk import-root sweep, and a cross-check against config/packages.
 from __future__ import annotations
 
 import ast
+import importlib
 import re
+import subprocess  # nosec
 import sys
 from pathlib import Path
 from types import ModuleType, SimpleNamespace
@@ -20,7 +22,7 @@ else:
 import pytest
 
 from mloda.community.feature_groups.data_operations import manifest_utils
-from mloda.community.feature_groups.data_operations.manifest_utils import load_plugin_classes
+from mloda.community.feature_groups.data_operations.manifest_utils import LazyPluginManifest, load_plugin_classes
 
 _IMPORT_MODULE_TARGET = "mloda.community.feature_groups.data_operations.manifest_utils.importlib.import_module"
 
@@ -102,6 +104,130 @@ def test_empty_specs_returns_empty_list() -> None:
     assert load_plugin_classes("pkg", []) == []
 
 
+def test_lazy_manifest_imports_nothing_until_accessed(monkeypatch: pytest.MonkeyPatch) -> None:
+    imported: list[str] = []
+
+    def fake_import(name: str) -> Any:
+        imported.append(name)
+        return SimpleNamespace(KeptClass=_KeptClass)
+
+    monkeypatch.setattr(_IMPORT_MODULE_TARGET, fake_import)
+
+    manifest = LazyPluginManifest("pkg", [("pandas_backend", "KeptClass", "PandasDataFrame")])
+    assert imported == []
+    assert manifest.frameworks == ("PandasDataFrame",)
+
+    assert list(manifest) == [_KeptClass]
+    assert len(manifest) == 1 and manifest[0] is _KeptClass
+    assert imported == ["pkg.pandas_backend"], "sequence access must resolve once and cache"
+
+
+def test_lazy_manifest_resolve_imports_only_requested_frameworks(monkeypatch: pytest.MonkeyPatch) -> None:
+    imported: list[str] = []
+
+    def fake_import(name: str) -> Any:
+        imported.append(name)
+        return SimpleNamespace(KeptClass=_KeptClass)
+
+    monkeypatch.setattr(_IMPORT_MODULE_TARGET, fake_import)
+
+    manifest = LazyPluginManifest(
+        "pkg",
+        [
+            ("polars_backend", "KeptClass", "PolarsLazyDataFrame"),
+            ("pandas_backend", "KeptClass", "PandasDataFrame"),
+        ],
+    )
+
+    assert manifest.resolve(["pandasdataframe"]) == [_KeptClass]
+    assert imported == ["pkg.pandas_backend"]
+    assert manifest.resolve(["UnknownFramework"]) == []
+
+
+def test_lazy_manifest_iteration_imports_only_env_selected_frameworks(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The entry-point loader iterates the manifest, so the env selection is what limits its imports."""
+    imported: list[str] = []
+
+    def fake_import(name: str) -> Any:
+        imported.append(name)
+        return SimpleNamespace(KeptClass=_KeptClass)
+
+    monkeypatch.setattr(_IMPORT_MODULE_TARGET, fake_import)
+    monkeypatch.setenv(manifest_utils.FRAMEWORKS_ENV_VAR, " pandasdataframe , PyArrowTable")
+
+    manifest = LazyPluginManifest(
+        "pkg",
+        [
+            ("polars_backend", "KeptClass", "PolarsLazyDataFrame"),
+            ("pandas_backend", "KeptClass", "PandasDataFrame"),
+        ],
+    )
+
+    assert list(manifest) == [_KeptClass]
+    assert imported == ["pkg.pandas_backend"]
+
+    monkeypatch.delenv(manifest_utils.FRAMEWORKS_ENV_VAR)
+    assert len(manifest) == 2
+    assert imported == ["pkg.pandas_backend", "pkg.polars_backend", "pkg.pandas_backend"]
+
+
+def test_lazy_manifest_skips_backend_with_missing_optional_framework(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fake_import(name: str) -> Any:
+        if name.endswith("polars_backend"):
+            raise ModuleNotFoundError("No module named 'polars'", name="polars")
+        return SimpleNamespace(KeptClass=_KeptClass)
+
+    monkeypatch.setattr(_IMPORT_MODULE_TARGET, fake_import)
+
+    manifest = LazyPluginManifest(
+        "pkg",
+        [
+            ("polars_backend", "PolarsClass", "PolarsLazyDataFrame"),
+            ("pandas_backend", "KeptClass", "PandasDataFrame"),
+        ],
+    )
+
+    assert list(manifest) == [_KeptClass]
+
+
+def _data_operations_manifest_modules() -> list[str]:
+    return sorted(
+        ".".join(path.relative_to(_REPO_ROOT).with_suffix("").parts)
+        for path in _DATA_OPERATIONS_ROOT.rglob("manifest.py")
+    )
+
+
+def test_data_operations_manifests_import_no_backend() -> None:
+    """Importing every data_operations manifest must not import a backend or its framework."""
+    modules = _data_operations_manifest_modules()
+    assert modules, "found no data_operations manifest modules"
+    code = "\n".join(
+        [
+            "import sys",
+            *(f"import {module}" for module in modules),
+            "loaded = sorted(m for m in sys.modules if m.split('.')[0] in "
+            f"{sorted(manifest_utils._OPTIONAL_BACKENDS)!r} or m.endswith(('_helpers', '.base')))",
+            "print(','.join(loaded))",
+        ]
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=_REPO_ROOT)  # nosec
+    assert result.stdout.strip() == "", f"manifest import pulled in: {result.stdout.strip()}"
+
+
+@pytest.mark.parametrize("module_name", _data_operations_manifest_modules())
+def test_data_operations_manifest_frameworks_match_classes(module_name: str) -> None:
+    """Each declared framework must be the compute framework its resolved class is built for."""
+    manifest = importlib.import_module(module_name).FEATURE_GROUPS
+    assert isinstance(manifest, LazyPluginManifest)
+    for spec in manifest.specs:
+        classes = manifest.resolve([spec.framework])
+        declared = [cls for cls in classes if cls.__name__ == spec.class_name]
+        if not declared:
+            continue  # optional framework not installed
+        frameworks = {fw.__name__ for fw in declared[0].compute_framework_definition()}
+        assert spec.framework in frameworks, f"{module_name}: {spec} but class runs on {sorted(frameworks)}"
+
+
 def _trusted_type_checking_alias(tree: ast.Module) -> str | None:
     """The module-level name that genuinely aliases ``typing.TYPE_CHECKING``, or ``None``.
 